@@ -0,0 +1,445 @@
+"""Benchmark: what the real proxy adds to streaming API traffic.
+
+Starts a local mock upstream that streams Anthropic- or OpenAI-shaped SSE
+with a configurable token count, token rate and delta size. A real proxy
+(cli._start_proxy_server + make_handler_class, events drained by a batched
+EventRouter) sits in front of it. N concurrent clients run the same workload
+twice: directly against the mock, then through the proxy. The report covers
+throughput, time to first byte and inter-chunk latency for both paths, plus
+the difference the proxy adds.
+
+Usage:
+    uv run python benchmarks/bench_proxy_throughput.py
+    uv run python benchmarks/bench_proxy_throughput.py --clients 16 --requests 10
+    uv run python benchmarks/bench_proxy_throughput.py --shape openai --token-rate 200
+    uv run python benchmarks/bench_proxy_throughput.py --progress-coalesce-ms 0   # one event per delta
+    uv run python benchmarks/bench_proxy_throughput.py --clients 128 --proxy-workers 32
+    uv run python benchmarks/bench_proxy_throughput.py --clients 256 --proxy-engine asyncio
+    uv run python benchmarks/bench_proxy_throughput.py --json   # machine-readable output
+"""
+
+import argparse
+import http.client
+import http.server
+import json
+import queue
+import statistics
+import sys
+import threading
+import time
+
+import cc_dump.providers
+from cc_dump.cli import (
+    DEFAULT_PROGRESS_COALESCE_MS,
+    PROXY_ENGINE_ASYNCIO,
+    PROXY_ENGINE_THREADED,
+    PROXY_ENGINES,
+    _start_proxy_server,
+)
+from cc_dump.pipeline.proxy import ProxyHandler, make_handler_class
+from cc_dump.pipeline.proxy_async import AsyncProxyRuntime
+from cc_dump.pipeline.router import DirectSubscriber, EventRouter
+from cc_dump.pipeline.upstream_pool import UpstreamConnectionPool
+
+_SHAPES = ("anthropic", "openai")
+
+
+# ─── Mock upstream ───────────────────────────────────────────────────────────
+
+
+def _sse(event: dict, *, named: bool = False) -> bytes:
+    frame = b"data: " + json.dumps(event).encode() + b"\n\n"
+    # Anthropic names every event; OpenAI sends bare data lines.
+    return b"event: " + event["type"].encode() + b"\n" + frame if named else frame
+
+
+def anthropic_stream(tokens: int, chunk_bytes: int):
+    """Yield the SSE frames of one Anthropic streaming response."""
+    yield _sse({
+        "type": "message_start",
+        "message": {
+            "id": "msg_bench", "type": "message", "role": "assistant",
+            "model": "claude-bench", "content": [],
+            "usage": {"input_tokens": 100, "output_tokens": 0},
+        },
+    }, named=True)
+    yield _sse({"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}},
+               named=True)
+    text = "x" * chunk_bytes
+    for _ in range(tokens):
+        yield _sse({"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": text}},
+                   named=True)
+    yield _sse({"type": "content_block_stop", "index": 0}, named=True)
+    yield _sse({
+        "type": "message_delta",
+        "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+        "usage": {"output_tokens": tokens},
+    }, named=True)
+    yield _sse({"type": "message_stop"}, named=True)
+
+
+def openai_stream(tokens: int, chunk_bytes: int):
+    """Yield the SSE frames of one OpenAI chat-completions streaming response."""
+    text = "x" * chunk_bytes
+    base = {"id": "chatcmpl-bench", "object": "chat.completion.chunk", "model": "gpt-bench"}
+    yield _sse({**base, "choices": [{"index": 0, "delta": {"role": "assistant"}}]})
+    for _ in range(tokens):
+        yield _sse({**base, "choices": [{"index": 0, "delta": {"content": text}}]})
+    yield _sse({**base, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]})
+    yield b"data: [DONE]\n\n"
+
+
+_STREAMS = {"anthropic": anthropic_stream, "openai": openai_stream}
+
+
+def make_mock_upstream_handler(shape: str, tokens: int, chunk_bytes: int, token_rate: float):
+    """HTTP/1.1 keep-alive handler that streams one chunked SSE response per POST."""
+    stream = _STREAMS[shape]
+    delay = 1.0 / token_rate if token_rate > 0 else 0.0
+
+    class MockUpstreamHandler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Real API servers flush each SSE frame immediately. With Nagle on, a
+        # reused (pooled) connection stalls ~40 ms on delayed ACKs per response.
+        disable_nagle_algorithm = True
+
+        def log_message(self, fmt, *args):
+            pass
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for frame in stream(tokens, chunk_bytes):
+                if delay:
+                    time.sleep(delay)
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(frame), frame))
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+            self.wfile.flush()
+
+    return MockUpstreamHandler
+
+
+class MockUpstreamServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    # socketserver's default listen backlog of 5 resets connections under 100+ clients.
+    request_queue_size = 1024
+
+
+# ─── Clients ─────────────────────────────────────────────────────────────────
+
+
+def request_body(shape: str, body_kb: int) -> bytes:
+    filler = "lorem ipsum " * (body_kb * 1024 // 12)
+    if shape == "anthropic":
+        body = {"model": "claude-bench", "max_tokens": 1024, "stream": True,
+                "messages": [{"role": "user", "content": filler}]}
+    else:
+        body = {"model": "gpt-bench", "stream": True,
+                "messages": [{"role": "user", "content": filler}]}
+    return json.dumps(body).encode()
+
+
+def _run_request(port: int, path: str, body: bytes) -> dict:
+    """One streaming request; times the first SSE line and the gaps between data lines."""
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    try:
+        start = time.perf_counter()
+        conn.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+        resp = conn.getresponse()
+        ttfb = None
+        last = None
+        gaps = []
+        received = 0
+        while True:
+            line = resp.readline()
+            if not line:
+                break
+            now = time.perf_counter()
+            received += len(line)
+            if ttfb is None:
+                ttfb = now - start
+            if line.startswith(b"data: "):
+                if last is not None:
+                    gaps.append(now - last)
+                last = now
+        return {
+            "status": resp.status,
+            "ttfb_s": ttfb if ttfb is not None else time.perf_counter() - start,
+            "gaps_s": gaps,
+            "bytes": received,
+        }
+    finally:
+        conn.close()
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def drive_clients(port: int, path: str, body: bytes, *, clients: int, requests_per_client: int) -> dict:
+    """Run clients x requests_per_client streaming requests concurrently and summarize."""
+    results: list[dict] = []
+    lock = threading.Lock()
+
+    def client() -> None:
+        for _ in range(requests_per_client):
+            row = _run_request(port, path, body)
+            with lock:
+                results.append(row)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall_s = time.perf_counter() - start
+
+    ttfbs = [row["ttfb_s"] * 1000 for row in results]
+    gaps = [gap * 1000 for row in results for gap in row["gaps_s"]]
+    total_bytes = sum(row["bytes"] for row in results)
+    return {
+        "requests": len(results),
+        "errors": sum(1 for row in results if row["status"] != 200),
+        "wall_s": round(wall_s, 3),
+        "requests_per_s": round(len(results) / wall_s, 2),
+        "mb_per_s": round(total_bytes / wall_s / 1e6, 3),
+        "ttfb_p50_ms": round(_percentile(ttfbs, 50), 3),
+        "ttfb_p99_ms": round(_percentile(ttfbs, 99), 3),
+        "chunk_gap_p50_ms": round(_percentile(gaps, 50), 4),
+        "chunk_gap_p99_ms": round(_percentile(gaps, 99), 4),
+        "chunk_gap_mean_ms": round(statistics.mean(gaps), 4) if gaps else 0.0,
+    }
+
+
+# ─── Benchmark ───────────────────────────────────────────────────────────────
+
+
+class _ThreadPeak:
+    """Samples the process thread count while active; peak is the highest seen."""
+
+    def __init__(self, interval_s: float = 0.005):
+        self.peak = threading.active_count()
+        self._interval_s = interval_s
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self._interval_s):
+            self.peak = max(self.peak, threading.active_count())
+
+
+def _pending_parses(before: dict) -> bool:
+    now = ProxyHandler.stream_stats.stats()
+    return now["parsed_streams"] - before["parsed_streams"] < now["streams"] - before["streams"]
+
+
+def run_benchmark(
+    *,
+    shape: str = "anthropic",
+    clients: int = 4,
+    requests_per_client: int = 5,
+    tokens: int = 200,
+    chunk_bytes: int = 16,
+    token_rate: float = 0.0,
+    body_kb: int = 64,
+    progress_coalesce_ms: float = DEFAULT_PROGRESS_COALESCE_MS,
+    proxy_workers: int = 0,
+    proxy_engine: str = PROXY_ENGINE_THREADED,
+) -> dict:
+    """Measure the mock upstream directly and through the proxy; returns a JSON-able dict."""
+    spec = cc_dump.providers.get_provider_spec(shape)
+    path = spec.api_paths[0]
+    body = request_body(shape, body_kb)
+
+    upstream = MockUpstreamServer(
+        ("127.0.0.1", 0),
+        make_mock_upstream_handler(shape, tokens, chunk_bytes, token_rate),
+    )
+    upstream_port = upstream.server_address[1]
+    threading.Thread(target=upstream.serve_forever, daemon=True).start()
+
+    event_q: queue.Queue = queue.Queue()
+    events_seen = [0]
+    router = EventRouter(event_q, batched=True)
+    router.add_subscriber(DirectSubscriber(lambda event: events_seen.__setitem__(0, events_seen[0] + 1)),
+                          name="counter")
+    router.start()
+    pool = UpstreamConnectionPool()
+    handler = make_handler_class(
+        provider=spec.key,
+        target_host=f"http://127.0.0.1:{upstream_port}",
+        event_queue=event_q,
+        upstream_pool=pool,
+        progress_coalesce_ms=progress_coalesce_ms,
+    )
+    async_runtime = AsyncProxyRuntime() if proxy_engine == PROXY_ENGINE_ASYNCIO else None
+    proxy_server, proxy_port, _thread = _start_proxy_server(
+        "127.0.0.1", 0, handler, workers=proxy_workers, async_runtime=async_runtime,
+    )
+    peak_threads = _ThreadPeak()
+
+    try:
+        direct = drive_clients(upstream_port, path, body, clients=clients,
+                               requests_per_client=requests_per_client)
+        stream_before = ProxyHandler.stream_stats.stats()
+        with peak_threads:
+            proxied = drive_clients(proxy_port, path, body, clients=clients,
+                                    requests_per_client=requests_per_client)
+        # Parser threads finish after the clients have their bytes.
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline and (
+            _pending_parses(stream_before) or not event_q.empty()
+        ):
+            time.sleep(0.01)
+        stream_after = ProxyHandler.stream_stats.stats()
+        server_stats = proxy_server.stats()
+    finally:
+        proxy_server.shutdown()
+        proxy_server.server_close()
+        upstream.shutdown()
+        upstream.server_close()
+        router.stop()
+        pool.close()
+        if async_runtime is not None:
+            async_runtime.close()
+
+    passthrough = {key: stream_after[key] - stream_before[key] for key in stream_after}
+    passthrough["parse_lag_max_us"] = stream_after["parse_lag_max_us"]  # a maximum, not a count
+    syscalls = passthrough["client_writes"] + passthrough["upstream_reads"]
+    passthrough["syscalls_per_event"] = (
+        round(syscalls / passthrough["sse_events"], 3) if passthrough["sse_events"] else 0.0
+    )
+    return {
+        "config": {
+            "shape": shape,
+            "clients": clients,
+            "requests_per_client": requests_per_client,
+            "tokens": tokens,
+            "chunk_bytes": chunk_bytes,
+            "token_rate": token_rate,
+            "body_kb": body_kb,
+            "progress_coalesce_ms": progress_coalesce_ms,
+            "proxy_workers": proxy_workers,
+            "proxy_engine": proxy_engine,
+        },
+        "direct": direct,
+        "proxied": proxied,
+        "added": {
+            "ttfb_p50_ms": round(proxied["ttfb_p50_ms"] - direct["ttfb_p50_ms"], 3),
+            "ttfb_p99_ms": round(proxied["ttfb_p99_ms"] - direct["ttfb_p99_ms"], 3),
+            "chunk_gap_p50_ms": round(proxied["chunk_gap_p50_ms"] - direct["chunk_gap_p50_ms"], 4),
+            "chunk_gap_p99_ms": round(proxied["chunk_gap_p99_ms"] - direct["chunk_gap_p99_ms"], 4),
+            "throughput_ratio": round(proxied["mb_per_s"] / direct["mb_per_s"], 3) if direct["mb_per_s"] else 0.0,
+        },
+        "passthrough": passthrough,
+        "server": {**server_stats, "peak_threads": peak_threads.peak},
+        "pipeline_events": events_seen[0],
+        "router": router.stats(),
+    }
+
+
+def print_report(results: dict) -> None:
+    config = results["config"]
+    print(f"\n{'='*72}")
+    print("  Proxy Throughput Benchmark")
+    print(f"{'='*72}")
+    print(f"  shape={config['shape']} clients={config['clients']} "
+          f"requests/client={config['requests_per_client']} tokens={config['tokens']} "
+          f"chunk={config['chunk_bytes']}B rate={config['token_rate'] or 'max'} "
+          f"body={config['body_kb']}KB coalesce={config['progress_coalesce_ms']:g}ms "
+          f"engine={config['proxy_engine']} workers={config['proxy_workers'] or 'per-connection'}")
+    print(f"\n  {'':<10} {'req/s':>8} {'MB/s':>8} {'ttfb p50':>9} {'ttfb p99':>9} "
+          f"{'gap p50':>9} {'gap p99':>9} {'errors':>7}")
+    for label in ("direct", "proxied"):
+        row = results[label]
+        print(f"  {label:<10} {row['requests_per_s']:>8.1f} {row['mb_per_s']:>8.2f} "
+              f"{row['ttfb_p50_ms']:>9.2f} {row['ttfb_p99_ms']:>9.2f} "
+              f"{row['chunk_gap_p50_ms']:>9.3f} {row['chunk_gap_p99_ms']:>9.3f} {row['errors']:>7}")
+    added = results["added"]
+    print(f"\n  proxy adds: ttfb p50 {added['ttfb_p50_ms']:+.2f} ms, p99 {added['ttfb_p99_ms']:+.2f} ms; "
+          f"chunk gap p50 {added['chunk_gap_p50_ms']:+.3f} ms, p99 {added['chunk_gap_p99_ms']:+.3f} ms; "
+          f"throughput x{added['throughput_ratio']:.2f}")
+    passthrough = results["passthrough"]
+    print(f"  passthrough: {passthrough['sse_events']} SSE events, "
+          f"{passthrough['upstream_reads']} upstream reads, {passthrough['client_writes']} client writes "
+          f"({passthrough['syscalls_per_event']:.2f} syscalls/event)")
+    frames = passthrough["parse_frames"] or 1
+    print(f"  parse handoff: lag mean {passthrough['parse_lag_total_us'] / frames / 1000:.3f} ms, "
+          f"max {passthrough['parse_lag_max_us'] / 1000:.3f} ms, "
+          f"backpressure waits {passthrough['parse_backpressure']}")
+    print(f"  progress events: {passthrough['progress_events']} emitted, "
+          f"{passthrough['progress_coalesced']} merged at the source")
+    server = results["server"]
+    print(f"  server: max active {server['max_active']}, max queued {server['max_queued']}, "
+          f"queue wait max {server['queue_wait_max_ms']} ms, rejected {server['rejected']}, "
+          f"peak threads {server['peak_threads']}")
+    print(f"  pipeline events: {results['pipeline_events']}")
+    print(f"{'='*72}\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="End-to-end proxy throughput benchmark")
+    parser.add_argument("--shape", choices=_SHAPES, default="anthropic",
+                        help="SSE response shape / provider (default: anthropic)")
+    parser.add_argument("--clients", type=int, default=4,
+                        help="Concurrent clients (default: 4)")
+    parser.add_argument("--requests", type=int, default=5,
+                        help="Requests per client (default: 5)")
+    parser.add_argument("--tokens", type=int, default=200,
+                        help="Text deltas per response (default: 200)")
+    parser.add_argument("--chunk-bytes", type=int, default=16,
+                        help="Text bytes per delta (default: 16)")
+    parser.add_argument("--token-rate", type=float, default=0.0,
+                        help="Deltas per second per response; 0 streams as fast as possible (default: 0)")
+    parser.add_argument("--body-kb", type=int, default=64,
+                        help="Request body size in KB (default: 64)")
+    parser.add_argument("--progress-coalesce-ms", type=float, default=DEFAULT_PROGRESS_COALESCE_MS,
+                        help=f"Source-side progress coalescing window; 0 disables "
+                             f"(default: {DEFAULT_PROGRESS_COALESCE_MS:g})")
+    parser.add_argument("--proxy-workers", type=int, default=0,
+                        help="Proxy worker pool size; 0 uses one thread per connection (default: 0)")
+    parser.add_argument("--proxy-engine", choices=PROXY_ENGINES, default=PROXY_ENGINE_THREADED,
+                        help="Proxy data plane (default: threaded)")
+    parser.add_argument("--json", action="store_true",
+                        help="Output machine-readable JSON")
+    args = parser.parse_args()
+
+    results = run_benchmark(
+        shape=args.shape,
+        clients=args.clients,
+        requests_per_client=args.requests,
+        tokens=args.tokens,
+        chunk_bytes=args.chunk_bytes,
+        token_rate=args.token_rate,
+        body_kb=args.body_kb,
+        progress_coalesce_ms=args.progress_coalesce_ms,
+        proxy_workers=args.proxy_workers,
+        proxy_engine=args.proxy_engine,
+    )
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print_report(results)
+
+
+if __name__ == "__main__":
+    main()
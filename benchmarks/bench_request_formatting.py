@@ -0,0 +1,153 @@
+"""Benchmark: per-request formatting time as the conversation grows.
+
+Each API request resends the whole conversation. This measures the time to
+format the request at turn N with a cold ProviderRuntimeState (every message
+formatted from scratch, the pre-memo behaviour) and with a warm one that
+already formatted turn N-1 (only the new tail is formatted; the shared prefix
+comes from the per-message memo).
+
+Usage:
+    uv run python benchmarks/bench_request_formatting.py                 # turns 10, 100, 1000
+    uv run python benchmarks/bench_request_formatting.py --turns 10 50
+    uv run python benchmarks/bench_request_formatting.py --json          # machine-readable output
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from cc_dump.core.formatting import ProviderRuntimeState, format_request_for_provider
+
+_TOOLS = [
+    {
+        "name": name,
+        "description": f"{name} tool. " + "Detailed usage notes. " * 40,
+        "input_schema": {"type": "object", "properties": {"path": {"type": "string"}}},
+    }
+    for name in ("Read", "Edit", "Write", "Bash", "Grep", "Glob", "Task", "Skill")
+]
+
+_SYSTEM = [
+    {"type": "text", "text": "You are a coding assistant.\n\n" + "## Guidelines\n- Be concise.\n" * 60},
+]
+
+
+def _turn_messages(turn: int) -> list[dict]:
+    """One user prompt → assistant tool call → tool result → assistant reply."""
+    tool_id = f"toolu_{turn:05d}"
+    return [
+        {
+            "role": "user",
+            "content": [
+                {
+                    "type": "text",
+                    "text": (
+                        f"<system-reminder>Reminder {turn}: follow CLAUDE.md.</system-reminder>\n"
+                        f"Please look at module_{turn}.py and fix the bug.\n\n"
+                        "```python\ndef f(x):\n    return x + 1\n```\n"
+                    ),
+                }
+            ],
+        },
+        {
+            "role": "assistant",
+            "content": [
+                {"type": "text", "text": f"Reading module_{turn}.py **now**."},
+                {"type": "tool_use", "id": tool_id, "name": "Read",
+                 "input": {"file_path": f"/repo/src/module_{turn}.py"}},
+            ],
+        },
+        {
+            "role": "user",
+            "content": [
+                {"type": "tool_result", "tool_use_id": tool_id,
+                 "content": "\n".join(f"{i}\tline {i} of module {turn}" for i in range(60))},
+            ],
+        },
+        {
+            "role": "assistant",
+            "content": [{"type": "text", "text": f"Fixed the off-by-one in `module_{turn}`.\n\n- step one\n- step two"}],
+        },
+    ]
+
+
+def build_body(turns: int) -> dict:
+    """Request body at turn ``turns``: full history plus a new user prompt."""
+    messages: list[dict] = []
+    for turn in range(turns - 1):
+        messages.extend(_turn_messages(turn))
+    messages.append(_turn_messages(turns - 1)[0])
+    return {
+        "model": "claude-sonnet-4-20250514",
+        "max_tokens": 16000,
+        "stream": True,
+        "system": _SYSTEM,
+        "tools": _TOOLS,
+        "messages": messages,
+        "metadata": {"user_id": "user_abc123_account_1111-2222_session_3333-4444"},
+    }
+
+
+def _format_ms(body: dict, state: ProviderRuntimeState) -> float:
+    start = time.perf_counter()
+    format_request_for_provider("anthropic", body, state)
+    return (time.perf_counter() - start) * 1000
+
+
+def measure_turn(turns: int, *, repeats: int = 3) -> dict:
+    """Cold vs warm per-request formatting time at one conversation length."""
+    previous, current = build_body(turns - 1), build_body(turns)
+    cold, warm = [], []
+    for _ in range(repeats):
+        cold.append(_format_ms(current, ProviderRuntimeState()))
+        state = ProviderRuntimeState()
+        format_request_for_provider("anthropic", previous, state)
+        warm.append(_format_ms(current, state))
+    cold_ms, warm_ms = statistics.median(cold), statistics.median(warm)
+    return {
+        "turns": turns,
+        "messages": len(current["messages"]),
+        "cold_ms": round(cold_ms, 2),
+        "warm_ms": round(warm_ms, 2),
+        "speedup": round(cold_ms / warm_ms, 1) if warm_ms else None,
+    }
+
+
+def run_benchmark(turn_counts: list[int], *, repeats: int = 3) -> dict:
+    return {"results": [measure_turn(turns, repeats=repeats) for turns in turn_counts]}
+
+
+def print_report(results: dict) -> None:
+    print(f"\n{'='*60}")
+    print("  Request Formatting Benchmark (per request)")
+    print(f"{'='*60}")
+    print(f"  {'turn':>6} {'messages':>9} {'cold ms':>10} {'warm ms':>10} {'speedup':>8}")
+    for row in results["results"]:
+        print(f"  {row['turns']:>6} {row['messages']:>9} {row['cold_ms']:>10.1f} "
+              f"{row['warm_ms']:>10.1f} {row['speedup']:>7}x")
+    print(f"{'='*60}\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Incremental request formatting benchmark")
+    parser.add_argument("--turns", type=int, nargs="+", default=[10, 100, 1000],
+                        help="Conversation lengths to measure (default: 10 100 1000)")
+    parser.add_argument("--repeats", type=int, default=3,
+                        help="Samples per measurement; the median is reported (default: 3)")
+    parser.add_argument("--json", action="store_true",
+                        help="Output machine-readable JSON")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.turns, repeats=args.repeats)
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print_report(results)
+
+
+if __name__ == "__main__":
+    main()
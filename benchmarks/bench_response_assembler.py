@@ -0,0 +1,191 @@
+"""Benchmark: proxy-boundary SSE response assembly on very long responses.
+
+Feeds N content_block_delta events through ResponseAssembler and
+OpenAiChatResponseAssembler and compares them with a buffered reference that
+keeps every event and grows strings with ``+=`` (the pre-streaming design).
+
+Usage:
+    uv run python benchmarks/bench_response_assembler.py                 # default 100k deltas
+    uv run python benchmarks/bench_response_assembler.py --deltas 20000
+    uv run python benchmarks/bench_response_assembler.py --json          # machine-readable output
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterable, Iterator
+
+from cc_dump.pipeline.response_assembler import (
+    OpenAiChatResponseAssembler,
+    ResponseAssembler,
+)
+
+_CHUNK_TEXTS = ["The ", "quick ", "brown ", "fox ", "jumps ", "over ", "the ", "lazy ", "dog. "]
+
+
+def iter_anthropic_events(n_deltas: int, *, tool_share: float = 0.25) -> Iterator[dict]:
+    """Text block followed by a tool_use block whose input streams as partial JSON.
+
+    Events are produced lazily, like dicts decoded off the wire, so peak memory
+    reflects what the assembler retains rather than the input list.
+    """
+    n_tool = int(n_deltas * tool_share)
+    n_tool = n_tool if n_tool >= 2 else 0
+    n_text = n_deltas - n_tool
+    yield {
+        "type": "message_start",
+        "message": {
+            "id": "msg_bench",
+            "model": "claude-sonnet-4-20250514",
+            "role": "assistant",
+            "usage": {"input_tokens": 1000, "output_tokens": 0},
+        },
+    }
+    yield {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}}
+    for i in range(n_text):
+        yield {
+            "type": "content_block_delta",
+            "index": 0,
+            "delta": {"type": "text_delta", "text": _CHUNK_TEXTS[i % len(_CHUNK_TEXTS)]},
+        }
+    yield {"type": "content_block_stop", "index": 0}
+    yield {
+        "type": "content_block_start",
+        "index": 1,
+        "content_block": {"type": "tool_use", "id": "toolu_bench", "name": "Write"},
+    }
+    json_parts = ['{"content": "', *(["x" * 8] * (n_tool - 2)), '"}'] if n_tool else []
+    for part in json_parts:
+        yield {
+            "type": "content_block_delta",
+            "index": 1,
+            "delta": {"type": "input_json_delta", "partial_json": part},
+        }
+    yield {"type": "content_block_stop", "index": 1}
+    yield {
+        "type": "message_delta",
+        "delta": {"stop_reason": "tool_use", "stop_sequence": None},
+        "usage": {"output_tokens": n_deltas},
+    }
+    yield {"type": "message_stop"}
+
+
+def iter_openai_chunks(n_deltas: int) -> Iterator[dict]:
+    for i in range(n_deltas):
+        yield {
+            "id": "chatcmpl-bench",
+            "model": "gpt-4o-mini",
+            "choices": [{"index": 0, "delta": {"content": _CHUNK_TEXTS[i % len(_CHUNK_TEXTS)]}}],
+        }
+    yield {
+        "id": "chatcmpl-bench",
+        "model": "gpt-4o-mini",
+        "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+    }
+
+
+class BufferedReferenceAssembler:
+    """Reference model of the buffered design: retain all events, concatenate with +=."""
+
+    def __init__(self) -> None:
+        self._events: list[dict] = []
+        self.result: dict | None = None
+
+    def on_event(self, event_type: str, event: dict) -> None:
+        self._events.append(event)
+
+    def on_done(self) -> None:
+        blocks: list[dict] = []
+        for event in self._events:
+            if event["type"] == "content_block_start":
+                block = dict(event["content_block"])
+                if block["type"] == "text":
+                    block["text"] = ""
+                else:
+                    block["_json"] = ""
+                blocks.append(block)
+            elif event["type"] == "content_block_delta":
+                delta = event["delta"]
+                if delta["type"] == "text_delta":
+                    blocks[-1]["text"] += delta["text"]
+                else:
+                    blocks[-1]["_json"] += delta["partial_json"]
+            elif event["type"] == "content_block_stop" and "_json" in blocks[-1]:
+                blocks[-1]["input"] = json.loads(blocks[-1].pop("_json") or "{}")
+        self.result = {"content": blocks}
+
+
+def _measure(assembler_factory, events: Iterable[dict]) -> dict:
+    assembler = assembler_factory()
+    tracemalloc.start()
+    start_ns = time.perf_counter_ns()
+    worst_event_ns = 0
+    for event in events:
+        event_start = time.perf_counter_ns()
+        assembler.on_event(event.get("type", ""), event)
+        worst_event_ns = max(worst_event_ns, time.perf_counter_ns() - event_start)
+    done_start = time.perf_counter_ns()
+    assembler.on_done()
+    end_ns = time.perf_counter_ns()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "wall_time_ms": round((end_ns - start_ns) / 1_000_000, 2),
+        "on_done_ms": round((end_ns - done_start) / 1_000_000, 2),
+        "max_event_us": round(worst_event_ns / 1000, 2),
+        "mem_peak_kb": round(peak / 1024, 1),
+        "has_result": assembler.result is not None,
+    }
+
+
+def run_benchmark(n_deltas: int) -> dict:
+    """Run every assembler variant over the same synthetic streams."""
+    return {
+        "n_deltas": n_deltas,
+        "variants": {
+            "anthropic_streaming": _measure(ResponseAssembler, iter_anthropic_events(n_deltas)),
+            "anthropic_buffered_reference": _measure(
+                BufferedReferenceAssembler, iter_anthropic_events(n_deltas)
+            ),
+            "openai_streaming": _measure(OpenAiChatResponseAssembler, iter_openai_chunks(n_deltas)),
+        },
+    }
+
+
+def print_report(results: dict) -> None:
+    print(f"\n{'='*60}")
+    print("  Response Assembler Benchmark")
+    print(f"{'='*60}")
+    print(f"  Deltas:     {results['n_deltas']}")
+    print()
+    for name, stats in results["variants"].items():
+        print(f"  [{name}]")
+        print(f"    wall={stats['wall_time_ms']:.1f}ms  "
+              f"on_done={stats['on_done_ms']:.1f}ms  "
+              f"max_event={stats['max_event_us']:.1f}us  "
+              f"peak={stats['mem_peak_kb']:.0f}KB")
+        print()
+    print(f"{'='*60}\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SSE response assembler benchmark")
+    parser.add_argument("--deltas", type=int, default=100_000,
+                        help="Number of delta events per response (default: 100000)")
+    parser.add_argument("--json", action="store_true",
+                        help="Output machine-readable JSON")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.deltas)
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print_report(results)
+
+
+if __name__ == "__main__":
+    main()
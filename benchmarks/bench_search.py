@@ -0,0 +1,145 @@
+"""Benchmark: conversation search latency as the session grows.
+
+Compares the full scan (the pattern runs over every block's text) with the
+trigram-narrowed search the search controller uses: the index is synced once
+up front, then each search after a new turn arrives only indexes that turn.
+
+Usage:
+    uv run python benchmarks/bench_search.py                    # 500, 5000 turns
+    uv run python benchmarks/bench_search.py --turns 1000
+    uv run python benchmarks/bench_search.py --json             # machine-readable output
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+
+from cc_dump.core.formatting import MessageBlock, TextContentBlock, ToolUseBlock
+from cc_dump.tui.search import (
+    SearchMode,
+    SearchTrigramIndex,
+    build_searchable_blocks,
+    compile_search_pattern,
+    find_all_matches,
+)
+
+_QUERIES = [
+    ("module_42.py", SearchMode.CASE_INSENSITIVE),
+    ("Off-By-One", SearchMode.CASE_INSENSITIVE),
+    ("no such text anywhere", SearchMode.CASE_INSENSITIVE),
+]
+
+
+@dataclass
+class _Turn:
+    blocks: list
+    is_streaming: bool = False
+    searchable_blocks: tuple = field(default=())
+
+    def __post_init__(self) -> None:
+        self.searchable_blocks = build_searchable_blocks(self.blocks)
+
+
+def build_turn(turn: int) -> _Turn:
+    """One request/response pair with a few KB of prose, code and tool output."""
+    prose = (
+        f"Please look at module_{turn}.py and fix the failing test. "
+        "The handler drops the last element of the batch when the input is empty. "
+    ) * 4
+    code = "\n".join(f"    value_{i} = compute(item_{i}, turn={turn})" for i in range(40))
+    return _Turn(blocks=[
+        MessageBlock(role="user", msg_index=0, children=[TextContentBlock(content=prose)]),
+        MessageBlock(role="assistant", msg_index=1, children=[
+            TextContentBlock(content=f"Reading module_{turn}.py now.\n\n```python\n{code}\n```"),
+            ToolUseBlock(name="Read", detail=f"/repo/src/module_{turn}.py"),
+            TextContentBlock(content=f"Fixed the off-by-one in module_{turn} and reran the suite."),
+        ]),
+    ])
+
+
+def _median_ms(fn, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def measure_session(turn_count: int, *, repeats: int = 3) -> dict:
+    turns = [build_turn(turn) for turn in range(turn_count)]
+    index = SearchTrigramIndex()
+    start = time.perf_counter()
+    index.sync(turns)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    queries = []
+    for query, modes in _QUERIES:
+        pattern = compile_search_pattern(query, modes)
+        scan_ms = _median_ms(lambda: find_all_matches(turns, pattern, text_cache={}), repeats)
+
+        def indexed_search():
+            index.sync(turns)
+            find_all_matches(turns, pattern, candidates=index.candidates(query, modes))
+
+        indexed_ms = _median_ms(indexed_search, repeats)
+        queries.append({
+            "query": query,
+            "matches": len(find_all_matches(turns, pattern)),
+            "scan_ms": round(scan_ms, 2),
+            "indexed_ms": round(indexed_ms, 2),
+        })
+
+    turns.append(build_turn(turn_count))
+    start = time.perf_counter()
+    index.sync(turns)
+    append_ms = (time.perf_counter() - start) * 1000
+    return {
+        "turns": turn_count,
+        "index_build_ms": round(build_ms, 2),
+        "index_append_turn_ms": round(append_ms, 3),
+        "queries": queries,
+    }
+
+
+def run_benchmark(turn_counts: list[int], *, repeats: int = 3) -> dict:
+    return {"results": [measure_session(count, repeats=repeats) for count in turn_counts]}
+
+
+def print_report(results: dict) -> None:
+    print(f"\n{'='*72}")
+    print("  Search Benchmark (per search)")
+    print(f"{'='*72}")
+    for row in results["results"]:
+        print(f"  {row['turns']} turns: index build {row['index_build_ms']:.1f} ms, "
+              f"+1 turn {row['index_append_turn_ms']:.2f} ms")
+        print(f"    {'query':<24} {'matches':>8} {'scan ms':>10} {'indexed ms':>11}")
+        for q in row["queries"]:
+            print(f"    {q['query']:<24} {q['matches']:>8} {q['scan_ms']:>10.2f} {q['indexed_ms']:>11.2f}")
+    print(f"{'='*72}\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Conversation search benchmark")
+    parser.add_argument("--turns", type=int, nargs="+", default=[500, 5000],
+                        help="Session sizes to measure (default: 500 5000)")
+    parser.add_argument("--repeats", type=int, default=3,
+                        help="Samples per measurement; the median is reported (default: 3)")
+    parser.add_argument("--json", action="store_true",
+                        help="Output machine-readable JSON")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.turns, repeats=args.repeats)
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print_report(results)
+
+
+if __name__ == "__main__":
+    main()
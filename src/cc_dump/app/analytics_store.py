@@ -11,7 +11,7 @@ for hot-reload preservation.
 import json
 import logging
 import hashlib
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import TypedDict
 
 from cc_dump.pipeline.event_types import (
@@ -117,6 +117,39 @@ class _RequestMeta:
     transport_retry_count: int = 0
 
 
+@dataclass
+class _UsageTotals:
+    """Running token and cost totals for one aggregation key."""
+
+    turns: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+    cost_usd: float = 0.0
+    cache_savings_usd: float = 0.0
+
+    def add(self, row: "DashboardTurnRow", cost_usd: float, cache_savings_usd: float) -> None:
+        self.turns += 1
+        self.input_tokens += row["input_tokens"]
+        self.output_tokens += row["output_tokens"]
+        self.cache_read_tokens += row["cache_read_tokens"]
+        self.cache_creation_tokens += row["cache_creation_tokens"]
+        self.cost_usd += cost_usd
+        self.cache_savings_usd += cache_savings_usd
+
+
+@dataclass
+class _ToolTotals:
+    """Running per-tool economics (see get_tool_economics)."""
+
+    calls: int = 0
+    input_tokens: int = 0
+    result_tokens: int = 0
+    cache_read: int = 0
+    norm_cost: float = 0.0
+
+
 class DashboardTurnRow(TypedDict):
     sequence_num: int
     model: str
@@ -334,6 +367,62 @@ def _is_interrupted_stop_reason(stop_reason: str) -> bool:
     return stop_reason in _INTERRUPTED_STOP_REASONS
 
 
+def _row_costs(row: DashboardTurnRow) -> tuple[float, float]:
+    """(cost_usd, cache_savings_usd) for one turn's usage."""
+    _, pricing = classify_model(row["model"])
+    cost = compute_session_cost(
+        row["input_tokens"],
+        row["output_tokens"],
+        row["cache_read_tokens"],
+        row["cache_creation_tokens"],
+        row["model"],
+    )
+    savings = row["cache_read_tokens"] * (pricing.base_input - pricing.cache_hit) / 1_000_000
+    return cost, savings
+
+
+def _timeline_row(row: DashboardTurnRow, prev_input_total: int) -> DashboardTimelineRow:
+    input_total = row["input_tokens"] + row["cache_read_tokens"]
+    cache_pct = (
+        (100.0 * row["cache_read_tokens"] / input_total)
+        if input_total > 0
+        else 0.0
+    )
+    return {
+        "sequence_num": row["sequence_num"],
+        "model": row["model"],
+        "input_tokens": row["input_tokens"],
+        "output_tokens": row["output_tokens"],
+        "cache_read_tokens": row["cache_read_tokens"],
+        "cache_creation_tokens": row["cache_creation_tokens"],
+        "input_total": input_total,
+        "cache_pct": cache_pct,
+        "delta_input": input_total - prev_input_total if prev_input_total > 0 else 0,
+    }
+
+
+def _model_row(model: str, totals: _UsageTotals) -> DashboardModelRow:
+    input_total = totals.input_tokens + totals.cache_read_tokens
+    return {
+        "model": model,
+        "model_label": format_model_short(model),
+        "turns": totals.turns,
+        "input_tokens": totals.input_tokens,
+        "output_tokens": totals.output_tokens,
+        "cache_read_tokens": totals.cache_read_tokens,
+        "cache_creation_tokens": totals.cache_creation_tokens,
+        "cost_usd": totals.cost_usd,
+        "input_total": input_total,
+        "total_tokens": input_total + totals.output_tokens,
+        "cache_pct": (
+            (100.0 * totals.cache_read_tokens / input_total)
+            if input_total > 0
+            else 0.0
+        ),
+        "token_share_pct": 0.0,
+    }
+
+
 def _prune_mapping(mapping: dict, *, limit: int) -> None:
     # [LAW:dataflow-not-control-flow] Pruning is an unconditional bounded-data transform.
     while len(mapping) > limit:
@@ -393,6 +482,72 @@ class AnalyticsStore:
         self._pending: dict[str, _PendingTurn] = {}
         self._request_meta: dict[str, _RequestMeta] = {}
         self._retry_ordinals: dict[str, int] = {}
+        self._reset_aggregates()
+
+    def _reset_aggregates(self) -> None:
+        """Running aggregates over self._turns, updated in O(1) per committed turn.
+
+        // [LAW:one-source-of-truth] Derived from self._turns only; restore_state
+        // rebuilds them from the restored turns instead of serializing them.
+        """
+        self._totals = _UsageTotals()
+        self._model_totals: dict[str, _UsageTotals] = {}
+        self._session_totals: dict[str, _UsageTotals] = {}
+        self._tool_totals: dict[str, _ToolTotals] = {}
+        self._tool_model_totals: dict[tuple[str, str], _ToolTotals] = {}
+        self._timeline: list[DashboardTimelineRow] = []
+
+    def _accumulate(self, turn: TurnRecord) -> None:
+        row: DashboardTurnRow = {
+            "sequence_num": len(self._timeline) + 1,
+            "model": turn.model or "",
+            "input_tokens": turn.input_tokens,
+            "output_tokens": turn.output_tokens,
+            "cache_read_tokens": turn.cache_read_tokens,
+            "cache_creation_tokens": turn.cache_creation_tokens,
+        }
+        prev_input_total = self._timeline[-1]["input_total"] if self._timeline else 0
+        self._timeline.append(_timeline_row(row, prev_input_total))
+
+        cost, savings = _row_costs(row)
+        self._totals.add(row, cost, savings)
+        self._model_totals.setdefault(row["model"], _UsageTotals()).add(row, cost, savings)
+        self._session_totals.setdefault(turn.session_id, _UsageTotals()).add(row, cost, savings)
+        self._accumulate_tools(turn)
+
+    def _accumulate_tools(self, turn: TurnRecord) -> None:
+        if not turn.tool_invocations:
+            return
+        # Compute proportional cache attribution
+        turn_tool_total = sum(inv.input_tokens for inv in turn.tool_invocations)
+        _, pricing = classify_model(turn.model)
+        for inv in turn.tool_invocations:
+            # Proportional cache contribution
+            if turn_tool_total > 0 and turn.cache_read_tokens > 0:
+                proportion = inv.input_tokens / turn_tool_total
+                cache_contrib = int(proportion * turn.cache_read_tokens)
+            else:
+                cache_contrib = 0
+
+            # Normalized cost
+            inv_norm_cost = inv.input_tokens * (
+                pricing.base_input / HAIKU_BASE_UNIT
+            ) + inv.result_tokens * (pricing.output / HAIKU_BASE_UNIT)
+
+            for agg in (
+                self._tool_totals.setdefault(inv.tool_name, _ToolTotals()),
+                self._tool_model_totals.setdefault((inv.tool_name, turn.model or ""), _ToolTotals()),
+            ):
+                agg.calls += 1
+                agg.input_tokens += inv.input_tokens
+                agg.result_tokens += inv.result_tokens
+                agg.cache_read += cache_contrib
+                agg.norm_cost += inv_norm_cost
+
+    def _rebuild_aggregates(self) -> None:
+        self._reset_aggregates()
+        for turn in self._turns:
+            self._accumulate(turn)
 
     @property
     def turn_count(self) -> int:
@@ -577,6 +732,7 @@ class AnalyticsStore:
             response_recv_ns=response_recv_ns,
         )
         self._turns.append(turn)
+        self._accumulate(turn)
         self._pending.pop(pending.request_id, None)
 
     # ─── Query methods (translated from db_queries.py SQL) ─────────────────
@@ -593,12 +749,11 @@ class AnalyticsStore:
             Dict with keys: input_tokens, output_tokens, cache_read_tokens,
             cache_creation_tokens
         """
-        # [LAW:dataflow-not-control-flow] Sum across all turns
         stats = {
-            "input_tokens": sum(t.input_tokens for t in self._turns),
-            "output_tokens": sum(t.output_tokens for t in self._turns),
-            "cache_read_tokens": sum(t.cache_read_tokens for t in self._turns),
-            "cache_creation_tokens": sum(t.cache_creation_tokens for t in self._turns),
+            "input_tokens": self._totals.input_tokens,
+            "output_tokens": self._totals.output_tokens,
+            "cache_read_tokens": self._totals.cache_read_tokens,
+            "cache_creation_tokens": self._totals.cache_creation_tokens,
         }
 
         # Merge current incomplete turn if provided
@@ -691,26 +846,36 @@ class AnalyticsStore:
             "records": records,
         }
 
-    def get_dashboard_snapshot(self, current_turn: dict | None = None) -> dict[str, object]:
+    def get_session_breakdown(self) -> dict[str, dict[str, object]]:
+        """Per-session running totals keyed by session_id ("" for unattributed turns)."""
+        return {
+            session_id: {
+                "turns": totals.turns,
+                "input_tokens": totals.input_tokens,
+                "output_tokens": totals.output_tokens,
+                "cache_read_tokens": totals.cache_read_tokens,
+                "cache_creation_tokens": totals.cache_creation_tokens,
+                "cost_usd": totals.cost_usd,
+            }
+            for session_id, totals in self._session_totals.items()
+        }
+
+    def get_dashboard_snapshot(
+        self,
+        current_turn: dict | None = None,
+        *,
+        timeline_limit: int | None = None,
+    ) -> dict[str, object]:
         """Build canonical analytics dashboard data from real API usage fields only.
 
+        Reads copy the running aggregates, so cost is independent of turn count
+        apart from the timeline; pass timeline_limit to keep only its newest rows.
+
         // [LAW:one-source-of-truth] Dashboard derives from TurnRecord token fields only.
         """
-        base_rows: list[DashboardTurnRow] = [
-            {
-                "sequence_num": t.sequence_num,
-                "model": t.model or "",
-                "input_tokens": t.input_tokens,
-                "output_tokens": t.output_tokens,
-                "cache_read_tokens": t.cache_read_tokens,
-                "cache_creation_tokens": t.cache_creation_tokens,
-            }
-            for t in self._turns
-        ]
-
         pending = current_turn if isinstance(current_turn, dict) else {}
         pending_row: DashboardTurnRow = {
-            "sequence_num": len(base_rows) + 1,
+            "sequence_num": len(self._timeline) + 1,
             "model": str(pending.get("model", "") or ""),
             "input_tokens": int(pending.get("input_tokens", 0) or 0),
             "output_tokens": int(pending.get("output_tokens", 0) or 0),
@@ -723,90 +888,29 @@ class AnalyticsStore:
             or pending_row["cache_read_tokens"] > 0
             or pending_row["cache_creation_tokens"] > 0
         )
-        rows: list[DashboardTurnRow] = base_rows + ([pending_row] if include_pending else [])
-
-        timeline_rows: list[DashboardTimelineRow] = []
-        prev_input_total = 0
-        for row in rows:
-            input_total = row["input_tokens"] + row["cache_read_tokens"]
-            cache_pct = (
-                (100.0 * row["cache_read_tokens"] / input_total)
-                if input_total > 0
-                else 0.0
-            )
-            delta_input = input_total - prev_input_total if prev_input_total > 0 else 0
-            prev_input_total = input_total
-            timeline_rows.append(
-                {
-                    "sequence_num": row["sequence_num"],
-                    "model": row["model"],
-                    "input_tokens": row["input_tokens"],
-                    "output_tokens": row["output_tokens"],
-                    "cache_read_tokens": row["cache_read_tokens"],
-                    "cache_creation_tokens": row["cache_creation_tokens"],
-                    "input_total": input_total,
-                    "cache_pct": cache_pct,
-                    "delta_input": delta_input,
-                }
-            )
 
-        model_agg: dict[str, DashboardModelRow] = {}
-        for row in rows:
-            model = row["model"]
-            if model not in model_agg:
-                model_agg[model] = {
-                    "model": model,
-                    "model_label": format_model_short(model),
-                    "turns": 0,
-                    "input_tokens": 0,
-                    "output_tokens": 0,
-                    "cache_read_tokens": 0,
-                    "cache_creation_tokens": 0,
-                    "cost_usd": 0.0,
-                    "input_total": 0,
-                    "total_tokens": 0,
-                    "cache_pct": 0.0,
-                    "token_share_pct": 0.0,
-                }
-            agg = model_agg[model]
-            agg["turns"] += 1
-            agg["input_tokens"] += row["input_tokens"]
-            agg["output_tokens"] += row["output_tokens"]
-            agg["cache_read_tokens"] += row["cache_read_tokens"]
-            agg["cache_creation_tokens"] += row["cache_creation_tokens"]
-            agg["cost_usd"] += compute_session_cost(
-                row["input_tokens"],
-                row["output_tokens"],
-                row["cache_read_tokens"],
-                row["cache_creation_tokens"],
-                model,
-            )
+        totals = self._totals
+        model_totals = self._model_totals
+        timeline_tail: list[DashboardTimelineRow] = []
+        if include_pending:
+            # The in-flight turn is folded into copies; stored aggregates stay committed-only.
+            cost, savings = _row_costs(pending_row)
+            totals = replace(totals)
+            totals.add(pending_row, cost, savings)
+            model_totals = dict(model_totals)
+            model_agg = replace(model_totals.get(pending_row["model"], _UsageTotals()))
+            model_agg.add(pending_row, cost, savings)
+            model_totals[pending_row["model"]] = model_agg
+            prev_input_total = self._timeline[-1]["input_total"] if self._timeline else 0
+            timeline_tail.append(_timeline_row(pending_row, prev_input_total))
+
+        if timeline_limit is None:
+            timeline_rows = self._timeline + timeline_tail
+        else:
+            limit = max(0, timeline_limit)
+            timeline_rows = (self._timeline[-limit:] + timeline_tail)[-limit:] if limit else []
 
-        model_rows: list[DashboardModelRow] = []
-        for model, agg in model_agg.items():
-            input_total = agg["input_tokens"] + agg["cache_read_tokens"]
-            total_tokens = input_total + agg["output_tokens"]
-            cache_pct = (
-                (100.0 * agg["cache_read_tokens"] / input_total)
-                if input_total > 0
-                else 0.0
-            )
-            model_rows.append(
-                {
-                    "model": model,
-                    "model_label": format_model_short(model),
-                    "turns": agg["turns"],
-                    "input_tokens": agg["input_tokens"],
-                    "output_tokens": agg["output_tokens"],
-                    "cache_read_tokens": agg["cache_read_tokens"],
-                    "cache_creation_tokens": agg["cache_creation_tokens"],
-                    "cost_usd": agg["cost_usd"],
-                    "input_total": input_total,
-                    "total_tokens": total_tokens,
-                    "cache_pct": cache_pct,
-                    "token_share_pct": 0.0,
-                }
-            )
+        model_rows = [_model_row(model, agg) for model, agg in model_totals.items()]
         model_rows.sort(key=lambda mrow: (-mrow["total_tokens"], mrow["model_label"]))
 
         summary_total_tokens = sum(mrow["total_tokens"] for mrow in model_rows)
@@ -817,19 +921,24 @@ class AnalyticsStore:
                 else 0.0
             )
 
+        latest_model = (
+            pending_row["model"] if include_pending
+            else self._timeline[-1]["model"] if self._timeline
+            else None
+        )
         summary: DashboardSummary = {
-            "turn_count": len(rows),
-            "input_tokens": sum(row["input_tokens"] for row in rows),
-            "output_tokens": sum(row["output_tokens"] for row in rows),
-            "cache_read_tokens": sum(row["cache_read_tokens"] for row in rows),
-            "cache_creation_tokens": sum(row["cache_creation_tokens"] for row in rows),
+            "turn_count": totals.turns,
+            "input_tokens": totals.input_tokens,
+            "output_tokens": totals.output_tokens,
+            "cache_read_tokens": totals.cache_read_tokens,
+            "cache_creation_tokens": totals.cache_creation_tokens,
             "cost_usd": sum(mrow["cost_usd"] for mrow in model_rows),
             "input_total": 0,
             "total_tokens": 0,
             "cache_pct": 0.0,
-            "cache_savings_usd": 0.0,
+            "cache_savings_usd": totals.cache_savings_usd,
             "active_model_count": len(model_rows),
-            "latest_model_label": format_model_short(rows[-1]["model"]) if rows else "Unknown",
+            "latest_model_label": format_model_short(latest_model) if latest_model is not None else "Unknown",
         }
         summary["input_total"] = summary["input_tokens"] + summary["cache_read_tokens"]
         summary["total_tokens"] = summary["input_total"] + summary["output_tokens"]
@@ -838,13 +947,6 @@ class AnalyticsStore:
             if summary["input_total"] > 0
             else 0.0
         )
-        cache_savings = 0.0
-        for row in rows:
-            _, pricing = classify_model(row["model"])
-            cache_savings += (
-                row["cache_read_tokens"] * (pricing.base_input - pricing.cache_hit) / 1_000_000
-            )
-        summary["cache_savings_usd"] = cache_savings
 
         return {
             "summary": summary,
@@ -866,100 +968,37 @@ class AnalyticsStore:
             - Normalized cost using model pricing
             - model field: None for aggregate mode, model string for breakdown mode
         """
-        if not self._turns:
-            return []
-
-        # Aggregate by (tool_name, model) or just tool_name
-        if group_by_model:
-            by_key: dict[tuple[str, str], dict] = {}
-        else:
-            by_name: dict[str, dict] = {}
-
-        for turn in self._turns:
-            if not turn.tool_invocations:
-                continue
-
-            # Compute proportional cache attribution
-            turn_tool_total = sum(inv.input_tokens for inv in turn.tool_invocations)
-
-            for inv in turn.tool_invocations:
-                # Proportional cache contribution
-                if turn_tool_total > 0 and turn.cache_read_tokens > 0:
-                    proportion = inv.input_tokens / turn_tool_total
-                    cache_contrib = int(proportion * turn.cache_read_tokens)
-                else:
-                    cache_contrib = 0
-
-                # Normalized cost
-                _, pricing = classify_model(turn.model)
-                inv_norm_cost = inv.input_tokens * (
-                    pricing.base_input / HAIKU_BASE_UNIT
-                ) + inv.result_tokens * (pricing.output / HAIKU_BASE_UNIT)
-
-                if group_by_model:
-                    key = (inv.tool_name, turn.model or "")
-                    if key not in by_key:
-                        by_key[key] = {
-                            "calls": 0,
-                            "input_tokens": 0,
-                            "result_tokens": 0,
-                            "cache_read": 0,
-                            "norm_cost": 0.0,
-                        }
-                    agg = by_key[key]
-                else:
-                    name = inv.tool_name
-                    if name not in by_name:
-                        by_name[name] = {
-                            "calls": 0,
-                            "input_tokens": 0,
-                            "result_tokens": 0,
-                            "cache_read": 0,
-                            "norm_cost": 0.0,
-                        }
-                    agg = by_name[name]
-
-                agg["calls"] += 1
-                agg["input_tokens"] += inv.input_tokens
-                agg["result_tokens"] += inv.result_tokens
-                agg["cache_read"] += cache_contrib
-                agg["norm_cost"] += inv_norm_cost
-
         # Build result list sorted by norm_cost descending
-        result = []
-
         if group_by_model:
-            for (name, model), agg in sorted(
-                by_key.items(), key=lambda x: (-x[1]["norm_cost"], x[0][0], x[0][1])
-            ):
-                result.append(
-                    ToolEconomicsRow(
-                        name=name,
-                        calls=agg["calls"],
-                        input_tokens=agg["input_tokens"],
-                        result_tokens=agg["result_tokens"],
-                        cache_read_tokens=agg["cache_read"],
-                        norm_cost=agg["norm_cost"],
-                        model=model if model else None,
-                    )
+            return [
+                ToolEconomicsRow(
+                    name=name,
+                    calls=agg.calls,
+                    input_tokens=agg.input_tokens,
+                    result_tokens=agg.result_tokens,
+                    cache_read_tokens=agg.cache_read,
+                    norm_cost=agg.norm_cost,
+                    model=model if model else None,
                 )
-        else:
-            for name, agg in sorted(
-                by_name.items(), key=lambda x: x[1]["norm_cost"], reverse=True
-            ):
-                result.append(
-                    ToolEconomicsRow(
-                        name=name,
-                        calls=agg["calls"],
-                        input_tokens=agg["input_tokens"],
-                        result_tokens=agg["result_tokens"],
-                        cache_read_tokens=agg["cache_read"],
-                        norm_cost=agg["norm_cost"],
-                        model=None,
-                    )
+                for (name, model), agg in sorted(
+                    self._tool_model_totals.items(),
+                    key=lambda x: (-x[1].norm_cost, x[0][0], x[0][1]),
                 )
-
-        return result
+            ]
+        return [
+            ToolEconomicsRow(
+                name=name,
+                calls=agg.calls,
+                input_tokens=agg.input_tokens,
+                result_tokens=agg.result_tokens,
+                cache_read_tokens=agg.cache_read,
+                norm_cost=agg.norm_cost,
+                model=None,
+            )
+            for name, agg in sorted(
+                self._tool_totals.items(), key=lambda x: x[1].norm_cost, reverse=True
+            )
+        ]
 
     # ─── State management for hot-reload ───────────────────────────────────
 
@@ -1159,6 +1198,7 @@ class AnalyticsStore:
         """Restore state from a previous instance."""
         # [LAW:dataflow-not-control-flow] Restore every slice from snapshot in a fixed sequence.
         self._turns = self._restore_turns(state.get("turns", []))
+        self._rebuild_aggregates()
         self._seq = state.get("seq", 0)
         self._pending = self._restore_pending(state.get("pending", []))
         self._request_meta = self._restore_request_meta(state.get("request_meta", []))
@@ -13,6 +13,45 @@ from collections.abc import Callable
 import cc_dump.core.formatting
 
 
+class StreamDeltaBuffer:
+    """Append-only rope of one stream's delta text.
+
+    append() is O(1): chunks are kept as they arrive and only joined on
+    request. version counts appends, so since(version) is exactly the text a
+    reader that saw that version has not seen yet.
+    """
+
+    __slots__ = ("_chunks", "_length")
+
+    def __init__(self, chunks: list[str] | None = None):
+        self._chunks: list[str] = list(chunks or [])
+        self._length = sum(len(chunk) for chunk in self._chunks)
+
+    def append(self, text: str) -> None:
+        self._chunks.append(text)
+        self._length += len(text)
+
+    @property
+    def version(self) -> int:
+        return len(self._chunks)
+
+    @property
+    def length(self) -> int:
+        return self._length
+
+    @property
+    def chunks(self) -> list[str]:
+        return self._chunks
+
+    def since(self, version: int) -> str:
+        """Text appended after version (all of it for version <= 0)."""
+        return "".join(self._chunks[max(0, version):])
+
+    def text(self) -> str:
+        """The whole text, joined now (O(length))."""
+        return "".join(self._chunks)
+
+
 class DomainStore:
     """Append-only domain data. Single owner of FormattedBlock trees.
 
@@ -30,9 +69,7 @@ class DomainStore:
         self._max_completed_turns = max(0, max_completed_turns)
         self._completed: list[list] = []  # sealed turn block lists
         self._stream_turns: dict[str, list] = {}  # active stream block lists
-        self._stream_delta_buffers: dict[str, list[str]] = {}  # text delta accumulators
-        self._stream_delta_text: dict[str, str] = {}  # incremental joined text
-        self._stream_delta_versions: dict[str, int] = {}  # incremented per appended delta
+        self._stream_deltas: dict[str, StreamDeltaBuffer] = {}  # streamed text per stream
         self._stream_meta: dict[str, dict] = {}
         self._stream_order: list[str] = []
         self._focused_stream_id: str | None = None
@@ -95,9 +132,7 @@ class DomainStore:
             return
 
         self._stream_turns[request_id] = []
-        self._stream_delta_buffers[request_id] = []
-        self._stream_delta_text[request_id] = ""
-        self._stream_delta_versions[request_id] = 0
+        self._stream_deltas[request_id] = StreamDeltaBuffer()
         self._stream_meta[request_id] = dict(meta or {})
         self._stream_order.append(request_id)
 
@@ -116,10 +151,9 @@ class DomainStore:
 
         # // [LAW:dataflow-not-control-flow] Block declares streaming behavior via property
         if block.show_during_streaming:
-            self._stream_delta_buffers[request_id].append(block.content)
-            # // [LAW:one-source-of-truth] Incremental text buffer avoids repeated joins in render path.
-            self._stream_delta_text[request_id] = self._stream_delta_text.get(request_id, "") + block.content
-            self._stream_delta_versions[request_id] = self._stream_delta_versions.get(request_id, 0) + 1
+            # // [LAW:one-source-of-truth] The rope is the only copy of streamed text;
+            # readers take what is new since their version instead of the whole string.
+            self._stream_deltas[request_id].append(block.content)
 
         if self.on_stream_block is not None:
             self.on_stream_block(request_id, block)
@@ -242,9 +276,7 @@ class DomainStore:
         """
         was_focused = request_id == self._focused_stream_id
         self._stream_turns.pop(request_id, None)
-        self._stream_delta_buffers.pop(request_id, None)
-        self._stream_delta_text.pop(request_id, None)
-        self._stream_delta_versions.pop(request_id, None)
+        self._stream_deltas.pop(request_id, None)
         self._stream_meta.pop(request_id, None)
         self._stream_order = [
             rid for rid in self._stream_order if rid != request_id
@@ -299,16 +331,26 @@ class DomainStore:
         return list(self._session_boundaries)
 
     def get_delta_text(self, request_id: str) -> list[str]:
-        """Return the accumulated delta text buffer for a stream."""
-        return self._stream_delta_buffers.get(request_id, [])
+        """Return the accumulated delta text chunks for a stream."""
+        return self._delta_buffer(request_id).chunks
 
     def get_delta_preview_text(self, request_id: str) -> str:
-        """Return concatenated delta text for streaming preview rendering."""
-        return self._stream_delta_text.get(request_id, "")
+        """Return the whole delta text of a stream (joined on each call)."""
+        return self._delta_buffer(request_id).text()
+
+    def get_delta_text_since(self, request_id: str, version: int) -> str:
+        """Return the delta text appended after version, for incremental preview rendering."""
+        return self._delta_buffer(request_id).since(version)
 
     def get_delta_version(self, request_id: str) -> int:
         """Return monotonic delta version for change detection."""
-        return self._stream_delta_versions.get(request_id, 0)
+        return self._delta_buffer(request_id).version
+
+    def _delta_buffer(self, request_id: str) -> StreamDeltaBuffer:
+        """The stream's delta rope; a fresh empty one for unknown streams."""
+        # // [LAW:single-enforcer] The only place that handles a missing stream buffer.
+        buffer = self._stream_deltas.get(request_id)
+        return buffer if buffer is not None else StreamDeltaBuffer()
 
     def get_stream_blocks(self, request_id: str) -> list:
         """Return the block list for an active stream."""
@@ -350,7 +392,7 @@ class DomainStore:
                 continue
             active_streams[rid] = {
                 "blocks": self._stream_turns[rid],
-                "delta_buffers": list(self._stream_delta_buffers.get(rid, [])),
+                "delta_buffers": list(self.get_delta_text(rid)),
                 "meta": dict(self._stream_meta.get(rid, {})),
             }
 
@@ -366,9 +408,7 @@ class DomainStore:
         """Restore state from serialized dict."""
         self._completed = list(state.get("completed", []))
         self._stream_turns.clear()
-        self._stream_delta_buffers.clear()
-        self._stream_delta_text.clear()
-        self._stream_delta_versions.clear()
+        self._stream_deltas.clear()
         self._stream_meta.clear()
         self._stream_order.clear()
         self._focused_stream_id = None
@@ -381,11 +421,7 @@ class DomainStore:
                     continue
                 rid = str(request_id)
                 self._stream_turns[rid] = payload.get("blocks", [])
-                delta_buffers = list(payload.get("delta_buffers", []))
-                self._stream_delta_buffers[rid] = delta_buffers
-                # // [LAW:one-source-of-truth] Derive concatenated text/version from buffer payload once.
-                self._stream_delta_text[rid] = "".join(delta_buffers)
-                self._stream_delta_versions[rid] = len(delta_buffers)
+                self._stream_deltas[rid] = StreamDeltaBuffer(payload.get("delta_buffers", []))
                 self._stream_meta[rid] = dict(payload.get("meta", {}))
 
             order = state.get("stream_order", [])
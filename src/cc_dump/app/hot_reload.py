@@ -67,6 +67,9 @@ _RELOAD_ORDER = [
 _EXCLUDED_FILES = {
     "pipeline/proxy.py",  # stable boundary, never reload
     "pipeline/forward_proxy_tls.py",  # stable boundary, holds crypto state
+    "pipeline/upstream_pool.py",  # stable boundary, holds live upstream sockets
+    "pipeline/proxy_server.py",  # stable boundary, holds live client sockets and workers
+    "pipeline/proxy_async.py",  # stable boundary, holds the proxy event loop and its sockets
     "cli.py",  # entry point, not reloadable at runtime
     "hot_reload.py",  # this file
     "pipeline/event_types.py",  # stable type definitions, never reload
@@ -87,7 +90,7 @@ _EXCLUDED_MODULES = {
 # Subset of _EXCLUDED_FILES ∪ _EXCLUDED_MODULES, minus boilerplate nobody touches.
 _STALENESS_WATCHLIST = {
     # from _EXCLUDED_FILES
-    "pipeline/proxy.py", "pipeline/forward_proxy_tls.py", "cli.py", "pipeline/event_types.py", "pipeline/response_assembler.py",
+    "pipeline/proxy.py", "pipeline/forward_proxy_tls.py", "pipeline/upstream_pool.py", "pipeline/proxy_server.py", "pipeline/proxy_async.py", "cli.py", "pipeline/event_types.py", "pipeline/response_assembler.py",
     "app/tmux_controller.py", "io/stderr_tee.py",
     # from _EXCLUDED_MODULES
     "tui/app.py", "tui/hot_reload_controller.py",
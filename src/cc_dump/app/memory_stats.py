@@ -5,6 +5,19 @@
 
 import tracemalloc
 
+# Counters reported by ConversationView.strip_budget_stats().
+_STRIP_STAT_KEYS = (
+    "strip_resident_bytes",
+    "strip_budget_bytes",
+    "strip_evictions",
+    "strip_rerenders",
+    "shared_strip_cache_entries",
+    "shared_strip_cache_bytes",
+    "shared_strip_cache_hits",
+    "shared_strip_cache_misses",
+    "shared_strip_cache_hit_rate_pct",
+)
+
 
 def capture_snapshot(app) -> dict[str, int]:
     """Capture coarse-grained memory-related counters from app/store state."""
@@ -46,7 +59,28 @@ def capture_snapshot(app) -> dict[str, int]:
         "line_cache_entries": line_cache_entries,
         "line_cache_index_keys": line_cache_index_keys,
         "block_cache_entries": block_cache_entries,
+        **_capture_strips(conv),
+        **_capture_router(app),
         "python_alloc_current_bytes": int(current_bytes),
         "python_alloc_peak_bytes": int(peak_bytes),
         "python_alloc_tracing": 1 if tracing else 0,
     }
+
+
+def _capture_strips(conv) -> dict[str, int]:
+    """Strip budget and shared strip cache counters (zeros without a conversation view)."""
+    stats_fn = getattr(conv, "strip_budget_stats", None)
+    stats = stats_fn() if callable(stats_fn) else {}
+    return {key: int(stats.get(key, 0)) for key in _STRIP_STAT_KEYS}
+
+
+def _capture_router(app) -> dict[str, int]:
+    """Event router channel counters summed over subscribers (zeros in serial mode)."""
+    stats_fn = getattr(getattr(app, "_router", None), "stats", None)
+    rows = stats_fn().values() if callable(stats_fn) else ()
+    return {
+        "router_queued_events": sum(row["queued"] for row in rows),
+        "router_dropped_events": sum(row["dropped"] for row in rows),
+        "router_coalesced_events": sum(row["coalesced"] for row in rows),
+        "router_max_lag_ms": max((row["max_lag_ms"] for row in rows), default=0),
+    }
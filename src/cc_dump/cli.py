@@ -2,7 +2,6 @@
 
 import argparse
 import hashlib
-import http.server
 import logging
 import os
 import queue
@@ -14,8 +13,17 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
-from cc_dump.pipeline.proxy import ProxyHandler, make_handler_class
-from cc_dump.pipeline.router import EventRouter, QueueSubscriber, DirectSubscriber
+from cc_dump.pipeline.proxy import DEFAULT_RESPONSE_TEE_MAX_BYTES, ProxyHandler, make_handler_class
+from cc_dump.pipeline.upstream_pool import UpstreamConnectionPool
+import cc_dump.pipeline.proxy_async
+import cc_dump.pipeline.proxy_server
+from cc_dump.pipeline.router import (
+    OVERFLOW_COALESCE,
+    OVERFLOW_DROP_PROGRESS,
+    DirectSubscriber,
+    EventRouter,
+    QueueSubscriber,
+)
 from cc_dump.app.analytics_store import AnalyticsStore
 import cc_dump.io.stderr_tee
 import cc_dump.core.palette
@@ -40,6 +48,16 @@ from cc_dump.tui.app import CcDumpApp
 
 logger = logging.getLogger(__name__)
 
+# Bound on events waiting for the TUI; progress deltas coalesce before it fills.
+DISPLAY_QUEUE_SIZE = 8192
+
+# Source-side window for merging live text deltas: about one frame at 60 Hz.
+DEFAULT_PROGRESS_COALESCE_MS = 16.0
+
+PROXY_ENGINE_THREADED = "threaded"
+PROXY_ENGINE_ASYNCIO = "asyncio"
+PROXY_ENGINES = (PROXY_ENGINE_THREADED, PROXY_ENGINE_ASYNCIO)
+
 
 def _detect_run_subcommand(
     argv: list[str],
@@ -121,7 +139,7 @@ class ProviderProxyBinding:
     """
 
     spec: cc_dump.providers.ProviderSpec
-    server: http.server.ThreadingHTTPServer
+    server: cc_dump.pipeline.proxy_server.ProxyHTTPServer | cc_dump.pipeline.proxy_async.AsyncProxyServer
     handler_class: type[ProxyHandler]
     port: int
     endpoint: cc_dump.providers.ProviderEndpoint
@@ -137,6 +155,19 @@ class ProxyRuntime:
     bindings: tuple[ProviderProxyBinding, ...]
     provider_endpoints: cc_dump.providers.ProviderEndpointMap
     provider_states: dict[str, "ProviderRuntimeState"]
+    upstream_pool: UpstreamConnectionPool
+    async_runtime: cc_dump.pipeline.proxy_async.AsyncProxyRuntime | None = None
+
+    def servers(
+        self,
+    ) -> tuple[cc_dump.pipeline.proxy_server.ProxyHTTPServer | cc_dump.pipeline.proxy_async.AsyncProxyServer, ...]:
+        return tuple(binding.server for binding in self.bindings)
+
+    def close(self) -> None:
+        """Release upstream connections and stop the asyncio engine, if any."""
+        self.upstream_pool.close()
+        if self.async_runtime is not None:
+            self.async_runtime.close()
 
 
 ProviderRuntimeState = cc_dump.core.formatting_impl.ProviderRuntimeState
@@ -167,7 +198,25 @@ def _create_forward_proxy_ca(
         return None
     from cc_dump.pipeline.forward_proxy_tls import ForwardProxyCertificateAuthority
     ca_dir = Path(args.forward_proxy_ca_dir) if args.forward_proxy_ca_dir else None
-    return ForwardProxyCertificateAuthority(ca_dir=ca_dir)
+    ca = ForwardProxyCertificateAuthority(ca_dir=ca_dir, leaf_key_type=args.forward_proxy_leaf_key)
+    # Intercepted hosts get their leaf contexts ready before the first CONNECT.
+    ca.prewarm(_forward_proxy_prewarm_hosts(args, active_specs))
+    return ca
+
+
+def _forward_proxy_prewarm_hosts(
+    args: argparse.Namespace,
+    active_specs: tuple[cc_dump.providers.ProviderSpec, ...],
+) -> list[str]:
+    """Forward-proxy provider hosts plus the --forward-proxy-prewarm list."""
+    hosts = [
+        host
+        for spec in active_specs
+        if spec.proxy_type == "forward"
+        for host in spec.forward_proxy_hosts
+    ]
+    hosts.extend(host.strip() for host in args.forward_proxy_prewarm.split(",") if host.strip())
+    return hosts
 
 
 def _provider_bind_port(
@@ -187,21 +236,71 @@ def _provider_target(
     return raw_target.rstrip("/") if spec.proxy_type == "reverse" else ""
 
 
-def _start_proxy_server(host, port, handler_class):
+def _start_proxy_server(
+    host,
+    port,
+    handler_class,
+    *,
+    workers: int = 0,
+    backlog: int = cc_dump.pipeline.proxy_server.DEFAULT_BACKLOG,
+    idle_timeout_s: float | None = cc_dump.pipeline.proxy_server.DEFAULT_IDLE_TIMEOUT_S,
+    async_runtime: cc_dump.pipeline.proxy_async.AsyncProxyRuntime | None = None,
+):
     """Create and start an HTTP proxy server. Returns (server, actual_port, thread)."""
-    srv = http.server.ThreadingHTTPServer((host, port), handler_class)
+    srv = _create_proxy_server(
+        (host, port),
+        handler_class,
+        workers=workers,
+        backlog=backlog,
+        idle_timeout_s=idle_timeout_s,
+        async_runtime=async_runtime,
+    )
     ap = srv.server_address[1]
     t = threading.Thread(target=srv.serve_forever, daemon=True)
     t.start()
     return srv, ap, t
 
 
+def _create_proxy_server(
+    address: tuple[str, int],
+    handler_class,
+    *,
+    workers: int,
+    backlog: int,
+    idle_timeout_s: float | None,
+    async_runtime: cc_dump.pipeline.proxy_async.AsyncProxyRuntime | None,
+) -> cc_dump.pipeline.proxy_server.ProxyHTTPServer | cc_dump.pipeline.proxy_async.AsyncProxyServer:
+    """Proxy server for the selected engine.
+
+    With async_runtime the server runs on that runtime's event loop (the
+    asyncio engine; workers is ignored). Otherwise workers=0 serves each
+    connection on its own thread and workers>0 uses a bounded pool.
+    """
+    if async_runtime is not None:
+        return cc_dump.pipeline.proxy_async.AsyncProxyServer(
+            address,
+            handler_class,
+            runtime=async_runtime,
+            backlog=backlog,
+            idle_timeout_s=idle_timeout_s,
+        )
+    return cc_dump.pipeline.proxy_server.ProxyHTTPServer(
+        address,
+        handler_class,
+        workers=workers,
+        backlog=backlog,
+        idle_timeout_s=idle_timeout_s,
+    )
+
+
 def _start_provider_binding(
     *,
     args: argparse.Namespace,
     spec: cc_dump.providers.ProviderSpec,
     event_q: queue.Queue[PipelineEvent],
     forward_proxy_ca,
+    upstream_pool: UpstreamConnectionPool,
+    async_runtime: cc_dump.pipeline.proxy_async.AsyncProxyRuntime | None,
 ) -> ProviderProxyBinding:
     provider_target = _provider_target(args, spec)
     provider_ca = forward_proxy_ca if spec.proxy_type == "forward" else None
@@ -210,11 +309,18 @@ def _start_provider_binding(
         target_host=provider_target if spec.proxy_type == "reverse" else None,
         event_queue=event_q,
         forward_proxy_ca=provider_ca,
+        upstream_pool=upstream_pool,
+        progress_coalesce_ms=args.progress_coalesce_ms,
+        response_tee_max_bytes=int(args.response_capture_max_mb * 1024 * 1024),
     )
     server, port, _thread = _start_proxy_server(
         args.host,
         _provider_bind_port(args, spec),
         handler,
+        workers=args.proxy_workers,
+        backlog=args.proxy_backlog,
+        idle_timeout_s=args.proxy_idle_timeout,
+        async_runtime=async_runtime,
     )
     endpoint = cc_dump.providers.build_provider_endpoint(
         spec.key,
@@ -234,6 +340,13 @@ def _start_provider_binding(
     )
 
 
+def _create_async_runtime(args: argparse.Namespace) -> cc_dump.pipeline.proxy_async.AsyncProxyRuntime | None:
+    """The asyncio engine runs every provider's server on one loop with its own pool."""
+    if args.proxy_engine != PROXY_ENGINE_ASYNCIO:
+        return None
+    return cc_dump.pipeline.proxy_async.AsyncProxyRuntime()
+
+
 def _build_proxy_runtime(
     *,
     args: argparse.Namespace,
@@ -242,6 +355,9 @@ def _build_proxy_runtime(
 ) -> ProxyRuntime:
     active_specs = _active_provider_specs(args, default_provider_spec)
     forward_proxy_ca = _create_forward_proxy_ca(args, active_specs)
+    # [LAW:one-source-of-truth] One keep-alive pool (and SSL context) serves every provider.
+    upstream_pool = UpstreamConnectionPool()
+    async_runtime = _create_async_runtime(args)
     # [LAW:dataflow-not-control-flow] Binding order is fixed; variability lives in active_specs.
     bindings = tuple(
         _start_provider_binding(
@@ -249,6 +365,8 @@ def _build_proxy_runtime(
             spec=spec,
             event_q=event_q,
             forward_proxy_ca=forward_proxy_ca,
+            upstream_pool=upstream_pool,
+            async_runtime=async_runtime,
         )
         for spec in active_specs
     )
@@ -256,6 +374,8 @@ def _build_proxy_runtime(
         bindings=bindings,
         provider_endpoints={binding.spec.key: binding.endpoint for binding in bindings},
         provider_states={binding.spec.key: _new_provider_state() for binding in bindings},
+        upstream_pool=upstream_pool,
+        async_runtime=async_runtime,
     )
 
 
@@ -336,6 +456,24 @@ def _build_cli_parser(
     parser.add_argument(
         "--no-record", action="store_true", help="Disable HAR recording"
     )
+    parser.add_argument(
+        "--record-format",
+        choices=("har", "dedup"),
+        default="har",
+        help=(
+            "Recording format: standard HAR, or 'dedup' to store each message once "
+            "and reference it from later turns (default: har)"
+        ),
+    )
+    parser.add_argument(
+        "--record-fsync",
+        choices=cc_dump.pipeline.har_recorder.FSYNC_POLICIES,
+        default=cc_dump.pipeline.har_recorder.FSYNC_NEVER,
+        help=(
+            "When recordings are fsynced: 'never' (leave it to the OS), 'group' (after every "
+            "batch of entries the writer appends) or 'close' (once at shutdown) (default: never)"
+        ),
+    )
     parser.add_argument(
         "--replay",
         type=str,
@@ -376,12 +514,87 @@ def _build_cli_parser(
         default=False,
         help="Preview recording cleanup without deleting files.",
     )
+    parser.add_argument(
+        "--expand-recording",
+        nargs=2,
+        metavar=("SRC", "DST"),
+        default=None,
+        help="Write a standard HAR copy of a (deduplicated) recording and exit.",
+    )
+    parser.add_argument(
+        "--progress-coalesce-ms",
+        type=float,
+        default=DEFAULT_PROGRESS_COALESCE_MS,
+        help=(
+            "Merge consecutive streaming text deltas within this window into one "
+            f"live-progress event; 0 disables (default: {DEFAULT_PROGRESS_COALESCE_MS:g})"
+        ),
+    )
+    parser.add_argument(
+        "--response-capture-max-mb",
+        type=float,
+        default=DEFAULT_RESPONSE_TEE_MAX_BYTES / (1024 * 1024),
+        help=(
+            "Non-streaming response bodies are relayed to the client as they arrive; keep a copy "
+            "of at most this many MB for the TUI and recording (default: "
+            f"{DEFAULT_RESPONSE_TEE_MAX_BYTES // (1024 * 1024)})"
+        ),
+    )
+    parser.add_argument(
+        "--proxy-engine",
+        choices=PROXY_ENGINES,
+        default=PROXY_ENGINE_THREADED,
+        help=(
+            "Proxy data plane: 'threaded' (http.server, a thread per connection or --proxy-workers) "
+            "or 'asyncio' (one event loop for all connections) (default: threaded)"
+        ),
+    )
+    parser.add_argument(
+        "--proxy-workers",
+        type=int,
+        default=0,
+        help=(
+            "Serve client connections on a fixed pool of this many threads, queueing the rest; "
+            "0 uses one thread per connection (default: 0)"
+        ),
+    )
+    parser.add_argument(
+        "--proxy-backlog",
+        type=int,
+        default=cc_dump.pipeline.proxy_server.DEFAULT_BACKLOG,
+        help=f"Listen backlog for proxy sockets (default: {cc_dump.pipeline.proxy_server.DEFAULT_BACKLOG})",
+    )
+    parser.add_argument(
+        "--proxy-idle-timeout",
+        type=float,
+        default=cc_dump.pipeline.proxy_server.DEFAULT_IDLE_TIMEOUT_S,
+        help=(
+            "Close client connections (keep-alive and CONNECT tunnels) idle this many seconds; "
+            f"0 disables (default: {cc_dump.pipeline.proxy_server.DEFAULT_IDLE_TIMEOUT_S:g})"
+        ),
+    )
     parser.add_argument(
         "--forward-proxy-ca-dir",
         type=str,
         default=None,
         help="Directory for forward proxy CA key/cert (default: ~/.cc-dump/forward-proxy-ca/)",
     )
+    parser.add_argument(
+        "--forward-proxy-leaf-key",
+        choices=("rsa", "ecdsa"),
+        default="rsa",
+        help="Key type for intercepted hosts' certificates; ecdsa (P-256) is much faster to generate (default: rsa)",
+    )
+    parser.add_argument(
+        "--forward-proxy-prewarm",
+        type=str,
+        default="",
+        metavar="HOSTS",
+        help=(
+            "Comma-separated extra hosts whose certificates are prepared in the background "
+            "at startup (forward-proxy provider hosts are always prepared)"
+        ),
+    )
     for spec in cc_dump.providers.optional_proxy_provider_specs():
         parser.add_argument(
             f"--{spec.key}-port",
@@ -416,12 +629,32 @@ def _handle_recording_admin_commands(args: argparse.Namespace) -> bool:
 
     Returns True when a command was handled and startup should exit.
     """
-    if args.list_recordings:
-        recordings = cc_dump.io.sessions.list_recordings()
-        # [LAW:single-enforcer] CLI owns terminal side effects; renderer stays pure.
-        print(cc_dump.cli_presentation.render_recordings_list(recordings), end="")
-        return True
+    # [LAW:dataflow-not-control-flow] Each command decides whether it applies.
+    for command in (_list_recordings_command, _expand_recording_command, _cleanup_recordings_command):
+        if command(args):
+            return True
+    return False
+
 
+def _list_recordings_command(args: argparse.Namespace) -> bool:
+    if not args.list_recordings:
+        return False
+    recordings = cc_dump.io.sessions.list_recordings()
+    # [LAW:single-enforcer] CLI owns terminal side effects; renderer stays pure.
+    print(cc_dump.cli_presentation.render_recordings_list(recordings), end="")
+    return True
+
+
+def _expand_recording_command(args: argparse.Namespace) -> bool:
+    if args.expand_recording is None:
+        return False
+    src, dst = args.expand_recording
+    count = cc_dump.pipeline.har_replayer.expand_har(src, dst)
+    print(f"Expanded {count} entries: {src} -> {dst}")
+    return True
+
+
+def _cleanup_recordings_command(args: argparse.Namespace) -> bool:
     if args.cleanup_recordings is None:
         return False
     result = cc_dump.io.sessions.cleanup_recordings(
@@ -506,9 +739,18 @@ def _configure_har_recording_subscribers(
         recorder = cc_dump.pipeline.har_recorder.HARRecordingSubscriber(
             record_path,
             provider_filter=provider,
+            dedup=args.record_format == "dedup",
+            fsync=args.record_fsync,
         )
         har_recorders.append(recorder)
-        router.add_subscriber(DirectSubscriber(recorder.on_event))
+        # [LAW:locality-or-seam] Recorders run on their own router worker and write
+        # from their own thread, so disk I/O never delays the UI or the router;
+        # they ignore progress hints, so those may drop.
+        router.add_subscriber(
+            DirectSubscriber(recorder.on_event),
+            overflow=OVERFLOW_DROP_PROGRESS,
+            name=f"har:{provider}",
+        )
         print(f"   Recording ({provider}): {record_path} (created on first API call)")
     primary_record_path = next(
         (
@@ -558,7 +800,7 @@ def _shutdown_runtime(
     *,
     app: CcDumpApp,
     tmux_ctrl,
-    bindings: tuple[ProviderProxyBinding, ...],
+    proxy_runtime: ProxyRuntime,
     router: EventRouter,
     har_recorders: list[cc_dump.pipeline.har_recorder.HARRecordingSubscriber],
     actual_port: int,
@@ -575,10 +817,12 @@ def _shutdown_runtime(
     if tmux_ctrl:
         tmux_ctrl.cleanup()
     # Graceful shutdown with timeout for in-flight requests
+    bindings = proxy_runtime.bindings
     if bindings:
         logger.info("Shutting down gracefully (press Ctrl+C again to force quit)...")
     for binding in bindings:
         _shutdown_binding(binding, timeout=3.0)
+    proxy_runtime.close()
 
     # Clean up other resources
     router.stop()
@@ -652,19 +896,21 @@ def main():
     # [LAW:one-source-of-truth] Default-state alias points at canonical per-provider state.
     state = provider_states[default_provider_key]
 
-    # Set up event router with subscribers
-    router = EventRouter(event_q)
+    # Set up event router with subscribers.
+    # Batched mode: each non-inline subscriber has its own bounded channel.
+    router = EventRouter(event_q, batched=True)
 
     # Analytics store (direct subscriber, in-memory)
     # [LAW:single-enforcer] Analytics projection updates before UI queue fan-out to avoid races.
     analytics_store = AnalyticsStore()
-    router.add_subscriber(DirectSubscriber(analytics_store.on_event))
+    router.add_subscriber(DirectSubscriber(analytics_store.on_event), inline=True)
 
-    # Display subscriber (queue-based for async consumption)
-    display_sub = QueueSubscriber()
-    router.add_subscriber(display_sub)
+    # Display subscriber (queue-based for async consumption). A lagging UI
+    # coalesces streaming deltas instead of growing its queue without bound.
+    display_sub = QueueSubscriber(maxsize=DISPLAY_QUEUE_SIZE, overflow=OVERFLOW_COALESCE)
+    router.add_subscriber(display_sub, name="display")
 
-    # HAR recording subscriber (direct subscriber, inline writes)
+    # HAR recording subscribers (one worker each, off the router thread)
     har_recorders, primary_record_path = _configure_har_recording_subscribers(
         args=args,
         router=router,
@@ -729,6 +975,7 @@ def main():
         provider_endpoints=provider_endpoints,
         auto_launch_config=auto_launch_config,
         auto_launch_extra_args=auto_launch_extra_args,
+        proxy_servers=proxy_runtime.servers(),
     )
 
     app._store_context = _app_store_context(store_context, app)
@@ -738,7 +985,7 @@ def main():
         _shutdown_runtime(
             app=app,
             tmux_ctrl=tmux_ctrl,
-            bindings=bindings,
+            proxy_runtime=proxy_runtime,
             router=router,
             har_recorders=har_recorders,
             actual_port=actual_port,
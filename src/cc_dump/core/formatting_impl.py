@@ -4,13 +4,15 @@ Returns FormattedBlock dataclasses that can be rendered by different backends
 (e.g., tui/rendering.py for Rich renderables in TUI mode).
 """
 
+import hashlib
 import json
 import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from collections.abc import Callable
-from typing import NamedTuple
+from typing import NamedTuple, TypeVar
 
 from cc_dump.pipeline.event_types import (
     InputJsonDeltaEvent,
@@ -109,6 +111,81 @@ class Category(Enum):
 # ─── Provider Runtime State ───────────────────────────────────────────────────
 
 
+# Identity of this module load. Cached templates from before a hot reload were
+# produced by the old formatting code and must not be handed out afterwards.
+_FORMAT_CACHE_GENERATION = object()
+
+_FORMAT_CACHE_MAX_ENTRIES = 8192
+
+
+class _CachedToolDefs(NamedTuple):
+    """ToolDefBlock templates for a tools array plus their total token estimate."""
+
+    templates: list["FormattedBlock"]
+    total_tokens: int
+
+
+class _CachedSystem(NamedTuple):
+    """System prompt block templates."""
+
+    templates: list["FormattedBlock"]
+
+
+@dataclass
+class _CachedMessage:
+    """Formatted children of one message plus the tool-correlation state it produced."""
+
+    children: list["FormattedBlock"]
+    tool_color_counter: int
+    tool_id_entries: tuple[tuple[str, tuple[str, int, str, dict]], ...]
+
+
+_FormatCacheEntry = _CachedToolDefs | _CachedSystem | _CachedMessage
+_EntryT = TypeVar("_EntryT", _CachedToolDefs, _CachedSystem, _CachedMessage)
+
+
+@dataclass
+class RequestFormatCache:
+    """Memo of formatted request sections, reused across requests.
+
+    Every request resends the whole conversation; without this memo each one
+    re-formats and re-segments the full history. Entries are block *templates*
+    that are never handed out: format_request returns clones with fresh
+    block_ids, because ViewOverrides and the widget block index are keyed by
+    block_id and each turn must own its blocks.
+
+    Message keys chain the previous key with the message's content hash, so
+    a hit implies an identical prefix — and therefore identical msg_index,
+    tool color counter and tool_use correlation state.
+
+    // [LAW:single-enforcer] Memo writes are unobservable: a hit returns blocks
+    // equal to what formatting from scratch would produce.
+    """
+
+    entries: OrderedDict[str, "_FormatCacheEntry"] = field(default_factory=OrderedDict)
+    generation: object = None
+    hits: int = 0
+    misses: int = 0
+
+    def get(self, key: str, kind: type[_EntryT]) -> _EntryT | None:
+        """The entry under key if it is a kind; keys are namespaced, so others are misses."""
+        if self.generation is not _FORMAT_CACHE_GENERATION:
+            self.entries.clear()
+            self.generation = _FORMAT_CACHE_GENERATION
+        value = self.entries.get(key)
+        if not isinstance(value, kind):
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: "_FormatCacheEntry") -> None:
+        self.entries[key] = value
+        while len(self.entries) > _FORMAT_CACHE_MAX_ENTRIES:
+            self.entries.popitem(last=False)
+
+
 @dataclass
 class ProviderRuntimeState:
     """Per-provider formatting state.
@@ -116,11 +193,15 @@ class ProviderRuntimeState:
     // [LAW:one-source-of-truth] Canonical container for all mutable state
     // used by formatting. Mutations happen in format_request_for_provider
     // (the caller boundary), not inside format_request/format_openai_request.
+    // format_cache is a memo, not state: see RequestFormatCache.
     """
 
     request_counter: int = 0
     current_session: str | None = None
     tool_descriptions: dict[str, str] = field(default_factory=dict)
+    format_cache: RequestFormatCache = field(
+        default_factory=RequestFormatCache, repr=False, compare=False
+    )
 
 
 # ─── Structured IR ────────────────────────────────────────────────────────────
@@ -975,6 +1056,115 @@ _COMPOUND_TOOL_PARSERS: dict[str, "Callable[[str], list[FormattedBlock]]"] = {
 
 
 
+_ROLE_CATEGORIES = {
+    "user": Category.USER,
+    "assistant": Category.ASSISTANT,
+    "system": Category.SYSTEM,
+}
+
+
+def _content_hash(value: object) -> str:
+    """Stable content key for a JSON value (canonical key order)."""
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _chain_hash(previous_key: str, content_key: str) -> str:
+    """Key for a message given the key of everything before it."""
+    return hashlib.blake2b(
+        f"{previous_key}:{content_key}".encode("ascii"), digest_size=16
+    ).hexdigest()
+
+
+def _prepare_templates(blocks: list[FormattedBlock]) -> list[FormattedBlock]:
+    """Populate content regions once so every clone inherits them."""
+    for block in blocks:
+        populate_content_regions(block)
+        _prepare_templates(getattr(block, "children", []))
+    return blocks
+
+
+def _clone_block(block: FormattedBlock) -> FormattedBlock:
+    """Copy a template block with a fresh block_id; payload data is shared."""
+    # Plain __dict__ copy: copy.copy's reduce protocol dominates warm formatting time.
+    clone = object.__new__(type(block))
+    clone.__dict__.update(block.__dict__)
+    clone.block_id = _auto_id()
+    clone.metadata = dict(block.metadata)
+    clone.content_regions = list(block.content_regions)
+    children = getattr(block, "children", None)
+    if children:
+        clone.children = _clone_blocks(children)
+    return clone
+
+
+def _clone_blocks(blocks: list[FormattedBlock]) -> list[FormattedBlock]:
+    return [_clone_block(block) for block in blocks]
+
+
+def _format_tool_defs(tools: list) -> _CachedToolDefs:
+    """Build ToolDefBlock templates and the total token estimate for a tools array."""
+    per_tool_tokens = [estimate_tokens(json.dumps(t)) for t in tools]
+
+    # // [LAW:one-source-of-truth] Compound tools parsed into children via _COMPOUND_TOOL_PARSERS.
+    tool_def_children: list[FormattedBlock] = []
+    for i, tool in enumerate(tools):
+        tool_name = tool.get("name", "?")
+        tool_desc = tool.get("description", "")
+        # Parse compound tools into children
+        parser = _COMPOUND_TOOL_PARSERS.get(tool_name)
+        compound_children = parser(tool_desc) if parser else []
+        tool_def_children.append(ToolDefBlock(
+            name=tool_name,
+            description=tool_desc,
+            input_schema=tool.get("input_schema", {}),
+            token_estimate=per_tool_tokens[i] if i < len(per_tool_tokens) else 0,
+            children=compound_children,
+            category=Category.TOOLS,
+        ))
+    return _CachedToolDefs(_prepare_templates(tool_def_children), sum(per_tool_tokens))
+
+
+def _format_message_children(msg: dict, ctx: _ContentContext) -> list[FormattedBlock]:
+    """Format the content of one messages[] entry into child blocks."""
+    content = msg.get("content", "")
+    msg_children: list[FormattedBlock] = []
+
+    if isinstance(content, str):
+        if content:
+            msg_children.append(
+                TextContentBlock(content=content, indent="    ", category=ctx.role_cat)
+            )
+    elif isinstance(content, list):
+        for cblock in content:
+            if isinstance(cblock, str):
+                msg_children.append(
+                    TextContentBlock(
+                        content=cblock[:200], indent="    ", category=ctx.role_cat
+                    )
+                )
+                continue
+            btype = cblock.get("type", "?")
+            factory = _CONTENT_BLOCK_FACTORIES.get(btype, _format_unknown_content)
+            msg_children.extend(factory(cblock, ctx))
+    return msg_children
+
+
+def _message_tool_id_entries(
+    msg: dict, tool_id_map: dict
+) -> tuple[tuple[str, tuple[str, int, str, dict]], ...]:
+    """tool_id_map entries registered by this message's tool_use blocks."""
+    content = msg.get("content", "")
+    if not isinstance(content, list):
+        return ()
+    ids = [
+        cblock.get("id", "")
+        for cblock in content
+        if isinstance(cblock, dict) and cblock.get("type") == "tool_use"
+    ]
+    return tuple((tool_id, tool_id_map[tool_id]) for tool_id in ids if tool_id in tool_id_map)
+
+
 def format_request(body, state: ProviderRuntimeState, request_headers: dict | None = None, cache_zones: dict | None = None, *, request_num: int | None = None):
     """Format a full API request as a list of FormattedBlock.
 
@@ -1065,25 +1255,13 @@ def format_request(body, state: ProviderRuntimeState, request_headers: dict | No
 
     # ToolDefsSection container — groups tool definitions
     # [LAW:dataflow-not-control-flow] Always create block, renderer handles empty list
-    per_tool_tokens = [estimate_tokens(json.dumps(t)) for t in tools]
-    total_tool_tokens = sum(per_tool_tokens)
-
-    # // [LAW:one-source-of-truth] Compound tools parsed into children via _COMPOUND_TOOL_PARSERS.
-    tool_def_children: list[FormattedBlock] = []
-    for i, tool in enumerate(tools):
-        tool_name = tool.get("name", "?")
-        tool_desc = tool.get("description", "")
-        # Parse compound tools into children
-        parser = _COMPOUND_TOOL_PARSERS.get(tool_name)
-        compound_children = parser(tool_desc) if parser else []
-        tool_def_children.append(ToolDefBlock(
-            name=tool_name,
-            description=tool_desc,
-            input_schema=tool.get("input_schema", {}),
-            token_estimate=per_tool_tokens[i] if i < len(per_tool_tokens) else 0,
-            children=compound_children,
-            category=Category.TOOLS,
-        ))
+    cache = state.format_cache
+    tools_key = "tools:" + _content_hash(tools)
+    cached_tools = cache.get(tools_key, _CachedToolDefs)
+    if cached_tools is None:
+        cached_tools = _format_tool_defs(tools)
+        cache.put(tools_key, cached_tools)
+    tool_def_children = _clone_blocks(cached_tools.templates)
 
     # Emit ToolDefsSection container
     # // [LAW:dataflow-not-control-flow] cache_zones flows through; metadata set at construction.
@@ -1092,7 +1270,7 @@ def format_request(body, state: ProviderRuntimeState, request_headers: dict | No
         _tools_meta["cache"] = cache_zones["tools"].value
     blocks.append(ToolDefsSection(
         tool_count=len(tools),
-        total_tokens=total_tool_tokens,
+        total_tokens=cached_tools.total_tokens,
         children=tool_def_children,
         category=Category.TOOLS,
         metadata=_tools_meta,
@@ -1101,7 +1279,13 @@ def format_request(body, state: ProviderRuntimeState, request_headers: dict | No
     blocks.append(SeparatorBlock(style="thin"))
 
     # SystemSection container — groups system prompt blocks
-    system_children = _make_system_prompt_children(body.get("system", ""))
+    system = body.get("system", "")
+    system_key = "system:" + _content_hash(system)
+    cached_system = cache.get(system_key, _CachedSystem)
+    if cached_system is None:
+        cached_system = _CachedSystem(_prepare_templates(_make_system_prompt_children(system)))
+        cache.put(system_key, cached_system)
+    system_children = _clone_blocks(cached_system.templates)
 
     # Emit SystemSection container (always — renderer handles empty children)
     _system_meta = {}
@@ -1120,56 +1304,45 @@ def format_request(body, state: ProviderRuntimeState, request_headers: dict | No
     ] = {}  # tool_use_id -> (name, color_idx, detail, tool_input)
     tool_color_counter = 0
 
-    # Messages — each wrapped in a MessageBlock container
+    # Messages — each wrapped in a MessageBlock container.
+    # Message keys chain from the tool descriptions, which enrich ToolUseBlocks.
     messages = body.get("messages", [])
+    message_key = _content_hash(state.tool_descriptions)
+    message_timestamp = _get_timestamp()
     for i, msg in enumerate(messages):
         role = msg.get("role", "?")
-        content = msg.get("content", "")
 
         # Blank line between messages (skip before the first one)
         if i > 0:
             blocks.append(NewlineBlock())
 
         # [LAW:one-source-of-truth] Category set here at creation, not resolved later
-        role_cat = {
-            "user": Category.USER,
-            "assistant": Category.ASSISTANT,
-            "system": Category.SYSTEM,
-        }.get(role.lower())
-
-        # Create shared context for content block formatters
-        ctx = _ContentContext(
-            role_cat=role_cat,
-            state=state,
-            tool_id_map=tool_id_map,
-            tool_color_counter=tool_color_counter,
-            msg_index=i,
-            indent="    ",
-        )
-
-        # Build children for this message
-        msg_children: list[FormattedBlock] = []
-
-        if isinstance(content, str):
-            if content:
-                msg_children.append(
-                    TextContentBlock(content=content, indent="    ", category=role_cat)
-                )
-        elif isinstance(content, list):
-            for cblock in content:
-                if isinstance(cblock, str):
-                    msg_children.append(
-                        TextContentBlock(
-                            content=cblock[:200], indent="    ", category=role_cat
-                        )
-                    )
-                    continue
-                btype = cblock.get("type", "?")
-                factory = _CONTENT_BLOCK_FACTORIES.get(btype, _format_unknown_content)
-                msg_children.extend(factory(cblock, ctx))
+        role_cat = _ROLE_CATEGORIES.get(role.lower())
+
+        message_key = _chain_hash(message_key, _content_hash(msg))
+        cached_msg = cache.get(message_key, _CachedMessage)
+        if cached_msg is None:
+            # Create shared context for content block formatters
+            ctx = _ContentContext(
+                role_cat=role_cat,
+                state=state,
+                tool_id_map=tool_id_map,
+                tool_color_counter=tool_color_counter,
+                msg_index=i,
+                indent="    ",
+            )
+            cached_msg = _CachedMessage(
+                children=_prepare_templates(_format_message_children(msg, ctx)),
+                tool_color_counter=ctx.tool_color_counter,
+                tool_id_entries=_message_tool_id_entries(msg, tool_id_map),
+            )
+            cache.put(message_key, cached_msg)
+        else:
+            tool_id_map.update(cached_msg.tool_id_entries)
+        msg_children = _clone_blocks(cached_msg.children)
 
         # Extract updated tool_color_counter from context
-        tool_color_counter = ctx.tool_color_counter
+        tool_color_counter = cached_msg.tool_color_counter
 
         # // [LAW:one-source-of-truth] MessageBlock container replaces RoleBlock + flat children.
         _msg_meta = {}
@@ -1179,7 +1352,7 @@ def format_request(body, state: ProviderRuntimeState, request_headers: dict | No
         blocks.append(MessageBlock(
             role=role,
             msg_index=i,
-            timestamp=_get_timestamp(),
+            timestamp=message_timestamp,
             children=msg_children,
             category=role_cat,
             metadata=_msg_meta,
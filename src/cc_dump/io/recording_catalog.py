@@ -0,0 +1,371 @@
+"""Recording catalog — cached per-recording metadata for fast listing.
+
+Listing recordings used to json.load every HAR file just to count entries.
+The catalog is a JSON sidecar in the recordings directory that holds one
+summary per recording, keyed by file name and validated by size and mtime:
+
+    {"version": 1, "recordings": {
+        "ccdump-....har": {"size_bytes": 1234, "mtime_ns": 1700000000000000000,
+                           "summary": {...RecordingSummary...}},
+        "broken.har":     {"size_bytes": 10, "mtime_ns": ..., "error": "..."},
+    }}
+
+HARRecordingSubscriber updates its recording's row after every group it
+writes, so a live recording never needs a rescan. Those updates are appended
+to a journal next to the catalog, one JSON line per row, so a commit costs
+one short append instead of a read and rewrite of the whole catalog:
+
+    {"name": "ccdump-....har", "row": {...}}
+
+load_catalog() applies the journal over the catalog (last line wins).
+rebuild_catalog() re-scans only files whose size or mtime no longer match
+their row, and folds the journal back into the catalog. A journal that grows
+past _JOURNAL_COMPACT_BYTES is folded in by the append that crossed it, so
+long sessions without a listing do not grow it without bound.
+
+Folding renames the journal aside before writing the catalog. Appends that
+land after that go to a fresh journal. Appends that reached the renamed file
+after it was read are replayed into the fresh journal.
+
+The catalog is a cache, never a source of truth: a missing, corrupt or stale
+row only costs a re-scan of that file. Concurrent writers (several cc-dump
+processes sharing a recordings directory) replace the catalog atomically and
+append whole lines to the journal, so the worst case is a lost row that the
+next listing rebuilds.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import uuid
+from pathlib import Path
+from typing import TypedDict
+
+import cc_dump.core.formatting
+import cc_dump.providers
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILENAME = ".cc-dump-catalog.json"
+JOURNAL_FILENAME = ".cc-dump-catalog.journal"
+CATALOG_VERSION = 1
+
+# Journal size past which an append folds the journal into the catalog.
+_JOURNAL_COMPACT_BYTES = 256 * 1024
+
+
+class RecordingSummary(TypedDict):
+    provider: str | None
+    created: str  # first entry's startedDateTime ("" when absent)
+    entry_count: int
+    session_ids: list[str]
+    models: list[str]
+    started: str  # earliest startedDateTime ("" when absent)
+    ended: str  # latest startedDateTime ("" when absent)
+    total_tokens: int
+
+
+def catalog_path(recordings_dir: str | Path) -> Path:
+    return Path(recordings_dir) / CATALOG_FILENAME
+
+
+def journal_path(recordings_dir: str | Path) -> Path:
+    return Path(recordings_dir) / JOURNAL_FILENAME
+
+
+# ─── Summaries ───────────────────────────────────────────────────────────────
+
+
+def new_summary() -> RecordingSummary:
+    return {
+        "provider": None,
+        "created": "",
+        "entry_count": 0,
+        "session_ids": [],
+        "models": [],
+        "started": "",
+        "ended": "",
+        "total_tokens": 0,
+    }
+
+
+def _session_id(request_body: dict) -> str:
+    metadata = request_body.get("metadata", {})
+    user_id = metadata.get("user_id", "") if isinstance(metadata, dict) else ""
+    if not isinstance(user_id, str) or not user_id:
+        return ""
+    parsed = cc_dump.core.formatting.parse_user_id(user_id)
+    session_id = parsed.get("session_id", "") if parsed else ""
+    return session_id if isinstance(session_id, str) else ""
+
+
+def _total_tokens(complete_message: dict) -> int:
+    usage = complete_message.get("usage", {})
+    if not isinstance(usage, dict):
+        return 0
+    # [LAW:one-source-of-truth] Same key normalization as AnalyticsStore usage.
+    counts = (
+        usage.get("input_tokens", 0) or usage.get("prompt_tokens", 0),
+        usage.get("output_tokens", 0) or usage.get("completion_tokens", 0),
+        usage.get("cache_read_input_tokens", 0),
+        usage.get("cache_creation_input_tokens", 0),
+    )
+    return sum(count for count in counts if isinstance(count, int))
+
+
+def _append_unique(values: list[str], value: str) -> None:
+    if value and value not in values:
+        values.append(value)
+
+
+def _add_started(summary: RecordingSummary, started: str) -> None:
+    if not started:
+        return
+    if not summary["started"] or started < summary["started"]:
+        summary["started"] = started
+    summary["ended"] = max(summary["ended"], started)
+
+
+def add_entry(
+    summary: RecordingSummary,
+    entry: dict,
+    request_body: dict | None,
+    complete_message: dict | None,
+) -> None:
+    """Fold one HAR entry into a summary (in place).
+
+    request_body may be the stripped body of a prefix-deduplicated entry:
+    model and metadata are never deduplicated.
+    """
+    if summary["entry_count"] == 0:
+        # [LAW:one-source-of-truth] HAR provider precedence is owned by providers module.
+        summary["provider"] = cc_dump.providers.detect_provider_from_har_entry(entry)
+        summary["created"] = str(entry.get("startedDateTime", "") or "")
+    summary["entry_count"] += 1
+    _add_started(summary, str(entry.get("startedDateTime", "") or ""))
+
+    request_body = request_body if isinstance(request_body, dict) else {}
+    complete_message = complete_message if isinstance(complete_message, dict) else {}
+    _append_unique(summary["session_ids"], _session_id(request_body))
+    _append_unique(summary["models"], str(request_body.get("model", "") or ""))
+    summary["total_tokens"] += _total_tokens(complete_message)
+
+
+def _json_field(container: object, *keys: str) -> dict | None:
+    for key in keys:
+        if not isinstance(container, dict):
+            return None
+        container = container.get(key)
+    if not isinstance(container, str):
+        return None
+    try:
+        value = json.loads(container)
+    except ValueError:
+        return None
+    return value if isinstance(value, dict) else None
+
+
+def scan_recording(path: str | Path) -> RecordingSummary:
+    """Summarize a HAR file by reading it in full.
+
+    Raises:
+        OSError, ValueError: unreadable file or invalid JSON.
+        KeyError: not a HAR document.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        har = json.load(f)
+    entries = har["log"].get("entries", [])
+    summary = new_summary()
+    for entry in entries:
+        if not isinstance(entry, dict):
+            summary["entry_count"] += 1
+            continue
+        add_entry(
+            summary,
+            entry,
+            _json_field(entry, "request", "postData", "text"),
+            _json_field(entry, "response", "content", "text"),
+        )
+    return summary
+
+
+# ─── Catalog file ────────────────────────────────────────────────────────────
+
+
+def load_catalog(recordings_dir: str | Path) -> dict[str, dict]:
+    """Return catalog rows by file name, journal applied; empty when missing, corrupt or outdated."""
+    rows = _load_snapshot(recordings_dir)
+    rows.update(_read_journal(recordings_dir)[0])
+    return rows
+
+
+def _load_snapshot(recordings_dir: str | Path) -> dict[str, dict]:
+    try:
+        data = json.loads(catalog_path(recordings_dir).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CATALOG_VERSION:
+        return {}
+    rows = data.get("recordings", {})
+    return rows if isinstance(rows, dict) else {}
+
+
+def _read_journal(recordings_dir: str | Path) -> tuple[dict[str, dict], int]:
+    """Journaled rows and the byte length of the complete lines they came from.
+
+    Last line per name wins; malformed lines and a torn last line are skipped.
+    """
+    try:
+        data = journal_path(recordings_dir).read_bytes()
+    except OSError:
+        return {}, 0
+    complete = data.rfind(b"\n") + 1
+    return _journal_rows(data[:complete]), complete
+
+
+def _journal_rows(data: bytes) -> dict[str, dict]:
+    rows: dict[str, dict] = {}
+    for line in data.decode("utf-8", errors="replace").splitlines():
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict) and isinstance(record.get("name"), str) and isinstance(record.get("row"), dict):
+            rows[record["name"]] = record["row"]
+    return rows
+
+
+def _write_catalog(recordings_dir: str | Path, rows: dict[str, dict], journal_seen: int) -> None:
+    """Replace the catalog with rows, which include the first journal_seen bytes of the journal.
+
+    The journal is renamed aside first, so appends racing this write land in
+    a fresh journal or in the renamed file's unseen tail, which is replayed.
+    """
+    directory = Path(recordings_dir)
+    claimed = _claim_journal(directory)
+    if claimed is None:
+        _replace_catalog(directory, rows)
+        return
+    try:
+        _replace_catalog(directory, rows)
+    except BaseException:
+        # The catalog kept none of it: hand the whole claimed journal back.
+        _replay_journal(directory, claimed, 0)
+        raise
+    _replay_journal(directory, claimed, journal_seen)
+
+
+def _replace_catalog(directory: Path, rows: dict[str, dict]) -> None:
+    """Atomic write: temp file in the same directory, then rename."""
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".cc-dump-catalog.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"version": CATALOG_VERSION, "recordings": rows}, f, ensure_ascii=False)
+        os.replace(tmp_path, catalog_path(directory))
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _claim_journal(directory: Path) -> Path | None:
+    """Rename the journal aside; None when there is none (or it cannot be renamed)."""
+    claimed = directory / f"{JOURNAL_FILENAME}.{uuid.uuid4().hex}.claimed"
+    try:
+        os.replace(journal_path(directory), claimed)
+    except OSError:
+        return None
+    return claimed
+
+
+def _replay_journal(directory: Path, claimed: Path, seen: int) -> None:
+    """Append what the claimed journal holds past seen bytes to the live journal, then drop it."""
+    with open(claimed, "rb") as f:
+        f.seek(seen)
+        unseen = f.read()
+    if unseen:
+        with open(journal_path(directory), "ab") as f:
+            f.write(unseen)
+    os.unlink(claimed)
+
+
+def _row_matches(row: object, stat: os.stat_result) -> bool:
+    return (
+        isinstance(row, dict)
+        and row.get("size_bytes") == stat.st_size
+        and row.get("mtime_ns") == stat.st_mtime_ns
+    )
+
+
+def record_recording(path: str | Path, summary: RecordingSummary) -> None:
+    """Journal a writer-maintained summary for a recording at its current size and mtime."""
+    path = Path(path)
+    stat = path.stat()
+    row = {
+        "size_bytes": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "summary": summary,
+    }
+    line = json.dumps({"name": path.name, "row": row}, ensure_ascii=False) + "\n"
+    # One write per line on an O_APPEND descriptor: concurrent writers never interleave within it.
+    with open(journal_path(path.parent), "a", encoding="utf-8") as f:
+        f.write(line)
+        journal_size = f.tell()
+    if journal_size >= _JOURNAL_COMPACT_BYTES:
+        compact_journal(path.parent)
+
+
+def compact_journal(recordings_dir: str | Path) -> None:
+    """Fold the journal into the catalog without stat'ing or scanning any recording."""
+    journal, seen = _read_journal(recordings_dir)
+    _write_catalog(recordings_dir, {**_load_snapshot(recordings_dir), **journal}, seen)
+
+
+def _scanned_row(path: Path, stat: os.stat_result) -> dict:
+    row: dict = {"size_bytes": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    try:
+        row["summary"] = scan_recording(path)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        row["error"] = str(e) or type(e).__name__
+    return row
+
+
+def _current_rows(har_files: list[Path], cached: dict[str, dict]) -> dict[str, dict]:
+    """Cached rows that still match their file, fresh scans for the rest."""
+    rows: dict[str, dict] = {}
+    for path in har_files:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        row = cached.get(path.name)
+        rows[path.name] = row if row is not None and _row_matches(row, stat) else _scanned_row(path, stat)
+    return rows
+
+
+def rebuild_catalog(
+    recordings_dir: str | Path,
+    har_files: list[Path] | None = None,
+) -> dict[str, dict]:
+    """Bring the catalog up to date and return its rows by file name.
+
+    Every file costs one stat; only files whose size or mtime changed since
+    their row was written are read. Rows for files that no longer exist are
+    dropped. Unreadable files get an ``error`` row so they are not re-read
+    until they change. A non-empty journal is folded into the catalog.
+    """
+    directory = Path(recordings_dir)
+    if har_files is None:
+        har_files = sorted(path for path in directory.glob("*.har") if path.is_file())
+    snapshot = _load_snapshot(directory)
+    journal, seen = _read_journal(directory)
+    rows = _current_rows(har_files, {**snapshot, **journal})
+    if journal or rows != snapshot:
+        try:
+            _write_catalog(directory, rows, seen)
+        except OSError as e:
+            logger.warning("could not write recording catalog in %s: %s", directory, e)
+    return rows
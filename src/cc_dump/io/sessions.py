@@ -1,12 +1,12 @@
 """HAR recording management utilities."""
 
-import json
 import logging
 import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, TypedDict
 
+import cc_dump.io.recording_catalog
 import cc_dump.providers
 
 logger = logging.getLogger(__name__)
@@ -19,6 +19,11 @@ class RecordingInfo(TypedDict):
     created: str
     entry_count: int
     size_bytes: int
+    session_ids: list[str]
+    models: list[str]
+    started: str
+    ended: str
+    total_tokens: int
 
 
 class CleanupResult(TypedDict):
@@ -55,41 +60,37 @@ def _provider_from_filename(path: Path, provider_keys: set[str]) -> str | None:
     return candidate if candidate in provider_keys else None
 
 
-def _provider_from_entries(entries: list[dict]) -> str | None:
-    if not entries:
-        return None
-    # [LAW:one-source-of-truth] HAR provider precedence is owned by providers module.
-    return cc_dump.providers.detect_provider_from_har_entry(entries[0])
-
-
-def _entry_created_or_mtime(entries: list[dict], path: Path) -> str:
-    if entries and "startedDateTime" in entries[0]:
-        return str(entries[0]["startedDateTime"])
-    return datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc).isoformat()
-
-
-def _load_recording_info(
+def _recording_info(
     path: Path,
+    row: dict,
     provider_keys: set[str],
 ) -> RecordingInfo:
-    with open(path, "r", encoding="utf-8") as f:
-        har = json.load(f)
-
-    entries = har.get("log", {}).get("entries", [])
+    summary = row["summary"]
+    created = summary["created"] or datetime.fromtimestamp(
+        row["mtime_ns"] / 1e9, tz=timezone.utc
+    ).isoformat()
     return {
         "path": str(path),
         "filename": path.name,
-        "provider": _provider_from_filename(path, provider_keys)
-        or _provider_from_entries(entries),
-        "created": _entry_created_or_mtime(entries, path),
-        "entry_count": len(entries),
-        "size_bytes": path.stat().st_size,
+        "provider": _provider_from_filename(path, provider_keys) or summary["provider"],
+        "created": created,
+        "entry_count": summary["entry_count"],
+        "size_bytes": row["size_bytes"],
+        "session_ids": list(summary["session_ids"]),
+        "models": list(summary["models"]),
+        "started": summary["started"],
+        "ended": summary["ended"],
+        "total_tokens": summary["total_tokens"],
     }
 
 
 def list_recordings(recordings_dir: Optional[str] = None) -> list[RecordingInfo]:
     """List available recordings with metadata.
 
+    Metadata comes from the recording catalog (see cc_dump.io.recording_catalog):
+    each file is stat'ed, and only files changed since they were catalogued
+    are read.
+
     Args:
         recordings_dir: Directory to search (default: ~/.local/share/cc-dump/recordings)
 
@@ -103,6 +104,11 @@ def list_recordings(recordings_dir: Optional[str] = None) -> list[RecordingInfo]
                 "created": "2026-02-03T14:30:00",
                 "entry_count": 42,
                 "size_bytes": 102400,
+                "session_ids": ["..."],
+                "models": ["claude-sonnet-4-20250514"],
+                "started": "2026-02-03T14:30:00",
+                "ended": "2026-02-03T15:10:00",
+                "total_tokens": 1234567,
             },
             ...
         ]
@@ -120,16 +126,15 @@ def list_recordings(recordings_dir: Optional[str] = None) -> list[RecordingInfo]
     # [LAW:one-source-of-truth] Canonical recording layout is flat under recordings root.
     har_files = sorted(path for path in recordings_path.glob("*.har") if path.is_file())
     provider_keys = _provider_keys()
+    rows = cc_dump.io.recording_catalog.rebuild_catalog(recordings_path, har_files)
 
-    # Process all found .har files
-    for path in har_files:
-        try:
-            recordings.append(_load_recording_info(path, provider_keys))
-
-        except (json.JSONDecodeError, OSError, KeyError) as e:
+    # Rows follow har_files order; files that vanished between glob and stat have none.
+    for name, row in rows.items():
+        if "summary" not in row:
             # Skip malformed files, but continue processing others
-            logger.warning("skipping malformed recording %s: %s", path.name, e)
+            logger.warning("skipping malformed recording %s: %s", name, row.get("error", ""))
             continue
+        recordings.append(_recording_info(recordings_path / name, row, provider_keys))
 
     return recordings
 
@@ -333,6 +333,46 @@ def sse_progress_payload(sse_event: SSEEvent) -> dict[str, object] | None:
     return None
 
 
+def merge_progress_events(
+    first: ResponseProgressEvent,
+    second: ResponseProgressEvent,
+) -> ResponseProgressEvent | None:
+    """Fold two consecutive progress hints for one request into one, or None.
+
+    Applying the merged event has the same effect as applying both in order:
+    delta text concatenates, and every other field takes the later value when
+    the later event sets it. The envelope (seq/recv_ns) is the later event's.
+    Events whose task lineage differs are never merged.
+    """
+    if first.request_id != second.request_id or first.provider != second.provider:
+        return None
+    if (
+        first.task_tool_use_id
+        and second.task_tool_use_id
+        and first.task_tool_use_id != second.task_tool_use_id
+    ):
+        return None
+
+    def later(name: str, unset: object) -> object:
+        value = getattr(second, name)
+        return getattr(first, name) if value == unset else value
+
+    return ResponseProgressEvent(
+        request_id=second.request_id,
+        seq=second.seq,
+        recv_ns=second.recv_ns,
+        provider=second.provider,
+        delta_text=first.delta_text + second.delta_text,
+        model=later("model", ""),
+        input_tokens=later("input_tokens", None),
+        cache_read_input_tokens=later("cache_read_input_tokens", None),
+        cache_creation_input_tokens=later("cache_creation_input_tokens", None),
+        output_tokens=later("output_tokens", None),
+        stop_reason=later("stop_reason", ""),
+        task_tool_use_id=later("task_tool_use_id", ""),
+    )
+
+
 # ─── Parse boundary ──────────────────────────────────────────────────────────
 # // [LAW:single-enforcer] Single parse boundary for SSE data validation.
 
@@ -3,6 +3,16 @@
 // [LAW:one-source-of-truth] CA lifecycle and per-host cert generation live here.
 // [LAW:single-enforcer] Certificate trust boundary enforced at this single module.
 
+Leaf certificates are cached on disk under the CA directory, keyed by the
+CA's fingerprint, the host and the leaf key type:
+
+    <ca_dir>/leaf-cache/<ca fingerprint>/<host stem>.<rsa|ecdsa>.pem
+
+Each file holds the certificate and its private key, written atomically,
+so a restart reloads them instead of generating keys again. A leaf within
+_HOST_RENEW_BEFORE of expiry is regenerated. A new CA gets a new cache
+directory; directories for other CA fingerprints are removed on startup.
+
 This module is STABLE — holds crypto state, never hot-reloaded.
 """
 
@@ -19,11 +29,12 @@ import shutil
 import ssl
 import tempfile
 import threading
+from collections.abc import Iterable
 from pathlib import Path
 
 from cryptography import x509
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
 from cryptography.x509.oid import NameOID
 
 logger = logging.getLogger(__name__)
@@ -32,21 +43,41 @@ _CA_KEY_SIZE = 2048
 _HOST_KEY_SIZE = 2048
 _CA_VALIDITY_DAYS = 365 * 3
 _HOST_VALIDITY_DAYS = 365
+_HOST_RENEW_BEFORE = datetime.timedelta(days=7)
+_LEAF_CACHE_DIRNAME = "leaf-cache"
+
+# RSA-2048 generation costs tens of milliseconds; a P-256 key takes well
+# under one, and makes handshakes cheaper too.
+LEAF_KEY_RSA = "rsa"
+LEAF_KEY_ECDSA = "ecdsa"
+LEAF_KEY_TYPES = (LEAF_KEY_RSA, LEAF_KEY_ECDSA)
 
 
 class ForwardProxyCertificateAuthority:
-    """Generate and cache per-host TLS certificates for forward proxy CONNECT."""
+    """Generate and cache per-host TLS certificates for forward proxy CONNECT.
 
-    def __init__(self, ca_dir: Path | None = None) -> None:
+    persist_leaves=False keeps leaf files in a temporary directory removed
+    at exit, so every process generates its own.
+    """
+
+    def __init__(
+        self,
+        ca_dir: Path | None = None,
+        *,
+        leaf_key_type: str = LEAF_KEY_RSA,
+        persist_leaves: bool = True,
+    ) -> None:
+        self._leaf_key_type = _checked_leaf_key_type(leaf_key_type)
         self._ca_dir = ca_dir or Path.home() / ".cc-dump" / "forward-proxy-ca"
         self._ca_dir.mkdir(parents=True, exist_ok=True)
         # [LAW:single-enforcer] CA directory permission hardening is enforced here.
         self._set_permissions(self._ca_dir, 0o700)
         self._ca_key, self._ca_cert = self._load_or_create_ca()
-        self._host_contexts: dict[str, ssl.SSLContext] = {}
+        self._host_contexts: dict[str, tuple[ssl.SSLContext, datetime.datetime]] = {}
+        self._host_locks: dict[str, threading.Lock] = {}
         self._lock = threading.Lock()
-        self._artifact_dir = Path(tempfile.mkdtemp(prefix="cc-dump-forward-proxy-"))
-        atexit.register(shutil.rmtree, str(self._artifact_dir), True)
+        self._counts = {"generated": 0, "loaded": 0, "memory_hits": 0}
+        self._artifact_dir = self._prepare_leaf_dir(persist_leaves)
 
     @property
     def ca_cert_path(self) -> Path:
@@ -55,21 +86,77 @@ class ForwardProxyCertificateAuthority:
 
     @property
     def artifact_dir(self) -> Path:
-        """Directory containing ephemeral per-host cert/key files."""
+        """Directory containing per-host cert/key files for the current CA."""
         return self._artifact_dir
 
     def ssl_context_for_host(self, hostname: str) -> ssl.SSLContext:
-        """Return a server-side SSL context presenting a cert for *hostname*."""
+        """Return a server-side SSL context presenting a cert for *hostname*.
+
+        Generation for one host never blocks lookups for other hosts.
+        """
         with self._lock:
-            ctx = self._host_contexts.get(hostname)
+            ctx = self._fresh_context(hostname)
             if ctx is not None:
+                self._counts["memory_hits"] += 1
                 return ctx
-            ctx = self._create_host_context(hostname)
-            self._host_contexts[hostname] = ctx
-            return ctx
+            host_lock = self._host_locks.setdefault(hostname, threading.Lock())
+        with host_lock:
+            return self._context_under_host_lock(hostname)
+
+    def prewarm(self, hostnames: Iterable[str]) -> threading.Thread:
+        """Load or generate contexts for *hostnames* on a background thread."""
+        hosts = list(dict.fromkeys(hostnames))
+
+        def warm() -> None:
+            for hostname in hosts:
+                try:
+                    self.ssl_context_for_host(hostname)
+                except Exception:
+                    logger.warning("Forward proxy cert pre-warm failed for %s", hostname, exc_info=True)
+
+        thread = threading.Thread(target=warm, name="cc-dump-cert-prewarm", daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self) -> dict[str, int]:
+        """Leaf counters: generated (new keys), loaded (from disk), memory_hits."""
+        with self._lock:
+            return dict(self._counts)
 
     # -- private ----------------------------------------------------------
 
+    def _fresh_context(self, hostname: str) -> ssl.SSLContext | None:
+        cached = self._host_contexts.get(hostname)
+        if cached is None or not _still_fresh(cached[1]):
+            return None
+        return cached[0]
+
+    def _context_under_host_lock(self, hostname: str) -> ssl.SSLContext:
+        """Context another thread just made while we waited, else load or create one."""
+        with self._lock:
+            ctx = self._fresh_context(hostname)
+        if ctx is not None:
+            return ctx
+        ctx, not_after = self._load_or_create_host_context(hostname)
+        with self._lock:
+            self._host_contexts[hostname] = (ctx, not_after)
+        return ctx
+
+    def _prepare_leaf_dir(self, persist: bool) -> Path:
+        if not persist:
+            return _temporary_leaf_dir()
+        cache_root = self._ca_dir / _LEAF_CACHE_DIRNAME
+        fingerprint = self._ca_cert.fingerprint(hashes.SHA256()).hex()[:32]
+        leaf_dir = cache_root / fingerprint
+        leaf_dir.mkdir(parents=True, exist_ok=True)
+        self._set_permissions(cache_root, 0o700)
+        self._set_permissions(leaf_dir, 0o700)
+        # Leaves signed by a previous CA can never validate again.
+        for stale in cache_root.iterdir():
+            if stale.is_dir() and stale.name != fingerprint:
+                shutil.rmtree(stale, ignore_errors=True)
+        return leaf_dir
+
     def _load_or_create_ca(self) -> tuple[rsa.RSAPrivateKey, x509.Certificate]:
         key_path = self._ca_dir / "ca.key"
         cert_path = self.ca_cert_path
@@ -108,10 +195,39 @@ class ForwardProxyCertificateAuthority:
         logger.info("Generated new forward proxy CA at %s", self._ca_dir)
         return key, cert
 
-    def _create_host_context(self, hostname: str) -> ssl.SSLContext:
-        key = rsa.generate_private_key(public_exponent=65537, key_size=_HOST_KEY_SIZE)
-        now = datetime.datetime.now(datetime.timezone.utc)
+    def _load_or_create_host_context(self, hostname: str) -> tuple[ssl.SSLContext, datetime.datetime]:
         normalized_hostname = _normalize_hostname(hostname)
+        leaf_path = self._artifact_dir / "{}.{}.pem".format(
+            _host_cert_stem(normalized_hostname),
+            self._leaf_key_type,
+        )
+        not_after = self._cached_leaf_expiry(leaf_path)
+        if not_after is None:
+            not_after = self._write_leaf(leaf_path, normalized_hostname)
+            counter = "generated"
+        else:
+            counter = "loaded"
+
+        ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        # ssl.SSLContext.load_cert_chain requires file paths.
+        ctx.load_cert_chain(str(leaf_path))
+        with self._lock:
+            self._counts[counter] += 1
+        return ctx, not_after
+
+    def _cached_leaf_expiry(self, leaf_path: Path) -> datetime.datetime | None:
+        """Expiry of a reusable cached leaf, or None when it must be (re)generated."""
+        try:
+            cert = x509.load_pem_x509_certificate(leaf_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if cert.issuer != self._ca_cert.subject or not _still_fresh(cert.not_valid_after_utc):
+            return None
+        return cert.not_valid_after_utc
+
+    def _write_leaf(self, leaf_path: Path, normalized_hostname: str) -> datetime.datetime:
+        key = _generate_leaf_key(self._leaf_key_type)
+        now = datetime.datetime.now(datetime.timezone.utc)
         cert = (
             x509.CertificateBuilder()
             .subject_name(x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, normalized_hostname)]))
@@ -126,25 +242,26 @@ class ForwardProxyCertificateAuthority:
             )
             .sign(self._ca_key, hashes.SHA256())
         )
-
-        # ssl.SSLContext.load_cert_chain requires file paths.
-        cert_stem = _host_cert_stem(normalized_hostname)
-        cert_path = self._artifact_dir / "{}.crt".format(cert_stem)
-        key_path = self._artifact_dir / "{}.key".format(cert_stem)
-        cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
-        key_path.write_bytes(
-            key.private_bytes(
-                serialization.Encoding.PEM,
-                serialization.PrivateFormat.PKCS8,
-                serialization.NoEncryption(),
-            )
+        pem = cert.public_bytes(serialization.Encoding.PEM) + key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
         )
-        self._set_permissions(key_path, 0o600)
-        self._set_permissions(cert_path, 0o644)
-
-        ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
-        ctx.load_cert_chain(str(cert_path), str(key_path))
-        return ctx
+        # Cert and key share one file, replaced atomically, so concurrent
+        # cc-dump processes never pair one process's key with another's cert.
+        fd, tmp_path = tempfile.mkstemp(dir=leaf_path.parent, prefix=".leaf-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(pem)
+            self._set_permissions(Path(tmp_path), 0o600)
+            os.replace(tmp_path, leaf_path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        return cert.not_valid_after_utc
 
     def _set_permissions(self, path: Path, mode: int) -> None:
         """Best-effort chmod for private key/cert artifacts."""
@@ -154,6 +271,29 @@ class ForwardProxyCertificateAuthority:
             logger.debug("Unable to set permissions for %s", path, exc_info=True)
 
 
+def _checked_leaf_key_type(key_type: str) -> str:
+    if key_type not in LEAF_KEY_TYPES:
+        raise ValueError(f"unknown leaf key type {key_type!r}")
+    return key_type
+
+
+def _temporary_leaf_dir() -> Path:
+    """Per-process leaf directory, removed at exit."""
+    path = Path(tempfile.mkdtemp(prefix="cc-dump-forward-proxy-"))
+    atexit.register(shutil.rmtree, str(path), True)
+    return path
+
+
+def _generate_leaf_key(key_type: str) -> rsa.RSAPrivateKey | ec.EllipticCurvePrivateKey:
+    if key_type == LEAF_KEY_ECDSA:
+        return ec.generate_private_key(ec.SECP256R1())
+    return rsa.generate_private_key(public_exponent=65537, key_size=_HOST_KEY_SIZE)
+
+
+def _still_fresh(not_after: datetime.datetime) -> bool:
+    return not_after - _HOST_RENEW_BEFORE > datetime.datetime.now(datetime.timezone.utc)
+
+
 def _normalize_hostname(hostname: str) -> str:
     raw = str(hostname or "").strip()
     if not raw:
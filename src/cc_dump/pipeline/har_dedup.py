@@ -0,0 +1,212 @@
+"""Prefix-deduplicated request bodies for HAR recordings.
+
+Every API request resends the whole conversation, so a standard HAR recording
+grows quadratically with turn count. In the deduplicated format each message,
+system block and tool definition is stored once as a content-addressed blob,
+and each entry's request body keeps only references:
+
+    entry["_cc_dump"]["body_refs"] = {
+        "order": ["model", "system", "messages", ...],   # original key order
+        "system": "<hash>" | ["<hash>", ...],
+        "tools": ["<hash>", ...],
+        "messages": {"base": 3, "keep": 40, "tail": ["<hash>", ...]},
+    }
+    entry["_cc_dump"]["blobs"] = {"<hash>": <json value>, ...}  # first sightings only
+
+``messages`` is the first ``keep`` message hashes of entry ``base`` followed by
+``tail``, so a new turn costs O(new messages) bytes instead of O(conversation).
+``request.postData.text`` holds the remaining (non-deduplicated) body fields.
+
+// [LAW:one-source-of-truth] Encoder and decoder share this module so the on-disk
+// layout is defined in exactly one place.
+"""
+
+import hashlib
+import json
+from collections import deque
+from dataclasses import dataclass
+
+FORMAT = "prefix-dedup/1"
+
+# Body fields whose items are content-addressed.
+_LIST_FIELDS = ("messages", "tools")
+_SYSTEM_FIELD = "system"
+
+# How many recent entries are considered as a prefix base. Subagent
+# conversations interleave with the main one, so a single "previous entry"
+# base would miss most shared prefixes.
+_BASE_CANDIDATES = 16
+
+
+def content_hash(value: object) -> str:
+    """Stable content address for a JSON value (canonical key order)."""
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+
+def is_dedup_entry(entry: dict) -> bool:
+    metadata = entry.get("_cc_dump")
+    return isinstance(metadata, dict) and isinstance(metadata.get("body_refs"), dict)
+
+
+def _common_prefix_len(a: tuple[str, ...], b: tuple[str, ...]) -> int:
+    limit = min(len(a), len(b))
+    i = 0
+    while i < limit and a[i] == b[i]:
+        i += 1
+    return i
+
+
+@dataclass(frozen=True)
+class EncodedBody:
+    """Result of encoding one request body; applied to encoder state via commit()."""
+
+    stripped_body: dict
+    body_refs: dict
+    blobs: dict[str, object]
+    message_hashes: tuple[str, ...]
+
+
+class PrefixDedupEncoder:
+    """Writer-side state: known blob hashes and recent message-hash sequences.
+
+    encode() is pure with respect to encoder state. The caller commits each
+    entry before encoding the next one, and rolls back (newest first) the
+    entries whose write failed, so the encoder never references blobs that
+    are not on disk.
+    """
+
+    def __init__(self) -> None:
+        self._known: set[str] = set()
+        self._recent: deque[tuple[int, tuple[str, ...]]] = deque(maxlen=_BASE_CANDIDATES)
+        self._entry_count = 0
+
+    def encode(self, body: dict) -> EncodedBody:
+        blobs: dict[str, object] = {}
+        stripped: dict = {}
+        refs: dict = {"order": list(body.keys())}
+        message_hashes: tuple[str, ...] = ()
+        for key, value in body.items():
+            if key == "messages" and isinstance(value, list):
+                message_hashes = tuple(self._ref(message, blobs) for message in value)
+                refs[key] = self._message_refs(message_hashes)
+                continue
+            field_refs = self._field_refs(key, value, blobs)
+            if field_refs is None:
+                stripped[key] = value
+            else:
+                refs[key] = field_refs
+        return EncodedBody(stripped, refs, blobs, message_hashes)
+
+    def _ref(self, value: object, blobs: dict[str, object]) -> str:
+        """Content address of value; first sightings are added to blobs."""
+        digest = content_hash(value)
+        if digest not in self._known:
+            blobs[digest] = value
+        return digest
+
+    def _field_refs(self, key: str, value: object, blobs: dict[str, object]) -> str | list[str] | None:
+        """Refs for a deduplicated body field; None keeps the field in the stripped body."""
+        if key == _SYSTEM_FIELD and isinstance(value, str):
+            return self._ref(value, blobs)
+        if (key == _SYSTEM_FIELD or key in _LIST_FIELDS) and isinstance(value, list):
+            return [self._ref(item, blobs) for item in value]
+        return None
+
+    def _message_refs(self, hashes: tuple[str, ...]) -> dict:
+        base, keep = -1, 0
+        for entry_index, previous in self._recent:
+            shared = _common_prefix_len(previous, hashes)
+            if shared > keep:
+                base, keep = entry_index, shared
+        return {"base": base, "keep": keep, "tail": list(hashes[keep:])}
+
+    def commit(self, encoded: EncodedBody) -> None:
+        self._known.update(encoded.blobs)
+        if encoded.message_hashes:
+            self._recent.append((self._entry_count, encoded.message_hashes))
+        self._entry_count += 1
+
+    def rollback(self, encoded: EncodedBody) -> None:
+        """Undo the most recent commit(encoded).
+
+        A base candidate that commit pushed out of the recent window stays
+        gone; later entries only deduplicate a little less.
+        """
+        self._known.difference_update(encoded.blobs)
+        if encoded.message_hashes:
+            self._recent.pop()
+        self._entry_count -= 1
+
+
+class PrefixDedupDecoder:
+    """Reader-side state: blob table and per-entry message-hash sequences.
+
+    ingest() must see every entry of a log in order (including entries the
+    caller later rejects) so ``base`` indices resolve against the same
+    numbering the writer used.
+    """
+
+    def __init__(self) -> None:
+        self._blobs: dict[str, object] = {}
+        self._messages_by_entry: list[tuple[str, ...]] = []
+
+    def ingest(self, entry: object) -> dict | None:
+        """Register an entry's blobs; return its resolved body refs (None for plain entries)."""
+        if not isinstance(entry, dict) or not is_dedup_entry(entry):
+            self._messages_by_entry.append(())
+            return None
+        metadata = entry["_cc_dump"]
+        blobs = metadata.get("blobs", {})
+        if isinstance(blobs, dict):
+            self._blobs.update(blobs)
+        refs = dict(metadata["body_refs"])
+        messages = refs.get("messages")
+        hashes: tuple[str, ...] = ()
+        try:
+            if isinstance(messages, dict):
+                hashes = self._resolve_message_hashes(messages)
+                refs["messages"] = list(hashes)
+        finally:
+            # Keep entry numbering aligned even when this entry is unusable.
+            self._messages_by_entry.append(hashes)
+        return refs
+
+    def _resolve_message_hashes(self, messages: dict) -> tuple[str, ...]:
+        base = int(messages.get("base", -1))
+        keep = int(messages.get("keep", 0))
+        tail = tuple(messages.get("tail", ()))
+        if keep <= 0:
+            return tail
+        if not 0 <= base < len(self._messages_by_entry):
+            raise ValueError(f"message prefix references unknown entry {base}")
+        prefix = self._messages_by_entry[base]
+        if keep > len(prefix):
+            raise ValueError(f"message prefix of entry {base} is shorter than {keep}")
+        return prefix[:keep] + tail
+
+    def _blob(self, digest: str) -> object:
+        try:
+            return self._blobs[digest]
+        except KeyError:
+            raise ValueError(f"missing blob {digest}") from None
+
+    def rebuild_body(self, stripped_body: dict, refs: dict) -> dict:
+        """Expand resolved refs back into the original request body.
+
+        Blob values are shared between rebuilt bodies; callers treat request
+        bodies as read-only, as they do for bodies decoded from standard HAR.
+        """
+        body: dict = {}
+        for key in refs.get("order", ()):
+            if key in stripped_body:
+                body[key] = stripped_body[key]
+            elif key not in refs:
+                continue
+            elif isinstance(refs[key], str):
+                body[key] = self._blob(refs[key])
+            else:
+                body[key] = [self._blob(digest) for digest in refs[key]]
+        for key, value in stripped_body.items():
+            body.setdefault(key, value)
+        return body
@@ -2,12 +2,24 @@
 
 Accumulates streaming SSE events and reconstructs complete HTTP request/response
 pairs in HAR 1.2 format for replay and analysis in standard tools.
+
+// [LAW:locality-or-seam] Disk I/O happens on the recorder's writer thread:
+// on_event() only tracks exchanges and queues completed ones. The writer
+// takes whatever has queued up, serializes each entry once and appends the
+// group with a single footer rewrite.
+
+fsync policy: "never" leaves durability to the OS (flush only), "group"
+fsyncs after every group commit, "close" fsyncs once when the file closes.
 """
 
 import json
 import logging
 import os
+import queue
+import threading
+import time
 from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import TextIO
@@ -20,10 +32,24 @@ from cc_dump.pipeline.event_types import (
     RequestBodyEvent,
     ResponseHeadersEvent,
 )
+import cc_dump.io.recording_catalog
+import cc_dump.pipeline.har_dedup
 import cc_dump.providers
 
 logger = logging.getLogger(__name__)
 
+FSYNC_NEVER = "never"
+FSYNC_GROUP = "group"
+FSYNC_CLOSE = "close"
+FSYNC_POLICIES = (FSYNC_NEVER, FSYNC_GROUP, FSYNC_CLOSE)
+
+# Most entries one group commit appends; the rest wait for the next group.
+_MAX_GROUP_ENTRIES = 64
+# Completed exchanges the writer may fall behind by. Past this, completed
+# exchanges are dropped (and counted) rather than stalling the router.
+_MAX_QUEUED_ENTRIES = 1024
+_FOOTER = "\n]}}"
+
 
 def build_har_request(method: str, url: str, headers: dict, body: dict) -> dict:
     """Build HAR request entry from HTTP headers and JSON body.
@@ -37,10 +63,42 @@ def build_har_request(method: str, url: str, headers: dict, body: dict) -> dict:
     Returns:
         HAR request structure with method, url, headers, postData
     """
+    text = json.dumps(_synthetic_request_body(body))
+    return _har_request_from_text(
+        method, url, headers, text, body_size=len(text.encode("utf-8"))
+    )
+
+
+def build_dedup_har_request(
+    method: str,
+    url: str,
+    headers: dict,
+    body: dict,
+    encoder: cc_dump.pipeline.har_dedup.PrefixDedupEncoder,
+) -> tuple[dict, cc_dump.pipeline.har_dedup.EncodedBody]:
+    """Build a HAR request whose postData holds only the non-deduplicated fields.
+
+    The caller stores ``encoded.body_refs`` / ``encoded.blobs`` on the entry and
+    commits ``encoded`` to the encoder once the entry is written. bodySize is
+    -1 (unknown) because the full body is never serialized here.
+    """
+    encoded = encoder.encode(_synthetic_request_body(body))
+    har_request = _har_request_from_text(
+        method, url, headers, json.dumps(encoded.stripped_body), body_size=-1
+    )
+    return har_request, encoded
+
+
+def _synthetic_request_body(body: dict) -> dict:
     # Create synthetic non-streaming request body for clarity in HAR viewers
     synthetic_body = body.copy()
     synthetic_body["stream"] = False
+    return synthetic_body
 
+
+def _har_request_from_text(
+    method: str, url: str, headers: dict, text: str, *, body_size: int
+) -> dict:
     # Convert headers dict to HAR format (list of name/value pairs)
     har_headers = [{"name": k, "value": v} for k, v in headers.items()]
 
@@ -52,10 +110,10 @@ def build_har_request(method: str, url: str, headers: dict, body: dict) -> dict:
         "queryString": [],
         "postData": {
             "mimeType": "application/json",
-            "text": json.dumps(synthetic_body),
+            "text": text,
         },
         "headersSize": -1,
-        "bodySize": len(json.dumps(synthetic_body).encode("utf-8")),
+        "bodySize": body_size,
     }
 
 
@@ -74,11 +132,12 @@ def build_har_response(
         HAR response structure with status, headers, content, timings
     """
     response_text = json.dumps(complete_message)
+    response_size = len(response_text.encode("utf-8"))
 
     # Synthetic headers for non-streaming response
     har_headers = [
         {"name": "content-type", "value": "application/json"},
-        {"name": "content-length", "value": str(len(response_text.encode("utf-8")))},
+        {"name": "content-length", "value": str(response_size)},
     ]
 
     # Add additional headers if provided
@@ -92,13 +151,13 @@ def build_har_response(
         "httpVersion": "HTTP/1.1",
         "headers": har_headers,
         "content": {
-            "size": len(response_text.encode("utf-8")),
+            "size": response_size,
             "mimeType": "application/json",
             "text": response_text,
         },
         "redirectURL": "",
         "headersSize": -1,
-        "bodySize": len(response_text.encode("utf-8")),
+        "bodySize": response_size,
     }
 
 
@@ -113,18 +172,51 @@ class _PendingExchange:
     complete_message: dict | None = None
     request_start_time: datetime | None = None
     provider: str = "anthropic"
+    # Set when the exchange is handed to the writer.
+    end_time: datetime | None = None
+    queued_ns: int = 0
+
+
+@dataclass(frozen=True)
+class _HarFormat:
+    """What one output format adds to a HAR file."""
+
+    # Extra log-level header fields, written before "entries".
+    log_fields: dict
+    # Request-body encoder for the format; None writes full bodies.
+    new_encoder: Callable[[], cc_dump.pipeline.har_dedup.PrefixDedupEncoder | None]
+
+
+# [LAW:dataflow-not-control-flow] Keyed by the dedup flag.
+_HAR_FORMATS: dict[bool, _HarFormat] = {
+    False: _HarFormat(log_fields={}, new_encoder=lambda: None),
+    True: _HarFormat(
+        log_fields={"_cc_dump": {"format": cc_dump.pipeline.har_dedup.FORMAT}},
+        new_encoder=cc_dump.pipeline.har_dedup.PrefixDedupEncoder,
+    ),
+}
+
+
+def _checked_fsync_policy(fsync: str) -> str:
+    if fsync not in FSYNC_POLICIES:
+        raise ValueError(f"unknown fsync policy {fsync!r}; expected one of {FSYNC_POLICIES}")
+    return fsync
+
 
+# (exchange, entry, entry JSON, dedup encoding) for one entry of a group commit.
+_SerializedEntry = tuple[_PendingExchange, dict, str, cc_dump.pipeline.har_dedup.EncodedBody | None]
 
 
 class HARRecordingSubscriber:
-    """Subscriber that accumulates events and writes HAR entries incrementally.
+    """Subscriber that accumulates events and appends HAR entries from a writer thread.
 
-    This is a DirectSubscriber-style component that runs inline in the router
-    thread. It writes each complete HAR entry immediately to disk, so the file
-    is always valid HAR JSON and close() is instant.
+    on_event() runs wherever the router delivers it and never touches the
+    disk: a completed exchange is queued for the writer thread, which keeps
+    the file valid HAR JSON after every group it commits. flush() waits for
+    the queue to be written; close() drains it fully before closing the file.
 
     File creation is deferred until the first entry is committed, so sessions
-    with no API traffic produce no file at all.
+    with no API traffic produce no file (and start no thread) at all.
     """
 
     def __init__(
@@ -132,15 +224,25 @@ class HARRecordingSubscriber:
         path: str,
         *,
         provider_filter: str = "",
+        dedup: bool = False,
+        fsync: str = FSYNC_NEVER,
     ):
         """Initialize HAR recorder. File is NOT created until first entry.
 
         Args:
             path: Output file path for HAR file
             provider_filter: Optional provider id; non-matching events are ignored.
+            dedup: Store request bodies in the prefix-deduplicated format
+                (see cc_dump.pipeline.har_dedup). Expand with
+                har_replayer.expand_har for tools that need standard HAR.
+            fsync: One of FSYNC_POLICIES (see module docstring).
         """
+        self._fsync = _checked_fsync_policy(fsync)
         self.path = path
         self._provider_filter = str(provider_filter or "").strip().lower()
+        har_format = _HAR_FORMATS[bool(dedup)]
+        self._log_fields = har_format.log_fields
+        self._dedup_encoder = har_format.new_encoder()
 
         # [LAW:one-source-of-truth] Request-scoped pending exchange state.
         self._pending_by_request: OrderedDict[str, _PendingExchange] = OrderedDict()
@@ -149,11 +251,31 @@ class HARRecordingSubscriber:
         # Diagnostic counters for investigation if something goes wrong
         self._events_received: dict[str, int] = {}
 
-        # Lazy file init — _file is None until first entry
+        # Completed exchanges waiting for the writer; None tells it to stop.
+        self._queue: queue.Queue[_PendingExchange | None] = queue.Queue(maxsize=_MAX_QUEUED_ENTRIES)
+        self._writer: threading.Thread | None = None
+        # Guards starting the writer against close(); exchanges after close() are dropped.
+        self._lifecycle_lock = threading.Lock()
+        self._closed = False
+        self._stats_lock = threading.Lock()
+        self._writer_stats = {
+            "entries_written": 0,
+            "groups_written": 0,
+            "max_group_entries": 0,
+            "write_errors": 0,
+            "entries_dropped": 0,
+            "fsyncs": 0,
+            "lag_total_ms": 0,
+            "lag_max_ms": 0,
+        }
+
+        # Writer-thread state. Lazy file init — _file is None until first entry
         self._file: TextIO | None = None
         self._entries_end_pos = 0
         self._first_entry = True
         self._entry_count = 0
+        # Listing metadata, folded in per written entry and mirrored to the catalog.
+        self._catalog_summary = cc_dump.io.recording_catalog.new_summary()
 
     def _read_max_pending_requests(self) -> int:
         """Read bounded pending-request cap from env with safe fallback."""
@@ -183,6 +305,8 @@ class HARRecordingSubscriber:
             "log": {
                 "version": "1.2",
                 "creator": {"name": "cc-dump", "version": "0.2.0"},
+                **self._log_fields,
+                # entries must stay last: the preamble below is cut at its opening [.
                 "entries": [],
             }
         }
@@ -192,7 +316,7 @@ class HARRecordingSubscriber:
         self._file = open(self.path, "w", encoding="utf-8")
         self._file.write(preamble)
         self._entries_end_pos = self._file.tell()
-        self._file.write("\n]}}")
+        self._file.write(_FOOTER)
         self._file.flush()
 
     def on_event(self, event: PipelineEvent) -> None:
@@ -201,7 +325,7 @@ class HARRecordingSubscriber:
         State machine:
         - request_headers + request -> store pending request
         - response_headers -> store response metadata
-        - response_complete -> build HAR entry from complete message
+        - response_complete -> queue the exchange for the writer thread
 
         Errors are logged but never crash the router.
         """
@@ -247,102 +371,248 @@ class HARRecordingSubscriber:
             # [LAW:one-source-of-truth] Complete message from ResponseAssembler
             assert isinstance(event, ResponseCompleteEvent)
             pending.complete_message = event.body
-            self._commit_entry(request_key)
+            self._queue_entry(request_key)
 
-    def _commit_entry(self, request_key: str) -> None:
-        """Reconstruct complete message and write HAR entry to disk immediately."""
-        pending = self._pending_by_request.get(request_key)
-        if pending is None:
-            return
-        if not pending.request_body or not pending.complete_message:
+    def _queue_entry(self, request_key: str) -> None:
+        """Hand a completed exchange to the writer thread and clear its state."""
+        pending = self._pending_by_request.pop(request_key, None)
+        if pending is None or not pending.request_body or not pending.complete_message:
             return
+        pending.end_time = datetime.now(timezone.utc)
+        pending.queued_ns = time.monotonic_ns()
+        with self._lifecycle_lock:
+            if self._closed:
+                logger.warning("HAR recorder for %s is closed; dropping entry %s", self.path, request_key)
+                return
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_loop,
+                    name=f"cc-dump-har-writer-{os.path.basename(self.path)}",
+                    daemon=True,
+                )
+                self._writer.start()
+            # Never blocks: the router thread must not wait on the disk.
+            try:
+                self._queue.put_nowait(pending)
+            except queue.Full:
+                self._drop_entry(request_key)
+
+    def _drop_entry(self, request_key: str) -> None:
+        with self._stats_lock:
+            self._writer_stats["entries_dropped"] += 1
+        logger.warning(
+            "HAR writer for %s is %d entries behind; dropping entry %s",
+            self.path,
+            _MAX_QUEUED_ENTRIES,
+            request_key,
+        )
+
+    def flush(self) -> None:
+        """Block until every exchange queued so far is on disk."""
+        self._queue.join()
+
+    def stats(self) -> dict[str, int]:
+        """Writer counters; lag is the time from response complete to written."""
+        with self._stats_lock:
+            return {**self._writer_stats, "queued": self._queue.qsize()}
+
+    # -- writer thread ----------------------------------------------------
+
+    def _write_loop(self) -> None:
+        """Writer thread: commit whatever has queued up as one group until told to stop."""
+        stop = False
+        while not stop:
+            group, stop = self._next_group()
+            try:
+                if group:
+                    self._commit_group(group)
+            except Exception:
+                logger.exception("HAR writer error")
+            finally:
+                for _ in range(len(group) + int(stop)):
+                    self._queue.task_done()
+
+    def _next_group(self) -> tuple[list[_PendingExchange], bool]:
+        """Wait for one exchange, then take what else is queued; True once the stop marker is taken."""
+        group: list[_PendingExchange] = []
+        item = self._queue.get()
+        while item is not None:
+            group.append(item)
+            if len(group) >= _MAX_GROUP_ENTRIES:
+                return group, False
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return group, False
+        return group, True
 
+    def _commit_group(self, group: list[_PendingExchange]) -> None:
+        """Serialize each entry once, then append the group with one footer rewrite."""
         # Lazy file creation — only when we have a real entry to write
         if self._file is None:
             self._open_file()
 
-        try:
-            complete_message = pending.complete_message
-
-            # Calculate timing
-            end_time = datetime.now(timezone.utc)
-            time_ms = (
-                (end_time - pending.request_start_time).total_seconds() * 1000
-                if pending.request_start_time
-                else 0.0
-            )
-
-            # [LAW:dataflow-not-control-flow] HAR URL derived from provider registry.
-            har_url = cc_dump.providers.get_provider_spec(pending.provider).har_request_url
+        serialized = self._serialize_group(group)
+        if not serialized or not self._append_group(serialized):
+            return
 
-            # Build HAR request/response
+        self._first_entry = False
+        self._entry_count += len(serialized)
+        for pending, entry, _, _ in serialized:
+            cc_dump.io.recording_catalog.add_entry(
+                self._catalog_summary, entry, pending.request_body, pending.complete_message
+            )
+        self._update_catalog()
+        self._record_group(serialized)
+
+    def _serialize_group(self, group: list[_PendingExchange]) -> list[_SerializedEntry]:
+        # Dedup state advances per entry so later entries in the group can
+        # reference earlier ones; it is rolled back if the group write fails.
+        serialized: list[_SerializedEntry] = []
+        for pending in group:
+            try:
+                entry, encoded = self._build_entry(pending)
+                entry_json = json.dumps(entry, ensure_ascii=False)
+            except Exception as e:
+                # Skip bad entries without corrupting file
+                logger.exception("error serializing HAR entry: %s", e)
+                continue
+            if encoded is not None:
+                self._dedup_encoder.commit(encoded)
+            serialized.append((pending, entry, entry_json, encoded))
+        return serialized
+
+    def _append_group(self, serialized: list[_SerializedEntry]) -> bool:
+        """Write the group and the footer after the last entry; False (rolled back) on failure."""
+        separator = "\n" if self._first_entry else ",\n"
+        chunk = separator + ",\n".join(entry_json for _, _, entry_json, _ in serialized)
+        start = self._entries_end_pos
+        try:
+            # Seek to entries end position and overwrite footer
+            self._file.seek(start)
+            self._file.write(chunk)
+            self._entries_end_pos = self._file.tell()
+            # Write footer to maintain valid HAR
+            self._file.write(_FOOTER)
+            self._file.flush()
+            if self._fsync == FSYNC_GROUP:
+                os.fsync(self._file.fileno())
+        except (OSError, ValueError):
+            # ValueError: the file was closed underneath the writer.
+            logger.exception("error writing %d HAR entries to %s", len(serialized), self.path)
+            self._rollback_group(start, serialized)
+            return False
+        return True
+
+    def _build_entry(
+        self, pending: _PendingExchange
+    ) -> tuple[dict, cc_dump.pipeline.har_dedup.EncodedBody | None]:
+        """HAR entry for one exchange, plus its dedup encoding (None when not deduplicating)."""
+        end_time = pending.end_time or datetime.now(timezone.utc)
+        time_ms = (
+            (end_time - pending.request_start_time).total_seconds() * 1000
+            if pending.request_start_time
+            else 0.0
+        )
+
+        # [LAW:dataflow-not-control-flow] HAR URL derived from provider registry.
+        har_url = cc_dump.providers.get_provider_spec(pending.provider).har_request_url
+
+        encoded = None
+        if self._dedup_encoder is None:
             har_request = build_har_request(
                 method="POST",
                 url=har_url,
                 headers=pending.request_headers or {},
                 body=pending.request_body,
             )
-
-            har_response = build_har_response(
-                status=pending.response_status or 200,
-                headers=pending.response_headers or {},
-                complete_message=complete_message,
-                time_ms=time_ms,
+        else:
+            har_request, encoded = build_dedup_har_request(
+                method="POST",
+                url=har_url,
+                headers=pending.request_headers or {},
+                body=pending.request_body,
+                encoder=self._dedup_encoder,
             )
 
-            # Create HAR entry
-            entry = {
-                "startedDateTime": pending.request_start_time.isoformat()
-                if pending.request_start_time
-                else datetime.now(timezone.utc).isoformat(),
-                "time": time_ms,
-                "request": har_request,
-                "response": har_response,
-                "cache": {},
-                "timings": {
-                    "send": 0,
-                    "wait": time_ms,
-                    "receive": 0,
-                },
-            }
-            # HAR allows custom fields using underscore prefix.
-            entry["_cc_dump"] = {"provider": pending.provider}
-
-            # Serialize entry (compact JSON, no indent)
-            entry_json = json.dumps(entry, ensure_ascii=False)
-
-            # Seek to entries end position and overwrite footer
-            self._file.seek(self._entries_end_pos)
-
-            # Write entry with comma separator (if not first)
-            if self._first_entry:
-                self._file.write(f"\n{entry_json}")
-                self._first_entry = False
-            else:
-                self._file.write(f",\n{entry_json}")
-
-            # Update entries end position
-            self._entries_end_pos = self._file.tell()
-
-            # Write footer to maintain valid HAR
-            self._file.write("\n]}}")
+        har_response = build_har_response(
+            status=pending.response_status or 200,
+            headers=pending.response_headers or {},
+            complete_message=pending.complete_message,
+            time_ms=time_ms,
+        )
+
+        entry = {
+            "startedDateTime": pending.request_start_time.isoformat()
+            if pending.request_start_time
+            else end_time.isoformat(),
+            "time": time_ms,
+            "request": har_request,
+            "response": har_response,
+            "cache": {},
+            "timings": {
+                "send": 0,
+                "wait": time_ms,
+                "receive": 0,
+            },
+        }
+        # HAR allows custom fields using underscore prefix.
+        cc_dump_fields: dict[str, object] = {"provider": pending.provider}
+        if encoded is not None:
+            cc_dump_fields["body_refs"] = encoded.body_refs
+            cc_dump_fields["blobs"] = encoded.blobs
+        entry["_cc_dump"] = cc_dump_fields
+        return entry, encoded
+
+    def _rollback_group(self, start: int, serialized: list[_SerializedEntry]) -> None:
+        """Cut a failed group off the file and forget its dedup state."""
+        self._entries_end_pos = start
+        if self._dedup_encoder is not None:
+            for _, _, _, encoded in reversed(serialized):
+                if encoded is not None:
+                    self._dedup_encoder.rollback(encoded)
+        with self._stats_lock:
+            self._writer_stats["write_errors"] += 1
+        try:
+            self._file.seek(start)
+            self._file.truncate()
+            self._file.write(_FOOTER)
             self._file.flush()
-
-            self._entry_count += 1
-
-        except Exception as e:
-            # Skip bad entries without corrupting file
-            logger.exception("error serializing HAR entry: %s", e)
-
-        # Clear state for this request.
-        self._pending_by_request.pop(request_key, None)
+        except (OSError, ValueError):
+            logger.exception("could not restore HAR footer in %s", self.path)
+
+    def _record_group(self, serialized: list[_SerializedEntry]) -> None:
+        now_ns = time.monotonic_ns()
+        lags_ms = [(now_ns - pending.queued_ns) // 1_000_000 for pending, _, _, _ in serialized]
+        with self._stats_lock:
+            stats = self._writer_stats
+            stats["entries_written"] += len(serialized)
+            stats["groups_written"] += 1
+            stats["max_group_entries"] = max(stats["max_group_entries"], len(serialized))
+            stats["fsyncs"] += int(self._fsync == FSYNC_GROUP)
+            stats["lag_total_ms"] += sum(lags_ms)
+            stats["lag_max_ms"] = max(stats["lag_max_ms"], *lags_ms)
+
+    def _update_catalog(self) -> None:
+        """Record this file's summary so listings never need to re-read it.
+
+        The catalog is a cache; failing to update it only costs a later re-scan.
+        """
+        try:
+            cc_dump.io.recording_catalog.record_recording(self.path, self._catalog_summary)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("could not update recording catalog for %s: %s", self.path, e)
 
     def close(self) -> None:
-        """Close file handle and enforce non-empty invariant.
+        """Drain the writer, close the file and enforce the non-empty invariant.
 
-        If no entries were written, the file is deleted (if it exists) and a
-        diagnostic message is emitted to stderr for investigation.
+        Every exchange queued before close() is written first; exchanges
+        completed after it are dropped. If no entries were written, the file
+        is deleted (if it exists) and a diagnostic message is emitted to
+        stderr for investigation.
         """
+        self._stop_writer()
+
         if self._file is None:
             # File was never opened — no entries, no file. Expected path for
             # sessions with no API traffic. Log quietly for diagnostics.
@@ -356,6 +626,7 @@ class HARRecordingSubscriber:
             return
 
         try:
+            self._fsync_on_close()
             self._file.close()
         except Exception as e:
             logger.exception("error closing HAR file: %s", e)
@@ -375,3 +646,23 @@ class HARRecordingSubscriber:
             except OSError as e:
                 logger.exception("failed to delete empty HAR file %s: %s", self.path, e)
             return
+
+    def _stop_writer(self) -> None:
+        """Refuse new exchanges, then let the writer drain the queue and exit."""
+        with self._lifecycle_lock:
+            self._closed = True
+            writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        # Outside the lock: nothing queues after _closed, and the marker may wait for room.
+        self._queue.put(None)
+        writer.join()
+        logger.info("HAR writer for %s: %s", os.path.basename(self.path), self.stats())
+
+    def _fsync_on_close(self) -> None:
+        if self._fsync != FSYNC_CLOSE or not self._entry_count:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        with self._stats_lock:
+            self._writer_stats["fsyncs"] += 1
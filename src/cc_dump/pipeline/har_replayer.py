@@ -6,7 +6,9 @@ typed events the live pipeline produces.
 
 import json
 import logging
+import os
 
+import cc_dump.pipeline.har_dedup
 import cc_dump.providers
 from cc_dump.pipeline.event_types import (
     PipelineEvent,
@@ -31,6 +33,55 @@ def _load_json_object(text: str, *, entry_index: int, field_name: str) -> dict[s
         raise ValueError(f"Entry {entry_index}: {field_name} must decode to a JSON object")
     return payload
 
+
+def _read_har_log(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        har = json.load(f)
+
+    # Validate HAR structure
+    if "log" not in har:
+        raise ValueError("Invalid HAR: missing 'log' key")
+
+    log = har["log"]
+    if "entries" not in log:
+        raise ValueError("Invalid HAR: missing 'log.entries' key")
+
+    if not isinstance(log["entries"], list):
+        raise ValueError("Invalid HAR: log.entries must be a list")
+    return log
+
+
+def _request_body(
+    entry: object,
+    entry_index: int,
+    decoder: cc_dump.pipeline.har_dedup.PrefixDedupDecoder,
+) -> dict[str, object]:
+    """Decode an entry's request body, expanding prefix-deduplicated references.
+
+    Every entry must pass through here in file order, even ones that turn out
+    malformed, so the decoder's entry numbering matches the writer's.
+    """
+    refs = decoder.ingest(entry)
+    i = entry_index
+    if not isinstance(entry, dict) or "request" not in entry:
+        raise ValueError(f"Entry {i}: missing 'request' key")
+    request = entry["request"]
+
+    if "postData" not in request:
+        raise ValueError(f"Entry {i}: missing 'request.postData' key")
+
+    post_data = request["postData"]
+    if "text" not in post_data:
+        raise ValueError(f"Entry {i}: missing 'request.postData.text' key")
+
+    request_body = _load_json_object(
+        post_data["text"],
+        entry_index=i,
+        field_name="request.postData.text",
+    )
+    return request_body if refs is None else decoder.rebuild_body(request_body, refs)
+
+
 def load_har(path: str) -> list[tuple[dict, dict, int, dict, dict, str]]:
     """Load HAR file and extract request/response pairs.
 
@@ -45,42 +96,17 @@ def load_har(path: str) -> list[tuple[dict, dict, int, dict, dict, str]]:
         FileNotFoundError: If file doesn't exist
         json.JSONDecodeError: If file is not valid JSON
     """
-    with open(path, "r", encoding="utf-8") as f:
-        har = json.load(f)
-
-    # Validate HAR structure
-    if "log" not in har:
-        raise ValueError("Invalid HAR: missing 'log' key")
-
-    log = har["log"]
-    if "entries" not in log:
-        raise ValueError("Invalid HAR: missing 'log.entries' key")
-
+    log = _read_har_log(path)
     entries = log["entries"]
-    if not isinstance(entries, list):
-        raise ValueError("Invalid HAR: log.entries must be a list")
 
+    # Prefix-deduplicated recordings resolve bodies against earlier entries.
+    decoder = cc_dump.pipeline.har_dedup.PrefixDedupDecoder()
     pairs = []
     for i, entry in enumerate(entries):
         try:
-            # Extract request body
-            if "request" not in entry:
-                raise ValueError(f"Entry {i}: missing 'request' key")
+            request_body = _request_body(entry, i, decoder)
             request = entry["request"]
 
-            if "postData" not in request:
-                raise ValueError(f"Entry {i}: missing 'request.postData' key")
-
-            post_data = request["postData"]
-            if "text" not in post_data:
-                raise ValueError(f"Entry {i}: missing 'request.postData.text' key")
-
-            request_body = _load_json_object(
-                post_data["text"],
-                entry_index=i,
-                field_name="request.postData.text",
-            )
-
             # Extract response body
             if "response" not in entry:
                 raise ValueError(f"Entry {i}: missing 'response' key")
@@ -155,6 +181,55 @@ def load_har(path: str) -> list[tuple[dict, dict, int, dict, dict, str]]:
     return pairs
 
 
+def expand_har(src_path: str, dst_path: str) -> int:
+    """Write a standard HAR copy of a recording, expanding deduplicated bodies.
+
+    Standard recordings are copied through unchanged. The source log is
+    parsed in full; expanded entries are written one at a time, so the
+    expanded request bodies are never all in memory together.
+
+    Returns:
+        Number of entries written.
+    """
+    log = _read_har_log(src_path)
+    entries = log["entries"]
+    header = {key: value for key, value in log.items() if key not in ("entries", "_cc_dump")}
+
+    decoder = cc_dump.pipeline.har_dedup.PrefixDedupDecoder()
+    os.makedirs(os.path.dirname(os.path.abspath(dst_path)), exist_ok=True)
+    written = 0
+    with open(dst_path, "w", encoding="utf-8") as out:
+        out.write(json.dumps({"log": {**header, "entries": []}}, ensure_ascii=False)[:-3])
+        for i, entry in enumerate(entries):
+            try:
+                request_body = _request_body(entry, i, decoder)
+            except (KeyError, json.JSONDecodeError, ValueError) as e:
+                logger.warning("skipping HAR entry %s: %s", i, e)
+                continue
+            out.write(",\n" if written else "\n")
+            out.write(json.dumps(_expanded_entry(entry, request_body), ensure_ascii=False))
+            written += 1
+        out.write("\n]}}")
+    return written
+
+
+def _expanded_entry(entry: dict, request_body: dict) -> dict:
+    if not cc_dump.pipeline.har_dedup.is_dedup_entry(entry):
+        return entry
+    text = json.dumps(request_body)
+    request = {
+        **entry["request"],
+        "postData": {**entry["request"]["postData"], "text": text},
+        "bodySize": len(text.encode("utf-8")),
+    }
+    metadata = {
+        key: value
+        for key, value in entry["_cc_dump"].items()
+        if key not in ("body_refs", "blobs")
+    }
+    return {**entry, "request": request, "_cc_dump": metadata}
+
+
 def convert_to_events(
     request_headers: dict,
     request_body: dict,
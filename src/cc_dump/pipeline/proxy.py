@@ -5,12 +5,11 @@ import json
 import logging
 import queue
 import ssl
-
-import truststore
+import threading
+import time
 import uuid
-import urllib.error
-import urllib.request
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -26,6 +25,7 @@ from cc_dump.pipeline.event_types import (
     ResponseHeadersEvent,
     ResponseProgressEvent,
     event_envelope,
+    merge_progress_events,
     new_request_id,
     parse_sse_event,
     sse_progress_payload,
@@ -34,6 +34,7 @@ from cc_dump.pipeline.response_assembler import (
     OpenAiChatResponseAssembler,
     ResponseAssembler,
 )
+from cc_dump.pipeline.upstream_pool import UpstreamConnectionPool
 import cc_dump.pipeline.proxy_flow
 import cc_dump.providers
 
@@ -52,6 +53,8 @@ _EXCLUDED_HEADERS = frozenset(
         "transfer-encoding",
     }
 )
+# Upstream connection-management headers must not leak to the client connection.
+_HOP_BY_HOP_RESPONSE_HEADERS = frozenset({"transfer-encoding", "connection", "keep-alive"})
 logger = logging.getLogger(__name__)
 
 
@@ -109,6 +112,10 @@ def _parse_connect_authority(authority: str) -> tuple[str, int] | None:
     return host, port
 
 
+def _always(_body_bytes: bytes) -> bool:
+    return True
+
+
 # ─── Request Pipeline ────────────────────────────────────────────────────────
 # // [LAW:dataflow-not-control-flow] Transforms compose by chaining; interceptors compose by first-match.
 
@@ -124,6 +131,21 @@ class RequestPipeline:
     transforms: list[Callable[[dict, str], tuple[dict, str]]] = field(default_factory=list)
     interceptors: list[Callable[[dict], str | None]] = field(default_factory=list)
 
+    def may_rewrite(self, body_bytes: bytes) -> bool:
+        """Whether process() could change or intercept a request with this raw body.
+
+        False lets the proxy forward the original bytes before parsing them.
+        Transforms always may. An interceptor may expose a cheap raw-bytes
+        prefilter as a ``may_intercept(body_bytes) -> bool`` attribute (False
+        must mean it cannot match); interceptors without one always may.
+        """
+        if self.transforms:
+            return True
+        return any(
+            getattr(interceptor, "may_intercept", _always)(body_bytes)
+            for interceptor in self.interceptors
+        )
+
     def process(self, body: dict, url: str) -> tuple[dict, str, str | None]:
         """Run pipeline. Returns (body, url, intercept_response_or_none)."""
         for transform in self.transforms:
@@ -229,26 +251,112 @@ class StreamSink:
     def on_done(self) -> None:
         pass
 
+    def flush_deadline_ns(self) -> int | None:
+        """monotonic_ns by which held-back output must be flushed, or None."""
+        return None
+
+    def flush(self) -> None:
+        pass
+
 
 class ClientSink(StreamSink):
-    """Writes raw SSE bytes back to the HTTP client."""
+    """Writes raw SSE bytes back to the HTTP client, one write+flush per call."""
 
     def __init__(self, wfile):
         self._wfile = wfile
+        self.writes = 0
 
     def on_raw(self, data):
         self._wfile.write(data)
         self._wfile.flush()
+        self.writes += 1
+
+
+class StreamStats:
+    """Process-wide SSE passthrough counters.
+
+    client_writes counts write+flush pairs to clients (one send syscall each);
+    upstream_reads counts reads from upstream responses. The parse_* counters
+    describe the handoff to off-thread parsing: parse_lag_* is the time a
+    frame waited between being relayed to the client and being parsed, and
+    parse_backpressure counts frames the relay had to wait to hand off;
+    inline_parsed_streams counts streams parsed by their relay because every
+    parser thread was busy.
+    progress_events counts ResponseProgressEvents put on the event queue;
+    progress_coalesced counts the ones merged away before that.
+    bodies_relayed counts non-SSE response bodies passed through in chunks;
+    body_tee_overflows counts the ones too large to keep a copy of.
+    """
+
+    _MAX_KEYS = frozenset({"parse_lag_max_us"})
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {
+            "streams": 0,
+            "upstream_reads": 0,
+            "client_writes": 0,
+            "sse_events": 0,
+            "bytes_relayed": 0,
+            "parsed_streams": 0,
+            "parse_frames": 0,
+            "parse_lag_total_us": 0,
+            "parse_lag_max_us": 0,
+            "parse_backpressure": 0,
+            "inline_parsed_streams": 0,
+            "progress_events": 0,
+            "progress_coalesced": 0,
+            "bodies_relayed": 0,
+            "body_tee_overflows": 0,
+        }
+
+    def record(self, **counts: int) -> None:
+        """Add counts; keys in _MAX_KEYS keep the maximum instead."""
+        with self._lock:
+            for key, value in counts.items():
+                if key in self._MAX_KEYS:
+                    self._counts[key] = max(self._counts[key], value)
+                else:
+                    self._counts[key] += value
+
+    def stats(self) -> dict[str, int]:
+        """Snapshot of passthrough counters."""
+        with self._lock:
+            return dict(self._counts)
 
 
 class EventQueueSink(StreamSink):
-    """Emits parsed events to the TUI event queue."""
+    """Emits parsed events to the TUI event queue.
+
+    With coalesce_window_s > 0, consecutive progress events for the same
+    content block are held back and merged (merge_progress_events) into one,
+    flushed when the window since the first held event elapses, when the held
+    delta text reaches coalesce_max_chars, when an unmergeable event arrives,
+    or on_done. Concatenated deltas render exactly like the originals, so the
+    assembled output is unchanged; only the event count drops.
+    """
 
-    def __init__(self, queue, request_id: str = "", seq_start: int = 0, provider: str = "anthropic"):
+    def __init__(
+        self,
+        queue,
+        request_id: str = "",
+        seq_start: int = 0,
+        provider: str = "anthropic",
+        *,
+        coalesce_window_s: float = 0.0,
+        coalesce_max_chars: int = 4096,
+    ):
         self._queue = queue
         self._request_id = request_id
         self._seq = seq_start
         self._provider = provider
+        self._window_ns = int(coalesce_window_s * 1e9)
+        self._max_chars = coalesce_max_chars
+        self._held: ResponseProgressEvent | None = None
+        self._held_key: object = None
+        self._held_since_ns = 0
+        self.emitted = 0
+        self.coalesced = 0
 
     def on_event(self, event_type, event):
         # [LAW:dataflow-not-control-flow] Provider family selects extraction strategy.
@@ -258,24 +366,64 @@ class EventQueueSink(StreamSink):
         if payload is None:
             return
         self._seq += 1
-        self._queue.put(
-            ResponseProgressEvent(
-                **event_envelope(
-                    request_id=self._request_id,
-                    seq=self._seq,
-                    provider=self._provider,
-                ),
-                **payload,
-            )
+        progress = ResponseProgressEvent(
+            **event_envelope(
+                request_id=self._request_id,
+                seq=self._seq,
+                provider=self._provider,
+            ),
+            **payload,
         )
+        self._hold(progress, _content_block_key(event))
 
     def on_done(self):
-        pass  # [LAW:single-enforcer] proxy emits ResponseDoneEvent explicitly
+        # [LAW:single-enforcer] proxy emits ResponseDoneEvent explicitly
+        self.flush()
+
+    def flush_deadline_ns(self) -> int | None:
+        return None if self._held is None else self._held_since_ns + self._window_ns
+
+    def flush(self) -> None:
+        held, self._held = self._held, None
+        if held is not None:
+            self._emit(held)
 
     @property
     def seq(self) -> int:
         return self._seq
 
+    def _hold(self, progress: ResponseProgressEvent, block_key: object) -> None:
+        """Merge into or replace the held event; flush once it is due (at once with no window)."""
+        now_ns = time.monotonic_ns()
+        merged = (
+            merge_progress_events(self._held, progress)
+            if self._held is not None and block_key == self._held_key
+            else None
+        )
+        if merged is not None:
+            self._held = merged
+            self.coalesced += 1
+        else:
+            self.flush()
+            self._held, self._held_key, self._held_since_ns = progress, block_key, now_ns
+        if (
+            len(self._held.delta_text) >= self._max_chars
+            or now_ns - self._held_since_ns >= self._window_ns
+        ):
+            self.flush()
+
+    def _emit(self, progress: ResponseProgressEvent) -> None:
+        self._queue.put(progress)
+        self.emitted += 1
+
+
+def _content_block_key(event: dict) -> object:
+    """Which content block an SSE event belongs to (None for message-level events)."""
+    if "index" in event:
+        return event["index"]
+    choice = _openai_chat_first_choice(event)
+    return choice.get("index") if choice is not None else None
+
 
 def _extract_anthropic_progress(event_type: str, event: dict) -> dict[str, object] | None:
     """Extract progress payload from Anthropic SSE event."""
@@ -337,32 +485,150 @@ _PROGRESS_EXTRACTORS_BY_FAMILY: dict[str, Callable[[str, dict], dict[str, object
 }
 
 
-def _fan_out_sse(resp, sinks):
-    """Drive an SSE response to multiple sinks with per-sink error isolation."""
-    def _safe_sink_call(phase: str, sink, method_name: str, *args: object) -> None:
-        try:
-            getattr(sink, method_name)(*args)
-        except Exception as exc:
-            # [LAW:single-enforcer] Sink failure handling is centralized and explicit.
-            logger.warning(
-                "SSE sink failure during %s (%s): %s",
-                phase,
-                sink.__class__.__name__,
-                exc,
-            )
+_SSE_READ_SIZE = 64 * 1024
+# A stream that never terminates an event (no blank line) is still relayed
+# line-wise once this much is pending, instead of buffering until EOF.
+_MAX_UNFRAMED_BYTES = 1024 * 1024
+
+
+def _upstream_chunks(resp) -> Iterator[bytes]:
+    """Yield upstream body bytes as they arrive: read1() when available, else iterate."""
+    read1 = getattr(resp, "read1", None)
+    if read1 is None:
+        yield from resp
+        return
+    while True:
+        chunk = read1(_SSE_READ_SIZE)
+        if not chunk:
+            # http.client's read1() never marks a Content-Length body finished;
+            # read() does, so the connection can go back to the pool.
+            resp.read()
+            return
+        yield chunk
 
-    # [LAW:dataflow-not-control-flow] All sinks called unconditionally
+
+# Non-SSE bodies are relayed as they arrive; this much is kept for the pipeline events.
+DEFAULT_RESPONSE_TEE_MAX_BYTES = 32 * 1024 * 1024
+
+
+class _CappedTee:
+    """Copy of a relayed body, kept only while it stays within max_bytes."""
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._parts: list[bytes] = []
+        self.size = 0
+        self.overflowed = False
+
+    def add(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.overflowed:
+            return
+        if self.size > self._max_bytes:
+            # Past the cap the copy is useless (it cannot be decoded), so drop it.
+            self.overflowed = True
+            self._parts.clear()
+            return
+        self._parts.append(chunk)
+
+    def getvalue(self) -> bytes | None:
+        """The whole body, or None when it outgrew the cap."""
+        return None if self.overflowed else b"".join(self._parts)
+
+
+def _sse_frame_end(buf: bytearray, start: int) -> int:
+    """Index just past the last blank line (event terminator) in buf, or 0.
+
+    Only terminators ending at or after start are considered new.
+    """
+    search_from = max(0, start - 2)
+    lf = buf.rfind(b"\n\n", search_from)
+    crlf = buf.rfind(b"\n\r\n", search_from)
+    return max(lf + 2 if lf >= 0 else 0, crlf + 3 if crlf >= 0 else 0)
+
+
+class _SseFramer:
+    """Incremental form of _iter_sse_frames: feed chunks, get complete frames back."""
+
+    def __init__(self):
+        self._pending = bytearray()
+
+    def feed(self, chunk: bytes) -> bytes:
+        """Add a chunk; returns every event it completed (b"" when none)."""
+        if not chunk:
+            return b""
+        pending = self._pending
+        start = len(pending)
+        pending += chunk
+        end = _sse_frame_end(pending, start)
+        if not end and len(pending) > _MAX_UNFRAMED_BYTES:
+            end = pending.rfind(b"\n") + 1
+        if not end:
+            return b""
+        frame = bytes(pending[:end])
+        del pending[:end]
+        return frame
+
+    def finish(self) -> bytes:
+        """Trailing bytes without a terminator (b"" when none)."""
+        frame = bytes(self._pending)
+        self._pending.clear()
+        return frame
+
+
+def _iter_sse_frames(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Regroup arbitrary byte chunks into runs of complete SSE events.
+
+    Each yielded frame holds every event completed by the bytes read so far,
+    so nothing waits past the arrival of its terminating blank line. Trailing
+    bytes without a terminator are yielded at EOF.
+    """
+    framer = _SseFramer()
+    for chunk in chunks:
+        frame = framer.feed(chunk)
+        if frame:
+            yield frame
+    frame = framer.finish()
+    if frame:
+        yield frame
+
+
+def _safe_sink_call(phase: str, sink, method_name: str, *args: object) -> None:
     try:
-        for raw_line in resp:
-            for sink in sinks:
-                _safe_sink_call("on_raw", sink, "on_raw", raw_line)
+        getattr(sink, method_name)(*args)
+    except Exception as exc:
+        # [LAW:single-enforcer] Sink failure handling is centralized and explicit.
+        logger.warning(
+            "SSE sink failure during %s (%s): %s",
+            phase,
+            sink.__class__.__name__,
+            exc,
+        )
+
+
+class _SseFrameParser:
+    """Parses framed SSE bytes and drives sinks' on_event/on_done."""
+
+    def __init__(self, sinks):
+        self._sinks = sinks
+        # Duck-typed sinks (the assemblers) have no flush hooks.
+        self._flushable = [sink for sink in sinks if hasattr(sink, "flush_deadline_ns")]
+        self._done = False
+        self.events = 0
 
-            line = raw_line.decode("utf-8", errors="replace").rstrip("\r\n")
-            if not line.startswith("data: "):
+    def feed(self, frame: bytes) -> None:
+        # [DONE] ends event parsing, but the trailing bytes are still relayed so the
+        # client sees the full body and the upstream connection can be reused.
+        if self._done:
+            return
+        for raw_line in frame.split(b"\n"):
+            if not raw_line.startswith(b"data: "):
                 continue
-            json_str = line[6:]
+            json_str = raw_line[6:].decode("utf-8", errors="replace").rstrip("\r")
             if json_str == "[DONE]":
-                break
+                self._done = True
+                return
+            self.events += 1
 
             try:
                 event = json.loads(json_str)
@@ -370,23 +636,453 @@ def _fan_out_sse(resp, sinks):
                 continue
 
             event_type = event.get("type", "")
-            for sink in sinks:
+            for sink in self._sinks:
                 _safe_sink_call("on_event", sink, "on_event", event_type, event)
-    finally:
-        for sink in sinks:
+
+    def flush_deadline_ns(self) -> int | None:
+        deadlines = [d for sink in self._flushable if (d := sink.flush_deadline_ns()) is not None]
+        return min(deadlines, default=None)
+
+    def flush(self) -> None:
+        for sink in self._flushable:
+            _safe_sink_call("flush", sink, "flush")
+
+    def finish(self) -> None:
+        for sink in self._sinks:
             _safe_sink_call("on_done", sink, "on_done")
 
 
+def _relay_frames(resp, sinks, counts: dict[str, int]) -> Iterator[bytes]:
+    """Read upstream, give every frame to each sink's on_raw, then yield it."""
+    for chunk_frame in _iter_sse_frames(_counted_chunks(resp, counts)):
+        counts["bytes_relayed"] += len(chunk_frame)
+        for sink in sinks:
+            _safe_sink_call("on_raw", sink, "on_raw", chunk_frame)
+        yield chunk_frame
+
+
+def _counted_chunks(resp, counts: dict[str, int]) -> Iterator[bytes]:
+    for chunk in _upstream_chunks(resp):
+        counts["upstream_reads"] += 1
+        yield chunk
+
+
+def _fan_out_sse(resp, sinks) -> dict[str, int]:
+    """Drive an SSE response to multiple sinks with per-sink error isolation.
+
+    Upstream bytes are read in chunks and framed at event boundaries; each
+    sink's on_raw gets every complete event read so far in one call, so the
+    client sees one write per read instead of one per line. Parsing runs
+    inline after each frame. Returns counters for StreamStats.
+    """
+    counts = {"upstream_reads": 0, "sse_events": 0, "bytes_relayed": 0}
+    # [LAW:dataflow-not-control-flow] All sinks called unconditionally
+    parser = _SseFrameParser(sinks)
+    try:
+        for frame in _relay_frames(resp, sinks, counts):
+            parser.feed(frame)
+    finally:
+        parser.finish()
+    counts["sse_events"] = parser.events
+    return counts
+
+
+_PARSE_HANDOFF_FRAMES = 1024
+
+# Most threads parsing SSE streams or request bodies at once, per kind. Well
+# above any sensible --proxy-workers, so a pooled server never runs short.
+_MAX_PARSE_THREADS = 64
+
+
+class _ParserThreads:
+    """Starts daemon threads, at most max_threads alive at once.
+
+    try_start() returns False instead of waiting when all are busy, so the
+    caller can do the work itself.
+    """
+
+    def __init__(self, thread_name: str, max_threads: int):
+        self._thread_name = thread_name
+        self._slots = threading.BoundedSemaphore(max_threads)
+
+    def try_start(self, target: Callable[[], None]) -> bool:
+        if not self._slots.acquire(blocking=False):
+            return False
+
+        def _run() -> None:
+            try:
+                target()
+            finally:
+                self._slots.release()
+
+        threading.Thread(target=_run, name=self._thread_name, daemon=True).start()
+        return True
+
+
+_sse_parser_threads = _ParserThreads("cc-dump-sse-parse", _MAX_PARSE_THREADS)
+
+
+def _relay_sse_with_parser_thread(
+    resp,
+    client_sink: StreamSink,
+    parse_sinks,
+    *,
+    stats: StreamStats,
+    on_parsed: Callable[[], None],
+) -> dict[str, int]:
+    """Relay SSE bytes to the client while a worker thread parses them.
+
+    The calling thread only reads, frames and writes; each frame then goes
+    over a bounded handoff to a per-stream parser thread that drives
+    parse_sinks and, once the stream is fully parsed, calls on_parsed.
+    The relay returns as soon as upstream is drained, without waiting for
+    parsing. A full handoff blocks the relay, bounding memory per stream.
+    When every parser thread is busy, the relay parses each frame itself.
+    Returns the relay's counters (parse counters go to stats directly).
+    """
+    handoff: queue.Queue[tuple[bytes, int] | None] = queue.Queue(maxsize=_PARSE_HANDOFF_FRAMES)
+    parser = _SseFrameParser(parse_sinks)
+    if not _sse_parser_threads.try_start(lambda: _parse_handoff(handoff, parser, stats, on_parsed)):
+        return _relay_and_parse(resp, client_sink, parser, stats=stats, on_parsed=on_parsed)
+    counts = {"upstream_reads": 0, "bytes_relayed": 0, "parse_backpressure": 0}
+    try:
+        for frame in _relay_frames(resp, [client_sink], counts):
+            item = (frame, time.monotonic_ns())
+            try:
+                handoff.put_nowait(item)
+            except queue.Full:
+                counts["parse_backpressure"] += 1
+                handoff.put(item)
+    finally:
+        handoff.put(None)
+    return counts
+
+
+def _relay_and_parse(
+    resp,
+    client_sink: StreamSink,
+    parser: _SseFrameParser,
+    *,
+    stats: StreamStats,
+    on_parsed: Callable[[], None],
+) -> dict[str, int]:
+    """Relay and parse on the calling thread; the client waits for each frame's parse."""
+    counts = {"upstream_reads": 0, "bytes_relayed": 0, "inline_parsed_streams": 1}
+    frames = 0
+    try:
+        for frame in _relay_frames(resp, [client_sink], counts):
+            frames += 1
+            parser.feed(frame)
+    finally:
+        _finish_parse(parser, stats, on_parsed, frames, 0, 0)
+    return counts
+
+
+def _parse_handoff(
+    handoff: "queue.Queue[tuple[bytes, int] | None]",
+    parser: _SseFrameParser,
+    stats: StreamStats,
+    on_parsed: Callable[[], None],
+) -> None:
+    frames = 0
+    lag_total_ns = 0
+    lag_max_ns = 0
+    try:
+        while True:
+            # Wake up for sinks holding output back (progress coalescing) even
+            # when upstream goes quiet, so held events never wait on the next frame.
+            deadline_ns = parser.flush_deadline_ns()
+            timeout = None if deadline_ns is None else max(0.0, (deadline_ns - time.monotonic_ns()) / 1e9)
+            try:
+                item = handoff.get(timeout=timeout)
+            except queue.Empty:
+                parser.flush()
+                continue
+            if item is None:
+                break
+            frame, relayed_ns = item
+            lag_ns = time.monotonic_ns() - relayed_ns
+            frames += 1
+            lag_total_ns += lag_ns
+            lag_max_ns = max(lag_max_ns, lag_ns)
+            parser.feed(frame)
+    finally:
+        _finish_parse(parser, stats, on_parsed, frames, lag_total_ns, lag_max_ns)
+
+
+def _finish_parse(
+    parser: _SseFrameParser,
+    stats: StreamStats,
+    on_parsed: Callable[[], None],
+    frames: int,
+    lag_total_ns: int,
+    lag_max_ns: int,
+) -> None:
+    """End of a parsed stream: finish the sinks, record parse counters, finalize."""
+    parser.finish()
+    stats.record(
+        parsed_streams=1,
+        sse_events=parser.events,
+        parse_frames=frames,
+        parse_lag_total_us=lag_total_ns // 1000,
+        parse_lag_max_us=lag_max_ns // 1000,
+    )
+    try:
+        on_parsed()
+    except Exception:
+        logger.exception("SSE stream finalization failed")
+
+
+def _request_emitted(request_events: "Future[dict | None]") -> bool:
+    """Wait for a request's parse job; True when it emitted request events."""
+    try:
+        return request_events.result() is not None
+    except Exception:
+        logger.exception("request parsing failed")
+        return False
+
+
+# [LAW:dataflow-not-control-flow] Provider → assembler type.
+_ASSEMBLER_CLASSES_BY_FAMILY: dict[str, type] = {
+    "anthropic": ResponseAssembler,
+    "openai": OpenAiChatResponseAssembler,
+}
+
+
+# ─── Event emission shared by the proxy engines ─────────────────────────────
+# // [LAW:one-source-of-truth] The threaded handler and the asyncio engine emit
+# identical pipeline events through these functions.
+
+
+def _emit_request_events(
+    event_queue,
+    provider: str,
+    body_bytes: bytes,
+    safe_req_headers: dict[str, str],
+    request_id: str,
+) -> dict | None:
+    """Parse an API request body and emit its request events; returns the body or None.
+
+    Runs on the request thread or on request_parser, so it must not touch
+    per-request handler state (headers are passed in already filtered).
+    """
+    body, parse_error = cc_dump.pipeline.proxy_flow.parse_request_json(
+        body_bytes,
+        expects_json=True,
+    )
+    if parse_error:
+        logger.warning("malformed request JSON: %s", parse_error)
+    if body is None:
+        return None
+    # Emit request headers before request body (TUI sees original request)
+    # // [LAW:one-source-of-truth] request_id/seq/recv_ns envelope is
+    # carried by request-side events too, not only response-side events.
+    event_queue.put(RequestHeadersEvent(
+        headers=safe_req_headers,
+        **event_envelope(
+            request_id=request_id,
+            seq=0,
+            provider=provider,
+        ),
+    ))
+    event_queue.put(RequestBodyEvent(
+        body=body,
+        **event_envelope(
+            request_id=request_id,
+            seq=1,
+            provider=provider,
+        ),
+    ))
+    return body
+
+
+def _emit_complete_response_events(
+    event_queue,
+    provider: str,
+    request_id: str,
+    status: int,
+    headers,
+    data: bytes | None,
+) -> None:
+    """Emit the events for a successful non-streaming response.
+
+    data is None when the body outgrew the tee; the complete event then
+    carries an empty body (the client still received every byte).
+    """
+    event_queue.put(ResponseHeadersEvent(
+        status_code=status,
+        headers=_safe_headers(headers),
+        **event_envelope(
+            request_id=request_id,
+            seq=0,
+            provider=provider,
+        ),
+    ))
+    if data is None:
+        logger.warning("response body for %s exceeded the capture limit; not decoded", request_id)
+    event_queue.put(ResponseCompleteEvent(
+        body=cc_dump.pipeline.proxy_flow.decode_json_response_body(data) if data is not None else {},
+        **event_envelope(
+            request_id=request_id,
+            seq=1,
+            provider=provider,
+        ),
+    ))
+
+
+def _expects_json_body(provider: str, request_path: str) -> bool:
+    """Check if this request path should be parsed as JSON."""
+    prefixes = cc_dump.providers.get_provider_spec(provider).api_paths
+    return any(request_path.startswith(p) for p in prefixes)
+
+
+def _synthetic_response_bytes(response_text: str, body: dict) -> bytes:
+    model = body.get("model", "synthetic")
+    if not isinstance(model, str):
+        model = "synthetic"
+    return _build_synthetic_sse_bytes(response_text, model)
+
+
+def _emit_synthetic_response_events(event_queue, provider: str, request_id: str, sse_bytes: bytes) -> None:
+    """Emit pipeline events for a synthetic response (same path as real responses)."""
+    seq = 0
+    event_queue.put(
+        ResponseHeadersEvent(
+            status_code=200,
+            headers={"content-type": "text/event-stream"},
+            **event_envelope(
+                request_id=request_id,
+                seq=seq,
+                provider=provider,
+            ),
+        )
+    )
+    # Parse our own SSE bytes through the event queue sink + assembler
+    assembler = ResponseAssembler()
+    for line in sse_bytes.split(b"\n"):
+        line_str = line.decode("utf-8", errors="replace").rstrip("\r")
+        if not line_str.startswith("data: "):
+            continue
+        json_str = line_str[6:]
+        if json_str == "[DONE]":
+            break
+        try:
+            event = json.loads(json_str)
+        except json.JSONDecodeError:
+            continue
+        event_type = event.get("type", "")
+        assembler.on_event(event_type, event)
+        try:
+            sse = parse_sse_event(event_type, event)
+            payload = sse_progress_payload(sse)
+            if payload is not None:
+                seq += 1
+                event_queue.put(ResponseProgressEvent(
+                    **event_envelope(
+                        request_id=request_id,
+                        seq=seq,
+                        provider=provider,
+                    ),
+                    **payload,
+                ))
+        except ValueError:
+            pass
+    assembler.on_done()
+    if assembler.result is not None:
+        seq += 1
+        event_queue.put(ResponseCompleteEvent(
+            body=assembler.result,
+            **event_envelope(
+                request_id=request_id,
+                seq=seq,
+                provider=provider,
+            ),
+        ))
+    seq += 1
+    event_queue.put(ResponseDoneEvent(
+        **event_envelope(
+            request_id=request_id,
+            seq=seq,
+            provider=provider,
+        ),
+    ))
+
+
+def _analysis_sinks(config, request_id: str) -> tuple[list, Callable[[], None]]:
+    """Parse-side sinks for one SSE stream and the callback that completes it.
+
+    config is a configured handler class or instance (provider, event_queue,
+    stream_stats and progress coalescing settings are read from it). The
+    callback records the stream's progress counters and emits
+    ResponseCompleteEvent/ResponseDoneEvent once parsing has finished.
+    """
+    family = cc_dump.providers.get_provider_spec(config.provider).protocol_family
+    assembler_cls = _ASSEMBLER_CLASSES_BY_FAMILY.get(family, OpenAiChatResponseAssembler)
+    assembler = assembler_cls()
+    event_queue = config.event_queue
+    provider = config.provider
+    stream_stats = config.stream_stats
+    event_sink = EventQueueSink(
+        event_queue,
+        request_id=request_id,
+        provider=provider,
+        coalesce_window_s=config.progress_coalesce_ms / 1000,
+        coalesce_max_chars=config.progress_coalesce_chars,
+    )
+
+    def emit_completion() -> None:
+        stream_stats.record(
+            progress_events=event_sink.emitted,
+            progress_coalesced=event_sink.coalesced,
+        )
+        seq = event_sink.seq
+        if assembler.result is not None:
+            seq += 1
+            event_queue.put(ResponseCompleteEvent(
+                body=assembler.result,
+                **event_envelope(
+                    request_id=request_id,
+                    seq=seq,
+                    provider=provider,
+                ),
+            ))
+        seq += 1
+        event_queue.put(ResponseDoneEvent(
+            **event_envelope(
+                request_id=request_id,
+                seq=seq,
+                provider=provider,
+            ),
+        ))
+
+    return [event_sink, assembler], emit_completion
+
+
 class ProxyHandler(http.server.BaseHTTPRequestHandler):
     target_host: str | None = None  # set by cli.py or factory before server starts
     event_queue: queue.Queue[PipelineEvent] = queue.Queue()  # set by cli.py or factory before server starts
     request_pipeline: RequestPipeline | None = None  # set by cli.py or factory before server starts
     provider: str = "anthropic"  # set by factory for multi-provider support
     forward_proxy_ca: "ForwardProxyCertificateAuthority | None" = None  # set by factory when forward proxy CONNECT interception is enabled
+    upstream_pool: UpstreamConnectionPool  # set by cli.py or factory; shared across providers
+    stream_stats: StreamStats = StreamStats()  # process-wide SSE passthrough counters
+    request_parser: Executor = ThreadPoolExecutor(_MAX_PARSE_THREADS, "cc-dump-request-parse")  # parses bodies while upstream works
+    progress_coalesce_ms: float = 0.0  # set by factory; 0 emits one progress event per SSE delta
+    progress_coalesce_chars: int = 4096  # flush held progress text at this size regardless of the window
+    response_tee_max_bytes: int = DEFAULT_RESPONSE_TEE_MAX_BYTES  # set by factory; non-SSE body copy kept for events
 
     def log_message(self, fmt, *args):
         self.event_queue.put(LogEvent(method=self.command, path=self.path, status=args[0] if args else "", provider=self.provider))
 
+    def log_error(self, format, *args):
+        # An idle client hitting the server's socket timeout is normal keep-alive churn.
+        if args and isinstance(args[0], TimeoutError):
+            note_idle_timeout = getattr(self.server, "note_idle_timeout", None)
+            if note_idle_timeout is not None:
+                note_idle_timeout()
+            return
+        super().log_error(format, *args)
+
     def _active_target_host(self) -> str | None:
         tunnel_target = getattr(self, "_connect_target_host", None)
         return tunnel_target if tunnel_target is not None else self.target_host
@@ -422,46 +1118,32 @@ class ProxyHandler(http.server.BaseHTTPRequestHandler):
             )
             return
 
-        body, parse_error = cc_dump.pipeline.proxy_flow.parse_request_json(
-            body_bytes,
-            expects_json=self._expects_json_body(request_path),
-        )
-        if parse_error:
-            logger.warning("malformed request JSON: %s", parse_error)
-        if body is not None:
-            # Emit request headers before request body (TUI sees original request)
-            safe_req_headers = _safe_headers(self.headers)
-            # // [LAW:one-source-of-truth] request_id/seq/recv_ns envelope is
-            # carried by request-side events too, not only response-side events.
-            self.event_queue.put(RequestHeadersEvent(
-                headers=safe_req_headers,
-                **event_envelope(
-                    request_id=request_id,
-                    seq=0,
-                    provider=self.provider,
-                ),
-            ))
-            self.event_queue.put(RequestBodyEvent(
-                body=body,
-                **event_envelope(
-                    request_id=request_id,
-                    seq=1,
-                    provider=self.provider,
-                ),
-            ))
-
-        # // [LAW:single-enforcer] Only emit response/error events for API-path requests
-        # that also emitted request events. Non-API traffic (health checks, token counting)
-        # is forwarded to the client but produces no pipeline events.
-        emitted_request = body is not None
-
-        # Pipeline processing — transforms modify body/url, interceptors short-circuit
-        if body is not None and self.request_pipeline is not None:
-            body, url, intercept_response = self.request_pipeline.process(body, url)
-            if intercept_response is not None:
-                self._send_synthetic_response(intercept_response, body, request_id)
-                return
-            body_bytes = json.dumps(body).encode()  # re-serialize for upstream
+        expects_json = self._expects_json_body(request_path)
+        safe_req_headers = _safe_headers(self.headers)
+        pipeline = self.request_pipeline
+        if expects_json and body_bytes and pipeline is not None and pipeline.may_rewrite(body_bytes):
+            # The pipeline needs the parsed body before anything goes upstream.
+            body = self._emit_request_events(body_bytes, safe_req_headers, request_id)
+            request_events: Future[dict | None] = Future()
+            request_events.set_result(body)
+            # Pipeline processing — transforms modify body/url, interceptors short-circuit
+            if body is not None:
+                body, url, intercept_response = pipeline.process(body, url)
+                if intercept_response is not None:
+                    self._send_synthetic_response(intercept_response, body, request_id)
+                    return
+                # Interceptors never modify the body; transforms may mutate it in place.
+                if pipeline.transforms:
+                    body_bytes = json.dumps(body).encode()  # re-serialize for upstream
+        elif expects_json and body_bytes:
+            # // [LAW:locality-or-seam] Forward-first: the original bytes go upstream
+            # now; parsing/validation for the TUI and recorders overlaps the upstream wait.
+            request_events = self.request_parser.submit(
+                self._emit_request_events, body_bytes, safe_req_headers, request_id,
+            )
+        else:
+            request_events = Future()
+            request_events.set_result(None)
 
         # Forward
         headers = cc_dump.pipeline.proxy_flow.build_upstream_headers(
@@ -469,32 +1151,12 @@ class ProxyHandler(http.server.BaseHTTPRequestHandler):
             content_length=len(body_bytes),
         )
 
-        req = urllib.request.Request(
-            url, data=body_bytes or None, headers=headers, method=self.command
-        )
         try:
-            ctx = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-            resp = urllib.request.urlopen(req, context=ctx, timeout=300)
-        except urllib.error.HTTPError as e:
-            if emitted_request:
-                self.event_queue.put(ErrorEvent(
-                    code=e.code,
-                    reason=e.reason,
-                    **event_envelope(
-                        request_id=request_id,
-                        seq=0,
-                        provider=self.provider,
-                    ),
-                ))
-            self.send_response(e.code)
-            for k, v in e.headers.items():
-                if k.lower() != "transfer-encoding":
-                    self.send_header(k, v)
-            self.end_headers()
-            self.wfile.write(e.read())
-            return
+            lease = self.upstream_pool.request(
+                self.command, url, body=body_bytes or None, headers=headers
+            )
         except Exception as e:
-            if emitted_request:
+            if _request_emitted(request_events):
                 self.event_queue.put(ProxyErrorEvent(
                     error=str(e),
                     **event_envelope(
@@ -507,63 +1169,100 @@ class ProxyHandler(http.server.BaseHTTPRequestHandler):
             self.end_headers()
             return
 
+        # // [LAW:single-enforcer] Only emit response/error events for API-path requests
+        # that also emitted request events. Non-API traffic (health checks, token counting)
+        # is forwarded to the client but produces no pipeline events.
+        # Waiting here also keeps request events ahead of this request's response events.
+        emitted_request = _request_emitted(request_events)
+
+        # [LAW:single-enforcer] The lease goes back to the pool exactly once, after the relay.
+        try:
+            self._relay_upstream_response(lease.response, request_id, emitted_request)
+        finally:
+            self.upstream_pool.release(lease)
+
+    def _emit_request_events(
+        self,
+        body_bytes: bytes,
+        safe_req_headers: dict[str, str],
+        request_id: str,
+    ) -> dict | None:
+        return _emit_request_events(self.event_queue, self.provider, body_bytes, safe_req_headers, request_id)
+
+    def _relay_upstream_response(self, resp, request_id: str, emitted_request: bool) -> None:
+        if not 200 <= resp.status < 300:
+            self._relay_error_response(resp, request_id, emitted_request)
+            return
+        if self._send_response_head(resp):
+            self._relay_sse_response(resp, request_id, emitted_request)
+        else:
+            self._relay_complete_response(resp, request_id, emitted_request)
+
+    def _send_response_head(self, resp) -> bool:
+        """Send status and end-to-end headers; True when the body is an SSE stream."""
         self.send_response(resp.status)
         is_stream = False
         for k, v in resp.headers.items():
-            if k.lower() == "transfer-encoding":
+            if k.lower() in _HOP_BY_HOP_RESPONSE_HEADERS:
                 continue
             if k.lower() == "content-type" and "text/event-stream" in v:
                 is_stream = True
             self.send_header(k, v)
         self.end_headers()
+        return is_stream
 
-        if is_stream:
-            if emitted_request:
-                safe_resp_headers = _safe_headers(resp.headers)
-                self.event_queue.put(ResponseHeadersEvent(
-                    status_code=resp.status,
-                    headers=safe_resp_headers,
-                    **event_envelope(
-                        request_id=request_id,
-                        seq=0,
-                        provider=self.provider,
-                    ),
-                ))
-            self._stream_response(resp, request_id, emit_events=emitted_request)
-        else:
-            data = resp.read()
-            self.wfile.write(data)
-            if emitted_request:
-                safe_resp_headers = _safe_headers(resp.headers)
-                resp_body = cc_dump.pipeline.proxy_flow.decode_json_response_body(data)
-                self.event_queue.put(ResponseHeadersEvent(
-                    status_code=resp.status,
-                    headers=safe_resp_headers,
-                    **event_envelope(
-                        request_id=request_id,
-                        seq=0,
-                        provider=self.provider,
-                    ),
-                ))
-                self.event_queue.put(ResponseCompleteEvent(
-                    body=resp_body,
-                    **event_envelope(
-                        request_id=request_id,
-                        seq=1,
-                        provider=self.provider,
-                    ),
-                ))
+    def _relay_error_response(self, resp, request_id: str, emitted_request: bool) -> None:
+        if emitted_request:
+            self.event_queue.put(ErrorEvent(
+                code=resp.status,
+                reason=resp.reason,
+                **event_envelope(
+                    request_id=request_id,
+                    seq=0,
+                    provider=self.provider,
+                ),
+            ))
+        self._send_response_head(resp)
+        self._relay_body(resp, max_tee_bytes=0)
+
+    def _relay_sse_response(self, resp, request_id: str, emitted_request: bool) -> None:
+        if emitted_request:
+            safe_resp_headers = _safe_headers(resp.headers)
+            self.event_queue.put(ResponseHeadersEvent(
+                status_code=resp.status,
+                headers=safe_resp_headers,
+                **event_envelope(
+                    request_id=request_id,
+                    seq=0,
+                    provider=self.provider,
+                ),
+            ))
+        self._stream_response(resp, request_id, emit_events=emitted_request)
+
+    def _relay_complete_response(self, resp, request_id: str, emitted_request: bool) -> None:
+        # // [LAW:locality-or-seam] Bytes reach the client as they arrive; only the
+        # tee's copy waits for the end of the body to be decoded.
+        data = self._relay_body(resp, max_tee_bytes=self.response_tee_max_bytes if emitted_request else 0)
+        if emitted_request:
+            _emit_complete_response_events(
+                self.event_queue, self.provider, request_id, resp.status, resp.headers, data,
+            )
+
+    def _relay_body(self, resp, *, max_tee_bytes: int) -> bytes | None:
+        """Pass a non-SSE body to the client chunk by chunk; returns the tee's copy."""
+        tee = _CappedTee(max_tee_bytes)
+        for chunk in _upstream_chunks(resp):
+            self.wfile.write(chunk)
+            tee.add(chunk)
+        self.stream_stats.record(bodies_relayed=1, body_tee_overflows=int(tee.overflowed and max_tee_bytes > 0))
+        return tee.getvalue()
 
     def _send_synthetic_response(self, response_text: str, body: dict, request_id: str) -> None:
         """Send a synthetic SSE response and emit pipeline events.
 
         Used when an interceptor short-circuits the request.
         """
-        model = body.get("model", "synthetic")
-        if not isinstance(model, str):
-            model = "synthetic"
-
-        sse_bytes = _build_synthetic_sse_bytes(response_text, model)
+        sse_bytes = _synthetic_response_bytes(response_text, body)
 
         # Send HTTP response to client
         self.send_response(200)
@@ -572,114 +1271,33 @@ class ProxyHandler(http.server.BaseHTTPRequestHandler):
         self.wfile.write(sse_bytes)
         self.wfile.flush()
 
-        # Emit events to TUI pipeline (same path as real responses)
-        seq = 0
-        self.event_queue.put(
-            ResponseHeadersEvent(
-                status_code=200,
-                headers={"content-type": "text/event-stream"},
-                **event_envelope(
-                    request_id=request_id,
-                    seq=seq,
-                    provider=self.provider,
-                ),
-            )
-        )
-        # Parse our own SSE bytes through the event queue sink + assembler
-        assembler = ResponseAssembler()
-        for line in sse_bytes.split(b"\n"):
-            line_str = line.decode("utf-8", errors="replace").rstrip("\r")
-            if not line_str.startswith("data: "):
-                continue
-            json_str = line_str[6:]
-            if json_str == "[DONE]":
-                break
-            try:
-                event = json.loads(json_str)
-            except json.JSONDecodeError:
-                continue
-            event_type = event.get("type", "")
-            assembler.on_event(event_type, event)
-            try:
-                sse = parse_sse_event(event_type, event)
-                payload = sse_progress_payload(sse)
-                if payload is not None:
-                    seq += 1
-                    self.event_queue.put(ResponseProgressEvent(
-                        **event_envelope(
-                            request_id=request_id,
-                            seq=seq,
-                            provider=self.provider,
-                        ),
-                        **payload,
-                    ))
-            except ValueError:
-                pass
-        assembler.on_done()
-        if assembler.result is not None:
-            seq += 1
-            self.event_queue.put(ResponseCompleteEvent(
-                body=assembler.result,
-                **event_envelope(
-                    request_id=request_id,
-                    seq=seq,
-                    provider=self.provider,
-                ),
-            ))
-        seq += 1
-        self.event_queue.put(ResponseDoneEvent(
-            **event_envelope(
-                request_id=request_id,
-                seq=seq,
-                provider=self.provider,
-            ),
-        ))
-
-    # [LAW:dataflow-not-control-flow] Provider → assembler type.
-    _ASSEMBLER_CLASSES_BY_FAMILY: dict[str, type] = {
-        "anthropic": ResponseAssembler,
-        "openai": OpenAiChatResponseAssembler,
-    }
+        _emit_synthetic_response_events(self.event_queue, self.provider, request_id, sse_bytes)
 
     def _stream_response(self, resp, request_id: str = "", *, emit_events: bool = True):
+        client_sink = ClientSink(self.wfile)
         if not emit_events:
-            # Forward SSE bytes to client only — no pipeline events.
-            _fan_out_sse(resp, [ClientSink(self.wfile)])
+            # Forward SSE bytes to client only — no parsing, no pipeline events.
+            counts = {"upstream_reads": 0, "bytes_relayed": 0}
+            for _frame in _relay_frames(resp, [client_sink], counts):
+                pass
+            self.stream_stats.record(streams=1, client_writes=client_sink.writes, **counts)
             return
 
-        family = cc_dump.providers.get_provider_spec(self.provider).protocol_family
-        assembler_cls = self._ASSEMBLER_CLASSES_BY_FAMILY.get(family, OpenAiChatResponseAssembler)
-        assembler = assembler_cls()
-        event_sink = EventQueueSink(self.event_queue, request_id=request_id, provider=self.provider)
-        _fan_out_sse(resp, [
-            ClientSink(self.wfile),
-            event_sink,
-            assembler,
-        ])
-        seq = event_sink.seq
-        if assembler.result is not None:
-            seq += 1
-            self.event_queue.put(ResponseCompleteEvent(
-                body=assembler.result,
-                **event_envelope(
-                    request_id=request_id,
-                    seq=seq,
-                    provider=self.provider,
-                ),
-            ))
-        seq += 1
-        self.event_queue.put(ResponseDoneEvent(
-            **event_envelope(
-                request_id=request_id,
-                seq=seq,
-                provider=self.provider,
-            ),
-        ))
+        parse_sinks, emit_completion = _analysis_sinks(self, request_id)
+
+        # // [LAW:locality-or-seam] Client delivery never waits on analysis sinks:
+        # parsing, assembly and the completion events run on the parser thread.
+        counts = _relay_sse_with_parser_thread(
+            resp,
+            client_sink,
+            parse_sinks,
+            stats=self.stream_stats,
+            on_parsed=emit_completion,
+        )
+        self.stream_stats.record(streams=1, client_writes=client_sink.writes, **counts)
 
     def _expects_json_body(self, request_path: str) -> bool:
-        """Check if this request path should be parsed as JSON."""
-        prefixes = cc_dump.providers.get_provider_spec(self.provider).api_paths
-        return any(request_path.startswith(p) for p in prefixes)
+        return _expects_json_body(self.provider, request_path)
 
     def do_CONNECT(self):
         """Handle HTTPS CONNECT tunneling with forward-proxy TLS interception."""
@@ -768,9 +1386,18 @@ def make_handler_class(
     event_queue: queue.Queue[PipelineEvent],
     request_pipeline: RequestPipeline | None = None,
     forward_proxy_ca: "ForwardProxyCertificateAuthority | None" = None,
+    upstream_pool: UpstreamConnectionPool | None = None,
+    progress_coalesce_ms: float = 0.0,
+    response_tee_max_bytes: int = DEFAULT_RESPONSE_TEE_MAX_BYTES,
 ) -> type[ProxyHandler]:
     """Create a configured ProxyHandler subclass for a specific provider.
 
+    Without upstream_pool the handler gets a pool of its own.
+    progress_coalesce_ms > 0 merges a stream's consecutive progress events
+    within that window (see EventQueueSink). response_tee_max_bytes caps the
+    copy of a non-SSE response body kept for pipeline events while the body
+    is relayed.
+
     // [LAW:one-type-per-behavior] All providers share one handler type,
     // parameterized by class attributes set here.
     """
@@ -780,9 +1407,17 @@ def make_handler_class(
         (ProxyHandler,),
         {
             "provider": spec.key,
-            "target_host": target_host.rstrip("/") if target_host else None,
+            "target_host": _reverse_target(target_host),
             "event_queue": event_queue,
             "request_pipeline": request_pipeline,
             "forward_proxy_ca": forward_proxy_ca,
+            "upstream_pool": upstream_pool if upstream_pool is not None else UpstreamConnectionPool(),
+            "progress_coalesce_ms": progress_coalesce_ms,
+            "response_tee_max_bytes": response_tee_max_bytes,
         },
     )
+
+
+def _reverse_target(target_host: str | None) -> str | None:
+    """Upstream base URL without a trailing slash; None for a forward proxy."""
+    return target_host.rstrip("/") if target_host else None
@@ -0,0 +1,828 @@
+"""asyncio proxy engine: the proxy data plane on one event loop.
+
+// [LAW:one-source-of-truth] Request semantics are shared with ProxyHandler:
+// target resolution, RequestPipeline transforms and interceptors, event
+// emission, SSE framing and parsing sinks, and CONNECT routing all call the
+// same functions. This module only replaces threads and blocking sockets.
+
+Selected with --proxy-engine asyncio. An AsyncProxyServer is configured by
+the handler class make_handler_class builds (provider, target, event queue,
+pipeline, forward-proxy CA, progress coalescing). It exposes the
+socketserver surface the CLI drives: server_address, serve_forever,
+shutdown, server_close and stats.
+
+Each client connection is one task on the loop, and so is each SSE stream's
+parser. After every upstream read the relay waits for the client transport
+to drain below its high-water mark before reading again. A slow client
+therefore slows its upstream read instead of growing a buffer. Upstream
+connections come from an AsyncUpstreamConnectionPool on the same loop.
+Request-body parsing and leaf-certificate generation still run on
+executors, so the loop never blocks on CPU-heavy work.
+
+All servers built on one AsyncProxyRuntime share its loop thread and pool.
+
+This module is STABLE — holds the event loop and live sockets, never hot-reloaded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import html
+import http.client
+import io
+import json
+import logging
+import ssl
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import ClassVar
+
+import cc_dump.pipeline.proxy_flow
+import cc_dump.pipeline.proxy_server
+import cc_dump.providers
+from cc_dump.pipeline.event_types import (
+    ErrorEvent,
+    LogEvent,
+    ProxyErrorEvent,
+    ResponseHeadersEvent,
+    event_envelope,
+    new_request_id,
+)
+from cc_dump.pipeline.proxy import (
+    _HOP_BY_HOP_RESPONSE_HEADERS,
+    _PARSE_HANDOFF_FRAMES,
+    _SSE_READ_SIZE,
+    ProxyHandler,
+    StreamSink,
+    StreamStats,
+    _analysis_sinks,
+    _CappedTee,
+    _emit_complete_response_events,
+    _emit_request_events,
+    _emit_synthetic_response_events,
+    _expects_json_body,
+    _finish_parse,
+    _parse_connect_authority,
+    _safe_headers,
+    _safe_sink_call,
+    _SseFrameParser,
+    _SseFramer,
+    _synthetic_response_bytes,
+)
+from cc_dump.pipeline.upstream_pool import (
+    AsyncUpstreamConnectionPool,
+    AsyncUpstreamResponse,
+    wait_with_timeout,
+)
+
+logger = logging.getLogger(__name__)
+
+_STREAM_LIMIT = 64 * 1024
+_MAX_HEADERS = 100
+_SHUTDOWN_TIMEOUT_S = 5.0
+
+# What AsyncUpstreamConnectionPool.request raises for an unreachable or broken
+# upstream: socket/TLS errors and timeouts, EOF mid-head, bad URLs and heads.
+_UPSTREAM_REQUEST_ERRORS = (OSError, EOFError, ValueError, http.client.HTTPException)
+
+
+class AsyncProxyRuntime:
+    """An event loop on a daemon thread plus the upstream pool its servers share."""
+
+    def __init__(self, *, upstream_pool: AsyncUpstreamConnectionPool | None = None):
+        self.loop = asyncio.new_event_loop()
+        self.upstream_pool = upstream_pool if upstream_pool is not None else AsyncUpstreamConnectionPool()
+        self._thread = threading.Thread(target=self._run, name="cc-dump-proxy-loop", daemon=True)
+        self._thread.start()
+
+    def call(self, coro, timeout: float | None = None):
+        """Run a coroutine on the loop from another thread and return its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def close(self) -> None:
+        """Close pooled upstream connections, then stop and close the loop."""
+        if self.loop.is_closed():
+            return
+        try:
+            self.call(self._close_pool(), timeout=_SHUTDOWN_TIMEOUT_S)
+        except Exception:
+            logger.debug("error closing async upstream pool", exc_info=True)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(_SHUTDOWN_TIMEOUT_S)
+        if not self._thread.is_alive():
+            self.loop.close()
+
+    async def _close_pool(self) -> None:
+        self.upstream_pool.close()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+
+class AsyncProxyServer:
+    """Listening socket plus per-connection tasks for one configured handler class.
+
+    stats() has the same keys as ProxyHTTPServer.stats(), plus event_loop=1.
+    Connections are never queued or rejected here, so the queue and
+    rejection counters stay 0.
+    """
+
+    def __init__(
+        self,
+        server_address,
+        handler_class: type[ProxyHandler],
+        *,
+        runtime: AsyncProxyRuntime | None = None,
+        backlog: int = cc_dump.pipeline.proxy_server.DEFAULT_BACKLOG,
+        idle_timeout_s: float | None = cc_dump.pipeline.proxy_server.DEFAULT_IDLE_TIMEOUT_S,
+    ):
+        self.handler_class = handler_class
+        self.idle_timeout_s = idle_timeout_s or None
+        self._owns_runtime = runtime is None
+        self.runtime = runtime if runtime is not None else AsyncProxyRuntime()
+        self._lock = threading.Lock()
+        self._counts = {
+            "accepted": 0,
+            "rejected": 0,
+            "active": 0,
+            "max_active": 0,
+            "max_queued": 0,
+            "queue_wait_total_ms": 0,
+            "queue_wait_max_ms": 0,
+            "idle_timeouts": 0,
+        }
+        self._tasks: set[asyncio.Task] = set()
+        self._stopped = threading.Event()
+        host, port = server_address
+        self._server = self.runtime.call(
+            asyncio.start_server(self._on_connection, host, port, backlog=backlog, limit=_STREAM_LIMIT)
+        )
+        self.server_address = self._server.sockets[0].getsockname()[:2]
+
+    @property
+    def upstream_pool(self) -> AsyncUpstreamConnectionPool:
+        return self.runtime.upstream_pool
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        """Block until shutdown(); the connections themselves are served on the loop."""
+        self._stopped.wait()
+
+    def shutdown(self) -> None:
+        """Stop accepting connections and release serve_forever()."""
+        if not self._server.is_serving() or self.runtime.loop.is_closed():
+            self._stopped.set()
+            return
+        self.runtime.call(self._stop_listening(), timeout=_SHUTDOWN_TIMEOUT_S)
+        self._stopped.set()
+
+    def server_close(self) -> None:
+        """Cancel in-flight connections and streams; stop an owned runtime."""
+        self.shutdown()
+        if not self.runtime.loop.is_closed():
+            self.runtime.call(self._cancel_tasks(), timeout=_SHUTDOWN_TIMEOUT_S)
+        if self._owns_runtime:
+            self.runtime.close()
+
+    def note_idle_timeout(self) -> None:
+        with self._lock:
+            self._counts["idle_timeouts"] += 1
+
+    def stats(self) -> dict[str, int]:
+        """Snapshot of connection counters."""
+        with self._lock:
+            return {**self._counts, "workers": 0, "queued": 0, "event_loop": 1}
+
+    def spawn(self, coro) -> asyncio.Task:
+        """Start a task that server_close() cancels if it is still running."""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    # -- private ----------------------------------------------------------
+
+    async def _stop_listening(self) -> None:
+        self._server.close()
+
+    async def _cancel_tasks(self) -> None:
+        tasks = [task for task in self._tasks if not task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks, timeout=_SHUTDOWN_TIMEOUT_S)
+
+    async def _on_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        with self._lock:
+            self._counts["accepted"] += 1
+            self._counts["active"] += 1
+            self._counts["max_active"] = max(self._counts["max_active"], self._counts["active"])
+        connection = _ProxyConnection(self, reader, writer)
+        try:
+            await connection.handle()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            logger.debug("client connection dropped", exc_info=True)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Unhandled error in asyncio proxy connection")
+        finally:
+            with self._lock:
+                self._counts["active"] -= 1
+            # A CONNECT tunnel swaps in a TLS writer; closing it sends close_notify.
+            connection.writer.close()
+
+
+class _WriterSink(StreamSink):
+    """ClientSink for asyncio: queues raw SSE bytes on the client transport.
+
+    The relay awaits drain() after each upstream read. A client that has
+    gone away stops receiving, but the stream is still read and parsed to
+    the end, as it is in the threaded engine.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self._writer = writer
+        self._gone = False
+        self.writes = 0
+
+    def on_raw(self, data):
+        if self._gone:
+            return
+        self._writer.write(data)
+        self.writes += 1
+
+    async def drain(self) -> None:
+        if self._gone:
+            return
+        try:
+            await self._writer.drain()
+        except ConnectionError:
+            logger.debug("client went away mid-stream; draining upstream for the record")
+            self._gone = True
+
+
+async def _parse_handoff_async(
+    handoff: asyncio.Queue[tuple[bytes, int] | None],
+    parser: _SseFrameParser,
+    stats: StreamStats,
+    on_parsed,
+) -> None:
+    """Loop-side twin of proxy._parse_handoff: parse relayed frames, flush held output on time."""
+    frames = 0
+    lag_total_ns = 0
+    lag_max_ns = 0
+    try:
+        while True:
+            try:
+                item = handoff.get_nowait()
+            except asyncio.QueueEmpty:
+                # Only an idle wait needs the flush deadline (progress coalescing).
+                deadline_ns = parser.flush_deadline_ns()
+                timeout = None if deadline_ns is None else max(0.0, (deadline_ns - time.monotonic_ns()) / 1e9)
+                try:
+                    item = await wait_with_timeout(handoff.get(), timeout)
+                except TimeoutError:
+                    parser.flush()
+                    continue
+            if item is None:
+                break
+            frame, relayed_ns = item
+            lag_ns = time.monotonic_ns() - relayed_ns
+            frames += 1
+            lag_total_ns += lag_ns
+            lag_max_ns = max(lag_max_ns, lag_ns)
+            parser.feed(frame)
+    finally:
+        _finish_parse(parser, stats, on_parsed, frames, lag_total_ns, lag_max_ns)
+
+
+async def _request_emitted(request_events: asyncio.Future) -> bool:
+    """Wait for a request's parse job; True when it emitted request events."""
+    try:
+        return (await request_events) is not None
+    except Exception:
+        logger.exception("request parsing failed")
+        return False
+
+
+def _done_future(result) -> asyncio.Future:
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(result)
+    return future
+
+
+class _ProxyConnection:
+    """One client connection: ProxyHandler's request flow on asyncio streams.
+
+    Method names follow ProxyHandler so the two engines read side by side.
+    Keep-alive follows the handler class's protocol_version exactly as
+    BaseHTTPRequestHandler does.
+    """
+
+    def __init__(self, server: AsyncProxyServer, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.server = server
+        self.handler = server.handler_class
+        self.reader = reader
+        self.writer = writer
+        self.close_connection = True
+        self.requestline = ""
+        self.command = ""
+        self.path = ""
+        self.headers: http.client.HTTPMessage = http.client.HTTPMessage()
+        self._connect_target_host: str | None = None
+        self._head: list[str] = []
+
+    async def handle(self) -> None:
+        while True:
+            await self.handle_one_request()
+            if self.close_connection:
+                break
+
+    async def handle_one_request(self) -> None:
+        self.close_connection = True
+        try:
+            if not await wait_with_timeout(self._read_request(), self.server.idle_timeout_s):
+                return
+        except TimeoutError:
+            self.server.note_idle_timeout()
+            return
+        except ValueError:
+            # Request line or a header longer than the stream limit.
+            await self.send_error(431 if self.command else 414)
+            return
+        method = self._METHODS.get(self.command)
+        if method is None:
+            await self.send_error(501, f"Unsupported method ({self.command!r})")
+            return
+        await method(self)
+
+    async def _read_request(self) -> bool:
+        """Read and parse the next request head; False when there is none to serve."""
+        line = await self.reader.readline()
+        if not line:
+            return False
+        return await self._parse_request(line)
+        await self.writer.drain()
+
+    async def _parse_request(self, line: bytes) -> bool:
+        version = await self._parse_request_line(line)
+        if version is None:
+            return False
+        protocol_http11 = self.handler.protocol_version >= "HTTP/1.1"
+        if version >= (1, 1) and protocol_http11:
+            self.close_connection = False
+        if not await self._read_headers():
+            return False
+        conntype = self.headers.get("Connection", "").lower()
+        if conntype == "close":
+            self.close_connection = True
+        elif conntype == "keep-alive" and protocol_http11:
+            self.close_connection = False
+        return True
+
+    async def _parse_request_line(self, line: bytes) -> tuple[int, int] | None:
+        """Set requestline, command and path; returns the HTTP version, or None after an error reply."""
+        self.requestline = line.decode("iso-8859-1").rstrip("\r\n")
+        words = self.requestline.split()
+        if len(words) != 3:
+            await self.send_error(400, f"Bad request syntax ({self.requestline!r})")
+            return None
+        command, path, version = words
+        try:
+            if not version.startswith("HTTP/"):
+                raise ValueError
+            major, minor = (int(part) for part in version.split("/", 1)[1].split(".", 1))
+        except ValueError:
+            await self.send_error(400, f"Bad request version ({version!r})")
+            return None
+        if (major, minor) >= (2, 0):
+            await self.send_error(505, f"Invalid HTTP version ({version})")
+            return None
+        self.command, self.path = command, path
+        return major, minor
+
+    async def _read_headers(self) -> bool:
+        header_lines = []
+        while (header_line := await self.reader.readline()) not in (b"\r\n", b"\n", b""):
+            header_lines.append(header_line)
+            if len(header_lines) > _MAX_HEADERS:
+                await self.send_error(431, "Too many headers")
+                return False
+        self.headers = http.client.parse_headers(io.BytesIO(b"".join(header_lines) + b"\r\n"))
+        return True
+
+    # -- response writing (BaseHTTPRequestHandler's surface) ---------------
+
+    def send_response(self, code: int, message: str | None = None) -> None:
+        self.handler.event_queue.put(
+            LogEvent(method=self.command, path=self.path, status=self.requestline, provider=self.handler.provider)
+        )
+        if message is None:
+            message = self.handler.responses.get(code, ("",))[0]
+        self._head = [
+            f"{self.handler.protocol_version} {code} {message}\r\n",
+            f"Server: {self.handler.server_version} {self.handler.sys_version}\r\n",
+            f"Date: {email.utils.formatdate(time.time(), usegmt=True)}\r\n",
+        ]
+
+    def send_header(self, keyword: str, value: str) -> None:
+        self._head.append(f"{keyword}: {value}\r\n")
+        if keyword.lower() == "connection":
+            if value.lower() == "close":
+                self.close_connection = True
+            elif value.lower() == "keep-alive":
+                self.close_connection = False
+
+    def end_headers(self) -> None:
+        self._head.append("\r\n")
+        self.writer.write("".join(self._head).encode("latin-1", "strict"))
+        self._head = []
+
+    async def send_error(self, code: int, message: str | None = None) -> None:
+        short, explain = self.handler.responses.get(code, ("???", "???"))
+        message = message or short
+        self.send_response(code, message)
+        self.send_header("Connection", "close")
+        body = None
+        if code >= 200 and code not in (204, 205, 304):
+            content = self.handler.error_message_format % {
+                "code": code,
+                "message": html.escape(message, quote=False),
+                "explain": html.escape(explain, quote=False),
+            }
+            body = content.encode("UTF-8", "replace")
+            self.send_header("Content-Type", self.handler.error_content_type)
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD" and body:
+            self.writer.write(body)
+        await self.writer.drain()
+
+    # -- request handling ---------------------------------------------------
+
+    def _active_target_host(self) -> str | None:
+        tunnel_target = self._connect_target_host
+        return tunnel_target if tunnel_target is not None else self.handler.target_host
+
+    async def _proxy(self) -> None:
+        handler = self.handler
+        request_id = new_request_id()
+        content_len = int(self.headers.get("Content-Length", 0))
+        body_bytes = (
+            await wait_with_timeout(self.reader.readexactly(content_len), self.server.idle_timeout_s)
+            if content_len
+            else b""
+        )
+
+        target = cc_dump.pipeline.proxy_flow.resolve_proxy_target_for_origin(
+            self.path,
+            self._active_target_host(),
+            required_origin=self._connect_target_host,
+        )
+        if target.error_reason:
+            self._reject_target(target, request_id)
+            return
+
+        prepared = await self._prepare_request(target, body_bytes, request_id)
+        if prepared is None:
+            return  # an interceptor answered the request
+        body_bytes, url, request_events = prepared
+
+        headers = cc_dump.pipeline.proxy_flow.build_upstream_headers(
+            self.headers,
+            content_length=len(body_bytes),
+        )
+
+        pool = self.server.upstream_pool
+        try:
+            lease = await pool.request(self.command, url, body=body_bytes or None, headers=headers)
+        except _UPSTREAM_REQUEST_ERRORS as e:
+            if await _request_emitted(request_events):
+                handler.event_queue.put(ProxyErrorEvent(
+                    error=str(e),
+                    **event_envelope(
+                        request_id=request_id,
+                        seq=0,
+                        provider=handler.provider,
+                    ),
+                ))
+            self.send_response(502)
+            self.end_headers()
+            return
+
+        # // [LAW:single-enforcer] Same API-path event gating and ordering as ProxyHandler.
+        emitted_request = await _request_emitted(request_events)
+
+        # [LAW:single-enforcer] The lease goes back to the pool exactly once, after the relay.
+        try:
+            await self._relay_upstream_response(lease.response, request_id, emitted_request)
+        finally:
+            pool.release(lease)
+
+    def _reject_target(self, target, request_id: str) -> None:
+        handler = self.handler
+        handler.event_queue.put(
+            ErrorEvent(
+                code=target.error_status or 500,
+                reason=target.error_reason,
+                **event_envelope(
+                    request_id=request_id,
+                    seq=0,
+                    provider=handler.provider,
+                ),
+            )
+        )
+        self.send_response(target.error_status or 500)
+        self.end_headers()
+        self.writer.write(
+            b"No target configured. Use --target or send absolute URIs."
+        )
+
+    async def _prepare_request(
+        self, target, body_bytes: bytes, request_id: str,
+    ) -> tuple[bytes, str, asyncio.Future] | None:
+        """Start request-event emission and apply the pipeline.
+
+        Returns (upstream body bytes, upstream url, request-events future), or
+        None when an interceptor already answered the client.
+        """
+        handler = self.handler
+        url = target.upstream_url
+        expects_json = _expects_json_body(handler.provider, target.request_path) and bool(body_bytes)
+        safe_req_headers = _safe_headers(self.headers)
+        pipeline = handler.request_pipeline
+        if not expects_json:
+            return body_bytes, url, _done_future(None)
+        if pipeline is None or not pipeline.may_rewrite(body_bytes):
+            # // [LAW:locality-or-seam] Forward-first, as in ProxyHandler._proxy.
+            request_events = asyncio.wrap_future(handler.request_parser.submit(
+                _emit_request_events, handler.event_queue, handler.provider, body_bytes, safe_req_headers, request_id,
+            ))
+            return body_bytes, url, request_events
+
+        # The pipeline needs the parsed body before anything goes upstream.
+        loop = asyncio.get_running_loop()
+        body = await loop.run_in_executor(
+            handler.request_parser,
+            _emit_request_events, handler.event_queue, handler.provider, body_bytes, safe_req_headers, request_id,
+        )
+        if body is not None:
+            body, url, intercept_response = await loop.run_in_executor(
+                handler.request_parser, pipeline.process, body, url,
+            )
+            if intercept_response is not None:
+                await self._send_synthetic_response(intercept_response, body, request_id)
+                return None
+            # Interceptors never modify the body; transforms may mutate it in place.
+            if pipeline.transforms:
+                body_bytes = json.dumps(body).encode()  # re-serialize for upstream
+        return body_bytes, url, _done_future(body)
+
+    async def _relay_upstream_response(
+        self,
+        resp: AsyncUpstreamResponse,
+        request_id: str,
+        emitted_request: bool,
+    ) -> None:
+        if not 200 <= resp.status < 300:
+            await self._relay_error_response(resp, request_id, emitted_request)
+            return
+        if self._send_response_head(resp):
+            await self._relay_sse_response(resp, request_id, emitted_request)
+        else:
+            await self._relay_complete_response(resp, request_id, emitted_request)
+
+    def _send_response_head(self, resp: AsyncUpstreamResponse) -> bool:
+        """Send status and end-to-end headers; True when the body is an SSE stream."""
+        self.send_response(resp.status)
+        is_stream = False
+        for k, v in resp.headers.items():
+            if k.lower() in _HOP_BY_HOP_RESPONSE_HEADERS:
+                continue
+            if k.lower() == "content-type" and "text/event-stream" in v:
+                is_stream = True
+            self.send_header(k, v)
+        self.end_headers()
+        return is_stream
+
+    async def _relay_error_response(
+        self, resp: AsyncUpstreamResponse, request_id: str, emitted_request: bool,
+    ) -> None:
+        handler = self.handler
+        if emitted_request:
+            handler.event_queue.put(ErrorEvent(
+                code=resp.status,
+                reason=resp.reason,
+                **event_envelope(
+                    request_id=request_id,
+                    seq=0,
+                    provider=handler.provider,
+                ),
+            ))
+        self._send_response_head(resp)
+        await self._relay_body(resp, max_tee_bytes=0)
+
+    async def _relay_sse_response(
+        self, resp: AsyncUpstreamResponse, request_id: str, emitted_request: bool,
+    ) -> None:
+        handler = self.handler
+        if emitted_request:
+            handler.event_queue.put(ResponseHeadersEvent(
+                status_code=resp.status,
+                headers=_safe_headers(resp.headers),
+                **event_envelope(
+                    request_id=request_id,
+                    seq=0,
+                    provider=handler.provider,
+                ),
+            ))
+        await self._stream_response(resp, request_id, emit_events=emitted_request)
+
+    async def _relay_complete_response(
+        self, resp: AsyncUpstreamResponse, request_id: str, emitted_request: bool,
+    ) -> None:
+        handler = self.handler
+        data = await self._relay_body(resp, max_tee_bytes=handler.response_tee_max_bytes if emitted_request else 0)
+        if emitted_request:
+            _emit_complete_response_events(
+                handler.event_queue, handler.provider, request_id, resp.status, resp.headers, data,
+            )
+
+    async def _relay_body(self, resp: AsyncUpstreamResponse, *, max_tee_bytes: int) -> bytes | None:
+        """Pass a non-SSE body to the client chunk by chunk; returns the tee's copy."""
+        tee = _CappedTee(max_tee_bytes)
+        while chunk := await resp.read1(_SSE_READ_SIZE):
+            self.writer.write(chunk)
+            tee.add(chunk)
+            await self.writer.drain()
+        self.handler.stream_stats.record(
+            bodies_relayed=1, body_tee_overflows=int(tee.overflowed and max_tee_bytes > 0),
+        )
+        return tee.getvalue()
+
+    async def _send_synthetic_response(self, response_text: str, body: dict, request_id: str) -> None:
+        sse_bytes = _synthetic_response_bytes(response_text, body)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        self.writer.write(sse_bytes)
+        await self.writer.drain()
+        _emit_synthetic_response_events(self.handler.event_queue, self.handler.provider, request_id, sse_bytes)
+
+    async def _stream_response(self, resp: AsyncUpstreamResponse, request_id: str, *, emit_events: bool) -> None:
+        stats = self.handler.stream_stats
+        client_sink = _WriterSink(self.writer)
+        counts = {"upstream_reads": 0, "bytes_relayed": 0, "parse_backpressure": 0}
+        if not emit_events:
+            # Forward SSE bytes to client only — no parsing, no pipeline events.
+            await self._relay_frames(resp, client_sink, None, counts)
+            stats.record(streams=1, client_writes=client_sink.writes, **counts)
+            return
+
+        parse_sinks, emit_completion = _analysis_sinks(self.handler, request_id)
+        handoff: asyncio.Queue[tuple[bytes, int] | None] = asyncio.Queue(maxsize=_PARSE_HANDOFF_FRAMES)
+        # // [LAW:locality-or-seam] Client delivery never waits on analysis sinks:
+        # the parser is its own task, fed through a bounded handoff.
+        parser_task = self.server.spawn(
+            _parse_handoff_async(handoff, _SseFrameParser(parse_sinks), stats, emit_completion)
+        )
+        try:
+            await self._relay_frames(resp, client_sink, handoff, counts)
+            await handoff.put(None)
+        except BaseException:
+            # The parser still finishes what it has: end it now, or cancel it if the handoff is full.
+            try:
+                handoff.put_nowait(None)
+            except asyncio.QueueFull:
+                parser_task.cancel()
+            raise
+        finally:
+            stats.record(streams=1, client_writes=client_sink.writes, **counts)
+
+    async def _relay_frames(
+        self,
+        resp: AsyncUpstreamResponse,
+        client_sink: _WriterSink,
+        handoff: asyncio.Queue[tuple[bytes, int] | None] | None,
+        counts: dict[str, int],
+    ) -> None:
+        """Read upstream, frame at event boundaries, write each frame, then wait for the client."""
+        framer = _SseFramer()
+        while chunk := await resp.read1(_SSE_READ_SIZE):
+            counts["upstream_reads"] += 1
+            await self._deliver_frame(framer.feed(chunk), client_sink, handoff, counts)
+        await self._deliver_frame(framer.finish(), client_sink, handoff, counts)
+
+    async def _deliver_frame(
+        self,
+        frame: bytes,
+        client_sink: _WriterSink,
+        handoff: asyncio.Queue[tuple[bytes, int] | None] | None,
+        counts: dict[str, int],
+    ) -> None:
+        if not frame:
+            return
+        counts["bytes_relayed"] += len(frame)
+        _safe_sink_call("on_raw", client_sink, "on_raw", frame)
+        # Backpressure: the next upstream read waits until the client has taken this frame.
+        await client_sink.drain()
+        if handoff is None:
+            return
+        item = (frame, time.monotonic_ns())
+        try:
+            handoff.put_nowait(item)
+        except asyncio.QueueFull:
+            counts["parse_backpressure"] += 1
+            await handoff.put(item)
+
+    async def do_CONNECT(self) -> None:
+        """Handle HTTPS CONNECT tunneling with forward-proxy TLS interception."""
+        handler = self.handler
+        parsed_authority = _parse_connect_authority(self.path)
+        if parsed_authority is None:
+            await self.send_error(400, "Malformed CONNECT authority")
+            return
+        host, port = parsed_authority
+
+        if not handler.forward_proxy_ca:
+            await self.send_error(501, "CONNECT not supported in reverse proxy mode")
+            return
+
+        route = cc_dump.providers.resolve_forward_proxy_connect_route(
+            handler.provider,
+            host=host,
+            port=port,
+        )
+        if route is None:
+            await self.send_error(403, "CONNECT host not allowed for provider")
+            return
+
+        # Leaf certificates may need generating: keep that off the loop.
+        ctx = await asyncio.get_running_loop().run_in_executor(
+            None, handler.forward_proxy_ca.ssl_context_for_host, host,
+        )
+
+        # Stop reading before the client can answer the 200 with its ClientHello:
+        # those bytes belong to the TLS layer, not to this plaintext StreamReader.
+        self.writer.transport.pause_reading()
+        self.send_response(200, "Connection Established")
+        self.end_headers()
+        try:
+            await self._start_server_tls(ctx)
+        except (ssl.SSLError, ConnectionError):
+            logger.debug("Forward-proxy TLS handshake failed for %s", host, exc_info=True)
+            self.close_connection = True
+            return
+
+        # [LAW:one-source-of-truth] CONNECT routing is resolved once, then reused for every tunneled request.
+        self._connect_target_host = route.upstream_origin
+        try:
+            while True:
+                await self.handle_one_request()
+                if self.close_connection:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            logger.debug("CONNECT tunnel for %s:%s dropped", host, port, exc_info=True)
+        except Exception:
+            logger.exception(
+                "Unhandled error while processing CONNECT tunnel for %s:%s",
+                host,
+                port,
+            )
+        self.close_connection = True
+
+    async def _start_server_tls(self, ctx: ssl.SSLContext) -> None:
+        """Replace reader/writer with streams over a server-side TLS transport.
+
+        loop.start_tls rather than StreamWriter.start_tls, which needs 3.11.
+        """
+        await self.writer.drain()
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=_STREAM_LIMIT)
+        protocol = asyncio.StreamReaderProtocol(reader)
+        transport = await loop.start_tls(self.writer.transport, protocol, ctx, server_side=True)
+        # start_tls hands over the transport without calling connection_made.
+        protocol.connection_made(transport)
+        self.reader = reader
+        self.writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+
+    async def do_OPTIONS(self) -> None:
+        self.send_response(200)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "*")
+        self.end_headers()
+
+    _METHODS: ClassVar[dict[str, Callable[[_ProxyConnection], Awaitable[None]]]] = {
+        "GET": _proxy,
+        "POST": _proxy,
+        "OPTIONS": do_OPTIONS,
+        "CONNECT": do_CONNECT,
+    }
@@ -15,6 +15,11 @@ from pydantic import TypeAdapter, ValidationError
 
 _JSON_OBJECT = TypeAdapter(dict[str, object])
 
+# Hop-by-hop headers describe the client<->proxy connection, never the upstream one.
+_HOP_BY_HOP_HEADERS = frozenset(
+    {"host", "content-length", "connection", "keep-alive", "proxy-connection"}
+)
+
 
 @dataclass(frozen=True)
 class ProxyTarget:
@@ -115,11 +120,11 @@ def parse_request_json(
 
 
 def build_upstream_headers(headers: Mapping[str, str], *, content_length: int) -> dict[str, str]:
-    """Build upstream headers with host/content-length normalization."""
+    """Build upstream headers with host/content-length and hop-by-hop normalization."""
     forwarded = {
         k: v
         for k, v in headers.items()
-        if k.lower() not in ("host", "content-length")
+        if k.lower() not in _HOP_BY_HOP_HEADERS
     }
     forwarded["Content-Length"] = str(content_length)
     return forwarded
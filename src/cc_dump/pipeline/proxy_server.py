@@ -0,0 +1,186 @@
+"""HTTP server for the proxy: thread-per-connection or a bounded worker pool.
+
+// [LAW:one-source-of-truth] Client connection admission (backlog, queueing,
+// idle timeouts) lives here; request handling stays in ProxyHandler.
+
+workers=0 keeps ThreadingHTTPServer's model: one thread per connection.
+workers=N hands accepted connections to N worker threads through a FIFO.
+At most max_pending connections wait there; beyond that a connection gets
+503 and is closed. Load past the pool size then shows up as queueing delay
+and fast rejections, instead of ever more threads fighting over the GIL.
+
+A worker is held for the whole connection, including keep-alive gaps and
+CONNECT tunnels. idle_timeout_s bounds how long a silent client can hold
+one: it is the client socket's timeout, so an idle keep-alive connection
+or tunnel is closed after that long.
+
+This module is STABLE — holds live sockets and worker threads, never hot-reloaded.
+"""
+
+from __future__ import annotations
+
+import http.client
+import http.server
+import logging
+import queue
+import socket
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKLOG = 128
+DEFAULT_MAX_PENDING = 1024
+DEFAULT_IDLE_TIMEOUT_S = 120.0
+
+# What serving one client connection is expected to raise: socket errors
+# (resets, timeouts, TLS failures) and malformed client or upstream HTTP.
+_CONNECTION_ERRORS = (OSError, ValueError, http.client.HTTPException)
+
+_REJECT_RESPONSE = (
+    b"HTTP/1.1 503 Service Unavailable\r\n"
+    b"Content-Length: 0\r\n"
+    b"Retry-After: 1\r\n"
+    b"Connection: close\r\n\r\n"
+)
+
+
+class ProxyHTTPServer(http.server.ThreadingHTTPServer):
+    """HTTP server with an optional bounded worker pool and admission counters."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        server_address,
+        handler_class,
+        *,
+        workers: int = 0,
+        backlog: int = DEFAULT_BACKLOG,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        idle_timeout_s: float | None = DEFAULT_IDLE_TIMEOUT_S,
+    ):
+        # Read by server_activate() inside the base constructor.
+        self.request_queue_size = backlog
+        self.workers = max(0, workers)
+        self.max_pending = max_pending
+        self.idle_timeout_s = idle_timeout_s
+        self._pending: queue.Queue[tuple[socket.socket, object, int] | None] = queue.Queue()
+        self._lock = threading.Lock()
+        self._idle_workers = 0
+        self._counts = {
+            "accepted": 0,
+            "rejected": 0,
+            "active": 0,
+            "max_active": 0,
+            "max_queued": 0,
+            "queue_wait_total_ms": 0,
+            "queue_wait_max_ms": 0,
+            "idle_timeouts": 0,
+        }
+        super().__init__(server_address, handler_class)
+        self._worker_threads = [
+            threading.Thread(target=self._work, name=f"cc-dump-proxy-worker-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._worker_threads:
+            thread.start()
+
+    def process_request(self, request, client_address):
+        if not self.workers:
+            with self._lock:
+                self._counts["accepted"] += 1
+            super().process_request(request, client_address)
+            return
+        with self._lock:
+            # Connections an idle worker is about to take are not waiting.
+            waiting = self._pending.qsize() - self._idle_workers
+            if waiting >= self.max_pending:
+                self._counts["rejected"] += 1
+                reject = True
+            else:
+                self._counts["accepted"] += 1
+                self._counts["max_queued"] = max(self._counts["max_queued"], waiting + 1)
+                reject = False
+        if reject:
+            _reject(request)
+            self.shutdown_request(request)
+            return
+        self._pending.put((request, client_address, time.monotonic_ns()))
+
+    def finish_request(self, request, client_address):
+        if self.idle_timeout_s:
+            request.settimeout(self.idle_timeout_s)
+        with self._lock:
+            self._counts["active"] += 1
+            self._counts["max_active"] = max(self._counts["max_active"], self._counts["active"])
+        try:
+            super().finish_request(request, client_address)
+        finally:
+            with self._lock:
+                self._counts["active"] -= 1
+
+    def note_idle_timeout(self) -> None:
+        """Called by handlers when a client connection is closed for idling."""
+        with self._lock:
+            self._counts["idle_timeouts"] += 1
+
+    def stats(self) -> dict[str, int]:
+        """Snapshot of admission counters; queued is the current queue depth."""
+        with self._lock:
+            queued = max(0, self._pending.qsize() - self._idle_workers)
+            return {**self._counts, "workers": self.workers, "queued": queued}
+
+    def server_close(self):
+        super().server_close()
+        # Connections still waiting for a worker are closed, then workers exit.
+        while True:
+            try:
+                item = self._pending.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self.shutdown_request(item[0])
+        for _thread in self._worker_threads:
+            self._pending.put(None)
+
+    # -- private ----------------------------------------------------------
+
+    def _work(self) -> None:
+        while True:
+            with self._lock:
+                self._idle_workers += 1
+            item = self._pending.get()
+            with self._lock:
+                self._idle_workers -= 1
+            if item is None:
+                return
+            request, client_address, queued_ns = item
+            wait_ms = (time.monotonic_ns() - queued_ns) // 1_000_000
+            with self._lock:
+                self._counts["queue_wait_total_ms"] += wait_ms
+                self._counts["queue_wait_max_ms"] = max(self._counts["queue_wait_max_ms"], wait_ms)
+            try:
+                self.finish_request(request, client_address)
+            except _CONNECTION_ERRORS:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+
+def combined_stats(servers) -> dict[str, int]:
+    """Sum several servers' stats; max_* keys keep the largest value."""
+    combined: dict[str, int] = {}
+    for server in servers:
+        for key, value in server.stats().items():
+            merge = max if key.startswith(("max_", "queue_wait_max")) else int.__add__
+            combined[key] = merge(combined[key], value) if key in combined else value
+    return combined
+
+
+def _reject(request: socket.socket) -> None:
+    try:
+        request.settimeout(1.0)
+        request.sendall(_REJECT_RESPONSE)
+    except OSError:
+        logger.debug("Could not send 503 to rejected client", exc_info=True)
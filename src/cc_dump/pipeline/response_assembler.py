@@ -63,7 +63,11 @@ _SSEEventRecord = dict[str, _SSEScalar | dict[str, _SSEScalar | dict[str, _SSESc
 
 
 class _ReconstructionState:
-    """Shared state for event reconstructors."""
+    """Shared state for event reconstructors.
+
+    Deltas are folded into per-block chunk lists as they arrive and joined
+    once when the block stops, so assembly is linear in response size.
+    """
 
     def __init__(
         self,
@@ -74,6 +78,10 @@ class _ReconstructionState:
         self.message = message
         self.content_blocks = content_blocks
         self.current_text_block = current_text_block
+        self.current_text_position = -1
+        # Pending chunks keyed by position in content_blocks (append-only, so stable).
+        self.text_parts: dict[int, list[str]] = {}
+        self.input_json_parts: dict[int, list[str]] = {}
 
 
 def _handle_message_start(event: dict, state: _ReconstructionState) -> None:
@@ -102,6 +110,8 @@ def _handle_content_block_start(event: dict, state: _ReconstructionState) -> Non
     block_type = block.get("type", "")
     if block_type == "text":
         state.current_text_block = {"type": "text", "text": ""}
+        state.current_text_position = len(state.content_blocks)
+        state.text_parts[state.current_text_position] = []
         state.content_blocks.append(state.current_text_block)
     elif block_type == "tool_use":
         tool_block = {
@@ -119,27 +129,46 @@ def _handle_content_block_delta(event: dict, state: _ReconstructionState) -> Non
     delta_type = delta.get("type", "")
 
     if delta_type == "text_delta" and state.current_text_block:
-        state.current_text_block["text"] += delta.get("text", "")
+        state.text_parts[state.current_text_position].append(delta.get("text", ""))
 
     elif delta_type == "input_json_delta":
         if state.content_blocks and state.content_blocks[-1].get("type") == "tool_use":
-            if "_input_json_str" not in state.content_blocks[-1]:
-                state.content_blocks[-1]["_input_json_str"] = ""
-            state.content_blocks[-1]["_input_json_str"] += delta.get(
-                "partial_json", ""
+            position = len(state.content_blocks) - 1
+            state.input_json_parts.setdefault(position, []).append(
+                delta.get("partial_json", "")
             )
 
 
 def _handle_content_block_stop(_event: dict, state: _ReconstructionState) -> None:
-    if state.content_blocks and state.content_blocks[-1].get("type") == "tool_use":
-        json_str = state.content_blocks[-1].pop("_input_json_str", "{}")
-        try:
-            state.content_blocks[-1]["input"] = json.loads(json_str)
-        except json.JSONDecodeError:
-            state.content_blocks[-1]["input"] = {}
+    if state.content_blocks:
+        finish = _BLOCK_FINALIZERS.get(state.content_blocks[-1].get("type", ""))
+        if finish is not None:
+            finish(state, len(state.content_blocks) - 1)
     state.current_text_block = None
 
 
+def _join_text_block(state: _ReconstructionState, position: int) -> None:
+    parts = state.text_parts.pop(position, None)
+    if parts:
+        state.content_blocks[position]["text"] += "".join(parts)
+
+
+def _parse_tool_input(state: _ReconstructionState, position: int) -> None:
+    parts = state.input_json_parts.pop(position, None)
+    json_str = "{}" if parts is None else "".join(parts)
+    try:
+        state.content_blocks[position]["input"] = json.loads(json_str)
+    except json.JSONDecodeError:
+        state.content_blocks[position]["input"] = {}
+
+
+# [LAW:dataflow-not-control-flow] Folded deltas are finalized per block type.
+_BLOCK_FINALIZERS = {
+    "text": _join_text_block,
+    "tool_use": _parse_tool_input,
+}
+
+
 def _handle_message_delta(event: dict, state: _ReconstructionState) -> None:
     delta = event.get("delta", {})
     if "stop_reason" in delta:
@@ -161,19 +190,7 @@ _EVENT_RECONSTRUCTORS = {
 }
 
 
-def reconstruct_message_from_events(
-    events: list[_SSEEventRecord],
-) -> ReconstructedMessage:
-    """Reconstruct complete Claude message from SSE event sequence.
-
-    Accumulates deltas into the same format as a stream=false API response.
-
-    Args:
-        events: List of SSE event dicts (message_start, content_block_delta, etc.)
-
-    Returns:
-        Complete message dict matching the Claude Messages API response shape.
-    """
+def _new_reconstruction_state() -> _ReconstructionState:
     message: ReconstructedMessage = {
         "id": "",
         "type": "message",
@@ -184,24 +201,51 @@ def reconstruct_message_from_events(
         "stop_sequence": None,
         "usage": {},
     }
-
-    state = _ReconstructionState(
+    return _ReconstructionState(
         message=message,
         content_blocks=[],
         current_text_block=None,
     )
 
-    # [LAW:dataflow-not-control-flow] Dispatch via table lookup
-    for event in events:
-        event_type = event.get("type", "")
-        handler = _EVENT_RECONSTRUCTORS.get(event_type)
-        if handler:
-            handler(event, state)
 
+def _apply_event(event: dict, state: _ReconstructionState) -> None:
+    # [LAW:dataflow-not-control-flow] Dispatch via table lookup
+    handler = _EVENT_RECONSTRUCTORS.get(event.get("type", ""))
+    if handler:
+        handler(event, state)
+
+
+def _finalize_message(state: _ReconstructionState) -> ReconstructedMessage:
+    """Flush blocks that never saw content_block_stop (truncated streams)."""
+    for position in list(state.text_parts):
+        _join_text_block(state, position)
+    for position, parts in state.input_json_parts.items():
+        # Unterminated tool input stays as its raw partial JSON string.
+        state.content_blocks[position]["_input_json_str"] = "".join(parts)
+    state.input_json_parts.clear()
     state.message["content"] = state.content_blocks
     return state.message
 
 
+def reconstruct_message_from_events(
+    events: list[_SSEEventRecord],
+) -> ReconstructedMessage:
+    """Reconstruct complete Claude message from SSE event sequence.
+
+    Accumulates deltas into the same format as a stream=false API response.
+
+    Args:
+        events: List of SSE event dicts (message_start, content_block_delta, etc.)
+
+    Returns:
+        Complete message dict matching the Claude Messages API response shape.
+    """
+    state = _new_reconstruction_state()
+    for event in events:
+        _apply_event(event, state)
+    return _finalize_message(state)
+
+
 # ─── Typed SSEEvent → raw dict bridge ────────────────────────────────────────
 
 
@@ -300,20 +344,23 @@ class ResponseAssembler:
     """
 
     def __init__(self) -> None:
-        self._events: list[_SSEEventRecord] = []
+        self._state = _new_reconstruction_state()
+        self._received = False
         self._result: ReconstructedMessage | None = None
 
     def on_raw(self, data: bytes) -> None:
         """No-op — raw bytes not needed for assembly."""
 
     def on_event(self, event_type: str, event: dict) -> None:
-        """Accumulate an SSE event for reconstruction."""
-        self._events.append(event)
+        """Fold an SSE event into the in-progress message."""
+        # [LAW:single-enforcer] Events are applied as they arrive; none are retained.
+        self._received = True
+        _apply_event(event, self._state)
 
     def on_done(self) -> None:
-        """Reconstruct the complete message from accumulated events."""
-        if self._events:
-            self._result = reconstruct_message_from_events(self._events)
+        """Finalize the message folded from received events."""
+        if self._received:
+            self._result = _finalize_message(self._state)
 
     @property
     def result(self) -> ReconstructedMessage | None:
@@ -324,24 +371,27 @@ class ResponseAssembler:
 class OpenAiChatResponseAssembler:
     """Assembles OpenAI SSE fragments into a complete response dict.
 
-    Accumulates text deltas and tool call fragments from OpenAI's streaming
-    format into a dict that matches the OpenAI chat completion response shape.
+    Folds text deltas and tool call fragments from OpenAI's streaming format
+    into running state as they arrive, then builds a dict that matches the
+    OpenAI chat completion response shape.
     """
 
     def __init__(self) -> None:
-        self._chunks: list[dict] = []
+        self._state = _OpenAiChatReconstructionState()
+        self._received = False
         self._result: dict | None = None
 
     def on_raw(self, data: bytes) -> None:
         pass
 
     def on_event(self, event_type: str, event: dict) -> None:
-        self._chunks.append(event)
+        self._received = True
+        _merge_openai_chat_chunk(event, self._state)
 
     def on_done(self) -> None:
-        if not self._chunks:
+        if not self._received:
             return
-        self._result = _reconstruct_openai_chat_message(self._chunks)
+        self._result = _openai_chat_response(self._state)
 
     @property
     def result(self) -> dict | None:
@@ -360,6 +410,7 @@ class _OpenAiChatReconstructionState:
     message_id: str = ""
     finish_reason: str | None = None
     tool_calls: dict[int, dict] = field(default_factory=dict)
+    tool_argument_parts: dict[int, list[str]] = field(default_factory=dict)
     usage: dict[str, int] = field(default_factory=dict)
 
 
@@ -422,13 +473,17 @@ def _openai_chat_tool_call_function(tool_call: dict) -> dict:
     return func if isinstance(func, dict) else {}
 
 
-def _merge_openai_chat_tool_function(entry_function: dict, source_function: dict) -> None:
+def _merge_openai_chat_tool_function(
+    entry_function: dict,
+    argument_parts: list[str],
+    source_function: dict,
+) -> None:
     name = source_function.get("name")
     if isinstance(name, str) and name:
         entry_function["name"] = name
     arguments = source_function.get("arguments")
     if isinstance(arguments, str):
-        entry_function["arguments"] += arguments
+        argument_parts.append(arguments)
 
 
 def _merge_openai_chat_tool_call(tool_call: dict, state: _OpenAiChatReconstructionState) -> None:
@@ -439,6 +494,7 @@ def _merge_openai_chat_tool_call(tool_call: dict, state: _OpenAiChatReconstructi
         entry["id"] = tool_call_id
     _merge_openai_chat_tool_function(
         entry["function"],
+        state.tool_argument_parts.setdefault(index, []),
         _openai_chat_tool_call_function(tool_call),
     )
 
@@ -486,34 +542,49 @@ def _openai_chat_response_usage(state: _OpenAiChatReconstructionState) -> dict[s
     }
 
 
+def _openai_chat_response_tool_call(index: int, state: _OpenAiChatReconstructionState) -> dict:
+    entry = state.tool_calls[index]
+    arguments = "".join(state.tool_argument_parts.get(index, ()))
+    return {**entry, "function": {**entry["function"], "arguments": arguments}}
+
+
 def _openai_chat_response_message(state: _OpenAiChatReconstructionState) -> dict:
     message_content = "".join(state.message_content_parts)
     result_message: dict = {"role": "assistant", "content": message_content or None}
     if state.tool_calls:
-        result_message["tool_calls"] = [state.tool_calls[i] for i in sorted(state.tool_calls)]
+        result_message["tool_calls"] = [
+            _openai_chat_response_tool_call(i, state) for i in sorted(state.tool_calls)
+        ]
     return result_message
 
 
+def _merge_openai_chat_chunk(chunk: dict, state: _OpenAiChatReconstructionState) -> None:
+    """Fold one streaming chunk into reconstruction state."""
+    if not isinstance(chunk, dict):
+        return
+    _merge_openai_chat_chunk_identity(chunk, state)
+    _merge_openai_chat_chunk_usage(chunk, state)
+    choices = chunk.get("choices", [])
+    if not isinstance(choices, list):
+        return
+    for choice in choices:
+        if not isinstance(choice, dict):
+            continue
+        _merge_openai_chat_choice(choice, state)
+
+
 def _reconstruct_openai_chat_message(chunks: list[dict]) -> dict:
     """Reconstruct a complete OpenAI chat completion from streaming chunks.
 
     Accumulates delta.content and delta.tool_calls into the non-streaming shape.
     """
     state = _OpenAiChatReconstructionState()
-
     for chunk in chunks:
-        if not isinstance(chunk, dict):
-            continue
-        _merge_openai_chat_chunk_identity(chunk, state)
-        _merge_openai_chat_chunk_usage(chunk, state)
-        choices = chunk.get("choices", [])
-        if not isinstance(choices, list):
-            continue
-        for choice in choices:
-            if not isinstance(choice, dict):
-                continue
-            _merge_openai_chat_choice(choice, state)
+        _merge_openai_chat_chunk(chunk, state)
+    return _openai_chat_response(state)
+
 
+def _openai_chat_response(state: _OpenAiChatReconstructionState) -> dict:
     return {
         "id": state.message_id,
         "object": "chat.completion",
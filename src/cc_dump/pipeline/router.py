@@ -2,18 +2,57 @@
 
 Routes events from a single source queue to multiple subscribers.
 Each subscriber can choose how to receive events (queue-based or direct callback).
+
+Two delivery modes:
+
+- serial (default): one thread takes one event at a time and calls every
+  subscriber inline, in registration order.
+- batched: the router thread drains the source in batches. Inline subscribers
+  still run in the router thread, before any other subscriber sees the batch.
+  Every other subscriber gets its own bounded EventChannel. Callback
+  subscribers also get their own worker thread, so a slow consumer only
+  fills its own channel and never delays the others.
+
+Each channel has an overflow policy for when it is full:
+
+- block: the router waits for space.
+- drop_progress: ResponseProgressEvents are dropped; everything else blocks.
+- coalesce: a ResponseProgressEvent merges into the request's queued
+  progress event (lossless for rendering, see merge_progress_events);
+  everything else blocks. A channel with room never merges.
+
+A blocked router waits at most max_block_s per put_many call, so one slow
+consumer cannot stall the router thread. Once that runs out, progress events
+are dropped and other events are queued past maxsize.
 """
 
+import itertools
 import queue
 import threading
 import logging
+import time
+from collections import deque
+from collections.abc import Iterable
 from typing import Protocol
 
-from cc_dump.pipeline.event_types import PipelineEvent
+from cc_dump.pipeline.event_types import (
+    PipelineEvent,
+    ResponseProgressEvent,
+    merge_progress_events,
+)
 
 Event = PipelineEvent
 logger = logging.getLogger(__name__)
 
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_PROGRESS = "drop_progress"
+OVERFLOW_COALESCE = "coalesce"
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_PROGRESS, OVERFLOW_COALESCE)
+
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_CHANNEL_SIZE = 4096
+DEFAULT_MAX_BLOCK_S = 1.0
+
 
 class Subscriber(Protocol):
     """Protocol for event subscribers. Any object with on_event(event) can subscribe."""
@@ -21,11 +60,173 @@ class Subscriber(Protocol):
     def on_event(self, event: Event) -> None: ...
 
 
+class _Pending:
+    __slots__ = ("enqueued_ns", "event")
+
+    def __init__(self, event: PipelineEvent, enqueued_ns: int):
+        self.event = event
+        self.enqueued_ns = enqueued_ns
+
+
+class EventChannel:
+    """Bounded FIFO of pipeline events with an overflow policy and counters.
+
+    Implements the part of the queue.Queue API that consumers use
+    (put/get/get_nowait/qsize/empty), so it can stand in for one.
+    maxsize=0 means unbounded.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        overflow: str = OVERFLOW_BLOCK,
+        max_block_s: float = DEFAULT_MAX_BLOCK_S,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy {overflow!r}")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.max_block_s = max_block_s
+        self._items: deque[_Pending] = deque()
+        # Last queued event per request, when it is a progress event that a
+        # later progress event may merge into. Any other event for the request
+        # clears it so merging never reorders a request's events.
+        self._mergeable: dict[str, _Pending] = {}
+        self._cond = threading.Condition()
+        self._closed = False
+        self._delivered = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._blocked = 0
+        self._max_depth = 0
+        self._max_lag_ns = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put(self, event: PipelineEvent, block: bool = True, timeout: float | None = None) -> None:
+        """Enqueue one event; block/timeout are accepted for queue.Queue compatibility."""
+        self.put_many((event,))
+
+    def put_many(self, events: Iterable[PipelineEvent]) -> None:
+        """Enqueue events in order under one lock acquisition, applying the overflow policy."""
+        deadline = time.monotonic() + self.max_block_s
+        with self._cond:
+            for event in events:
+                self._offer(event, deadline)
+            self._cond.notify_all()
+
+    def get(self, block: bool = True, timeout: float | None = None) -> PipelineEvent:
+        """Dequeue the oldest event. Raises queue.Empty on timeout, or once closed and drained."""
+        with self._cond:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while not self._items:
+                if self._closed or not block:
+                    raise queue.Empty
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                self._cond.wait(remaining)
+            pending = self._items.popleft()
+            if self._mergeable.get(pending.event.request_id) is pending:
+                del self._mergeable[pending.event.request_id]
+            self._delivered += 1
+            self._max_lag_ns = max(self._max_lag_ns, time.monotonic_ns() - pending.enqueued_ns)
+            self._cond.notify_all()
+            return pending.event
+
+    def get_nowait(self) -> PipelineEvent:
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def close(self) -> None:
+        """Stop accepting waits: blocked producers enqueue immediately, consumers drain then get Empty."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def stats(self) -> dict[str, int]:
+        """Snapshot of channel counters. lag_ms is the age of the oldest queued event."""
+        with self._cond:
+            oldest = self._items[0].enqueued_ns if self._items else None
+            lag_ns = 0 if oldest is None else time.monotonic_ns() - oldest
+            return {
+                "queued": len(self._items),
+                "max_queued": self._max_depth,
+                "delivered": self._delivered,
+                "dropped": self._dropped,
+                "coalesced": self._coalesced,
+                "blocked": self._blocked,
+                "lag_ms": lag_ns // 1_000_000,
+                "max_lag_ms": self._max_lag_ns // 1_000_000,
+            }
+
+    # -- private ----------------------------------------------------------
+
+    def _offer(self, event: PipelineEvent, deadline: float) -> None:
+        is_progress = isinstance(event, ResponseProgressEvent)
+        if self._full() and not self._make_room(event, deadline):
+            return
+        pending = _Pending(event, time.monotonic_ns())
+        self._items.append(pending)
+        if is_progress:
+            self._mergeable[event.request_id] = pending
+        else:
+            self._mergeable.pop(event.request_id, None)
+        self._max_depth = max(self._max_depth, len(self._items))
+
+    def _make_room(self, event: PipelineEvent, deadline: float) -> bool:
+        """Apply the overflow policy to a full channel; False when the event was merged or dropped."""
+        if isinstance(event, ResponseProgressEvent) and self._shed_progress(event):
+            return False
+        self._blocked += 1
+        # Out of time: progress is dropped, anything else goes over maxsize.
+        if self._wait_for_room(deadline) or not isinstance(event, ResponseProgressEvent):
+            return True
+        self._dropped += 1
+        return False
+
+    def _shed_progress(self, event: ResponseProgressEvent) -> bool:
+        """Merge or drop a progress event per the policy; True when it needs no slot."""
+        if self.overflow == OVERFLOW_DROP_PROGRESS:
+            self._dropped += 1
+            return True
+        return self.overflow == OVERFLOW_COALESCE and self._merge(event)
+
+    def _wait_for_room(self, deadline: float) -> bool:
+        remaining = deadline - time.monotonic()
+        while self._full() and not self._closed and remaining > 0:
+            self._cond.wait(remaining)
+            remaining = deadline - time.monotonic()
+        return self._closed or not self._full()
+
+    def _merge(self, event: ResponseProgressEvent) -> bool:
+        pending = self._mergeable.get(event.request_id)
+        if pending is None:
+            return False
+        assert isinstance(pending.event, ResponseProgressEvent)
+        merged = merge_progress_events(pending.event, event)
+        if merged is None:
+            return False
+        pending.event = merged
+        self._coalesced += 1
+        return True
+
+    def _full(self) -> bool:
+        return bool(self.maxsize) and len(self._items) >= self.maxsize
+
+
 class QueueSubscriber:
     """Subscriber that puts events into its own queue for async consumption."""
 
-    def __init__(self):
-        self.queue: queue.Queue[PipelineEvent] = queue.Queue()
+    def __init__(self, maxsize: int = 0, overflow: str = OVERFLOW_BLOCK):
+        self.queue = EventChannel(maxsize=maxsize, overflow=overflow)
 
     def on_event(self, event: Event) -> None:
         self.queue.put(event)
@@ -41,29 +242,124 @@ class DirectSubscriber:
         self._fn(event)
 
 
+class _Route:
+    """A batched-mode subscriber with its channel and, for callbacks, its worker."""
+
+    def __init__(self, name: str, sub: Subscriber, channel: EventChannel, needs_worker: bool):
+        self.name = name
+        self.sub = sub
+        self.channel = channel
+        self.needs_worker = needs_worker
+        self.thread: threading.Thread | None = None
+
+
 class EventRouter:
     """Router that drains a source queue and fans out to subscribers."""
 
-    def __init__(self, source: queue.Queue[PipelineEvent]):
+    def __init__(
+        self,
+        source: queue.Queue[PipelineEvent],
+        *,
+        batched: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
         self._source = source
+        self._batched = batched
+        self._batch_size = max(1, batch_size)
         self._subscribers: list[Subscriber] = []
+        self._routes: list[_Route] = []
+        self._names: dict[str, itertools.count] = {}
         self._stop = threading.Event()
         self._thread: threading.Thread | None = None
 
-    def add_subscriber(self, sub: Subscriber) -> None:
-        """Add a subscriber to receive events."""
-        self._subscribers.append(sub)
+    @property
+    def batched(self) -> bool:
+        return self._batched
+
+    def add_subscriber(
+        self,
+        sub: Subscriber,
+        *,
+        inline: bool = False,
+        maxsize: int = DEFAULT_CHANNEL_SIZE,
+        overflow: str = OVERFLOW_BLOCK,
+        name: str = "",
+    ) -> None:
+        """Add a subscriber to receive events.
+
+        The keyword options only apply in batched mode. inline=True runs the
+        subscriber in the router thread ahead of all queued subscribers.
+        A QueueSubscriber is fed through its own queue; any other subscriber
+        gets a channel of maxsize with the given overflow policy and a worker.
+        """
+        # [LAW:dataflow-not-control-flow] Serial mode is batched mode with every subscriber inline.
+        route = self._new_route(sub, inline=inline, maxsize=maxsize, overflow=overflow, name=name)
+        self._register(sub, route)
 
     def start(self) -> None:
-        """Start the router thread."""
-        self._thread = threading.Thread(target=self._run, daemon=True)
+        """Start the router thread (and, in batched mode, subscriber workers)."""
+        self._start_workers()
+        self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
-        """Stop the router thread gracefully."""
+        """Stop the router thread gracefully.
+
+        Workers finish the events already in their channels, bounded by a
+        shared deadline so a wedged subscriber cannot hang shutdown.
+        """
         self._stop.set()
         if self._thread:
             self._thread.join(timeout=2.0)
+        self._stop_workers(timeout=2.0)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Per-subscriber channel counters (batched mode), keyed by subscriber name."""
+        return {route.name: route.channel.stats() for route in self._routes}
+
+    def _new_route(
+        self,
+        sub: Subscriber,
+        *,
+        inline: bool,
+        maxsize: int,
+        overflow: str,
+        name: str,
+    ) -> _Route | None:
+        """The channel route for a batched-mode subscriber; None when it runs inline."""
+        if not self._batched or inline:
+            return None
+        name = self._unique_name(name or _subscriber_name(sub))
+        if isinstance(sub, QueueSubscriber):
+            return _Route(name, sub, sub.queue, needs_worker=False)
+        return _Route(name, sub, EventChannel(maxsize=maxsize, overflow=overflow), needs_worker=True)
+
+    def _register(self, sub: Subscriber, route: _Route | None) -> None:
+        if route is None:
+            self._subscribers.append(sub)
+            return
+        self._routes.append(route)
+        if self._thread is not None and not self._stop.is_set():
+            self._start_worker(route)
+
+    def _start_workers(self) -> None:
+        for route in self._routes:
+            self._start_worker(route)
+
+    def _stop_workers(self, timeout: float) -> None:
+        """Close every channel, then join workers against one shared deadline."""
+        for route in self._routes:
+            route.channel.close()
+        deadline = time.monotonic() + timeout
+        for route in self._routes:
+            if route.thread is not None:
+                route.thread.join(timeout=max(0.0, deadline - time.monotonic()))
+
+    def _run_loop(self) -> None:
+        if self._batched:
+            self._run_batched()
+        else:
+            self._run()
 
     def _run(self) -> None:
         """Router thread main loop: drain source, fan out to subscribers."""
@@ -73,10 +369,70 @@ class EventRouter:
             except queue.Empty:
                 continue
 
-            # Fan out to all subscribers
-            for sub in self._subscribers:
-                try:
-                    sub.on_event(event)
-                except Exception:
-                    # Don't let one subscriber's error kill the router
-                    logger.exception("subscriber error")
+            self._deliver_inline(event)
+
+    def _run_batched(self) -> None:
+        """Batched main loop: inline subscribers per event, then one put_many per channel."""
+        while not self._stop.is_set():
+            batch = self._next_batch()
+            if not batch:
+                continue
+            for event in batch:
+                self._deliver_inline(event)
+            for route in self._routes:
+                route.channel.put_many(batch)
+
+    def _next_batch(self) -> list[PipelineEvent]:
+        try:
+            batch = [self._source.get(timeout=0.5)]
+        except queue.Empty:
+            return []
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._source.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _deliver_inline(self, event: PipelineEvent) -> None:
+        # Fan out to all subscribers
+        for sub in self._subscribers:
+            try:
+                sub.on_event(event)
+            except Exception:
+                # Don't let one subscriber's error kill the router
+                logger.exception("subscriber error")
+
+    def _start_worker(self, route: _Route) -> None:
+        if not route.needs_worker or route.thread is not None:
+            return
+        route.thread = threading.Thread(
+            target=_drain_channel,
+            args=(route,),
+            name=f"cc-dump-router-{route.name}",
+            daemon=True,
+        )
+        route.thread.start()
+
+    def _unique_name(self, base: str) -> str:
+        counter = self._names.setdefault(base, itertools.count(1))
+        n = next(counter)
+        return base if n == 1 else f"{base}#{n}"
+
+
+def _subscriber_name(sub: Subscriber) -> str:
+    fn = getattr(sub, "_fn", None)
+    return getattr(fn, "__qualname__", None) or type(sub).__name__
+
+
+def _drain_channel(route: _Route) -> None:
+    """Worker loop: deliver a channel's events to its subscriber until closed and drained."""
+    while True:
+        try:
+            event = route.channel.get()
+        except queue.Empty:
+            return
+        try:
+            route.sub.on_event(event)
+        except Exception:
+            logger.exception("subscriber error (%s)", route.name)
@@ -12,6 +12,13 @@ if TYPE_CHECKING:
     from cc_dump.app.tmux_controller import TmuxController
 
 SENTINEL = "$$"
+# "$" may also arrive JSON-escaped; either spelling must reach the full check.
+_SENTINEL_RAW_MARKERS = (SENTINEL.encode(), b"\\u0024")
+
+
+def may_contain_sentinel(body_bytes: bytes) -> bool:
+    """Raw-bytes prefilter: False means extract_sentinel_command cannot match the body."""
+    return any(marker in body_bytes for marker in _SENTINEL_RAW_MARKERS)
 
 
 def extract_sentinel_command(body: dict) -> str | None:
@@ -76,4 +83,6 @@ def make_interceptor(tmux_controller: TmuxController | None = None):
 
         return "[cc-dump]"
 
+    # [LAW:locality-or-seam] Lets the proxy forward unparsed bodies that cannot match.
+    interceptor.may_intercept = may_contain_sentinel
     return interceptor
@@ -0,0 +1,699 @@
+"""Pooled keep-alive HTTP/1.1 client for upstream API connections.
+
+// [LAW:one-source-of-truth] Upstream connection lifecycle (open, reuse, evict) lives here.
+// [LAW:single-enforcer] The shared client SSL context is built once per pool.
+
+UpstreamConnectionPool serves the threaded proxy over http.client.
+AsyncUpstreamConnectionPool is its asyncio counterpart for the asyncio
+engine (same policy and counters): it speaks HTTP/1.1 on asyncio streams
+and must only be used from the event loop that owns its connections.
+
+This module is STABLE — holds live sockets, never hot-reloaded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import http.client
+import io
+import logging
+import select
+import ssl
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Mapping
+from dataclasses import dataclass
+from typing import TypeVar
+from urllib.parse import urlsplit
+
+import truststore
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_IDLE_PER_TARGET = 8
+_DEFAULT_IDLE_TIMEOUT_S = 60.0
+_DEFAULT_TIMEOUT_S = 300.0
+
+# Errors writing a request to a reused keep-alive socket the server closed while idle.
+_STALE_CONNECTION_ERRORS = (
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+# asyncio equivalents: a reset or broken pipe while sending.
+_ASYNC_STALE_CONNECTION_ERRORS = (
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+_READ_SIZE = 64 * 1024
+_MAX_HEADERS = 100
+
+TargetKey = tuple[str, str, int]
+
+_T = TypeVar("_T")
+
+
+def _new_client_ssl_context() -> ssl.SSLContext:
+    ctx = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    ctx.set_alpn_protocols(["http/1.1"])
+    return ctx
+
+
+def _target_key(url: str) -> tuple[TargetKey, str]:
+    """Split an absolute URL into (scheme, host, port) and the request target."""
+    parts = urlsplit(url)
+    scheme = (parts.scheme or "https").lower()
+    if scheme not in ("http", "https"):
+        raise ValueError(f"Unsupported upstream scheme: {scheme!r}")
+    host = parts.hostname or ""
+    if not host:
+        raise ValueError(f"Upstream URL has no host: {url!r}")
+    port = parts.port or (443 if scheme == "https" else 80)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    return (scheme, host, port), path
+
+
+@dataclass
+class _IdleConnection:
+    connection: http.client.HTTPConnection
+    idle_since: float
+
+
+@dataclass
+class UpstreamLease:
+    """An in-flight upstream exchange. Hand back to the pool via ``release``."""
+
+    key: TargetKey
+    connection: http.client.HTTPConnection
+    response: http.client.HTTPResponse
+    reused: bool
+
+
+class UpstreamConnectionPool:
+    """Per-target pool of keep-alive HTTP/1.1 connections.
+
+    In-flight connections are never capped; ``max_idle_per_target`` bounds how
+    many are kept open between requests. Idle connections older than
+    ``idle_timeout_s`` are closed on the next acquire/release for any target.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_idle_per_target: int = _DEFAULT_MAX_IDLE_PER_TARGET,
+        idle_timeout_s: float = _DEFAULT_IDLE_TIMEOUT_S,
+        timeout_s: float = _DEFAULT_TIMEOUT_S,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        self._max_idle_per_target = max(0, int(max_idle_per_target))
+        self._idle_timeout_s = float(idle_timeout_s)
+        self._timeout_s = float(timeout_s)
+        self._ssl_context = ssl_context
+        self._idle: dict[TargetKey, deque[_IdleConnection]] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._opened = 0
+        self._reused = 0
+        self._evicted = 0
+
+    # -- public -----------------------------------------------------------
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | None,
+        headers: Mapping[str, str],
+    ) -> UpstreamLease:
+        """Send a request upstream and return the lease once headers arrive.
+
+        A reused connection that fails while the request is written is retried
+        once on a fresh connection. Nothing is retried once the request is
+        fully written, since the upstream may already have acted on it.
+        """
+        key, path = _target_key(url)
+        connection, reused = self._acquire(key)
+        connection, reused = self._write_request(connection, reused, key, method, path, body, headers)
+        try:
+            response = connection.getresponse()
+        except BaseException:
+            connection.close()
+            raise
+        return UpstreamLease(key=key, connection=connection, response=response, reused=reused)
+
+    def release(self, lease: UpstreamLease) -> None:
+        """Return a lease's connection to the pool, or close it if not reusable."""
+        response = lease.response
+        reusable = response.isclosed() and not response.will_close
+        with self._lock:
+            idle = self._idle.setdefault(lease.key, deque())
+            keep = reusable and not self._closed and len(idle) < self._max_idle_per_target
+            if keep:
+                idle.append(_IdleConnection(lease.connection, time.monotonic()))
+            stale = self._collect_expired_locked()
+        if not keep:
+            response.close()
+            lease.connection.close()
+        _close_all(stale)
+
+    def evict_idle(self) -> int:
+        """Close idle connections past the idle timeout. Returns the number closed."""
+        with self._lock:
+            stale = self._collect_expired_locked()
+        _close_all(stale)
+        return len(stale)
+
+    def close(self) -> None:
+        """Close every idle connection and stop pooling new ones."""
+        with self._lock:
+            self._closed = True
+            stale = [entry.connection for idle in self._idle.values() for entry in idle]
+            self._idle.clear()
+        _close_all(stale)
+
+    def stats(self) -> dict[str, int]:
+        """Snapshot of pool counters."""
+        with self._lock:
+            return {
+                "idle_connections": sum(len(idle) for idle in self._idle.values()),
+                "targets": len(self._idle),
+                "connections_opened": self._opened,
+                "connections_reused": self._reused,
+                "connections_evicted": self._evicted,
+            }
+
+    # -- private ----------------------------------------------------------
+
+    def _acquire(self, key: TargetKey) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            stale = self._collect_expired_locked()
+            idle = self._idle.get(key)
+            entry = None
+            # [LAW:dataflow-not-control-flow] Most-recently released socket is the likeliest to be alive.
+            while idle and entry is None:
+                candidate = idle.pop()
+                if _connection_dropped(candidate.connection):
+                    stale.append(candidate.connection)
+                else:
+                    entry = candidate
+            if entry is not None:
+                self._reused += 1
+        _close_all(stale)
+        if entry is not None:
+            return entry.connection, True
+        return self._open(key), False
+
+    def _open(self, key: TargetKey) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        connection: http.client.HTTPConnection
+        if scheme == "https":
+            connection = http.client.HTTPSConnection(
+                host, port, timeout=self._timeout_s, context=self._client_ssl_context()
+            )
+        else:
+            connection = http.client.HTTPConnection(host, port, timeout=self._timeout_s)
+        with self._lock:
+            self._opened += 1
+        return connection
+
+    def _client_ssl_context(self) -> ssl.SSLContext:
+        with self._lock:
+            if self._ssl_context is None:
+                self._ssl_context = _new_client_ssl_context()
+            return self._ssl_context
+
+    def _write_request(
+        self,
+        connection: http.client.HTTPConnection,
+        reused: bool,
+        key: TargetKey,
+        method: str,
+        path: str,
+        body: bytes | None,
+        headers: Mapping[str, str],
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        """Write the request, replacing a reused socket the upstream had already closed."""
+        try:
+            connection.request(method, path, body=body, headers=dict(headers))
+        except _STALE_CONNECTION_ERRORS:
+            connection.close()
+            if not reused:
+                raise
+        except BaseException:
+            connection.close()
+            raise
+        else:
+            return connection, reused
+        logger.debug("stale pooled connection to %s:%s, reconnecting", key[1], key[2])
+        fresh = self._open(key)
+        try:
+            fresh.request(method, path, body=body, headers=dict(headers))
+        except BaseException:
+            fresh.close()
+            raise
+        return fresh, False
+
+    def _collect_expired_locked(self) -> list[http.client.HTTPConnection]:
+        cutoff = time.monotonic() - self._idle_timeout_s
+        expired: list[http.client.HTTPConnection] = []
+        for key in list(self._idle):
+            idle = self._idle[key]
+            # Deque is ordered oldest-first, so expired entries form a prefix.
+            while idle and idle[0].idle_since <= cutoff:
+                expired.append(idle.popleft().connection)
+            if not idle:
+                del self._idle[key]
+        self._evicted += len(expired)
+        return expired
+
+
+def _connection_dropped(connection: http.client.HTTPConnection) -> bool:
+    """True when an idle socket is readable: the upstream closed it (or sent stray bytes)."""
+    sock = connection.sock
+    return sock is None or bool(select.select([sock], [], [], 0)[0])
+
+
+def _close_all(connections: list[http.client.HTTPConnection] | list[_AsyncConnection]) -> None:
+    for connection in connections:
+        try:
+            connection.close()
+        except Exception:
+            logger.debug("error closing pooled upstream connection", exc_info=True)
+
+
+# ─── asyncio client ──────────────────────────────────────────────────────────
+
+
+def _body_length(
+    headers: http.client.HTTPMessage, *, method: str, status: int, chunked: bool,
+) -> int | None:
+    """Declared body length; None when the body is chunked or runs to end of connection."""
+    if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+        return 0
+    if chunked or headers.get("Content-Length") is None:
+        return None
+    try:
+        return max(0, int(headers["Content-Length"]))
+    except ValueError:
+        return None
+
+
+if sys.version_info >= (3, 11):
+
+    async def wait_with_timeout(aw: Awaitable[_T], timeout: float | None) -> _T:
+        """Await aw; TimeoutError after timeout seconds (None waits forever)."""
+        async with asyncio.timeout(timeout):
+            return await aw
+
+else:
+
+    async def wait_with_timeout(aw: Awaitable[_T], timeout: float | None) -> _T:
+        """Await aw; TimeoutError after timeout seconds (None waits forever)."""
+        # asyncio.TimeoutError is not the builtin (an OSError) before 3.11.
+        try:
+            return await asyncio.wait_for(aw, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError from None
+
+
+class AsyncUpstreamResponse:
+    """An upstream HTTP/1.1 response being read from an asyncio stream.
+
+    Mirrors the parts of http.client.HTTPResponse the proxy uses: status,
+    reason, headers, read(), read1(), isclosed() and will_close. Bodies are
+    framed by chunked encoding, Content-Length, or end of connection.
+    """
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        *,
+        method: str,
+        version: int,
+        status: int,
+        reason: str,
+        headers: http.client.HTTPMessage,
+        timeout_s: float,
+    ) -> None:
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._reader = reader
+        self._timeout_s = timeout_s
+        self._chunked = "chunked" in headers.get("Transfer-Encoding", "").lower()
+        length = _body_length(headers, method=method, status=status, chunked=self._chunked)
+        self._remaining = length
+        self._chunk_left = 0
+        self._done = length == 0
+        connection = headers.get("Connection", "").lower()
+        self.will_close = (
+            "close" in connection
+            or (version < 11 and "keep-alive" not in connection)
+            or (not self._chunked and length is None)
+        )
+
+    def isclosed(self) -> bool:
+        """True once the whole body has been read."""
+        return self._done
+
+    async def read1(self, amt: int = _READ_SIZE) -> bytes:
+        """Up to amt body bytes as soon as any arrive; b"" at the end of the body."""
+        if self._done:
+            return b""
+        read = self._read_chunked(amt) if self._chunked else self._read_plain(amt)
+        return await wait_with_timeout(read, self._timeout_s)
+
+    async def read(self) -> bytes:
+        """The rest of the body."""
+        parts = []
+        while chunk := await self.read1():
+            parts.append(chunk)
+        return b"".join(parts)
+
+    async def _read_plain(self, amt: int) -> bytes:
+        if self._remaining is None:
+            data = await self._reader.read(amt)
+            self._done = not data
+            return data
+        data = await self._reader.read(min(amt, self._remaining))
+        if not data:
+            raise http.client.IncompleteRead(b"", self._remaining)
+        self._remaining -= len(data)
+        self._done = self._remaining == 0
+        return data
+
+    async def _read_chunked(self, amt: int) -> bytes:
+        if not self._chunk_left:
+            line = await self._reader.readline()
+            try:
+                size = int(line.split(b";", 1)[0].strip(), 16)
+            except ValueError:
+                raise http.client.IncompleteRead(b"") from None
+            if size == 0:
+                # Trailer section, ended by a blank line.
+                while (line := await self._reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                self._done = True
+                return b""
+            self._chunk_left = size
+        data = await self._reader.read(min(amt, self._chunk_left))
+        if not data:
+            raise http.client.IncompleteRead(b"", self._chunk_left)
+        self._chunk_left -= len(data)
+        if not self._chunk_left:
+            await self._reader.readexactly(2)  # CRLF closing the chunk
+        return data
+
+
+@dataclass
+class _AsyncConnection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+
+    async def send(self, data: bytes) -> None:
+        self.writer.write(data)
+        await self.writer.drain()
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+@dataclass
+class _IdleAsyncConnection:
+    connection: _AsyncConnection
+    idle_since: float
+
+
+@dataclass
+class AsyncUpstreamLease:
+    """An in-flight upstream exchange. Hand back to the pool via ``release``."""
+
+    key: TargetKey
+    connection: _AsyncConnection
+    response: AsyncUpstreamResponse
+    reused: bool
+
+
+class AsyncUpstreamConnectionPool:
+    """Per-target pool of keep-alive HTTP/1.1 connections on asyncio streams.
+
+    Same policy and stats() as UpstreamConnectionPool. Connections are bound
+    to the event loop that opened them, so every method except stats() must
+    run on that loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_idle_per_target: int = _DEFAULT_MAX_IDLE_PER_TARGET,
+        idle_timeout_s: float = _DEFAULT_IDLE_TIMEOUT_S,
+        timeout_s: float = _DEFAULT_TIMEOUT_S,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        self._max_idle_per_target = max(0, int(max_idle_per_target))
+        self._idle_timeout_s = float(idle_timeout_s)
+        self._timeout_s = float(timeout_s)
+        self._ssl_context = ssl_context
+        self._idle: dict[TargetKey, deque[_IdleAsyncConnection]] = {}
+        # Only stats() runs off the loop; the lock keeps its snapshot consistent.
+        self._lock = threading.Lock()
+        self._closed = False
+        self._opened = 0
+        self._reused = 0
+        self._evicted = 0
+
+    # -- public -----------------------------------------------------------
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | None,
+        headers: Mapping[str, str],
+    ) -> AsyncUpstreamLease:
+        """Send a request upstream and return the lease once headers arrive.
+
+        Retries follow UpstreamConnectionPool.request: only a reused connection
+        that fails while the request is written is retried.
+        """
+        key, path = _target_key(url)
+        connection, reused = self._acquire(key)
+        if connection is None:
+            connection = await self._open(key)
+        request = _request_head(key, method, path, body, headers) + (body or b"")
+        connection, reused = await self._write_request(connection, reused, key, request)
+        try:
+            response = await wait_with_timeout(
+                _read_response_head(connection.reader, method, self._timeout_s), self._timeout_s
+            )
+        except BaseException:
+            connection.close()
+            raise
+        return AsyncUpstreamLease(key=key, connection=connection, response=response, reused=reused)
+
+    def release(self, lease: AsyncUpstreamLease) -> None:
+        """Return a lease's connection to the pool, or close it if not reusable."""
+        response = lease.response
+        reusable = (
+            response.isclosed()
+            and not response.will_close
+            and not lease.connection.reader.at_eof()
+        )
+        with self._lock:
+            idle = self._idle.setdefault(lease.key, deque())
+            keep = reusable and not self._closed and len(idle) < self._max_idle_per_target
+            if keep:
+                idle.append(_IdleAsyncConnection(lease.connection, time.monotonic()))
+            stale = self._collect_expired_locked()
+        if not keep:
+            lease.connection.close()
+        _close_all(stale)
+
+    def evict_idle(self) -> int:
+        """Close idle connections past the idle timeout. Returns the number closed."""
+        with self._lock:
+            stale = self._collect_expired_locked()
+        _close_all(stale)
+        return len(stale)
+
+    def close(self) -> None:
+        """Close every idle connection and stop pooling new ones."""
+        with self._lock:
+            self._closed = True
+            stale = [entry.connection for idle in self._idle.values() for entry in idle]
+            self._idle.clear()
+        _close_all(stale)
+
+    def stats(self) -> dict[str, int]:
+        """Snapshot of pool counters."""
+        with self._lock:
+            return {
+                "idle_connections": sum(len(idle) for idle in self._idle.values()),
+                "targets": len(self._idle),
+                "connections_opened": self._opened,
+                "connections_reused": self._reused,
+                "connections_evicted": self._evicted,
+            }
+
+    # -- private ----------------------------------------------------------
+
+    def _acquire(self, key: TargetKey) -> tuple[_AsyncConnection | None, bool]:
+        with self._lock:
+            stale = self._collect_expired_locked()
+            idle = self._idle.get(key)
+            entry = None
+            # [LAW:dataflow-not-control-flow] Most-recently released socket is the likeliest to be alive.
+            while idle and entry is None:
+                candidate = idle.pop()
+                if candidate.connection.reader.at_eof():
+                    stale.append(candidate.connection)
+                else:
+                    entry = candidate
+            if entry is not None:
+                self._reused += 1
+        _close_all(stale)
+        if entry is not None:
+            return entry.connection, True
+        return None, False
+
+    async def _open(self, key: TargetKey) -> _AsyncConnection:
+        scheme, host, port = key
+        context = self._client_ssl_context() if scheme == "https" else None
+        reader, writer = await wait_with_timeout(
+            asyncio.open_connection(
+                host,
+                port,
+                ssl=context,
+                server_hostname=host if context is not None else None,
+                limit=_READ_SIZE,
+            ),
+            self._timeout_s,
+        )
+        with self._lock:
+            self._opened += 1
+        return _AsyncConnection(reader, writer)
+
+    def _client_ssl_context(self) -> ssl.SSLContext:
+        with self._lock:
+            if self._ssl_context is None:
+                self._ssl_context = _new_client_ssl_context()
+            return self._ssl_context
+
+    async def _write_request(
+        self,
+        connection: _AsyncConnection,
+        reused: bool,
+        key: TargetKey,
+        request: bytes,
+    ) -> tuple[_AsyncConnection, bool]:
+        """Write the request, replacing a reused socket the upstream had already closed."""
+        try:
+            await connection.send(request)
+        except _ASYNC_STALE_CONNECTION_ERRORS:
+            connection.close()
+            if not reused:
+                raise
+        except BaseException:
+            connection.close()
+            raise
+        else:
+            return connection, reused
+        logger.debug("stale pooled connection to %s:%s, reconnecting", key[1], key[2])
+        fresh = await self._open(key)
+        try:
+            await fresh.send(request)
+        except BaseException:
+            fresh.close()
+            raise
+        return fresh, False
+
+    def _collect_expired_locked(self) -> list[_AsyncConnection]:
+        cutoff = time.monotonic() - self._idle_timeout_s
+        expired: list[_AsyncConnection] = []
+        for key in list(self._idle):
+            idle = self._idle[key]
+            # Deque is ordered oldest-first, so expired entries form a prefix.
+            while idle and idle[0].idle_since <= cutoff:
+                expired.append(idle.popleft().connection)
+            if not idle:
+                del self._idle[key]
+        self._evicted += len(expired)
+        return expired
+
+
+def _request_head(
+    key: TargetKey,
+    method: str,
+    path: str,
+    body: bytes | None,
+    headers: Mapping[str, str],
+) -> bytes:
+    """Request line and headers, defaulted the way http.client defaults them."""
+    scheme, host, port = key
+    present = {name.lower() for name in headers}
+    lines = [f"{method} {path} HTTP/1.1"]
+    if "host" not in present:
+        host_text = f"[{host}]" if ":" in host else host
+        default_port = 443 if scheme == "https" else 80
+        lines.append(f"Host: {host_text}" if port == default_port else f"Host: {host_text}:{port}")
+    if "accept-encoding" not in present:
+        lines.append("Accept-Encoding: identity")
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    if body and "content-length" not in present:
+        lines.append(f"Content-Length: {len(body)}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def _read_status_line(reader: asyncio.StreamReader) -> tuple[str, int, str]:
+    """(HTTP version, status, reason) of the next status line."""
+    line = await reader.readline()
+    if not line:
+        raise http.client.RemoteDisconnected("Remote end closed connection without response")
+    parts = line.decode("iso-8859-1").rstrip("\r\n").split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+        raise http.client.BadStatusLine(line.decode("iso-8859-1", "replace"))
+    try:
+        status = int(parts[1])
+    except ValueError:
+        raise http.client.BadStatusLine(line.decode("iso-8859-1", "replace")) from None
+    return parts[0], status, parts[2] if len(parts) == 3 else ""
+
+
+async def _read_header_lines(reader: asyncio.StreamReader) -> list[bytes]:
+    header_lines = []
+    while (header_line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        header_lines.append(header_line)
+        if len(header_lines) > _MAX_HEADERS:
+            raise http.client.HTTPException(f"got more than {_MAX_HEADERS} headers")
+    return header_lines
+
+
+async def _read_response_head(
+    reader: asyncio.StreamReader,
+    method: str,
+    timeout_s: float,
+) -> AsyncUpstreamResponse:
+    while True:
+        version, status, reason = await _read_status_line(reader)
+        header_lines = await _read_header_lines(reader)
+        # Interim 1xx responses (100 Continue) precede the real one.
+        if status != 101 and 100 <= status < 200:
+            continue
+        headers = http.client.parse_headers(io.BytesIO(b"".join(header_lines) + b"\r\n"))
+        return AsyncUpstreamResponse(
+            reader,
+            method=method,
+            version=11 if version == "HTTP/1.1" else 10,
+            status=status,
+            reason=reason,
+            headers=headers,
+            timeout_s=timeout_s,
+        )
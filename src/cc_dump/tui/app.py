@@ -63,6 +63,7 @@ import cc_dump.tui.keys_panel
 import cc_dump.tui.debug_settings_panel
 import cc_dump.tui.error_indicator
 import cc_dump.pipeline.har_replayer
+import cc_dump.pipeline.proxy_server
 import cc_dump.io.sessions
 import cc_dump.app.memory_stats
 import cc_dump.pipeline.event_types
@@ -155,14 +156,19 @@ class NewSession(Message):
         super().__init__()
 
 
-class _ProxyEvent(Message, bubble=False):
-    """Thread-safe bridge: drain thread → app message pump."""
+class _ProxyEventBatch(Message, bubble=False):
+    """Thread-safe bridge: drain thread → app message pump, one message per drained batch."""
 
-    def __init__(self, event) -> None:
-        self.event = event
+    def __init__(self, events: list) -> None:
+        self.events = events
         super().__init__()
 
 
+# Drain budget per batch: whatever is queued, up to this many events or this long.
+EVENT_BATCH_MAX_EVENTS = 512
+EVENT_BATCH_BUDGET_S = 0.004
+
+
 class CcDumpApp(App):
     """TUI application for cc-dump."""
 
@@ -189,6 +195,7 @@ class CcDumpApp(App):
         provider_endpoints: cc_dump.providers.ProviderEndpointMap | None = None,
         auto_launch_config: Optional[str] = None,
         auto_launch_extra_args: Optional[list[str]] = None,
+        proxy_servers: tuple = (),
     ):
         super().__init__()
         self._event_queue = event_queue
@@ -197,6 +204,8 @@ class CcDumpApp(App):
         self._provider_states.setdefault(cc_dump.providers.DEFAULT_PROVIDER_KEY, state)
         self._state = self._provider_states[cc_dump.providers.DEFAULT_PROVIDER_KEY]
         self._router = router
+        # Servers exposing stats() (ProxyHTTPServer); shown in the info panel.
+        self._proxy_servers = tuple(proxy_servers)
         self._analytics_store = analytics_store
         self._session_id: str | None = None
         self._host = host
@@ -244,6 +253,8 @@ class CcDumpApp(App):
             "pending_request_headers": {},
             "last_message_time_by_session": {},
         }
+        # Set while a drained batch is handled; see _handle_event_batch.
+        self._deferred_refresh: dict[str, object] | None = None
 
         self._launch_configs_cache: list | None = None
         self._search_state = cc_dump.tui.search.SearchState(self._view_store)
@@ -910,7 +921,7 @@ class CcDumpApp(App):
         unique_modes = set(provider_modes)
         proxy_mode = provider_modes[0] if len(unique_modes) == 1 and provider_modes else "mixed"
 
-        info = {
+        info: dict[str, object] = {
             "proxy_url": proxy_url,
             "proxy_mode": proxy_mode,
             "target": primary_target,
@@ -922,11 +933,22 @@ class CcDumpApp(App):
             "python_version": sys.version.split()[0],
             "textual_version": textual.__version__,
             "pid": os.getpid(),
+            # Empty without proxy servers; the info panel then shows "--".
+            "proxy_connections": cc_dump.pipeline.proxy_server.combined_stats(self._proxy_servers),
         }
         runtime_log = cc_dump.io.logging_setup.get_runtime()
         info["log_file"] = runtime_log.file_path if runtime_log is not None else None
         return info
 
+    def _refresh_server_info(self) -> None:
+        """Periodic info-panel refresh so connection counters stay live while it is shown.
+
+        Costs nothing while the panel is hidden, so it runs with or without proxy servers.
+        """
+        info = self._get_info()
+        if info is not None and info.display:
+            info.update_info(self._build_server_info())
+
     def _log_memory_snapshot(self, phase: str) -> None:
         """Emit a structured memory snapshot to the logs panel when enabled."""
         if not self._memory_snapshot_enabled:
@@ -940,6 +962,19 @@ class CcDumpApp(App):
             "line_cache_entries",
             "line_cache_index_keys",
             "block_cache_entries",
+            "strip_resident_bytes",
+            "strip_budget_bytes",
+            "strip_evictions",
+            "strip_rerenders",
+            "shared_strip_cache_entries",
+            "shared_strip_cache_bytes",
+            "shared_strip_cache_hits",
+            "shared_strip_cache_misses",
+            "shared_strip_cache_hit_rate_pct",
+            "router_queued_events",
+            "router_dropped_events",
+            "router_coalesced_events",
+            "router_max_lag_ms",
             "python_alloc_current_bytes",
             "python_alloc_peak_bytes",
             "python_alloc_tracing",
@@ -996,7 +1031,9 @@ class CcDumpApp(App):
 
         Uses post_message (thread-safe, non-blocking) instead of call_from_thread
         so events flow through the normal message pump and don't interfere with
-        _wait_for_screen settling in pilot tests.
+        _wait_for_screen settling in pilot tests. After the first event, everything
+        already queued (within the batch budget) rides along in the same message,
+        so a burst of deltas costs one pump round trip instead of one per event.
         """
         self._replay_complete.wait()
         while not self._closing:
@@ -1010,19 +1047,51 @@ class CcDumpApp(App):
                 print(f"Event queue error: {e}", file=sys.__stderr__)
                 continue
 
-            self.post_message(_ProxyEvent(event))
+            self.post_message(_ProxyEventBatch(self._drain_batch(event)))
+
+    def _drain_batch(self, first) -> list:
+        batch = [first]
+        deadline = time.monotonic() + EVENT_BATCH_BUDGET_S
+        while len(batch) < EVENT_BATCH_MAX_EVENTS and time.monotonic() < deadline:
+            try:
+                batch.append(self._event_queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def on__proxy_event_batch(self, message: _ProxyEventBatch):
+        self._handle_event_batch(message.events)
 
-    def on__proxy_event(self, message: _ProxyEvent):
-        self._handle_event(message.event)
+    def _handle_event_batch(self, events: list) -> None:
+        """Handle a drained batch in one pass.
+
+        Progress deltas are merged per request first, and stats refreshes
+        requested by any handler are published once, after the last event.
+        """
+        deferred: dict[str, object] = {}
+        self._deferred_refresh = deferred
+        try:
+            for event in cc_dump.tui.event_handlers.coalesce_progress(events):
+                self._handle_event(event)
+        finally:
+            self._deferred_refresh = None
+        self._run_guarded(
+            "refreshing stats after an event batch",
+            lambda: cc_dump.tui.event_handlers.flush_deferred_refresh(deferred, self._app_state),
+        )
 
     def _handle_event(self, event):
+        self._run_guarded("handling event", lambda: self._handle_event_inner(event))
+
+    def _run_guarded(self, what: str, fn: Callable[[], None]) -> None:
+        """Run fn on the event path; a crash is logged, never raised into the message pump."""
         try:
-            self._handle_event_inner(event)
+            fn()
         except Exception as e:
             tb = traceback.format_exc()
-            self._error_log.append(f"CRASH in _handle_event: {e}")
+            self._error_log.append(f"CRASH {what}: {e}")
             self._error_log.append(tb)
-            self._app_log("ERROR", f"Uncaught exception handling event: {e}")
+            self._app_log("ERROR", f"Uncaught exception {what}: {e}")
             for line in tb.split("\n"):
                 if line:
                     self._app_log("ERROR", f"  {line}")
@@ -1057,6 +1126,7 @@ class CcDumpApp(App):
             "view_store": event_view_store,
             "domain_store": domain_store,
             "analytics_store": self._analytics_store,
+            "deferred_refresh": self._deferred_refresh,
         }
 
         # [LAW:dataflow-not-control-flow] Always call handler, use no-op for unknown
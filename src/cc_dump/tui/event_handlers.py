@@ -27,6 +27,8 @@ from cc_dump.pipeline.event_types import (
     ErrorEvent,
     ProxyErrorEvent,
     LogEvent,
+    PipelineEvent,
+    merge_progress_events,
     sse_progress_payload,
 )
 
@@ -147,14 +149,30 @@ def _with_capacity_summary(snapshot: dict[str, object]) -> dict[str, object]:
     }
 
 
+# The timeline view shows only the newest rows; publishing the whole history
+# would make every refresh scale with session length.
+_STATS_TIMELINE_ROWS = 64
+
+
 def _refresh_stats_snapshot(widgets, app_state) -> None:
     """Recompute and publish canonical stats panel snapshot.
 
+    While a batch is handled (widgets["deferred_refresh"] is a dict) the
+    refresh is only noted; flush_deferred_refresh publishes it once.
+
     // [LAW:single-enforcer] This is the sole writer for panel:stats_snapshot.
     """
     view_store = widgets.get("view_store")
     if view_store is None:
         return
+    deferred = widgets.get("deferred_refresh")
+    if deferred is not None:
+        deferred["stats"] = widgets
+        return
+    _publish_stats_snapshot(view_store, widgets, app_state)
+
+
+def _publish_stats_snapshot(view_store, widgets, app_state) -> None:
     analytics_store = widgets.get("analytics_store")
     if analytics_store is None:
         view_store.set("panel:stats_snapshot", {"summary": {}, "timeline": [], "models": []})
@@ -162,7 +180,8 @@ def _refresh_stats_snapshot(widgets, app_state) -> None:
 
     domain_store = widgets.get("domain_store")
     snapshot = analytics_store.get_dashboard_snapshot(
-        current_turn=_focused_current_turn_usage(app_state, domain_store)
+        current_turn=_focused_current_turn_usage(app_state, domain_store),
+        timeline_limit=_STATS_TIMELINE_ROWS,
     )
     view_store.set("panel:stats_snapshot", _with_capacity_summary(snapshot))
 
@@ -181,6 +200,47 @@ def _refresh_stats_snapshot_throttled(widgets, app_state) -> None:
     _refresh_stats_snapshot(widgets, app_state)
 
 
+def flush_deferred_refresh(deferred: dict[str, object], app_state) -> None:
+    """Publish the last stats refresh requested during a batch, if any."""
+    widgets = deferred.pop("stats", None)
+    if isinstance(widgets, dict):
+        _publish_stats_snapshot(widgets["view_store"], widgets, app_state)
+
+
+def _merge_held_progress(out: list[PipelineEvent], index: int, event: ResponseProgressEvent) -> bool:
+    """Fold event into the progress event held at out[index]; False if they cannot merge."""
+    held = out[index]
+    if not isinstance(held, ResponseProgressEvent):
+        return False
+    merged = merge_progress_events(held, event)
+    if merged is None:
+        return False
+    out[index] = merged
+    return True
+
+
+def coalesce_progress(events: list[PipelineEvent]) -> list[PipelineEvent]:
+    """Merge each request's consecutive progress events within a batch.
+
+    A progress event folds into the request's previous progress event unless
+    another event for that request came in between, so every request still
+    sees its events in order; one merged delta appends one stream block.
+    """
+    out: list[PipelineEvent] = []
+    mergeable: dict[str, int] = {}
+    for event in events:
+        request_id = event.request_id
+        if isinstance(event, ResponseProgressEvent):
+            index = mergeable.get(request_id)
+            if index is not None and _merge_held_progress(out, index, event):
+                continue
+            mergeable[request_id] = len(out)
+        else:
+            mergeable.pop(request_id, None)
+        out.append(event)
+    return out
+
+
 def _refresh_post_response(state, widgets, app_state, *, rerender_budget: bool = True) -> None:
     """Refresh derived UI state after a response completion path."""
     conv = widgets["conv"]
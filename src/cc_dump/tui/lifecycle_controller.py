@@ -72,6 +72,7 @@ def _log_proxy_endpoints(app) -> None:
 def _start_workers(app) -> None:
     app.run_worker(app._drain_events, thread=True, exclusive=False)
     app.run_worker(app._start_file_watcher)
+    app.set_interval(1.0, app._refresh_server_info)
 
 
 def _seed_panel_state(app) -> None:
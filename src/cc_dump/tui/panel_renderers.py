@@ -293,6 +293,7 @@ def info_panel_rows(info: dict) -> list[tuple[str, str, str]]:
         if openai_proxy_url:
             rows.append(("OpenAI Proxy", str(openai_proxy_url), f"OPENAI_BASE_URL={openai_proxy_url}"))
 
+    connections = _connections_summary(info.get("proxy_connections"))
     rows.extend(
         [
             ("Session ID", str(info.get("session_id") or "--"), str(info.get("session_id") or "--")),
@@ -302,11 +303,32 @@ def info_panel_rows(info: dict) -> list[tuple[str, str, str]]:
             ("Python", str(info.get("python_version", "--")), str(info.get("python_version", "--"))),
             ("Textual", str(info.get("textual_version", "--")), str(info.get("textual_version", "--"))),
             ("PID", str(info.get("pid", "--")), str(info.get("pid", "--"))),
+            ("Connections", connections, connections),
         ]
     )
     return rows
 
 
+def _connections_summary(stats: object) -> str:
+    """One-line proxy admission summary from proxy server stats (combined)."""
+    if not isinstance(stats, dict) or not stats:
+        return "--"
+    workers = stats.get("workers", 0)
+    pool = (
+        "asyncio event loop" if stats.get("event_loop")
+        else f"{workers} workers" if workers
+        else "thread per connection"
+    )
+    accepted = stats.get("accepted", 0)
+    mean_wait = stats.get("queue_wait_total_ms", 0) / accepted if accepted else 0.0
+    return (
+        f"{stats.get('active', 0)} active (max {stats.get('max_active', 0)}), "
+        f"{stats.get('queued', 0)} queued (max {stats.get('max_queued', 0)}), "
+        f"wait {mean_wait:.1f}/{stats.get('queue_wait_max_ms', 0)} ms mean/max, "
+        f"{stats.get('rejected', 0)} rejected, {stats.get('idle_timeouts', 0)} idle closed; {pool}"
+    )
+
+
 def render_info_panel(info: dict) -> Text:
     """Render the server info panel display.
 
@@ -19,13 +19,13 @@ from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import dataclass, field
 from collections.abc import MutableMapping
-from typing import Callable, cast
+from typing import Callable, Protocol, cast
 
 from rich.text import Text
 from rich.markdown import Markdown
 from rich.console import ConsoleRenderable, Group
 from rich.syntax import Syntax
-from collections import Counter
+from collections import Counter, OrderedDict
 
 from cc_dump.core.analysis import fmt_tokens as _fmt_tokens
 from cc_dump.core.formatting import (
@@ -62,11 +62,14 @@ import cc_dump.core.special_content
 
 import re
 import os
+import hashlib
+import weakref
 from rich.segment import Segment
 from rich.style import Style
 from textual.strip import Strip
 from textual.color import Color
 import cc_dump.core.segmentation
+import cc_dump.tui.strip_codec
 
 # Region kinds that support being collapsed/expanded via ViewOverrides.
 # FUTURE: consider md/other region kinds for collapse behavior
@@ -146,6 +149,8 @@ class RenderRuntime:
         default_factory=lambda: ["cyan", "magenta", "yellow", "blue", "green", "red"]
     )
     filter_indicators: dict[str, tuple[str, str]] = field(default_factory=dict)
+    # Identity of the configured theme for process-wide strip cache keys.
+    theme_key: str = ""
 
 
 def _normalize_color(color: str | None, fallback: str) -> str:
@@ -349,6 +354,7 @@ def _configure_runtime_theme(runtime: RenderRuntime, textual_theme) -> None:
     """Populate all theme-derived runtime fields in one place."""
     tc = build_theme_colors(textual_theme)
     runtime.theme_colors = tc
+    runtime.theme_key = repr(tc)
 
     runtime.role_styles = {
         "user": f"bold {tc.user}",
@@ -3650,6 +3656,180 @@ def _block_cache(ctx: _RenderContext) -> MutableMapping[tuple[object, ...], obje
     return cast(MutableMapping[tuple[object, ...], object] | None, ctx.block_cache)
 
 
+# ─── Process-wide content-addressed strip cache ───────────────────────────────
+
+DEFAULT_SHARED_STRIP_CACHE_MB = 64
+
+# Identity and memo fields: equal payloads with different block_ids render identically.
+_CONTENT_KEY_EXCLUDED_FIELDS = frozenset({"block_id", "children", "_segment_result"})
+
+
+# id(block) -> (weak ref to the block, content key). Keyed by identity, not
+# block_id: block ids restart when the format runtime is reset or
+# formatting_impl is hot-reloaded. The weak ref tells a live block from a
+# dead one whose id() was reused. Rendered (non-streaming) blocks are not
+# mutated, so a key stays valid until clear_shared_strip_cache() starts a
+# new generation.
+_CONTENT_KEY_MEMO_MAX = 65536
+_content_key_memo: OrderedDict[int, tuple[weakref.ref[FormattedBlock], str]] = OrderedDict()
+
+
+def block_content_key(block: FormattedBlock) -> str:
+    """Hash of everything a renderer can read from *block*, block_id excluded.
+
+    O(subtree) on the first call per block object, O(1) afterwards.
+    """
+    memo = _content_key_memo.get(id(block))
+    if memo is not None and memo[0]() is block:
+        return memo[1]
+    key = _hash_block_content(block)
+    _content_key_memo[id(block)] = (weakref.ref(block), key)
+    if len(_content_key_memo) > _CONTENT_KEY_MEMO_MAX:
+        _content_key_memo.popitem(last=False)
+    return key
+
+
+def _hash_block_content(block: FormattedBlock) -> str:
+    digest = hashlib.blake2b(type(block).__name__.encode("ascii"), digest_size=16)
+    for name, value in block.__dict__.items():
+        if name not in _CONTENT_KEY_EXCLUDED_FIELDS:
+            digest.update(f"\0{name}={value!r}".encode("utf-8", "surrogatepass"))
+    for child in getattr(block, "children", None) or ():
+        digest.update(block_content_key(child).encode("ascii"))
+    return digest.hexdigest()
+
+
+def _resolve_shared_strip_cache_bytes() -> int:
+    """Byte ceiling from CC_DUMP_SHARED_STRIP_CACHE_MB; 0 disables the cache."""
+    raw = str(
+        os.environ.get("CC_DUMP_SHARED_STRIP_CACHE_MB", DEFAULT_SHARED_STRIP_CACHE_MB) or ""
+    ).strip()
+    try:
+        return max(0, int(float(raw) * 1024 * 1024))
+    except ValueError:
+        return DEFAULT_SHARED_STRIP_CACHE_MB * 1024 * 1024
+
+
+class SharedStripCache:
+    """LRU of rendered block strips keyed by content, shared by every view and turn.
+
+    The per-view block cache is keyed by block_id, so the same tool definition
+    or system prompt resent in every request — or shown in several tabs — is
+    rendered once per block instance. Keys here are
+    (content hash, renderer key, width, visibility, theme[, region state]),
+    so a hit is exactly what rendering from scratch would produce.
+
+    // [LAW:single-enforcer] Cache writes are unobservable; cached strip lists are never mutated.
+    """
+
+    def __init__(self, max_bytes: int | None = None) -> None:
+        self.entries: OrderedDict[tuple[object, ...], tuple[list[Strip], int]] = OrderedDict()
+        self.max_bytes = _resolve_shared_strip_cache_bytes() if max_bytes is None else max(0, max_bytes)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: tuple[object, ...]) -> list[Strip] | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: tuple[object, ...], strips: list[Strip]) -> None:
+        size = cc_dump.tui.strip_codec.estimate_strip_bytes(strips)
+        if size > self.max_bytes:
+            return
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.nbytes -= previous[1]
+        self.entries[key] = (strips, size)
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.nbytes -= evicted
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.nbytes = 0
+
+    def stats(self) -> dict[str, int]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate_pct": (100 * self.hits // lookups) if lookups else 0,
+        }
+
+
+_shared_strip_cache = SharedStripCache()
+
+
+def shared_strip_cache_stats() -> dict[str, int]:
+    """Counters of the process-wide strip cache for memory snapshots."""
+    return _shared_strip_cache.stats()
+
+
+def clear_shared_strip_cache() -> None:
+    """Drop all shared strips and memoized content keys; hit/miss counters are kept."""
+    _shared_strip_cache.clear()
+    _content_key_memo.clear()
+
+
+def _renderer_key(block_type: str, renderer: Callable) -> tuple[str, str]:
+    return (block_type, getattr(renderer, "__qualname__", repr(renderer)))
+
+
+def _shared_cache_key(
+    block: FormattedBlock,
+    renderer_key: tuple[object, ...],
+    ctx: _RenderContext,
+    vis: VisState,
+    search_hash: str | None,
+) -> tuple[object, ...] | None:
+    """Shared cache key, or None when the output is view-specific.
+
+    Search highlights mark the current match of one view, so they stay in
+    the per-view cache only; streaming turns would only fill it with
+    transient partial blocks.
+    """
+    if search_hash is not None or ctx.is_streaming or _shared_strip_cache.max_bytes == 0:
+        return None
+    return (
+        block_content_key(block),
+        renderer_key,
+        ctx.render_width,
+        vis,
+        _active_runtime().theme_key,
+    )
+
+
+def _lookup_or_render_shared(
+    shared_key: tuple[object, ...] | None,
+    cache: MutableMapping[tuple[object, ...], object] | None,
+    cache_key: tuple[object, ...],
+    render_fn: Callable[[], list[Strip]],
+) -> list[Strip]:
+    """Strips from the shared cache, else render_fn(); fills both caches."""
+    # // [LAW:single-enforcer] One place decides shared-cache hits and fills.
+    strips = _shared_strip_cache.get(shared_key) if shared_key is not None else None
+    if strips is None:
+        strips = render_fn()
+        if shared_key is not None:
+            _shared_strip_cache.put(shared_key, strips)
+    if cache is not None:
+        cache[cache_key] = strips
+    return strips
+
+
 _STRUCTURAL_EMPTY_BLOCK_TYPES = frozenset(
     {
         "NewlineBlock",
@@ -3811,21 +3991,24 @@ def _render_region_block_strips(
     if cache is not None and cache_key in cache:
         cached_block = cache[cache_key]
         return cached_block if isinstance(cached_block, list) else []
+    shared_key = _shared_cache_key(
+        block, (_renderer_key(block_type, region_renderer), region_cache_state), ctx, vis, search_hash
+    )
 
-    block_strips: list[Strip] = []
-    for part_renderable, _region_idx in region_parts:
-        part_segments = ctx.console.render(part_renderable, ctx.render_options)
-        part_lines = list(Segment.split_lines(part_segments))
-        if part_lines:
-            part_strips = [
-                strip.adjust_cell_length(ctx.render_width)
-                for strip in Strip.from_lines(part_lines)
-            ]
-            block_strips.extend(part_strips)
+    def _render() -> list[Strip]:
+        block_strips: list[Strip] = []
+        for part_renderable, _region_idx in region_parts:
+            part_segments = ctx.console.render(part_renderable, ctx.render_options)
+            part_lines = list(Segment.split_lines(part_segments))
+            if part_lines:
+                part_strips = [
+                    strip.adjust_cell_length(ctx.render_width)
+                    for strip in Strip.from_lines(part_lines)
+                ]
+                block_strips.extend(part_strips)
+        return block_strips
 
-    if cache is not None:
-        cache[cache_key] = block_strips
-    return block_strips
+    return _lookup_or_render_shared(shared_key, cache, cache_key, _render)
 
 
 def _resolve_renderable(
@@ -3847,6 +4030,7 @@ def _render_standard_block_strips(
     ctx: _RenderContext,
     vis: VisState,
     search_hash: str | None,
+    renderer_key: tuple[str, str],
 ) -> list[Strip]:
     cache_key = (
         block.block_id,
@@ -3858,17 +4042,16 @@ def _render_standard_block_strips(
     if cache is not None and cache_key in cache:
         cached = cache[cache_key]
         return cached if isinstance(cached, list) else []
+    shared_key = _shared_cache_key(block, renderer_key, ctx, vis, search_hash)
 
-    segments = ctx.console.render(renderable, ctx.render_options)
-    lines = list(Segment.split_lines(segments))
-    block_strips = (
-        [strip.adjust_cell_length(ctx.render_width) for strip in Strip.from_lines(lines)]
-        if lines
-        else []
-    )
-    if cache is not None:
-        cache[cache_key] = block_strips
-    return block_strips
+    def _render() -> list[Strip]:
+        segments = ctx.console.render(renderable, ctx.render_options)
+        lines = list(Segment.split_lines(segments))
+        if not lines:
+            return []
+        return [strip.adjust_cell_length(ctx.render_width) for strip in Strip.from_lines(lines)]
+
+    return _lookup_or_render_shared(shared_key, cache, cache_key, _render)
 
 
 def _compute_expandable(
@@ -4005,7 +4188,14 @@ def _render_block_tree(block: FormattedBlock, ctx: _RenderContext) -> None:
     block_strips = (
         _render_region_block_strips(block, block_type, ctx, vis, search_hash)
         if use_region_rendering
-        else _render_standard_block_strips(block, cast(ConsoleRenderable, renderable), ctx, vis, search_hash)
+        else _render_standard_block_strips(
+            block,
+            cast(ConsoleRenderable, renderable),
+            ctx,
+            vis,
+            search_hash,
+            _renderer_key(block_type, cast(Callable, renderer)),
+        )
     )
 
     is_expandable = _compute_expandable(block_type, vis, children, block_strips)
@@ -4035,27 +4225,34 @@ def _render_block_tree(block: FormattedBlock, ctx: _RenderContext) -> None:
 
 
 def render_streaming_preview(
-    text: str,
+    text: str | None,
     console,
     width: int,
     runtime: RenderRuntime | None = None,
+    state: StreamingPreviewState | None = None,
 ) -> list:
     """Lightweight streaming renderer — Markdown + gutter, nothing else.
 
     Bypasses: visibility resolution, _render_block_tree(), renderer dispatch,
     search highlighting, expandability, truncation, block caching, region handling.
 
-    Used by _refresh_streaming_delta() for O(n) rendering of accumulated text,
-    replacing the O(n^2) full pipeline that re-ran all visibility/dispatch logic.
+    Used by _refresh_streaming_delta() while a response streams. With a
+    StreamingPreviewState, finished Markdown blocks are rendered once per
+    width and only the trailing block is re-rendered, so frame cost is bounded
+    by the size of the last block instead of the whole response. text=None
+    renders what was already fed to the state with append().
     """
-    return render_streaming_preview_with_runtime(text, console, width, runtime=runtime)
+    return render_streaming_preview_with_runtime(
+        text, console, width, runtime=runtime, state=state
+    )
 
 
 def render_streaming_preview_with_runtime(
-    text: str,
+    text: str | None,
     console,
     width: int,
     runtime: RenderRuntime | None,
+    state: StreamingPreviewState | None = None,
 ) -> list:
     """Runtime-aware variant of render_streaming_preview."""
     # // [LAW:one-source-of-truth] Runtime binding is explicit at this boundary.
@@ -4064,29 +4261,193 @@ def render_streaming_preview_with_runtime(
         show_right = width >= MIN_WIDTH_FOR_RIGHT_GUTTER
         total_gutter = GUTTER_WIDTH + (RIGHT_GUTTER_WIDTH if show_right else 0)
         render_width = max(1, width - total_gutter)
-
         tc = get_theme_colors()
-        renderable = Markdown(text, code_theme=tc.code_theme)
 
-        render_options = console.options.update_width(render_width)
-        segments = console.render(renderable, render_options)
-        lines = list(Segment.split_lines(segments))
-        if lines:
-            content_strips = [
-                strip.adjust_cell_length(render_width)
-                for strip in Strip.from_lines(lines)
-            ]
-        else:
-            content_strips = []
+        def _render(chunk: str, *, trim_leading: bool, trim_trailing: bool) -> list:
+            return _add_gutter_to_strips(
+                _render_markdown_chunk(
+                    chunk,
+                    console,
+                    render_width,
+                    tc.code_theme,
+                    trim_leading=trim_leading,
+                    trim_trailing=trim_trailing,
+                ),
+                indicator_name="assistant",
+                is_expandable=False,
+                arrow_char="",
+                width=width,
+                show_right=show_right,
+            )
+
+        if state is None:
+            return _render(text, trim_leading=False, trim_trailing=False)
 
-        return _add_gutter_to_strips(
-            content_strips,
+        # Each finished chunk ends with the separator line Rich would have
+        # emitted between it and the next block.
+        separator = _add_gutter_to_strips(
+            [Strip([]).adjust_cell_length(render_width)],
             indicator_name="assistant",
             is_expandable=False,
             arrow_char="",
             width=width,
             show_right=show_right,
         )
+        return _render_incremental_preview(state, text, (width, tc), _render, separator)
+
+
+class _ChunkRenderer(Protocol):
+    def __call__(self, chunk: str, *, trim_leading: bool, trim_trailing: bool) -> list: ...
+
+
+def _render_incremental_preview(
+    state: StreamingPreviewState,
+    text: str | None,
+    render_key: tuple,
+    render: _ChunkRenderer,
+    separator: list,
+) -> list:
+    """Cached strips of state's finished chunks (rendered once per render_key) plus its tail."""
+    if text is not None:
+        state.advance(text)
+    if state.render_key != render_key:
+        state.render_key = render_key
+        state.chunk_strips = []
+    for i in range(len(state.chunk_strips), len(state.chunk_texts)):
+        state.chunk_strips.append(
+            render(state.chunk_texts[i], trim_leading=i > 0, trim_trailing=True) + separator
+        )
+    tail = render(state.tail, trim_leading=bool(state.boundaries), trim_trailing=False)
+    return [strip for chunk in state.chunk_strips for strip in chunk] + tail
+
+
+def _render_markdown_chunk(
+    text: str,
+    console,
+    render_width: int,
+    code_theme: str,
+    *,
+    trim_leading: bool,
+    trim_trailing: bool,
+) -> list:
+    """Render Markdown to content-width strips, optionally dropping edge separator lines.
+
+    Rich separates top-level Markdown elements with segment-less lines; when a
+    document is rendered chunk by chunk, those edge separators are trimmed and
+    re-inserted once between chunks so the result matches a whole-text render.
+    """
+    renderable = Markdown(text, code_theme=code_theme)
+    render_options = console.options.update_width(render_width)
+    lines = list(Segment.split_lines(console.render(renderable, render_options)))
+    start, end = 0, len(lines)
+    while trim_leading and start < end and not lines[start]:
+        start += 1
+    while trim_trailing and end > start and not lines[end - 1]:
+        end -= 1
+    return [
+        strip.adjust_cell_length(render_width)
+        for strip in Strip.from_lines(lines[start:end])
+    ]
+
+
+_FENCE_OPEN_RE = re.compile(r" {0,3}(`{3,}|~{3,})")
+# Lines that can continue the block before a blank line (loose list items,
+# indented code, lazy blockquotes), so a blank line before them is not a boundary.
+_BLOCK_CONTINUATION_RE = re.compile(r"\s|[-*+](?:\s|$)|\d{1,9}[.)](?:\s|$)|>")
+
+
+@dataclass
+class StreamingPreviewState:
+    """Incremental Markdown preview state for one stream.
+
+    Accumulated text is split at block boundaries: a blank line outside a code
+    fence followed by a complete line that cannot continue the previous block.
+    Chunks before the last boundary are finished — their text is kept apart
+    and their strips are cached per (width, theme). Text after it is the
+    unstable tail, re-rendered per frame.
+
+    Feed it with append(new_text) so each frame costs only the new text and
+    the tail; advance(full_text) accepts the whole text instead.
+
+    // [LAW:single-enforcer] Boundary scanning happens only in append(); it
+    // visits each complete line once.
+    """
+
+    boundaries: list[int] = field(default_factory=list)  # absolute chunk starts
+    chunk_texts: list[str] = field(default_factory=list)  # finished chunks, one per boundary
+    chunk_strips: list[list] = field(default_factory=list)
+    render_key: tuple | None = None
+    tail: str = ""
+    _tail_start: int = 0
+    _scan_pos: int = 0  # offset in tail of the first line not yet scanned
+    _fence: str = ""
+    _after_blank: bool = False
+
+    @property
+    def length(self) -> int:
+        return self._tail_start + len(self.tail)
+
+    def append(self, text: str) -> None:
+        """Add newly streamed text and scan the lines it completes."""
+        if not text:
+            return
+        tail = self.tail + text
+        pos = self._scan_pos
+        cuts: list[int] = []
+        while True:
+            end = tail.find("\n", pos)
+            if end < 0:
+                break
+            if self._scan_line(tail[pos:end]):
+                cuts.append(pos)
+            pos = end + 1
+        prev = 0
+        for cut in cuts:
+            self.chunk_texts.append(tail[prev:cut])
+            self.boundaries.append(self._tail_start + cut)
+            prev = cut
+        self.tail = tail[prev:]
+        self._tail_start += prev
+        self._scan_pos = pos - prev
+
+    def advance(self, text: str) -> None:
+        """Catch up with the whole text; reset if it was not appended to."""
+        if not self._is_prefix_of(text):
+            self.reset()
+        self.append(text[self.length :])
+
+    def reset(self) -> None:
+        self.boundaries = []
+        self.chunk_texts = []
+        self.chunk_strips = []
+        self.tail = ""
+        self._tail_start = 0
+        self._scan_pos = 0
+        self._fence = ""
+        self._after_blank = False
+
+    def _is_prefix_of(self, text: str) -> bool:
+        starts = [0, *self.boundaries]
+        return all(
+            text.startswith(chunk, start) for chunk, start in zip(self.chunk_texts, starts)
+        ) and text.startswith(self.tail, self._tail_start)
+
+    def _scan_line(self, line: str) -> bool:
+        """Track fences and blank lines; True when line starts a new block."""
+        if self._fence:
+            stripped = line.strip()
+            if stripped.startswith(self._fence) and not stripped.strip(self._fence[0]):
+                self._fence = ""
+            return False
+        if not line.strip():
+            self._after_blank = True
+            return False
+        starts_block = self._after_blank and not _BLOCK_CONTINUATION_RE.match(line)
+        self._after_blank = False
+        fence = _FENCE_OPEN_RE.match(line)
+        if fence:
+            self._fence = fence.group(1)
+        return bool(starts_block)
 
 
 def render_block(block: FormattedBlock) -> ConsoleRenderable | None:
@@ -4139,7 +4500,8 @@ def render_turn_to_strips(
         console: Rich Console instance
         width: Render width in cells
         wrap: Enable word wrapping
-        block_cache: Optional LRUCache for caching rendered strips per block
+        block_cache: Optional LRUCache for caching rendered strips per block;
+            misses fall back to the process-wide SharedStripCache keyed by content
         is_streaming: If True, skip truncation (show all content during stream)
         search_ctx: Optional SearchContext for highlighting matches
         turn_index: Turn index for search match correlation
@@ -4187,6 +4549,43 @@ def render_turn_to_strips(
         return ctx.all_strips, ctx.block_strip_map, ctx.flat_blocks
 
 
+def estimate_turn_lines(
+    blocks: list[FormattedBlock],
+    filters: dict,
+    width: int,
+    overrides=None,
+) -> int:
+    """Estimate how many lines render_turn_to_strips() would produce, without rendering.
+
+    Walks the same visibility and truncation policy as _render_block_tree(),
+    counting wrapped lines of each block's raw content. Markdown, regions,
+    tool-run collapsing and renderer chrome are ignored, so the result is
+    approximate; it only has to place unrendered turns in the offset tree
+    until they are actually rendered.
+    """
+    show_right = width >= MIN_WIDTH_FOR_RIGHT_GUTTER
+    total_gutter = GUTTER_WIDTH + (RIGHT_GUTTER_WIDTH if show_right else 0)
+    render_width = max(1, width - total_gutter)
+
+    def _estimate(block: FormattedBlock) -> int:
+        vis = _resolve_visibility(block, filters, overrides)
+        max_lines = TRUNCATION_LIMITS[vis]
+        if max_lines == 0:
+            return 0
+        content = block.content or ""
+        lines = sum(
+            max(1, -(-len(line) // render_width)) for line in content.splitlines()
+        ) or 1
+        if max_lines is not None:
+            lines = min(lines, max_lines)
+        children = getattr(block, "children", None) or []
+        if children and vis.visible and vis.full and vis.expanded:
+            lines += sum(_estimate(child) for child in children)
+        return lines
+
+    return sum(_estimate(block) for block in blocks)
+
+
 def _apply_search_highlights(
     text: Text, search_ctx, turn_index: int, block_index: int, block: object = None
 ) -> None:
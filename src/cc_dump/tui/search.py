@@ -182,6 +182,201 @@ class SearchTextCache:
             self._owners_by_key.pop(key, None)
 
 
+@dataclass(frozen=True)
+class _IndexedTurn:
+    """One turn's contribution to the trigram index.
+
+    source is the searchable_blocks tuple the entry was built from; a turn whose
+    blocks were replaced gets a new tuple, which is how staleness is detected.
+    positions maps text id → indices into source, in search iteration order.
+    """
+
+    source: tuple[tuple[int, object], ...]
+    positions: dict[int, tuple[int, ...]]
+    distinct: frozenset[int]
+
+
+@dataclass(frozen=True)
+class SearchCandidates:
+    """Blocks that can contain a literal query, as narrowed by SearchTrigramIndex."""
+
+    index: SearchTrigramIndex
+    text_ids: frozenset[int]
+
+    def turn_blocks(self, turn: object) -> list[tuple[int, object, str]] | None:
+        """(hier_idx, block, text) for the turn's candidate blocks; None if the turn is unindexed."""
+        return self.index.turn_candidates(turn, self.text_ids)
+
+
+# re.IGNORECASE equates these with ASCII letters, but str.lower() does not map
+# them onto those letters. Folding them keeps the index a superset of regex matches.
+_INDEX_FOLD_FIXES = {0x130: "i", 0x131: "i", 0x17F: "s"}
+# A plain REGEX-mode query without these characters is a literal.
+_REGEX_META_CHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _index_fold(text: str) -> str:
+    if text.isascii():
+        return text.lower()
+    return text.translate(_INDEX_FOLD_FIXES).lower()
+
+
+def _trigrams(folded: str) -> set[str]:
+    return {folded[i:i + 3] for i in range(len(folded) - 2)}
+
+
+class SearchTrigramIndex:
+    """Inverted trigram index over searchable block text.
+
+    Texts are interned, so a message repeated in every request's turn is
+    indexed once; postings map a case-folded trigram to the ids of texts that
+    contain it. Turns are added, refreshed and dropped by sync() as the
+    conversation grows, changes and is pruned, so each search only pays for
+    text it has not seen before.
+
+    Case-folded trigrams make candidates a superset of both case-sensitive and
+    case-insensitive literal matches; the compiled pattern still decides.
+
+    // [LAW:one-source-of-truth] Block text comes from the same extractors as the
+    // scan path, so narrowing never changes which blocks can match.
+    """
+
+    def __init__(self) -> None:
+        self._text_ids: dict[str, int] = {}
+        self._texts: dict[int, str] = {}
+        self._refcounts: dict[int, int] = {}
+        self._postings: dict[str, set[int]] = {}
+        self._turns: dict[int, _IndexedTurn] = {}
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        """Number of distinct indexed texts."""
+        return len(self._texts)
+
+    @property
+    def turn_count(self) -> int:
+        return len(self._turns)
+
+    def clear(self) -> None:
+        self._text_ids.clear()
+        self._texts.clear()
+        self._refcounts.clear()
+        self._postings.clear()
+        self._turns.clear()
+
+    def sync(self, turns: Sequence[object]) -> None:
+        """Bring the index in line with the current non-streaming turns.
+
+        New and replaced turns are (re)indexed; turns no longer present are
+        released. Unchanged turns cost one dict lookup.
+        """
+        previous = self._turns
+        current: dict[int, _IndexedTurn] = {}
+        released: list[_IndexedTurn] = []
+        for td in turns:
+            if td.is_streaming:
+                continue
+            owner = id(td)
+            source = _turn_searchable_blocks(td)
+            entry = previous.get(owner)
+            if entry is None or entry.source is not source:
+                if entry is not None:
+                    released.append(entry)
+                entry = self._index_turn(source)
+            current[owner] = entry
+        released.extend(entry for owner, entry in previous.items() if owner not in current)
+        # Release after indexing so texts shared with surviving turns are not re-extracted.
+        for entry in released:
+            self._release_turn(entry)
+        self._turns = current
+
+    def candidates(self, query: str, modes: SearchMode) -> SearchCandidates | None:
+        """Texts that can contain the query, or None when the index cannot narrow it.
+
+        Only literal ASCII queries of at least three characters narrow:
+        REGEX-mode queries with metacharacters and any non-ASCII query fall
+        back to a full scan, since str.lower() folds some characters by
+        context (final sigma) and the query would not fold like the text.
+        """
+        if len(query) < 3:
+            return None
+        if modes & SearchMode.REGEX and not _REGEX_META_CHARS.isdisjoint(query):
+            return None
+        if not query.isascii():
+            return None
+        postings = []
+        for trigram in _trigrams(_index_fold(query)):
+            posting = self._postings.get(trigram)
+            if not posting:
+                return SearchCandidates(self, frozenset())
+            postings.append(posting)
+        postings.sort(key=len)
+        text_ids = set(postings[0])
+        for posting in postings[1:]:
+            text_ids &= posting
+            if not text_ids:
+                break
+        return SearchCandidates(self, frozenset(text_ids))
+
+    def turn_candidates(
+        self, turn: object, text_ids: frozenset[int]
+    ) -> list[tuple[int, object, str]] | None:
+        entry = self._turns.get(id(turn))
+        if entry is None or entry.source is not _turn_searchable_blocks(turn):
+            return None
+        hits = entry.distinct & text_ids
+        if not hits:
+            return []
+        texts = self._texts
+        order = sorted(
+            (pos, text_id) for text_id in hits for pos in entry.positions[text_id]
+        )
+        source = entry.source
+        return [(*source[pos], texts[text_id]) for pos, text_id in order]
+
+    def _index_turn(self, source: tuple[tuple[int, object], ...]) -> _IndexedTurn:
+        positions: dict[int, list[int]] = {}
+        for pos, (_hier_idx, block) in enumerate(source):
+            text = get_searchable_text_cached(block)
+            if text:
+                positions.setdefault(self._acquire_text(text), []).append(pos)
+        return _IndexedTurn(
+            source=source,
+            positions={text_id: tuple(p) for text_id, p in positions.items()},
+            distinct=frozenset(positions),
+        )
+
+    def _acquire_text(self, text: str) -> int:
+        text_id = self._text_ids.get(text)
+        if text_id is not None:
+            self._refcounts[text_id] += 1
+            return text_id
+        text_id = self._next_id
+        self._next_id += 1
+        self._text_ids[text] = text_id
+        self._texts[text_id] = text
+        self._refcounts[text_id] = 1
+        for trigram in _trigrams(_index_fold(text)):
+            self._postings.setdefault(trigram, set()).add(text_id)
+        return text_id
+
+    def _release_turn(self, entry: _IndexedTurn) -> None:
+        for text_id, positions in entry.positions.items():
+            remaining = self._refcounts[text_id] - len(positions)
+            if remaining > 0:
+                self._refcounts[text_id] = remaining
+                continue
+            del self._refcounts[text_id]
+            text = self._texts.pop(text_id)
+            del self._text_ids[text]
+            for trigram in _trigrams(_index_fold(text)):
+                posting = self._postings.get(trigram)
+                if posting is not None:
+                    posting.discard(text_id)
+                    if not posting:
+                        del self._postings[trigram]
+
+
 class SearchState:
     """Mutable search state managed by the app.
 
@@ -203,6 +398,7 @@ class SearchState:
         self.debounce_timer: object | None = None
         self.saved_scroll_y: float | None = None
         self.text_cache: SearchTextCache = SearchTextCache(max_entries=20_000)
+        self.trigram_index: SearchTrigramIndex = SearchTrigramIndex()
 
     # ── Identity properties (delegated to store) ──
 
@@ -410,10 +606,27 @@ def _match_region_index(
     return None
 
 
+def _turn_search_texts(
+    td: object,
+    text_cache: SearchTextCache | dict[tuple[str, int], str] | None,
+    candidates: SearchCandidates | None,
+) -> Iterable[tuple[int, object, str]]:
+    """(hier_idx, block, text) for the blocks of a turn the pattern must run over."""
+    narrowed = None if candidates is None else candidates.turn_blocks(td)
+    if narrowed is not None:
+        return narrowed
+    owner = id(td)
+    return (
+        (hier_idx, block, get_searchable_text_cached(block, text_cache, owner=owner))
+        for hier_idx, block in _turn_searchable_blocks(td)
+    )
+
+
 def find_all_matches(
     turns: Sequence[object],
     pattern: re.Pattern,
     text_cache: SearchTextCache | dict[tuple[str, int], str] | None = None,
+    candidates: SearchCandidates | None = None,
 ) -> list[SearchMatch]:
     """Find all matches across all turns, ordered most-recent-first.
 
@@ -426,6 +639,10 @@ def find_all_matches(
     hierarchical index as block_index, but store the actual
     child block in the `block` field (for identity lookup).
 
+    With candidates (from SearchTrigramIndex.candidates), the pattern only
+    runs over blocks whose text can contain the query; turns the index has
+    not seen are scanned in full.
+
     // [LAW:dataflow-not-control-flow] searchable list is always built;
     // blocks without children contribute only themselves.
     """
@@ -436,11 +653,7 @@ def find_all_matches(
         td = turns[turn_idx]
         if td.is_streaming:
             continue
-        owner = id(td)
-        searchable = _turn_searchable_blocks(td)
-
-        for hier_idx, block in searchable:
-            text = get_searchable_text_cached(block, text_cache, owner=owner)
+        for hier_idx, block, text in _turn_search_texts(td, text_cache, candidates):
             if not text:
                 continue
 
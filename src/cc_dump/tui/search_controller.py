@@ -392,10 +392,15 @@ def run_search(app) -> None:
         # Legacy fallback for tests/mocks that still provide a plain dict.
         cache.clear()
 
+    # // [LAW:one-source-of-truth] The index follows the same turn snapshot the scan sees.
+    index = state.trigram_index
+    index.sync(turns)
+
     state.matches = cc_dump.tui.search.find_all_matches(
         turns,
         pattern,
         text_cache=cache,
+        candidates=index.candidates(state.query, state.modes),
     )
     if state.current_index >= len(state.matches):
         state.current_index = 0
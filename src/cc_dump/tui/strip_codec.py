@@ -0,0 +1,155 @@
+"""Compact storage for rendered strips: shared text buffer plus run-length style indexes.
+
+A rendered Strip is a list of Rich Segments — a tuple, a str and a Style
+reference per segment — which costs a few hundred bytes per segment.
+EncodedStrips keeps a turn's lines as one concatenated str and flat unsigned
+int arrays: each line's text start and cell length, and per segment its
+character length and an index into a StyleTable shared by the view. Lines are
+decoded back into Strips one at a time, without re-running the render pipeline.
+
+// [LAW:one-source-of-truth] A decoded line equals the Strip that was encoded.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import Iterator
+from typing import overload
+
+from rich.segment import Segment
+from rich.style import Style
+from textual.strip import Strip
+
+# Approximate CPython footprint of a rendered Strip and of each Segment in it
+# (tuple, str header and per-segment Style), measured with tracemalloc.
+_STRIP_OVERHEAD_BYTES = 150
+_SEGMENT_OVERHEAD_BYTES = 250
+
+
+def estimate_strip_bytes(strips) -> int:
+    """Approximate memory held by a list of raw strips. O(segments)."""
+    total = _STRIP_OVERHEAD_BYTES * len(strips)
+    for strip in strips:
+        segments = strip._segments
+        total += _SEGMENT_OVERHEAD_BYTES * len(segments)
+        total += sum(len(segment.text) for segment in segments)
+    return total
+
+
+class StyleTable:
+    """Interns Styles to small integer indexes. Append-only."""
+
+    __slots__ = ("_index", "styles")
+
+    def __init__(self) -> None:
+        self.styles: list[Style | None] = []
+        self._index: dict[Style | None, int] = {}
+
+    def intern(self, style: Style | None) -> int:
+        """Return the index for *style*, adding it on first sight. O(1)."""
+        idx = self._index.get(style)
+        if idx is None:
+            idx = len(self.styles)
+            self.styles.append(style)
+            self._index[style] = idx
+        return idx
+
+    def __len__(self) -> int:
+        return len(self.styles)
+
+
+class EncodedStrips:
+    """Read-only sequence of strips stored compactly; indexing decodes one line.
+
+    ``_line_starts`` and ``_run_starts`` carry a trailing sentinel, so line
+    ``i`` spans ``[_line_starts[i], _line_starts[i + 1])`` of the text and
+    ``[_run_starts[i], _run_starts[i + 1])`` of ``_runs``, which holds
+    ``(char_length, style_index)`` pairs.
+    """
+
+    __slots__ = ("_cell_lengths", "_line_starts", "_run_starts", "_runs", "_table", "_text")
+
+    def __init__(
+        self,
+        table: StyleTable,
+        text: str,
+        line_starts: array,
+        cell_lengths: array,
+        run_starts: array,
+        runs: array,
+    ) -> None:
+        self._table = table
+        self._text = text
+        self._line_starts = line_starts
+        self._cell_lengths = cell_lengths
+        self._run_starts = run_starts
+        self._runs = runs
+
+    @classmethod
+    def encode(cls, strips, table: StyleTable) -> EncodedStrips | None:
+        """Encode *strips* against *table*; None when a segment carries control codes."""
+        parts: list[str] = []
+        line_starts = array("I")
+        cell_lengths = array("I")
+        run_starts = array("I")
+        runs = array("I")
+        pos = 0
+        for strip in strips:
+            line_starts.append(pos)
+            cell_lengths.append(strip.cell_length)
+            run_starts.append(len(runs))
+            for text, style, control in strip._segments:
+                if control:
+                    return None
+                parts.append(text)
+                runs.append(len(text))
+                runs.append(table.intern(style))
+                pos += len(text)
+        line_starts.append(pos)
+        run_starts.append(len(runs))
+        return cls(table, "".join(parts), line_starts, cell_lengths, run_starts, runs)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by this encoding (the shared style table excluded)."""
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self._text)
+            + sys.getsizeof(self._line_starts)
+            + sys.getsizeof(self._cell_lengths)
+            + sys.getsizeof(self._run_starts)
+            + sys.getsizeof(self._runs)
+        )
+
+    def __len__(self) -> int:
+        return len(self._cell_lengths)
+
+    @overload
+    def __getitem__(self, index: int) -> Strip: ...
+    @overload
+    def __getitem__(self, index: slice[int | None, int | None, int | None]) -> list[Strip]: ...
+    def __getitem__(self, index: int | slice[int | None, int | None, int | None]) -> Strip | list[Strip]:
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("EncodedStrips index out of range")
+        return self._decode(index)
+
+    def __iter__(self) -> Iterator[Strip]:
+        for i in range(len(self)):
+            yield self._decode(i)
+
+    def _decode(self, i: int) -> Strip:
+        styles = self._table.styles
+        text = self._text
+        runs = self._runs
+        pos = self._line_starts[i]
+        segments = []
+        for r in range(self._run_starts[i], self._run_starts[i + 1], 2):
+            end = pos + runs[r]
+            segments.append(Segment(text[pos:end], styles[runs[r + 1]]))
+            pos = end
+        return Strip(segments, self._cell_lengths[i])
@@ -6,6 +6,7 @@ instances from the updated class definitions and swap them in.
 
 import datetime
 import logging
+import os
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
@@ -40,6 +41,7 @@ from cc_dump.tui.follow_mode import (
 )
 from cc_dump.io.perf_logging import monitor_complexity
 from cc_dump.tui.prefix_sum_tree import FenwickTree, MaxTracker
+from cc_dump.tui.strip_codec import EncodedStrips, StyleTable, estimate_strip_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +49,7 @@ if TYPE_CHECKING:
     from cc_dump.tui.rendering_impl import RenderRuntime
 
 
-def _compute_widest(strips: list) -> int:
+def _compute_widest(strips: list[Strip] | EncodedStrips) -> int:
     """Compute max cell_length across strips.
 
     O(m) but called once per strip assignment.
@@ -70,19 +72,43 @@ def _next_strip_version() -> int:
     return _strip_version_counter
 
 
+_access_stamp_counter = 0
+
+
+def _next_access_stamp() -> int:
+    """Allocate a monotonically increasing stamp for strip LRU ordering."""
+    global _access_stamp_counter
+    _access_stamp_counter += 1
+    return _access_stamp_counter
+
+
+DEFAULT_STRIP_BUDGET_MB = 256
+
+
+def _resolve_strip_budget_bytes(budget_bytes: int | None) -> int:
+    """Strip memory ceiling in bytes; CC_DUMP_STRIP_BUDGET_MB when not given, 0 = unlimited."""
+    if budget_bytes is None:
+        raw = str(os.environ.get("CC_DUMP_STRIP_BUDGET_MB", DEFAULT_STRIP_BUDGET_MB) or "").strip()
+        try:
+            budget_bytes = int(float(raw) * 1024 * 1024)
+        except ValueError:
+            budget_bytes = DEFAULT_STRIP_BUDGET_MB * 1024 * 1024
+    return max(0, budget_bytes)
+
+
 @dataclass
 class TurnData:
     """Pre-rendered turn data for Line API storage."""
 
     turn_index: int
     blocks: list  # list[FormattedBlock] - hierarchical source of truth
-    strips: list  # list[Strip] - pre-rendered lines
+    strips: list[Strip] | EncodedStrips  # pre-rendered lines; indexing or iterating decodes EncodedStrips
     block_strip_map: dict = field(
         default_factory=dict
     )  # block_index → first strip line
     _flat_blocks: list = field(default_factory=list)  # flattened block list for click resolution
     relevant_filter_keys: set = field(default_factory=set)
-    _last_filter_snapshot: dict = field(default_factory=dict)
+    _last_filter_snapshot: dict | None = field(default_factory=dict)  # None: no strips to compare
     # Streaming fields
     is_streaming: bool = False
     _text_delta_buffer: list = field(
@@ -92,18 +118,31 @@ class TurnData:
     _widest_strip: int = 0  # cached max(s.cell_length for s in strips)
     _stream_last_delta_version: int = -1  # last rendered delta version
     _stream_last_render_width: int = 0  # width used for last preview render
+    _stream_preview_state: object | None = None  # rendering.StreamingPreviewState
     _strip_version: int = 0  # monotonic version for change detection
     _last_render_key: tuple | None = None  # width/search/theme/override revision tuple
     _filter_revision: int = 0  # last filter revision this turn was validated against
+    _pending_render: bool = False  # appended without strips; line_count is an estimate
+    _estimated_lines: int = 0  # offset-tree height while _pending_render; 0 once rendered
+    _evicted: bool = False  # strips dropped by the strip budget; re-rendered on demand
+    _strip_bytes: int = 0  # approximate memory held by strips
+    _last_access: int = 0  # LRU stamp: last render or paint
     searchable_blocks: tuple[tuple[int, object], ...] = field(default_factory=tuple)
 
     def __post_init__(self) -> None:
         self.rebuild_block_derivatives()
 
 
+    @property
+    def rendered_filter_revision(self) -> int:
+        """Filter revision the current strips were rendered under; -1 while unrendered."""
+        return -1 if self._pending_render else self._filter_revision
+
     @property
     def line_count(self) -> int:
-        return len(self.strips)
+        # [LAW:one-source-of-truth] The offset tree reads heights only through here.
+        # A pending turn has no strips and a rendered one no estimate, so one term is 0.
+        return len(self.strips) + self._estimated_lines
 
     def compute_relevant_keys(self):
         """Compute which filter keys affect this turn's blocks.
@@ -179,10 +218,30 @@ class TurnData:
         self.strips = strips
         self.block_strip_map = block_strip_map
         self._flat_blocks = flat_blocks
+        self._pending_render = False
+        self._estimated_lines = 0
+        self._evicted = False
         self._strip_version = _next_strip_version()
         self._widest_strip = _compute_widest(self.strips)
+        self._strip_bytes = estimate_strip_bytes(self.strips)
+        self._last_access = _next_access_stamp()
         return True
 
+    def evict_strips(self) -> None:
+        """Drop rendered strips, keeping the line count the offset tree holds.
+
+        The turn becomes pending again, so the next paint or navigation
+        re-renders it from `blocks`.
+        """
+        self._estimated_lines = len(self.strips)
+        self._pending_render = True
+        self._evicted = True
+        self._last_filter_snapshot = None
+        self.strips = []
+        self.block_strip_map = {}
+        self._flat_blocks = []
+        self._strip_bytes = 0
+
     def strip_offset_for_block(self, block_index: int) -> int | None:
         """Return the first strip line for a given block index, or None if filtered out."""
         return self.block_strip_map.get(block_index)
@@ -203,14 +262,31 @@ class SearchTurnsSnapshot:
     turns: tuple[TurnData, ...]
 
 
+def _selection_lines(turn: TurnData, left: int, right: int) -> list[str]:
+    """Plain text of a turn's lines with the gutters removed."""
+    # Unrendered turns were never on screen; blank lines keep y aligned with the tree.
+    if turn._pending_render:
+        return [""] * turn.line_count
+    lines = []
+    for strip in turn.strips:
+        raw = strip.text
+        content = raw[left:len(raw) - right] if right else raw[left:]
+        lines.append(content.rstrip())
+    return lines
+
+
 class ConversationView(ScrollView):
     """Virtual-rendering conversation display using Line API.
 
     Stores turns as TurnData (blocks + pre-rendered strips).
     render_line(y) maps virtual line y to the correct turn's strip.
-    Only visible lines are rendered per frame.
+    Only visible lines are rendered per frame. Completed turns are appended
+    with an estimated height and rendered when they first come into view.
     """
 
+    # Lines beyond the viewport whose unrendered turns the pending-render flush renders.
+    _PENDING_RENDER_BUFFER_LINES = 200
+
     DEFAULT_CSS = """
     ConversationView {
         color: $foreground;
@@ -228,6 +304,7 @@ class ConversationView(ScrollView):
         view_store=None,
         domain_store=None,
         runtime: "RenderRuntime | None" = None,
+        strip_budget_bytes: int | None = None,
     ):
         super().__init__()
         self._view_store = view_store
@@ -293,6 +370,13 @@ class ConversationView(ScrollView):
         # // [LAW:one-source-of-truth] MaxTracker IS the widest-strip source of truth.
         self._width_tracker = MaxTracker()
         self._deferred_anchor_resolve_scheduled: bool = False
+        self._pending_render_flush_scheduled: bool = False
+        # Rendered strips beyond this many bytes are evicted from off-screen turns.
+        self._strip_budget_bytes: int = _resolve_strip_budget_bytes(strip_budget_bytes)
+        self._strip_evictions: int = 0
+        self._strip_rerenders: int = 0
+        # Styles of compacted off-screen strips, shared by every EncodedStrips of this view.
+        self._style_table = StyleTable()
         # // [LAW:one-source-of-truth] Block ID → block object index for O(1) lookup.
         self._block_index: dict[int, object] = {}
 
@@ -718,7 +802,7 @@ class ConversationView(ScrollView):
             return None
 
     def _should_lazy_refresh_turn(self, turn: TurnData) -> bool:
-        return not turn.is_streaming and turn._filter_revision != self._active_filter_revision
+        return not turn.is_streaming and turn.rendered_filter_revision != self._active_filter_revision
 
     def _line_cache_key(
         self,
@@ -821,6 +905,7 @@ class ConversationView(ScrollView):
         turn, turn_offset = result
         if self._should_lazy_refresh_turn(turn):
             self._lazy_rerender_turn(turn)
+        turn._last_access = _next_access_stamp()
 
         local_y = actual_y - turn_offset
         cache_key = self._line_cache_key(
@@ -939,10 +1024,7 @@ class ConversationView(ScrollView):
         # Build clean text: strip left gutter and right gutter from each line
         lines = []
         for turn in self._turns:
-            for strip in turn.strips:
-                raw = strip.text
-                content = raw[left:len(raw) - right] if right else raw[left:]
-                lines.append(content.rstrip())
+            lines.extend(_selection_lines(turn, left, right))
 
         # Adjust selection x-coordinates to account for removed left gutter
         start = selection.start
@@ -1017,18 +1099,32 @@ class ConversationView(ScrollView):
 
         return (start_idx, end_idx)
 
+    def _ensure_rendered(self, turn: TurnData) -> None:
+        """Render turn now if it is unrendered or stale against the active filters."""
+        # // [LAW:single-enforcer] Same "needs render" decision as render_line.
+        if self._should_lazy_refresh_turn(turn):
+            self._render_turn_now(turn)
+
     def _lazy_rerender_turn(self, turn: TurnData):
-        """Lazily re-render a stale turn when it scrolls into the viewport.
+        """Lazily (re-)render a stale or unrendered turn when it scrolls into the viewport.
 
-        Called from render_line() when a turn with mismatched _filter_revision
-        scrolls into view.  Updates the tree O(log n) immediately — no deferred
-        recalc needed.
+        Called from render_line() when a turn with mismatched _filter_revision,
+        or one still waiting for its first render, scrolls into view.  Updates
+        the tree O(log n) immediately — no deferred recalc needed.
         """
+        self._render_turn_now(turn)
+
+        # Schedule deferred anchor resolve (coalesced across multiple lazy rerenders).
+        self._schedule_deferred_anchor_resolve()
+
+    def _render_turn_now(self, turn: TurnData) -> None:
+        """Render one turn with current view state and sync its geometry. O(log n)."""
         width = self._content_width if self._size_known else self._last_width
         console = self.app.console
         render_key = self._turn_render_key(width)
 
         old_widest = turn._widest_strip
+        self._strip_rerenders += int(turn._evicted)
         filters = dict(self._last_filters)
         turn.re_render(
             filters,
@@ -1047,9 +1143,6 @@ class ConversationView(ScrollView):
         self._width_tracker.replace(old_widest, turn._widest_strip)
         self._update_virtual_size()
 
-        # Schedule deferred anchor resolve (coalesced across multiple lazy rerenders).
-        self._schedule_deferred_anchor_resolve()
-
     def _schedule_deferred_anchor_resolve(self) -> None:
         """Schedule one deferred anchor resolve + refresh after lazy rerenders."""
         if self._deferred_anchor_resolve_scheduled:
@@ -1058,10 +1151,15 @@ class ConversationView(ScrollView):
         self.call_later(self._flush_deferred_anchor_resolve)
 
     def _flush_deferred_anchor_resolve(self) -> None:
-        """Apply deferred anchor restoration after lazy rerenders."""
+        """Apply deferred anchor restoration (or re-pin follow) after lazy rerenders."""
         self._deferred_anchor_resolve_scheduled = False
-        if not self._is_following:
+        if self._is_following:
+            with self._programmatic_scroll():
+                self.scroll_end(animate=False, immediate=False, x_axis=False)
+        else:
             self._resolve_anchor()
+        self._compact_offscreen_turns()
+        self._enforce_strip_budget()
         self.refresh()
 
     # ─── Unified render invalidation ─────────────────────────────────────────
@@ -1289,40 +1387,124 @@ class ConversationView(ScrollView):
         self._render_and_append_turn(blocks, filters)
 
     def _render_and_append_turn(self, blocks: list, filters: dict | None = None) -> None:
-        """Render blocks to TurnData and append as completed turn."""
+        """Append blocks as a completed turn whose strips are rendered on demand.
+
+        The turn enters the offset tree with an estimated height. Rendering
+        happens when it reaches the viewport (render_line, the pending-render
+        flush) or a navigation target needs it (ensure_turn_rendered), so a
+        large replay costs one estimate per turn plus the visible turns.
+        """
         if filters is None:
             filters = self._last_filters
         width = self._content_width if self._size_known else self._last_width
-        console = self.app.console
         self._update_render_revisions(self._last_search_ctx)
-        turn_index = len(self._turns)
-        render_key = self._turn_render_key(width)
-
-        strips, block_strip_map, flat_blocks = cc_dump.tui.rendering.render_turn_to_strips(
-            blocks, filters, console, width, block_cache=self._block_strip_cache,
-            search_ctx=self._last_search_ctx,
-            turn_index=turn_index,
-            overrides=self._view_overrides,
-            runtime=self._render_runtime,
-        )
         td = TurnData(
-            turn_index=turn_index,
+            turn_index=len(self._turns),
             blocks=blocks,
-            strips=strips,
-            block_strip_map=block_strip_map,
-            _flat_blocks=flat_blocks,
+            strips=[],
+            _last_filter_snapshot=None,
+            _pending_render=True,
+            _estimated_lines=cc_dump.tui.rendering.estimate_turn_lines(
+                blocks, filters, width, overrides=self._view_overrides,
+            ),
         )
-        td._strip_version = _next_strip_version()
-        td._last_render_key = render_key
-        td._widest_strip = _compute_widest(strips)
-
-        # Use ALWAYS_VISIBLE default to match filters dict structure
-        td._last_filter_snapshot = {
-            k: filters.get(k, cc_dump.core.formatting.ALWAYS_VISIBLE) for k in td.relevant_filter_keys
-        }
         td._filter_revision = self._active_filter_revision
         self._index_blocks(blocks)
         self._append_completed_turn(td)
+        self._schedule_pending_render_flush()
+
+    def _schedule_pending_render_flush(self) -> None:
+        """Schedule one flush of unrendered turns the viewport now covers."""
+        if self._pending_render_flush_scheduled or not self.is_attached:
+            return
+        self._pending_render_flush_scheduled = True
+        self.call_later(self._flush_pending_renders)
+
+    def _flush_pending_renders(self) -> None:
+        """Render unrendered turns in view, then re-pin follow or the scroll anchor.
+
+        Following views render backwards from the last turn until real heights
+        fill the viewport plus buffer; otherwise the turns in
+        _viewport_turn_range are rendered and the anchor absorbs the offset
+        correction.
+        """
+        self._pending_render_flush_scheduled = False
+        if self._is_following:
+            budget = self.scrollable_content_region.height + self._PENDING_RENDER_BUFFER_LINES
+            covered = 0
+            for td in reversed(self._turns):
+                self._ensure_rendered(td)
+                covered += td.line_count
+                if covered >= budget:
+                    break
+            with self._programmatic_scroll():
+                self.scroll_end(animate=False, immediate=False, x_axis=False)
+        else:
+            vp_start, vp_end = self._viewport_turn_range(self._PENDING_RENDER_BUFFER_LINES)
+            for td in self._turns[vp_start:vp_end]:
+                self._ensure_rendered(td)
+            self._resolve_anchor()
+        self._compact_offscreen_turns()
+        self._enforce_strip_budget()
+        self.refresh()
+
+    def _compact_offscreen_turns(self) -> None:
+        """Re-encode raw strips of turns outside the viewport buffer as EncodedStrips.
+
+        Lines keep rendering through _strip_for_turn_line (decoded one at a
+        time, then held by _line_cache); a later re-render stores raw strips
+        again until the turn next leaves the buffer.
+        """
+        vp_start, vp_end = self._viewport_turn_range(self._PENDING_RENDER_BUFFER_LINES)
+        for td in self._turns:
+            if (
+                td.is_streaming
+                or td._pending_render
+                or isinstance(td.strips, EncodedStrips)
+                or vp_start <= td.turn_index < vp_end
+            ):
+                continue
+            encoded = EncodedStrips.encode(td.strips, self._style_table)
+            if encoded is None:
+                continue
+            td.strips = encoded
+            td._strip_bytes = encoded.nbytes
+
+    def _enforce_strip_budget(self) -> None:
+        """Evict least recently used strips of off-screen turns until under budget.
+
+        Turns within _viewport_turn_range (plus buffer) and streaming previews
+        are never evicted. Evicted turns keep their line count in the offset
+        tree, so scroll geometry does not move.
+        """
+        budget = self._strip_budget_bytes
+        if budget <= 0:
+            return
+        resident = [td for td in self._turns if not td._pending_render and not td.is_streaming]
+        resident_bytes = sum(td._strip_bytes for td in resident)
+        if resident_bytes <= budget:
+            return
+        vp_start, vp_end = self._viewport_turn_range(self._PENDING_RENDER_BUFFER_LINES)
+        resident.sort(key=lambda td: td._last_access)
+        for td in resident:
+            if vp_start <= td.turn_index < vp_end:
+                continue
+            resident_bytes -= td._strip_bytes
+            td.evict_strips()
+            self._strip_evictions += 1
+            if resident_bytes <= budget:
+                break
+
+    def strip_budget_stats(self) -> dict[str, int]:
+        """Strip memory counters for memory snapshots, including the process-wide strip cache."""
+        shared = cc_dump.tui.rendering.shared_strip_cache_stats()
+        return {
+            "strip_resident_bytes": sum(td._strip_bytes for td in self._turns),
+            "strip_budget_bytes": self._strip_budget_bytes,
+            "strip_evictions": self._strip_evictions,
+            "strip_rerenders": self._strip_rerenders,
+            **{f"shared_strip_cache_{name}": value for name, value in shared.items()},
+        }
 
     def add_turn(self, blocks: list, filters: dict | None = None):
         """Add a completed turn from block list.
@@ -1430,7 +1612,9 @@ class ConversationView(ScrollView):
 
         Uses render_streaming_preview() — Markdown + gutter only, bypassing
         the full rendering pipeline (visibility, dispatch, truncation, caching).
-        Finalization re-renders through the full pipeline.
+        td._stream_preview_state is fed only the text appended since the last
+        frame, and caches finished Markdown blocks, so each frame re-renders
+        only the trailing block. Finalization re-renders through the full pipeline.
         """
         width = (
             width
@@ -1445,18 +1629,17 @@ class ConversationView(ScrollView):
         ):
             return False
 
-        delta_text = self._domain_store.get_delta_preview_text(request_id)
-        if not delta_text:
-            td.strips = td.strips[: td._stable_strip_count]
-            td._strip_version = _next_strip_version()
-            td._widest_strip = _compute_widest(td.strips)
-            td._stream_last_delta_version = delta_version
-            td._stream_last_render_width = width
-            return True
-
-        console = self.app.console
-        delta_strips = cc_dump.tui.rendering.render_streaming_preview(
-            delta_text, console, width, runtime=self._render_runtime
+        state = self._feed_stream_preview(request_id, td)
+        delta_strips = (
+            cc_dump.tui.rendering.render_streaming_preview(
+                None,
+                self.app.console,
+                width,
+                runtime=self._render_runtime,
+                state=state,
+            )
+            if state.length
+            else []
         )
 
         td.strips = td.strips[: td._stable_strip_count] + delta_strips
@@ -1466,6 +1649,19 @@ class ConversationView(ScrollView):
         td._stream_last_render_width = width
         return True
 
+    def _feed_stream_preview(
+        self, request_id: str, td: TurnData
+    ) -> cc_dump.tui.rendering.StreamingPreviewState:
+        """td's preview state, fed the delta text appended since its last frame."""
+        state = td._stream_preview_state
+        if state is None:
+            state = td._stream_preview_state = cc_dump.tui.rendering.StreamingPreviewState()
+            seen_version = 0
+        else:
+            seen_version = max(0, td._stream_last_delta_version)
+        state.append(self._domain_store.get_delta_text_since(request_id, seen_version))
+        return state
+
     def _queue_stream_delta(self, request_id: str) -> None:
         """Coalesce streaming delta paints to one invalidate per UI tick."""
         self._pending_stream_delta_request_ids.add(request_id)
@@ -1574,9 +1770,12 @@ class ConversationView(ScrollView):
         )
         td._strip_version = _next_strip_version()
         td._widest_strip = _compute_widest(td.strips)
+        td._strip_bytes = estimate_strip_bytes(td.strips)
+        td._last_access = _next_access_stamp()
         td.is_streaming = False
         td._text_delta_buffer.clear()
         td._stable_strip_count = 0
+        td._stream_preview_state = None
         td._stream_last_delta_version = -1
         td._stream_last_render_width = 0
 
@@ -1857,6 +2056,7 @@ class ConversationView(ScrollView):
             return
         td = self._turns[turn_index]
         old_widest = td._widest_strip
+        self._strip_rerenders += int(td._evicted)
         width = self._content_width if self._size_known else self._last_width
         render_key = self._turn_render_key(width)
         td.re_render(
@@ -1970,6 +2170,7 @@ class ConversationView(ScrollView):
         if turn_index >= len(self._turns):
             return
         td = self._turns[turn_index]
+        self._ensure_rendered(td)
         strip_offset = td.strip_offset_for_block(block_index)
         turn_offset = self._offset_tree.prefix_sum(turn_index)
         if strip_offset is None:
@@ -1986,6 +2187,8 @@ class ConversationView(ScrollView):
         self._dispatch_follow_event(FollowEvent.DEACTIVATE, at_bottom=False)
         with self._programmatic_scroll():
             self.scroll_to(y=centered_y, animate=False)
+        # Turns rendered on arrival correct offsets against this anchor, not the old one.
+        self._scroll_anchor = self._anchor_at_line(centered_y)
 
     def _block_index_at_line(self, turn: TurnData, content_y: int) -> int | None:
         """Find the block index within a turn for a given content line.
@@ -2025,15 +2228,18 @@ class ConversationView(ScrollView):
         Returns ScrollAnchor(turn_index, line_in_turn).
         Returns None if no turns or scroll position invalid.
         """
+        return self._anchor_at_line(int(self.scroll_offset.y))
+
+    def _anchor_at_line(self, line_y: int) -> ScrollAnchor | None:
+        """Anchor for virtual line y; None if no turn holds it."""
         if not self._turns:
             return None
 
-        scroll_y = int(self.scroll_offset.y)
-        turn = self._find_turn_for_line(scroll_y)
+        turn = self._find_turn_for_line(line_y)
         if turn is None:
             return None
 
-        line_in_turn = scroll_y - self._offset_tree.prefix_sum(turn.turn_index)
+        line_in_turn = line_y - self._offset_tree.prefix_sum(turn.turn_index)
         return ScrollAnchor(turn_index=turn.turn_index, line_in_turn=max(0, line_in_turn))
 
     def _scroll_programmatically_to(self, *, y: int) -> None:
@@ -2413,12 +2619,14 @@ def create_conversation_view(
     view_store=None,
     domain_store=None,
     runtime: "RenderRuntime | None" = None,
+    strip_budget_bytes: int | None = None,
 ) -> ConversationView:
     """Create a new ConversationView instance."""
     return ConversationView(
         view_store=view_store,
         domain_store=domain_store,
         runtime=runtime,
+        strip_budget_bytes=strip_budget_bytes,
     )
 
 
@@ -23,6 +23,13 @@ def _init_theme():
     set_theme(BUILTIN_THEMES["textual-dark"])
 
 
+@pytest.fixture(autouse=True)
+def _clear_shared_strip_cache():
+    """Keep strips rendered by one test (possibly with patched renderers) out of the next."""
+    from cc_dump.tui.rendering import clear_shared_strip_cache
+    clear_shared_strip_cache()
+
+
 @pytest.fixture
 def isolated_render_runtime():
     """Provide an isolated, uninitialized render runtime for a test.
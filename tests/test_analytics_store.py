@@ -231,6 +231,7 @@ def test_get_session_stats_with_data():
             request_json="{}",
         ),
     ]
+    store._rebuild_aggregates()
 
     stats = store.get_session_stats()
 
@@ -424,6 +425,8 @@ def setup_test_store() -> AnalyticsStore:
             ],
         )
     )
+    # Turns were seeded directly; derive the running aggregates from them.
+    store._rebuild_aggregates()
 
     return store
 
@@ -544,6 +547,84 @@ def test_get_state_restore_state():
     assert read_inv.result_tokens == 1000
 
 
+def _record_exchange(store: AnalyticsStore, i: int, *, model: str, session: str) -> None:
+    request_id = f"req-{i}"
+    store.on_event(RequestBodyEvent(
+        body={
+            "model": model,
+            "metadata": {"user_id": f"user_abc123_account_aaaa-bbbb_session_{session}"},
+            "messages": [
+                {"role": "user", "content": "read it"},
+                {"role": "assistant", "content": [
+                    {"type": "tool_use", "id": f"tu_{i}", "name": "Read", "input": {"file_path": f"/f{i}.py"}},
+                ]},
+                {"role": "user", "content": [
+                    {"type": "tool_result", "tool_use_id": f"tu_{i}", "content": "x = 1\n" * (i + 1)},
+                ]},
+            ],
+        },
+        request_id=request_id,
+    ))
+    store.on_event(ResponseCompleteEvent(
+        body={
+            "model": model,
+            "usage": {
+                "input_tokens": 100 + i,
+                "output_tokens": 10 * i,
+                "cache_read_input_tokens": 1000 * i,
+                "cache_creation_input_tokens": 5,
+            },
+            "stop_reason": "end_turn",
+        },
+        request_id=request_id,
+    ))
+
+
+def test_running_aggregates_survive_state_round_trip():
+    """Restored stores rebuild the same aggregates the live store maintained incrementally."""
+    store = AnalyticsStore()
+    for i in range(6):
+        _record_exchange(
+            store, i,
+            model="claude-sonnet-4" if i % 2 else "claude-haiku-4",
+            session="1111" if i < 4 else "2222",
+        )
+    restored = AnalyticsStore()
+    restored.restore_state(store.get_state())
+
+    current = {"model": "claude-opus-4", "input_tokens": 7, "output_tokens": 3}
+    assert restored.get_dashboard_snapshot(current) == store.get_dashboard_snapshot(current)
+    assert restored.get_tool_economics() == store.get_tool_economics()
+    assert restored.get_tool_economics(group_by_model=True) == store.get_tool_economics(group_by_model=True)
+    assert restored.get_session_breakdown() == store.get_session_breakdown()
+
+    breakdown = store.get_session_breakdown()
+    assert breakdown["1111"]["turns"] == 4
+    assert breakdown["2222"]["input_tokens"] == 104 + 105
+    # The in-flight turn never leaks into the committed aggregates.
+    assert store.get_dashboard_snapshot()["summary"]["turn_count"] == 6
+
+
+def test_dashboard_snapshot_reads_do_not_rescan_turns(monkeypatch):
+    """Snapshot cost is independent of how many turns were committed."""
+    store = AnalyticsStore()
+    for i in range(50):
+        _record_exchange(store, i, model="claude-sonnet-4", session="1111")
+
+    calls = []
+    real_classify = analytics_store_mod.classify_model
+    monkeypatch.setattr(
+        analytics_store_mod, "classify_model", lambda model: calls.append(model) or real_classify(model)
+    )
+    snapshot = store.get_dashboard_snapshot(timeline_limit=5)
+    store.get_tool_economics()
+
+    assert calls == []
+    assert snapshot["summary"]["turn_count"] == 50
+    assert [row["sequence_num"] for row in snapshot["timeline"]] == [46, 47, 48, 49, 50]
+    assert len(store.get_dashboard_snapshot()["timeline"]) == 50
+
+
 def test_get_state_restore_state_handles_old_format():
     """restore_state gracefully ignores old state dicts with eliminated fields."""
     store = AnalyticsStore()
@@ -1,6 +1,7 @@
 """Tests for DomainStore retention and lifecycle."""
 
 from cc_dump.app.domain_store import DomainStore
+from cc_dump.core.formatting import TextDeltaBlock
 
 
 def test_completed_turn_retention_prunes_oldest_and_notifies():
@@ -14,3 +15,20 @@ def test_completed_turn_retention_prunes_oldest_and_notifies():
 
     assert ds.iter_completed_blocks() == [["t2"], ["t3"]]
     assert pruned == [1]
+
+
+def test_stream_delta_rope_serves_text_since_a_version():
+    ds = DomainStore()
+    ds.begin_stream("req-1")
+    for piece in ("hello ", "big ", "world"):
+        ds.append_stream_block("req-1", TextDeltaBlock(content=piece))
+
+    assert ds.get_delta_version("req-1") == 3
+    assert ds.get_delta_text_since("req-1", 1) == "big world"
+    assert ds.get_delta_text_since("req-1", 3) == ""
+    assert ds.get_delta_preview_text("req-1") == "hello big world"
+
+    restored = DomainStore()
+    restored.restore_state(ds.get_state())
+    assert restored.get_delta_version("req-1") == 3
+    assert restored.get_delta_text_since("req-1", 0) == "hello big world"
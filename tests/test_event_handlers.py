@@ -12,6 +12,7 @@ from cc_dump.pipeline.event_types import (
     ResponseCompleteEvent,
     ResponseDoneEvent,
     ResponseHeadersEvent,
+    ResponseProgressEvent,
     ResponseSSEEvent,
     StopReason,
     TextDeltaEvent,
@@ -67,7 +68,9 @@ class _FakeViewStore:
 class _FakeAnalyticsStore:
     snapshots: list[dict[str, object]] = field(default_factory=list)
 
-    def get_dashboard_snapshot(self, current_turn: dict | None = None) -> dict[str, object]:
+    def get_dashboard_snapshot(
+        self, current_turn: dict | None = None, *, timeline_limit: int | None = None
+    ) -> dict[str, object]:
         snapshot = {
             "summary": {"total_tokens": int((current_turn or {}).get("output_tokens", 0))},
             "timeline": [],
@@ -484,3 +487,39 @@ def test_capacity_total_cache_tracks_env_changes(monkeypatch):
 
     monkeypatch.setenv("CC_DUMP_TOKEN_CAPACITY", "bad-value")
     assert event_handlers._get_capacity_total() == 0
+
+
+def test_coalesce_progress_merges_per_request_without_reordering():
+    events = [
+        ResponseProgressEvent(request_id="a", seq=1, delta_text="he"),
+        ResponseProgressEvent(request_id="b", seq=1, delta_text="x"),
+        ResponseProgressEvent(request_id="a", seq=2, delta_text="llo", output_tokens=3),
+        ResponseDoneEvent(request_id="b", seq=2),
+        ResponseProgressEvent(request_id="b", seq=3, delta_text="y"),
+    ]
+
+    out = event_handlers.coalesce_progress(events)
+
+    assert [(e.request_id, getattr(e, "delta_text", None)) for e in out] == [
+        ("a", "hello"),
+        ("b", "x"),
+        ("b", None),
+        ("b", "y"),
+    ]
+    assert out[0].seq == 2 and out[0].output_tokens == 3
+
+
+def test_deferred_stats_refresh_publishes_once_at_flush():
+    view_store = _FakeViewStore()
+    deferred: dict[str, object] = {}
+    widgets = {**_mk_widgets(_FakeConv(), view_store), "deferred_refresh": deferred}
+    app_state = {"current_turn_usage_by_request": {}}
+
+    event_handlers._refresh_stats_snapshot(widgets, app_state)
+    event_handlers._refresh_stats_snapshot(widgets, app_state)
+    assert "panel:stats_snapshot" not in view_store.values
+
+    event_handlers.flush_deferred_refresh(deferred, app_state)
+    assert "panel:stats_snapshot" in view_store.values
+    assert len(widgets["analytics_store"].snapshots) == 1
+    assert deferred == {}
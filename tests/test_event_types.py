@@ -32,6 +32,7 @@ from cc_dump.pipeline.event_types import (
     LogEvent,
     # Parse boundary
     parse_sse_event,
+    merge_progress_events,
 )
 
 # ─── Value types ─────────────────────────────────────────────────────────────
@@ -276,3 +277,39 @@ class TestParseSSEEvent:
         evt = parse_sse_event("message_delta", raw)
         assert evt.stop_reason == StopReason.NONE
         assert evt.output_tokens == 0
+
+
+# ─── Progress merging ────────────────────────────────────────────────────────
+
+
+class TestMergeProgressEvents:
+    def test_concatenates_text_and_keeps_later_fields(self):
+        first = ResponseProgressEvent(
+            delta_text="Hel", model="claude", input_tokens=10, request_id="r1", seq=1, recv_ns=5,
+        )
+        second = ResponseProgressEvent(
+            delta_text="lo", output_tokens=3, stop_reason="end_turn", request_id="r1", seq=2, recv_ns=9,
+        )
+        merged = merge_progress_events(first, second)
+        assert merged is not None
+        assert merged.delta_text == "Hello"
+        assert merged.model == "claude"
+        assert merged.input_tokens == 10
+        assert merged.output_tokens == 3
+        assert merged.stop_reason == "end_turn"
+        assert (merged.request_id, merged.seq, merged.recv_ns) == ("r1", 2, 9)
+
+    def test_zero_is_a_set_value(self):
+        first = ResponseProgressEvent(output_tokens=7, request_id="r1")
+        second = ResponseProgressEvent(output_tokens=0, request_id="r1")
+        assert merge_progress_events(first, second).output_tokens == 0
+
+    def test_refuses_other_request_or_task_lineage(self):
+        base = ResponseProgressEvent(task_tool_use_id="t1", request_id="r1")
+        assert merge_progress_events(base, ResponseProgressEvent(request_id="r2")) is None
+        assert merge_progress_events(
+            base, ResponseProgressEvent(task_tool_use_id="t2", request_id="r1")
+        ) is None
+        assert merge_progress_events(
+            base, ResponseProgressEvent(task_tool_use_id="t1", request_id="r1")
+        ) is not None
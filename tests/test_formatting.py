@@ -1330,6 +1330,111 @@ class TestToolUseBlockDescription:
         assert tool_uses[0].description == ""
 
 
+# ─── Incremental Formatting Tests ────────────────────────────────────────────
+
+
+def _block_signature(blocks):
+    """Structural view of a block tree, ignoring per-request identity and clock."""
+    import dataclasses
+
+    def _sig(block):
+        values = tuple(
+            (f.name, _block_signature(getattr(block, f.name)) if f.name == "children" else getattr(block, f.name))
+            for f in dataclasses.fields(block)
+            if f.name not in ("block_id", "timestamp", "_segment_result")
+        )
+        return (type(block).__name__, values)
+
+    return [_sig(block) for block in blocks]
+
+
+def _conversation(turns):
+    messages = []
+    for turn in range(turns):
+        tool_id = f"tu_{turn}"
+        messages += [
+            {"role": "user", "content": f"<system-reminder>r{turn}</system-reminder>\nask {turn}"},
+            {"role": "assistant", "content": [
+                {"type": "text", "text": f"**reading** {turn}"},
+                {"type": "tool_use", "id": tool_id, "name": "Read", "input": {"file_path": f"/f{turn}"}},
+            ]},
+            {"role": "user", "content": [{"type": "tool_result", "tool_use_id": tool_id, "content": "ok"}]},
+        ]
+    return {
+        "model": "claude-3-opus",
+        "system": [{"type": "text", "text": "system prompt"}],
+        "tools": [{"name": "Read", "description": "Reads files", "input_schema": {}}],
+        "messages": messages,
+    }
+
+
+class TestIncrementalFormatting:
+    """Tests for the per-message format cache in ProviderRuntimeState."""
+
+    def test_warm_cache_matches_cold_formatting(self):
+        from cc_dump.core.formatting_impl import ProviderRuntimeState
+
+        warm = ProviderRuntimeState()
+        format_request_for_provider("anthropic", _conversation(3), warm)
+        warm_blocks = format_request_for_provider("anthropic", _conversation(4), warm)
+
+        cold = ProviderRuntimeState(request_counter=1)
+        cold_blocks = format_request_for_provider("anthropic", _conversation(4), cold)
+
+        assert _block_signature(warm_blocks) == _block_signature(cold_blocks)
+        assert warm.format_cache.hits > 0
+
+    def test_only_new_tail_messages_are_formatted(self):
+        from cc_dump.core.formatting_impl import ProviderRuntimeState
+
+        state = ProviderRuntimeState()
+        format_request_for_provider("anthropic", _conversation(3), state)
+        misses_before = state.format_cache.misses
+        format_request_for_provider("anthropic", _conversation(4), state)
+        # Tools and system hit; of 12 messages only the 3 new ones miss.
+        assert state.format_cache.misses - misses_before == 3
+
+    def test_cached_blocks_get_fresh_block_ids(self):
+        from cc_dump.core.formatting_impl import ProviderRuntimeState
+
+        state = ProviderRuntimeState()
+        first = format_request_for_provider("anthropic", _conversation(2), state)
+        second = format_request_for_provider("anthropic", _conversation(2), state)
+
+        def _ids(blocks):
+            return {b.block_id for b in _find_blocks(blocks, FormattedBlock)}
+
+        assert _ids(first).isdisjoint(_ids(second))
+        first_text = _find_blocks(_find_blocks(first, MessageBlock), TextContentBlock)[0]
+        second_text = _find_blocks(_find_blocks(second, MessageBlock), TextContentBlock)[0]
+        assert first_text is not second_text
+        assert first_text.content_regions
+        assert first_text.content_regions == second_text.content_regions
+
+    def test_tool_result_in_tail_correlates_with_cached_tool_use(self):
+        from cc_dump.core.formatting_impl import ProviderRuntimeState
+
+        state = ProviderRuntimeState()
+        body = _conversation(1)
+        prefix = dict(body, messages=body["messages"][:2])
+        format_request_for_provider("anthropic", prefix, state)
+        blocks = format_request_for_provider("anthropic", body, state)
+
+        result = _find_blocks(blocks, ToolResultBlock)[0]
+        assert result.tool_name == "Read"
+        assert result.detail == _find_blocks(blocks, ToolUseBlock)[0].detail
+
+    def test_changed_tool_descriptions_invalidate_messages(self):
+        from cc_dump.core.formatting_impl import ProviderRuntimeState
+
+        state = ProviderRuntimeState()
+        format_request_for_provider("anthropic", _conversation(1), state)
+        body = _conversation(1)
+        body["tools"] = [{"name": "Read", "description": "New description", "input_schema": {}}]
+        blocks = format_request_for_provider("anthropic", body, state)
+        assert _find_blocks(blocks, ToolUseBlock)[0].description == "New description"
+
+
 # ─── OpenAI Formatting Tests ─────────────────────────────────────────────────
 
 
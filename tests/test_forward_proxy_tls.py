@@ -1,9 +1,15 @@
 """Unit tests for forward proxy TLS certificate authority."""
 
+import datetime
 import os
 import stat
 
+from cryptography import x509
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from cc_dump.pipeline import forward_proxy_tls
 from cc_dump.pipeline.forward_proxy_tls import (
+    LEAF_KEY_ECDSA,
     ForwardProxyCertificateAuthority,
     _host_cert_stem,
 )
@@ -37,3 +43,53 @@ def test_generated_leaf_files_stay_in_tmp_dir(tmp_path):
     generated = list(ca.artifact_dir.iterdir())
     assert generated
     assert all(path.parent == ca.artifact_dir for path in generated)
+
+
+def test_leaf_cache_survives_restart(tmp_path):
+    ca_dir = tmp_path / "ca"
+    first = ForwardProxyCertificateAuthority(ca_dir=ca_dir)
+    first.ssl_context_for_host("api.example.com")
+    assert first.stats()["generated"] == 1
+
+    second = ForwardProxyCertificateAuthority(ca_dir=ca_dir)
+    second.ssl_context_for_host("api.example.com")
+    second.ssl_context_for_host("api.example.com")
+    assert second.stats() == {"generated": 0, "loaded": 1, "memory_hits": 1}
+
+
+def test_new_ca_discards_old_leaves(tmp_path):
+    ca_dir = tmp_path / "ca"
+    old = ForwardProxyCertificateAuthority(ca_dir=ca_dir)
+    old.ssl_context_for_host("api.example.com")
+    (ca_dir / "ca.key").unlink()
+    (ca_dir / "ca.crt").unlink()
+
+    new = ForwardProxyCertificateAuthority(ca_dir=ca_dir)
+    new.ssl_context_for_host("api.example.com")
+
+    assert new.stats()["generated"] == 1
+    assert not old.artifact_dir.exists()
+
+
+def test_expiring_leaf_is_regenerated(tmp_path, monkeypatch):
+    ca_dir = tmp_path / "ca"
+    ForwardProxyCertificateAuthority(ca_dir=ca_dir).ssl_context_for_host("api.example.com")
+    monkeypatch.setattr(forward_proxy_tls, "_HOST_RENEW_BEFORE", datetime.timedelta(days=400))
+
+    ca = ForwardProxyCertificateAuthority(ca_dir=ca_dir)
+    ca.ssl_context_for_host("api.example.com")
+    assert ca.stats()["generated"] == 1
+
+
+def test_ecdsa_leaf_and_prewarm(tmp_path):
+    ca = ForwardProxyCertificateAuthority(ca_dir=tmp_path / "ca", leaf_key_type=LEAF_KEY_ECDSA)
+    ca.prewarm(["api.example.com", "api.example.com"]).join(10)
+    assert ca.stats()["generated"] == 1
+
+    ca.ssl_context_for_host("api.example.com")
+    assert ca.stats()["memory_hits"] == 1
+    (leaf,) = ca.artifact_dir.glob("*.ecdsa.pem")
+    cert = x509.load_pem_x509_certificate(leaf.read_bytes())
+    assert isinstance(cert.public_key(), ec.EllipticCurvePublicKey)
+    if os.name == "posix":
+        assert stat.S_IMODE(os.stat(leaf).st_mode) & 0o077 == 0
@@ -2,6 +2,9 @@
 
 import json
 import logging
+import threading
+
+import pytest
 
 from cc_dump.pipeline.event_types import (
     RequestHeadersEvent,
@@ -10,10 +13,14 @@ from cc_dump.pipeline.event_types import (
     ResponseCompleteEvent,
 )
 from cc_dump.pipeline.har_recorder import (
+    FSYNC_CLOSE,
+    FSYNC_GROUP,
     HARRecordingSubscriber,
     build_har_request,
     build_har_response,
 )
+import cc_dump.pipeline.har_recorder
+import cc_dump.pipeline.har_replayer
 from cc_dump.pipeline.response_assembler import reconstruct_message_from_events
 
 
@@ -622,7 +629,7 @@ def test_har_subscriber_progressive_saving(tmp_path):
     """Entries are written to disk BEFORE close() is called.
 
     This is the key invariant of progressive saving - entries appear on disk
-    immediately after ResponseCompleteEvent, not buffered until close().
+    as soon as the writer thread commits them, not buffered until close().
     """
     har_path = tmp_path / "test.har"
     subscriber = HARRecordingSubscriber(str(har_path))
@@ -641,6 +648,7 @@ def test_har_subscriber_progressive_saving(tmp_path):
     subscriber.on_event(ResponseCompleteEvent(body=_complete_msg(msg_id="msg_1", text="Response 1")))
 
     # Verify first entry is on disk BEFORE close() - this is progressive saving
+    subscriber.flush()
     assert har_path.exists()
     with open(har_path, "r") as f:
         har = json.load(f)
@@ -666,6 +674,7 @@ def test_har_subscriber_progressive_saving(tmp_path):
     subscriber.on_event(ResponseCompleteEvent(body=_complete_msg(msg_id="msg_2", text="Response 2")))
 
     # Verify second entry is on disk BEFORE close()
+    subscriber.flush()
     with open(har_path, "r") as f:
         har = json.load(f)
     assert len(har["log"]["entries"]) == 2
@@ -676,7 +685,7 @@ def test_har_subscriber_progressive_saving(tmp_path):
         == "Response 2"
     )
 
-    # Finally close - this should be instant (no buffered writes)
+    # Finally close - nothing is left queued, so this only closes the file
     subscriber.close()
 
     # Verify file still valid after close
@@ -728,3 +737,266 @@ def test_har_subscriber_provider_filter(tmp_path):
     subscriber.close()
 
     assert not har_path.exists()
+
+
+# ─── Prefix-Deduplicated Recording Tests ──────────────────────────────────────
+
+
+def _conversation_bodies(turns: int) -> list[dict]:
+    """Request bodies of a growing conversation: each turn resends all prior messages."""
+    messages: list[dict] = []
+    bodies = []
+    for turn in range(turns):
+        messages = messages + [{"role": "user", "content": f"question {turn} " + "x" * 200}]
+        bodies.append({
+            "model": "claude-3-opus-20240229",
+            "system": [{"type": "text", "text": "You are helpful. " * 20}],
+            "tools": [{"name": "Read", "input_schema": {"type": "object"}}],
+            "messages": messages,
+            "stream": True,
+        })
+        messages = messages + [{"role": "assistant", "content": f"answer {turn}"}]
+    return bodies
+
+
+def _record(path, bodies, **kwargs) -> None:
+    subscriber = HARRecordingSubscriber(str(path), **kwargs)
+    for i, body in enumerate(bodies):
+        request_id = f"req-{i}"
+        subscriber.on_event(RequestHeadersEvent(headers={}, request_id=request_id))
+        subscriber.on_event(RequestBodyEvent(body=body, request_id=request_id))
+        subscriber.on_event(ResponseHeadersEvent(status_code=200, headers={}, request_id=request_id))
+        subscriber.on_event(ResponseCompleteEvent(body=_complete_msg(msg_id=f"msg_{i}"), request_id=request_id))
+    subscriber.close()
+
+
+def test_dedup_recording_stores_each_message_once(tmp_path):
+    """Dedup entries reference earlier messages and carry only new blobs."""
+    har_path = tmp_path / "dedup.har"
+    _record(har_path, _conversation_bodies(5), dedup=True)
+
+    with open(har_path) as f:
+        har = json.load(f)
+
+    assert har["log"]["_cc_dump"]["format"] == "prefix-dedup/1"
+    entries = har["log"]["entries"]
+    first, last = entries[0]["_cc_dump"], entries[-1]["_cc_dump"]
+    # First entry introduces system, tool and the opening message.
+    assert len(first["blobs"]) == 3
+    # Later entries add only the previous answer and the new question.
+    assert len(last["blobs"]) == 2
+    assert last["body_refs"]["messages"]["base"] == 3
+    assert last["body_refs"]["messages"]["keep"] == 7
+    assert len(last["body_refs"]["messages"]["tail"]) == 2
+    post_body = json.loads(entries[-1]["request"]["postData"]["text"])
+    assert post_body == {"model": "claude-3-opus-20240229", "stream": False}
+
+
+def test_dedup_recording_is_smaller_than_standard(tmp_path):
+    """Recording size grows linearly instead of quadratically with turns."""
+    bodies = _conversation_bodies(40)
+    standard, dedup = tmp_path / "standard.har", tmp_path / "dedup.har"
+    _record(standard, bodies)
+    _record(dedup, bodies, dedup=True)
+    assert dedup.stat().st_size * 4 < standard.stat().st_size
+
+
+# ─── Recording Catalog Tests ──────────────────────────────────────────────────
+
+
+def test_recorder_keeps_catalog_current(tmp_path, monkeypatch):
+    """Each written entry refreshes the catalog row, so listing never re-reads the file."""
+    import cc_dump.io.recording_catalog
+    import cc_dump.io.sessions
+
+    session = "11111111-2222-3333-4444-555555555555"
+    bodies = _conversation_bodies(3)
+    for body in bodies:
+        body["metadata"] = {"user_id": f"user_abc123_account_aaaa-bbbb_session_{session}"}
+    har_path = tmp_path / "recordings" / "ccdump-anthropic-20260304-101530Z-a1b2c3d4.har"
+    _record(har_path, bodies, dedup=True)
+
+    def _no_scan(path):
+        raise AssertionError(f"re-scanned {path}")
+
+    monkeypatch.setattr(cc_dump.io.recording_catalog, "scan_recording", _no_scan)
+    (rec,) = cc_dump.io.sessions.list_recordings(str(har_path.parent))
+    assert rec["entry_count"] == 3
+    assert rec["session_ids"] == [session]
+    assert rec["models"] == ["claude-3-opus-20240229"]
+    assert rec["total_tokens"] == 45
+    assert rec["started"] <= rec["ended"]
+    assert rec["size_bytes"] == har_path.stat().st_size
+
+
+# ─── Writer Thread Tests ──────────────────────────────────────────────────────
+
+
+def _send_exchange(subscriber, i: int, body: dict | None = None) -> None:
+    request_id = f"req-{i}"
+    subscriber.on_event(RequestHeadersEvent(headers={}, request_id=request_id))
+    subscriber.on_event(RequestBodyEvent(body=body or {"model": "m", "n": i}, request_id=request_id))
+    subscriber.on_event(ResponseHeadersEvent(status_code=200, headers={}, request_id=request_id))
+    subscriber.on_event(ResponseCompleteEvent(body=_complete_msg(msg_id=f"msg_{i}"), request_id=request_id))
+
+
+def _hold_group_commits(subscriber) -> tuple[threading.Event, threading.Event]:
+    """Make the writer wait inside group commits: returns (entered, release) events."""
+    entered, release = threading.Event(), threading.Event()
+    commit = subscriber._commit_group
+
+    def _held(group):
+        entered.set()
+        release.wait(5)
+        commit(group)
+
+    subscriber._commit_group = _held
+    return entered, release
+
+
+def test_entries_queued_while_writing_commit_as_one_group(tmp_path):
+    """on_event never waits for the disk; entries that queue up meanwhile share one write."""
+    har_path = tmp_path / "test.har"
+    subscriber = HARRecordingSubscriber(str(har_path))
+    entered, release = _hold_group_commits(subscriber)
+
+    _send_exchange(subscriber, 0)
+    assert entered.wait(5)
+    for i in range(1, 5):
+        _send_exchange(subscriber, i)
+    assert not har_path.exists()
+    release.set()
+    subscriber.flush()
+
+    stats = subscriber.stats()
+    assert stats["entries_written"] == 5
+    assert stats["groups_written"] == 2
+    assert stats["max_group_entries"] == 4
+    assert stats["queued"] == 0
+    assert stats["lag_max_ms"] >= stats["lag_total_ms"] // 5
+    with open(har_path) as f:
+        entries = json.load(f)["log"]["entries"]
+    assert [e["response"]["content"]["text"] for e in entries] == [
+        json.dumps(_complete_msg(msg_id=f"msg_{i}")) for i in range(5)
+    ]
+    subscriber.close()
+
+
+def test_close_drains_every_queued_entry(tmp_path):
+    har_path = tmp_path / "test.har"
+    subscriber = HARRecordingSubscriber(str(har_path))
+    _entered, release = _hold_group_commits(subscriber)
+    for i in range(3):
+        _send_exchange(subscriber, i)
+    threading.Timer(0.1, release.set).start()
+
+    subscriber.close()
+
+    with open(har_path) as f:
+        assert len(json.load(f)["log"]["entries"]) == 3
+
+
+def test_full_queue_drops_entries_instead_of_blocking(tmp_path, monkeypatch):
+    monkeypatch.setattr(cc_dump.pipeline.har_recorder, "_MAX_QUEUED_ENTRIES", 2)
+    har_path = tmp_path / "test.har"
+    subscriber = HARRecordingSubscriber(str(har_path))
+    entered, release = _hold_group_commits(subscriber)
+    _send_exchange(subscriber, 0)
+    assert entered.wait(5)
+    for i in range(1, 5):
+        _send_exchange(subscriber, i)
+    release.set()
+
+    subscriber.close()
+
+    assert subscriber.stats()["entries_dropped"] == 2
+    with open(har_path) as f:
+        assert len(json.load(f)["log"]["entries"]) == 3
+
+
+@pytest.mark.parametrize(("policy", "expected"), [(FSYNC_GROUP, 2), (FSYNC_CLOSE, 1)])
+def test_fsync_policy(tmp_path, monkeypatch, policy, expected):
+    synced = []
+    monkeypatch.setattr(cc_dump.pipeline.har_recorder.os, "fsync", synced.append)
+    subscriber = HARRecordingSubscriber(str(tmp_path / "test.har"), fsync=policy)
+    _send_exchange(subscriber, 0)
+    subscriber.flush()
+    _send_exchange(subscriber, 1)
+    subscriber.close()
+
+    assert len(synced) == expected
+    assert subscriber.stats()["fsyncs"] == expected
+
+
+def test_unknown_fsync_policy_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        HARRecordingSubscriber(str(tmp_path / "test.har"), fsync="sometimes")
+
+
+class _FailingWrites:
+    """File stand-in whose next write fails once (e.g. disk full)."""
+
+    def __init__(self, file):
+        self._file = file
+        self.fail_next = False
+
+    def write(self, text):
+        if self.fail_next:
+            self.fail_next = False
+            raise OSError("disk full")
+        return self._file.write(text)
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+
+def test_failed_group_write_leaves_valid_file_and_dedup_state(tmp_path):
+    """A failed write is cut off the file and its blobs are not referenced later."""
+    har_path = tmp_path / "dedup.har"
+    subscriber = HARRecordingSubscriber(str(har_path), dedup=True)
+    bodies = _conversation_bodies(3)
+    _send_exchange(subscriber, 0, bodies[0])
+    subscriber.flush()
+
+    subscriber._file = failing = _FailingWrites(subscriber._file)
+    failing.fail_next = True
+    _send_exchange(subscriber, 1, bodies[1])
+    subscriber.flush()
+    _send_exchange(subscriber, 2, bodies[2])
+    subscriber.close()
+
+    assert subscriber.stats()["write_errors"] == 1
+    pairs = cc_dump.pipeline.har_replayer.load_har(str(har_path))
+    assert [pair[1]["messages"] for pair in pairs] == [bodies[0]["messages"], bodies[2]["messages"]]
+
+
+def test_exchange_after_close_is_dropped(tmp_path):
+    har_path = tmp_path / "test.har"
+    subscriber = HARRecordingSubscriber(str(har_path))
+    _send_exchange(subscriber, 0)
+    subscriber.close()
+
+    _send_exchange(subscriber, 1)
+
+    assert subscriber._writer is None
+    stats = subscriber.stats()
+    assert stats["entries_written"] == 1
+    assert stats["queued"] == 0
+    with open(har_path) as f:
+        assert len(json.load(f)["log"]["entries"]) == 1
+
+
+def test_write_to_closed_file_is_rolled_back(tmp_path):
+    """A ValueError from a closed file handle counts as a failed group, not a writer crash."""
+    subscriber = HARRecordingSubscriber(str(tmp_path / "test.har"))
+    _send_exchange(subscriber, 0)
+    subscriber.flush()
+    subscriber._file.close()
+
+    _send_exchange(subscriber, 1)
+    subscriber.flush()
+
+    stats = subscriber.stats()
+    assert stats["write_errors"] == 1
+    assert stats["entries_written"] == 1
+    subscriber.close()
@@ -4,7 +4,8 @@ import json
 import logging
 import pytest
 
-from cc_dump.pipeline.har_replayer import load_har, convert_to_events
+from cc_dump.pipeline.har_recorder import HARRecordingSubscriber
+from cc_dump.pipeline.har_replayer import load_har, convert_to_events, expand_har
 from cc_dump.pipeline.event_types import (
     RequestHeadersEvent,
     RequestBodyEvent,
@@ -656,3 +657,100 @@ def test_convert_to_events_passes_provider():
 
     for event in events:
         assert event.provider == "openai"
+
+
+# ─── Prefix-Deduplicated Recording Tests ─────────────────────────────────────
+
+
+def _interleaved_bodies(turns: int) -> list[dict]:
+    """Main conversation interleaved with a subagent conversation, like Claude Code sessions."""
+    main: list[dict] = []
+    sub: list[dict] = []
+    bodies = []
+    for turn in range(turns):
+        main = main + [{"role": "user", "content": [{"type": "text", "text": f"main {turn}"}]}]
+        bodies.append({"model": "m", "system": "main system", "messages": main, "stream": True})
+        main = main + [{"role": "assistant", "content": [{"type": "text", "text": f"main reply {turn}"}]}]
+        sub = sub + [{"role": "user", "content": f"sub {turn}"}]
+        bodies.append({"model": "m", "messages": sub, "tools": [{"name": "Grep"}], "stream": True})
+        sub = sub + [{"role": "assistant", "content": f"sub reply {turn}"}]
+    return bodies
+
+
+def _record_bodies(path, bodies, *, dedup: bool) -> None:
+    recorder = HARRecordingSubscriber(str(path), dedup=dedup)
+    for i, body in enumerate(bodies):
+        request_id = f"req-{i}"
+        recorder.on_event(RequestHeadersEvent(headers={"x-turn": str(i)}, request_id=request_id))
+        recorder.on_event(RequestBodyEvent(body=body, request_id=request_id))
+        recorder.on_event(ResponseHeadersEvent(status_code=200, headers={}, request_id=request_id))
+        recorder.on_event(ResponseCompleteEvent(
+            body={
+                "id": f"msg_{i}",
+                "type": "message",
+                "role": "assistant",
+                "content": [{"type": "text", "text": "ok"}],
+                "model": "m",
+                "stop_reason": "end_turn",
+                "usage": {"input_tokens": 1, "output_tokens": 1},
+            },
+            request_id=request_id,
+        ))
+    recorder.close()
+
+
+def test_load_har_rebuilds_dedup_bodies(tmp_path):
+    """Dedup recordings load to the same pairs as standard recordings."""
+    bodies = _interleaved_bodies(6)
+    standard, dedup = tmp_path / "standard.har", tmp_path / "dedup.har"
+    _record_bodies(standard, bodies, dedup=False)
+    _record_bodies(dedup, bodies, dedup=True)
+
+    standard_pairs = load_har(str(standard))
+    dedup_pairs = load_har(str(dedup))
+
+    assert [p[1] for p in dedup_pairs] == [p[1] for p in standard_pairs]
+    assert [list(p[1]) for p in dedup_pairs] == [list(p[1]) for p in standard_pairs]
+    assert [p[0] for p in dedup_pairs] == [p[0] for p in standard_pairs]
+
+
+def test_load_har_skips_dedup_entry_with_missing_blob(tmp_path, caplog):
+    """A dangling blob reference skips the entries that need it; others still load."""
+    har_path = tmp_path / "dedup.har"
+    _record_bodies(har_path, _interleaved_bodies(2), dedup=True)
+    with open(har_path) as f:
+        har = json.load(f)
+    har["log"]["entries"][1]["_cc_dump"]["blobs"] = {}
+    with open(har_path, "w") as f:
+        json.dump(har, f)
+
+    with caplog.at_level(logging.WARNING, logger="cc_dump.pipeline.har_replayer"):
+        pairs = load_har(str(har_path))
+
+    # Entries 1 and 3 (the subagent conversation) share the removed blob.
+    assert [p[0]["x-turn"] for p in pairs] == ["0", "2"]
+    assert "missing blob" in caplog.text
+
+
+def test_expand_har_writes_standard_har(tmp_path):
+    """Expanded output is plain HAR that matches a standard recording entry for entry."""
+    bodies = _interleaved_bodies(4)
+    standard, dedup, expanded = (
+        tmp_path / "standard.har",
+        tmp_path / "dedup.har",
+        tmp_path / "out" / "expanded.har",
+    )
+    _record_bodies(standard, bodies, dedup=False)
+    _record_bodies(dedup, bodies, dedup=True)
+
+    assert expand_har(str(dedup), str(expanded)) == len(bodies)
+
+    with open(standard) as f:
+        standard_entries = json.load(f)["log"]["entries"]
+    with open(expanded) as f:
+        expanded_log = json.load(f)["log"]
+    assert "_cc_dump" not in expanded_log
+    for want, got in zip(standard_entries, expanded_log["entries"]):
+        assert got["request"]["postData"]["text"] == want["request"]["postData"]["text"]
+        assert got["request"]["bodySize"] == want["request"]["bodySize"]
+        assert got["_cc_dump"] == {"provider": "anthropic"}
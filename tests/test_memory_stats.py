@@ -20,11 +20,28 @@ def test_capture_snapshot_with_store_and_render_state(monkeypatch):
         _line_cache={"a": 1, "b": 2},
         _cache_keys_by_turn={0: {("k0",), ("k1",)}, 1: {("k2",)}},
         _block_strip_cache={"b0": 1},
+        strip_budget_stats=lambda: {
+            "strip_resident_bytes": 4096,
+            "strip_budget_bytes": 8192,
+            "strip_evictions": 3,
+            "strip_rerenders": 2,
+            "shared_strip_cache_entries": 5,
+            "shared_strip_cache_bytes": 2048,
+            "shared_strip_cache_hits": 9,
+            "shared_strip_cache_misses": 3,
+            "shared_strip_cache_hit_rate_pct": 75,
+        },
     )
 
+    class RouterStub:
+        def stats(self):
+            row = {"queued": 2, "dropped": 1, "coalesced": 4, "max_lag_ms": 30}
+            return {"display": row, "har:anthropic": {**row, "max_lag_ms": 90}}
+
     app = SimpleNamespace(
         _domain_store=DomainStoreStub(),
         _analytics_store=AnalyticsStoreStub(),
+        _router=RouterStub(),
         _get_conv=lambda: conv,
     )
 
@@ -42,6 +59,17 @@ def test_capture_snapshot_with_store_and_render_state(monkeypatch):
     assert snapshot["line_cache_entries"] == 2
     assert snapshot["line_cache_index_keys"] == 3
     assert snapshot["block_cache_entries"] == 1
+    assert snapshot["strip_resident_bytes"] == 4096
+    assert snapshot["strip_budget_bytes"] == 8192
+    assert snapshot["strip_evictions"] == 3
+    assert snapshot["strip_rerenders"] == 2
+    assert snapshot["shared_strip_cache_entries"] == 5
+    assert snapshot["shared_strip_cache_bytes"] == 2048
+    assert snapshot["shared_strip_cache_hit_rate_pct"] == 75
+    assert snapshot["router_queued_events"] == 4
+    assert snapshot["router_dropped_events"] == 2
+    assert snapshot["router_coalesced_events"] == 8
+    assert snapshot["router_max_lag_ms"] == 90
     assert snapshot["python_alloc_current_bytes"] == 1234
     assert snapshot["python_alloc_peak_bytes"] == 5678
     assert snapshot["python_alloc_tracing"] == 1
@@ -65,6 +93,10 @@ def test_capture_snapshot_without_optional_state(monkeypatch):
     assert snapshot["line_cache_entries"] == 0
     assert snapshot["line_cache_index_keys"] == 0
     assert snapshot["block_cache_entries"] == 0
+    assert snapshot["strip_evictions"] == 0
+    assert snapshot["strip_rerenders"] == 0
+    assert snapshot["shared_strip_cache_hits"] == 0
+    assert snapshot["router_queued_events"] == 0
     assert snapshot["python_alloc_current_bytes"] == 0
     assert snapshot["python_alloc_peak_bytes"] == 0
     assert snapshot["python_alloc_tracing"] == 0
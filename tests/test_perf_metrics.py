@@ -200,6 +200,43 @@ class TestBenchmarkSmoke:
             f"p95 queue delay {queue_delay['p95_us']:.1f}us exceeds {budget_us}us budget"
         )
 
+    def test_response_assembler_benchmark_shape(self):
+        from benchmarks.bench_response_assembler import run_benchmark
+        results = run_benchmark(n_deltas=200)
+        assert results["n_deltas"] == 200
+        for name, stats in results["variants"].items():
+            assert stats["has_result"], f"{name} produced no result"
+            assert stats["wall_time_ms"] > 0
+            assert "mem_peak_kb" in stats
+
+    def test_request_formatting_benchmark_shape(self):
+        from benchmarks.bench_request_formatting import run_benchmark
+        results = run_benchmark([2, 5], repeats=1)
+        assert [row["turns"] for row in results["results"]] == [2, 5]
+        for row in results["results"]:
+            assert row["cold_ms"] > 0
+            assert row["warm_ms"] > 0
+
+    def test_search_benchmark_shape(self):
+        from benchmarks.bench_search import run_benchmark
+        results = run_benchmark([20], repeats=1)
+        (row,) = results["results"]
+        assert row["turns"] == 20
+        by_query = {q["query"]: q for q in row["queries"]}
+        assert by_query["Off-By-One"]["matches"] == 20
+        assert by_query["no such text anywhere"]["matches"] == 0
+
+    @pytest.mark.parametrize("shape", ["anthropic", "openai"])
+    def test_proxy_throughput_benchmark_shape(self, shape):
+        from benchmarks.bench_proxy_throughput import run_benchmark
+        results = run_benchmark(shape=shape, clients=2, requests_per_client=1, tokens=5, body_kb=1)
+        for label in ("direct", "proxied"):
+            assert results[label]["requests"] == 2
+            assert results[label]["errors"] == 0
+            assert results[label]["chunk_gap_p99_ms"] >= 0
+        assert "ttfb_p50_ms" in results["added"]
+        assert results["pipeline_events"] > 0
+
     def test_event_generation(self):
         """Verify synthetic event stream structure."""
         from benchmarks.bench_streaming import generate_sse_stream
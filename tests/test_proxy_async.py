@@ -0,0 +1,184 @@
+"""Tests specific to the asyncio proxy engine: upstream framing, reuse, backpressure, idle clients.
+
+Behaviour shared with the threaded engine is covered in test_proxy_handler.py.
+"""
+
+import http.server
+import json
+import queue
+import socket
+import threading
+import time
+
+import pytest
+
+from cc_dump.pipeline.event_types import ResponseCompleteEvent, ResponseProgressEvent
+from cc_dump.pipeline.proxy import _build_synthetic_sse_bytes, make_handler_class
+from cc_dump.pipeline.proxy_async import AsyncProxyServer
+
+_BIG_STREAM_BYTES = 32 * 1024 * 1024
+
+
+class _Upstream(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    written = 0
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path.endswith("?chunked"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for line in _build_synthetic_sse_bytes("hello there", "m").split(b"\n\n"):
+                if line:
+                    part = line + b"\n\n"
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(part), part))
+            self.wfile.write(b"0\r\n\r\n")
+        elif self.path == "/big":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Content-Length", str(_BIG_STREAM_BYTES))
+            self.end_headers()
+            frame = b"data: " + b"x" * 1017 + b"\n\n"
+            try:
+                for _ in range(_BIG_STREAM_BYTES // len(frame)):
+                    self.wfile.write(frame)
+                    type(self).written += len(frame)
+            except OSError:
+                pass
+        else:
+            body = b'{"input_tokens": 7}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            # Drop the keep-alive connection without announcing it.
+            self.close_connection = self.path == "/drop"
+
+
+@pytest.fixture
+def upstream():
+    handler = type("Upstream", (_Upstream,), {"written": 0})
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def proxy(upstream):
+    events: queue.Queue = queue.Queue()
+    handler = make_handler_class("anthropic", f"http://127.0.0.1:{upstream.server_address[1]}", events)
+    server = AsyncProxyServer(("127.0.0.1", 0), handler, idle_timeout_s=0.2)
+    yield server, events
+    server.shutdown()
+    server.server_close()
+
+
+def _request(server, path: str, body: dict) -> bytes:
+    data = json.dumps(body).encode()
+    head = f"POST {path} HTTP/1.1\r\nHost: x\r\nContent-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n"
+    return head.encode() + data
+
+
+def _exchange(server, path: str, body: dict) -> bytes:
+    with socket.create_connection(server.server_address, timeout=10) as sock:
+        sock.sendall(_request(server, path, body))
+        out = b""
+        while chunk := sock.recv(65536):
+            out += chunk
+    return out
+
+
+def _drain(events: queue.Queue) -> list:
+    out = []
+    while True:
+        try:
+            out.append(events.get(timeout=0.2))
+        except queue.Empty:
+            return out
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and not condition():
+        time.sleep(0.01)
+    return condition()
+
+
+def test_chunked_upstream_stream_is_relayed_and_parsed(proxy):
+    server, events = proxy
+    response = _exchange(server, "/v1/messages?chunked", {"model": "m", "stream": True, "messages": []})
+
+    head, _, body = response.partition(b"\r\n\r\n")
+    assert b"Transfer-Encoding" not in head
+    assert body.endswith(b"data: [DONE]\n\n")
+    emitted = _drain(events)
+    assert "".join(e.delta_text for e in emitted if isinstance(e, ResponseProgressEvent)) == "hello there"
+    (complete,) = [e for e in emitted if isinstance(e, ResponseCompleteEvent)]
+    assert complete.body["content"][0]["text"] == "hello there"
+
+
+def test_silently_closed_pooled_connection_is_retried(proxy):
+    server, _events = proxy
+    for _ in range(3):
+        response = _exchange(server, "/drop", {})
+        assert response.endswith(b'{"input_tokens": 7}')
+    stats = server.upstream_pool.stats()
+    assert stats["connections_opened"] >= 2
+
+
+def test_slow_client_pauses_upstream_reads(proxy, upstream):
+    server, _events = proxy
+    sock = socket.create_connection(server.server_address, timeout=10)
+    try:
+        sock.sendall(_request(server, "/big", {}))
+        sock.recv(1)  # response started
+        handler = upstream.RequestHandlerClass
+        # The client reads nothing more: once socket buffers fill, upstream stalls.
+        time.sleep(1.0)
+        stalled_at = handler.written
+        time.sleep(0.5)
+        assert handler.written == stalled_at
+        assert stalled_at < _BIG_STREAM_BYTES
+    finally:
+        sock.close()
+
+
+def test_idle_client_is_closed_and_counted(proxy):
+    server, _events = proxy
+    with socket.create_connection(server.server_address, timeout=5) as idle:
+        assert _wait_for(lambda: server.stats()["idle_timeouts"] == 1)
+        assert idle.recv(1) == b""
+    assert _wait_for(lambda: server.stats()["active"] == 0)
+    assert server.stats()["event_loop"] == 1
+
+
+def test_many_concurrent_streams_share_one_loop(proxy):
+    server, events = proxy
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                _exchange(server, "/v1/messages?chunked", {"model": "m", "stream": True, "messages": []})
+            )
+        )
+        for _ in range(50)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert len(results) == 50
+    assert all(r.endswith(b"data: [DONE]\n\n") for r in results)
+    complete = [e for e in _drain(events) if isinstance(e, ResponseCompleteEvent)]
+    assert len(complete) == 50
+    assert server.stats()["accepted"] == 50
@@ -0,0 +1,648 @@
+"""End-to-end tests for ProxyHandler against a local upstream server.
+
+Server-level tests run against both proxy engines (threaded http.server and asyncio).
+"""
+
+import http.server
+import io
+import json
+import queue
+import socket
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import ClassVar
+
+import pytest
+
+import cc_dump.pipeline.proxy
+from cc_dump.pipeline.event_types import (
+    ErrorEvent,
+    RequestBodyEvent,
+    ResponseCompleteEvent,
+    ResponseDoneEvent,
+    ResponseHeadersEvent,
+    ResponseProgressEvent,
+)
+from cc_dump.pipeline.forward_proxy_tls import ForwardProxyCertificateAuthority
+from cc_dump.pipeline.proxy import (
+    ClientSink,
+    ProxyHandler,
+    RequestPipeline,
+    StreamSink,
+    _build_synthetic_sse_bytes,
+    _fan_out_sse,
+    _iter_sse_frames,
+    make_handler_class,
+)
+from cc_dump.pipeline.proxy_async import AsyncProxyServer
+from cc_dump.pipeline.sentinel import make_interceptor
+from cc_dump.pipeline.upstream_pool import UpstreamConnectionPool
+
+_LARGE_JSON_TEXT = "x" * (1024 * 1024)
+
+
+class _Upstream(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    bodies: ClassVar[list[bytes]] = []
+    release = threading.Event()
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        raw = self.rfile.read(length)
+        type(self).bodies.append(raw)
+        if "fail=1" in self.path:
+            self._send(429, "application/json", b'{"error":"slow down"}')
+        elif self.path.startswith("/v1/messages/count_tokens"):
+            self._send(200, "application/json", b'{"input_tokens": 7}')
+        elif "large=1" in self.path:
+            self._send_in_halves(
+                json.dumps({"type": "message", "content": [{"type": "text", "text": _LARGE_JSON_TEXT}]}).encode()
+            )
+        elif self.path.startswith("/v1/messages") and json.loads(raw).get("stream"):
+            self._send(200, "text/event-stream", _build_synthetic_sse_bytes("hello there", "claude-test"))
+        elif self.path.startswith("/v1/messages"):
+            self._send(200, "application/json", b'{"type":"message","content":[{"type":"text","text":"ok"}]}')
+
+    def _send(self, status: int, content_type: str, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_in_halves(self, body: bytes) -> None:
+        """Send half the body, then the rest once release is set."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body[: len(body) // 2])
+        self.wfile.flush()
+        type(self).release.wait(5)
+        self.wfile.write(body[len(body) // 2:])
+
+
+def _serve(handler_class):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+ENGINES = ("threaded", "asyncio")
+
+
+def _serve_proxy(handler_class, engine):
+    if engine == "asyncio":
+        return AsyncProxyServer(("127.0.0.1", 0), handler_class)
+    return _serve(handler_class)
+
+
+def _run_proxy(request_pipeline=None, engine="threaded", **handler_kwargs):
+    upstream_handler = type("Upstream", (_Upstream,), {"bodies": [], "release": threading.Event()})
+    upstream = _serve(upstream_handler)
+    events: queue.Queue = queue.Queue()
+    pool = UpstreamConnectionPool()
+    handler = make_handler_class(
+        "anthropic",
+        f"http://127.0.0.1:{upstream.server_address[1]}",
+        events,
+        request_pipeline=request_pipeline,
+        upstream_pool=pool,
+        **handler_kwargs,
+    )
+    server = _serve_proxy(handler, engine)
+    # The asyncio engine keeps its own keep-alive pool on its event loop.
+    engine_pool = server.upstream_pool if engine == "asyncio" else pool
+    yield f"http://127.0.0.1:{server.server_address[1]}", events, upstream_handler, engine_pool
+    upstream_handler.release.set()
+    server.shutdown()
+    server.server_close()
+    upstream.shutdown()
+    upstream.server_close()
+    pool.close()
+
+
+@pytest.fixture(params=ENGINES)
+def engine(request):
+    return request.param
+
+
+@pytest.fixture
+def proxy(engine):
+    yield from _run_proxy(engine=engine)
+
+
+@pytest.fixture
+def pipeline():
+    return RequestPipeline(interceptors=[make_interceptor(None)])
+
+
+@pytest.fixture
+def proxy_with_pipeline(pipeline, engine):
+    yield from _run_proxy(pipeline, engine=engine)
+
+
+def _post(base: str, path: str, body: dict | bytes) -> tuple[int, bytes]:
+    req = urllib.request.Request(
+        base + path,
+        data=body if isinstance(body, bytes) else json.dumps(body).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.read()
+
+
+def _drain(events: queue.Queue) -> list:
+    out = []
+    while True:
+        try:
+            out.append(events.get(timeout=0.2))
+        except queue.Empty:
+            return out
+
+
+def test_streaming_response_is_relayed_and_assembled(proxy):
+    base, events, _upstream, _pool = proxy
+    body = {"model": "claude-test", "stream": True, "messages": [{"role": "user", "content": "hi"}]}
+
+    status, data = _post(base, "/v1/messages", body)
+
+    assert status == 200
+    assert data.startswith(b"data: ")
+    assert b'"text": "hello there"' in data
+    assert data.endswith(b"data: [DONE]\n\n")
+    emitted = _drain(events)
+    assert any(isinstance(e, RequestBodyEvent) and e.body == body for e in emitted)
+    deltas = "".join(e.delta_text for e in emitted if isinstance(e, ResponseProgressEvent))
+    assert deltas == "hello there"
+    complete = [e for e in emitted if isinstance(e, ResponseCompleteEvent)]
+    assert complete[0].body["content"][0]["text"] == "hello there"
+    assert any(isinstance(e, ResponseDoneEvent) for e in emitted)
+
+
+def test_non_streaming_response_emits_complete_event(proxy):
+    base, events, _upstream, _pool = proxy
+    status, data = _post(base, "/v1/messages", {"model": "m", "messages": []})
+
+    assert status == 200
+    assert json.loads(data)["content"][0]["text"] == "ok"
+    emitted = _drain(events)
+    assert any(isinstance(e, ResponseHeadersEvent) and e.status_code == 200 for e in emitted)
+    complete = [e for e in emitted if isinstance(e, ResponseCompleteEvent)]
+    assert complete[0].body["content"][0]["text"] == "ok"
+
+
+def test_upstream_error_status_is_forwarded(proxy):
+    base, events, _upstream, _pool = proxy
+    status, data = _post(base, "/v1/messages?fail=1", {"model": "m"})
+
+    assert status == 429
+    assert json.loads(data) == {"error": "slow down"}
+    errors = [e for e in _drain(events) if isinstance(e, ErrorEvent)]
+    assert errors and errors[0].code == 429
+
+
+def test_request_body_reaches_upstream_unchanged(proxy):
+    base, _events, upstream, _pool = proxy
+    body = {"model": "m", "messages": [{"role": "user", "content": "exact"}]}
+    _post(base, "/v1/messages", body)
+    assert json.loads(upstream.bodies[-1]) == body
+
+
+def test_sequential_requests_share_upstream_connection(proxy):
+    base, _events, _upstream, pool = proxy
+    for _ in range(3):
+        _post(base, "/v1/messages/count_tokens", {"model": "m", "messages": []})
+    stats = pool.stats()
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 2
+
+
+def test_original_bytes_are_forwarded_without_reserializing(proxy_with_pipeline):
+    base, events, upstream, _pool = proxy_with_pipeline
+    raw = b'{ "model" : "m",\n  "messages": [{"role": "user", "content": "caf\\u00e9"}] }'
+
+    status, _data = _post(base, "/v1/messages", raw)
+
+    assert status == 200
+    assert upstream.bodies[-1] == raw
+    emitted = _drain(events)
+    kinds = [type(e) for e in emitted if e.request_id]
+    assert kinds.index(RequestBodyEvent) < kinds.index(ResponseHeadersEvent)
+    body_event = next(e for e in emitted if isinstance(e, RequestBodyEvent))
+    assert body_event.body["messages"][0]["content"] == "caf\u00e9"
+
+
+def test_sentinel_still_intercepts_with_forward_first_path(proxy_with_pipeline):
+    base, events, upstream, _pool = proxy_with_pipeline
+    body = {"model": "m", "stream": True, "messages": [{"role": "user", "content": "$$"}]}
+
+    status, data = _post(base, "/v1/messages", body)
+
+    assert status == 200
+    assert b"[cc-dump]" in data
+    assert upstream.bodies == []
+    assert any(isinstance(e, RequestBodyEvent) for e in _drain(events))
+
+
+def test_transforms_reserialize_the_body(proxy_with_pipeline, pipeline):
+    base, _events, upstream, _pool = proxy_with_pipeline
+
+    def add_field(body, url):
+        body["extra"] = True
+        return body, url
+
+    pipeline.transforms.append(add_field)
+    _post(base, "/v1/messages", b'{"model": "m", "messages": []}')
+
+    assert json.loads(upstream.bodies[-1]) == {"model": "m", "messages": [], "extra": True}
+
+
+def test_request_parses_never_queue_behind_each_other():
+    """Concurrent parse jobs run at once while fewer than _MAX_PARSE_THREADS are in flight."""
+    executor = ProxyHandler.request_parser
+    barrier = threading.Barrier(4, timeout=2)
+    futures = [executor.submit(barrier.wait) for _ in range(4)]
+    assert sorted(f.result(timeout=5) for f in futures) == [0, 1, 2, 3]
+
+
+# ─── SSE passthrough framing ─────────────────────────────────────────────────
+
+
+class _ChunkedResponse:
+    """Stands in for HTTPResponse.read1: returns the given chunks in order."""
+
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+
+    def read1(self, _n):
+        return self._chunks.pop(0) if self._chunks else b""
+
+    def read(self):
+        return b"".join(self._chunks)
+
+
+class _Recorder(io.BytesIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append(bytes(data))
+        return super().write(data)
+
+
+def test_frames_end_on_event_boundaries_for_any_split():
+    stream = b"event: a\ndata: {}\n\nevent: b\r\ndata: {}\r\n\r\ndata: [DONE]\n\n"
+    for size in (1, 2, 3, 7, len(stream)):
+        chunks = [stream[i:i + size] for i in range(0, len(stream), size)]
+        frames = list(_iter_sse_frames(chunks))
+        assert b"".join(frames) == stream
+        assert all(frame.endswith((b"\n\n", b"\r\n\r\n")) for frame in frames)
+
+
+def test_trailing_partial_event_is_flushed_at_eof():
+    assert list(_iter_sse_frames([b"data: 1\n\ndata: 2"])) == [b"data: 1\n\n", b"data: 2"]
+
+
+def test_unterminated_stream_is_relayed_linewise_past_the_cap(monkeypatch):
+    monkeypatch.setattr(cc_dump.pipeline.proxy, "_MAX_UNFRAMED_BYTES", 8)
+    assert list(_iter_sse_frames([b"data: 1\ndata: 2\nda", b"ta: 3"])) == [
+        b"data: 1\ndata: 2\n",
+        b"data: 3",
+    ]
+
+
+def test_fan_out_writes_once_per_read_and_parses_every_event():
+    events = b"".join(
+        b'event: content_block_delta\ndata: {"type": "content_block_delta", "n": %d}\n\n' % i
+        for i in range(5)
+    )
+    wfile = _Recorder()
+    client = ClientSink(wfile)
+    seen = []
+
+    class _Events(StreamSink):
+        def on_event(self, event_type, event):
+            seen.append(event["n"])
+
+    # Two reads: the first carries three whole events and part of the fourth.
+    split = events.index(b'"n": 3')
+    counts = _fan_out_sse(_ChunkedResponse([events[:split], events[split:]]), [client, _Events()])
+
+    assert wfile.getvalue() == events
+    assert len(wfile.writes) == 2
+    assert seen == [0, 1, 2, 3, 4]
+    assert counts == {"upstream_reads": 2, "sse_events": 5, "bytes_relayed": len(events)}
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and not condition():
+        time.sleep(0.01)
+    return condition()
+
+
+def test_stream_stats_record_passthrough_and_parse_counts(proxy):
+    base, _events, _upstream, _pool = proxy
+    before = ProxyHandler.stream_stats.stats()
+    _post(base, "/v1/messages", {"model": "m", "stream": True, "messages": []})
+
+    def delta(key):
+        return ProxyHandler.stream_stats.stats()[key] - before[key]
+
+    # The relay and the parser thread record after the client has its bytes.
+    assert _wait_for(lambda: delta("streams") >= 1 and delta("parse_frames") >= 1)
+    assert delta("client_writes") >= 1
+    assert delta("sse_events") >= 6
+
+
+class _SlowSink(StreamSink):
+    def __init__(self):
+        self.release = threading.Event()
+        self.events = []
+
+    def on_event(self, event_type, event):
+        self.release.wait(5)
+        self.events.append(event_type)
+
+
+def test_client_relay_does_not_wait_for_slow_parse_sinks():
+    stream = _build_synthetic_sse_bytes("hello", "m")
+    wfile = _Recorder()
+    slow = _SlowSink()
+    parsed = threading.Event()
+    stats = cc_dump.pipeline.proxy.StreamStats()
+
+    counts = cc_dump.pipeline.proxy._relay_sse_with_parser_thread(
+        _ChunkedResponse([stream]),
+        ClientSink(wfile),
+        [slow],
+        stats=stats,
+        on_parsed=parsed.set,
+    )
+
+    # The client already has every byte while the parser is still blocked.
+    assert wfile.getvalue() == stream
+    assert counts["bytes_relayed"] == len(stream)
+    assert not parsed.is_set()
+    slow.release.set()
+    assert parsed.wait(2)
+    assert slow.events[0] == "message_start"
+    assert stats.stats()["parse_frames"] == 1
+
+
+def test_relay_parses_inline_when_every_parser_thread_is_busy(monkeypatch):
+    monkeypatch.setattr(
+        cc_dump.pipeline.proxy, "_sse_parser_threads", cc_dump.pipeline.proxy._ParserThreads("t", 0)
+    )
+    stream = _build_synthetic_sse_bytes("hello", "m")
+    wfile = _Recorder()
+    sink = _SlowSink()
+    sink.release.set()
+    parsed = threading.Event()
+    stats = cc_dump.pipeline.proxy.StreamStats()
+
+    counts = cc_dump.pipeline.proxy._relay_sse_with_parser_thread(
+        _ChunkedResponse([stream]),
+        ClientSink(wfile),
+        [sink],
+        stats=stats,
+        on_parsed=parsed.set,
+    )
+
+    # Nothing is left for another thread: parsing finished before the relay returned.
+    assert wfile.getvalue() == stream
+    assert parsed.is_set()
+    assert sink.events[0] == "message_start"
+    assert counts["inline_parsed_streams"] == 1
+    assert stats.stats()["parsed_streams"] == 1
+
+
+# ─── Progress coalescing ─────────────────────────────────────────────────────
+
+
+def _text_deltas(*blocks: list[str]) -> list[tuple[str, dict]]:
+    events = [("message_start", {"type": "message_start", "message": {
+        "id": "msg", "type": "message", "role": "assistant", "model": "m", "content": [],
+        "usage": {"input_tokens": 3, "output_tokens": 0},
+    }})]
+    for index, texts in enumerate(blocks):
+        events.append(("content_block_start", {"type": "content_block_start", "index": index,
+                                               "content_block": {"type": "text", "text": ""}}))
+        events.extend(
+            ("content_block_delta", {"type": "content_block_delta", "index": index,
+                                     "delta": {"type": "text_delta", "text": text}})
+            for text in texts
+        )
+        events.append(("content_block_stop", {"type": "content_block_stop", "index": index}))
+    return events
+
+
+def _progress(events: queue.Queue) -> list[ResponseProgressEvent]:
+    return [event for event in _drain(events) if isinstance(event, ResponseProgressEvent)]
+
+
+def test_coalescing_merges_deltas_per_content_block():
+    events: queue.Queue = queue.Queue()
+    sink = cc_dump.pipeline.proxy.EventQueueSink(events, request_id="r", coalesce_window_s=60)
+    for event_type, event in _text_deltas(["a", "b", "c"], ["d", "e"]):
+        sink.on_event(event_type, event)
+    sink.on_done()
+
+    progress = _progress(events)
+    assert [p.delta_text for p in progress] == ["", "abc", "de"]
+    assert progress[0].model == "m"
+    assert [p.seq for p in progress] == [1, 4, 6]
+    assert (sink.emitted, sink.coalesced) == (3, 3)
+
+
+def test_coalescing_flushes_at_the_size_limit():
+    events: queue.Queue = queue.Queue()
+    sink = cc_dump.pipeline.proxy.EventQueueSink(
+        events, request_id="r", coalesce_window_s=60, coalesce_max_chars=4,
+    )
+    for event_type, event in _text_deltas(["ab", "cd", "ef"]):
+        sink.on_event(event_type, event)
+    assert [p.delta_text for p in _progress(events)] == ["", "abcd"]
+    sink.on_done()
+    assert [p.delta_text for p in _progress(events)] == ["ef"]
+
+
+def test_parser_thread_flushes_held_progress_when_upstream_goes_quiet():
+    events: queue.Queue = queue.Queue()
+    sink = cc_dump.pipeline.proxy.EventQueueSink(events, request_id="r", coalesce_window_s=0.02)
+    handoff: queue.Queue = queue.Queue()
+    worker = threading.Thread(
+        target=cc_dump.pipeline.proxy._parse_handoff,
+        args=(handoff, cc_dump.pipeline.proxy._SseFrameParser([sink]),
+              cc_dump.pipeline.proxy.StreamStats(), lambda: None),
+    )
+    worker.start()
+    frame = b"".join(
+        b"data: " + json.dumps(event).encode() + b"\n\n" for _type, event in _text_deltas(["hi", "!"])
+    )
+    handoff.put((frame, time.monotonic_ns()))
+
+    # No further frames and no end of stream: the window alone releases the text.
+    held = [events.get(timeout=2), events.get(timeout=2)]
+    assert [p.delta_text for p in held] == ["", "hi!"]
+    handoff.put(None)
+    worker.join(2)
+
+
+def test_coalesced_stream_assembles_the_same_text(engine):
+    upstream_handler = type("Upstream", (_Upstream,), {"bodies": []})
+    upstream = _serve(upstream_handler)
+    events: queue.Queue = queue.Queue()
+    handler = make_handler_class(
+        "anthropic",
+        f"http://127.0.0.1:{upstream.server_address[1]}",
+        events,
+        progress_coalesce_ms=1000,
+    )
+    server = _serve_proxy(handler, engine)
+    try:
+        status, _data = _post(f"http://127.0.0.1:{server.server_address[1]}", "/v1/messages",
+                              {"model": "m", "stream": True, "messages": []})
+        emitted = _drain(events)
+    finally:
+        server.shutdown()
+        server.server_close()
+        upstream.shutdown()
+        upstream.server_close()
+
+    assert status == 200
+    assert isinstance(emitted[-1], ResponseDoneEvent)
+    text = "".join(e.delta_text for e in emitted if isinstance(e, ResponseProgressEvent))
+    assert text == "hello there"
+    (complete,) = [e for e in emitted if isinstance(e, ResponseCompleteEvent)]
+    assert complete.body["content"][0]["text"] == text
+
+
+# ─── Non-SSE passthrough ─────────────────────────────────────────────────────
+
+
+def test_large_json_body_reaches_client_before_upstream_finishes(proxy):
+    base, events, upstream, _pool = proxy
+    port = int(base.rsplit(":", 1)[1])
+    data = json.dumps({"model": "m", "messages": []}).encode()
+    with socket.create_connection(("127.0.0.1", port), timeout=10) as sock:
+        sock.sendall(
+            b"POST /v1/messages?large=1 HTTP/1.1\r\nHost: x\r\nContent-Type: application/json\r\n"
+            b"Content-Length: %d\r\n\r\n%s" % (len(data), data)
+        )
+        sock.settimeout(2)  # well inside the upstream's hold
+        head = _read_head(sock)
+        # Upstream holds back the second half until released: the first half must already flow.
+        assert head.startswith(b"HTTP/1.0 200")
+        body = head.partition(b"\r\n\r\n")[2]
+        while len(body) < 64 * 1024:
+            body += sock.recv(65536)
+        upstream.release.set()
+        body += _read_all(sock)
+
+    assert json.loads(body)["content"][0]["text"] == _LARGE_JSON_TEXT
+    (complete,) = [e for e in _drain(events) if isinstance(e, ResponseCompleteEvent)]
+    assert complete.body["content"][0]["text"] == _LARGE_JSON_TEXT
+
+
+@pytest.fixture
+def capped_proxy(engine):
+    yield from _run_proxy(engine=engine, response_tee_max_bytes=64 * 1024)
+
+
+def test_body_over_the_tee_cap_is_relayed_but_not_captured(capped_proxy):
+    base, events, upstream, _pool = capped_proxy
+    upstream.release.set()
+    before = ProxyHandler.stream_stats.stats()["body_tee_overflows"]
+
+    status, data = _post(base, "/v1/messages?large=1", {"model": "m", "messages": []})
+
+    assert status == 200
+    assert json.loads(data)["content"][0]["text"] == _LARGE_JSON_TEXT
+    (complete,) = [e for e in _drain(events) if isinstance(e, ResponseCompleteEvent)]
+    assert complete.body == {}
+    assert ProxyHandler.stream_stats.stats()["body_tee_overflows"] - before >= 1
+
+
+def test_capped_tee_keeps_bodies_within_the_cap():
+    tee = cc_dump.pipeline.proxy._CappedTee(4)
+    tee.add(b"ab")
+    tee.add(b"cd")
+    assert tee.getvalue() == b"abcd"
+    tee.add(b"e")
+    assert tee.overflowed and tee.getvalue() is None
+    assert tee.size == 5
+
+
+# ─── CONNECT interception ────────────────────────────────────────────────────
+
+
+def _read_head(sock) -> bytes:
+    data = b""
+    while b"\r\n\r\n" not in data:
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def _read_all(sock) -> bytes:
+    data = b""
+    while chunk := sock.recv(4096):
+        data += chunk
+    return data
+
+
+def test_connect_tunnel_terminates_tls_and_serves_requests(engine, tmp_path):
+    ca = ForwardProxyCertificateAuthority(ca_dir=tmp_path)
+    handler = make_handler_class("copilot", None, queue.Queue(), forward_proxy_ca=ca)
+    server = _serve_proxy(handler, engine)
+    try:
+        sock = socket.create_connection(server.server_address, timeout=10)
+        sock.sendall(b"CONNECT api.githubcopilot.com:443 HTTP/1.1\r\nHost: api.githubcopilot.com:443\r\n\r\n")
+        assert b" 200 Connection Established" in _read_head(sock)
+
+        context = ssl.create_default_context(cafile=str(ca.ca_cert_path))
+        with context.wrap_socket(sock, server_hostname="api.githubcopilot.com") as tls:
+            tls.sendall(b"OPTIONS / HTTP/1.1\r\nHost: api.githubcopilot.com\r\n\r\n")
+            response = _read_all(tls)
+        assert response.split(b"\r\n", 1)[0].endswith(b" 200 OK")
+        assert b"Access-Control-Allow-Origin: *" in response
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.parametrize(
+    "provider,authority,status",
+    [
+        ("copilot", "api.githubcopilot.com:notaport", 400),
+        ("copilot", "example.com:443", 403),
+        ("anthropic", "api.anthropic.com:443", 501),
+    ],
+)
+def test_connect_rejections(engine, tmp_path, provider, authority, status):
+    ca = ForwardProxyCertificateAuthority(ca_dir=tmp_path) if provider == "copilot" else None
+    handler = make_handler_class(provider, None, queue.Queue(), forward_proxy_ca=ca)
+    server = _serve_proxy(handler, engine)
+    try:
+        with socket.create_connection(server.server_address, timeout=10) as sock:
+            sock.sendall(f"CONNECT {authority} HTTP/1.1\r\n\r\n".encode())
+            status_line = _read_all(sock).split(b"\r\n", 1)[0]
+        assert status_line.split()[1] == str(status).encode()
+    finally:
+        server.shutdown()
+        server.server_close()
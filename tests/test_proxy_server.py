@@ -0,0 +1,151 @@
+"""Tests for ProxyHTTPServer admission: worker pool, queueing, rejection, idle timeouts."""
+
+import http.client
+import http.server
+import queue
+import socket
+import threading
+import time
+
+import pytest
+
+from cc_dump.pipeline.proxy import make_handler_class
+from cc_dump.pipeline.proxy_server import ProxyHTTPServer, combined_stats
+
+
+class _Slow(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    release = threading.Event()
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def do_GET(self):
+        if self.path == "/hold":
+            type(self).release.wait(5)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+
+def _serve(handler, **kwargs):
+    server = ProxyHTTPServer(("127.0.0.1", 0), handler, **kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _get(server, path="/", timeout=5.0):
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=timeout)
+    try:
+        conn.request("GET", path)
+        resp = conn.getresponse()
+        return resp.status, resp.read()
+    finally:
+        conn.close()
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and not condition():
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture
+def slow_handler():
+    handler = type("Slow", (_Slow,), {"release": threading.Event()})
+    yield handler
+    handler.release.set()
+
+
+def test_pool_serves_requests_and_counts_them(slow_handler):
+    server = _serve(slow_handler, workers=2)
+    try:
+        assert _get(server) == (200, b"ok")
+        assert _get(server) == (200, b"ok")
+        stats = server.stats()
+        assert stats["workers"] == 2
+        assert stats["accepted"] == 2
+        assert _wait_for(lambda: server.stats()["active"] == 0)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_connections_beyond_the_pool_queue_then_run(slow_handler):
+    server = _serve(slow_handler, workers=1)
+    try:
+        held = threading.Thread(target=_get, args=(server, "/hold"))
+        held.start()
+        assert _wait_for(lambda: server.stats()["active"] == 1)
+
+        results = []
+        waiting = threading.Thread(target=lambda: results.append(_get(server)))
+        waiting.start()
+        assert _wait_for(lambda: server.stats()["queued"] == 1)
+        assert not results
+
+        slow_handler.release.set()
+        waiting.join(5)
+        held.join(5)
+        assert results == [(200, b"ok")]
+        assert server.stats()["max_queued"] == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_full_queue_rejects_with_503(slow_handler):
+    server = _serve(slow_handler, workers=1, max_pending=0)
+    try:
+        held = threading.Thread(target=_get, args=(server, "/hold"))
+        held.start()
+        assert _wait_for(lambda: server.stats()["active"] == 1)
+
+        assert _get(server)[0] == 503
+        assert server.stats()["rejected"] == 1
+    finally:
+        slow_handler.release.set()
+        server.shutdown()
+        server.server_close()
+
+
+def test_idle_client_is_closed_and_frees_its_worker():
+    handler = make_handler_class("anthropic", "http://127.0.0.1:9", queue.Queue())
+    server = _serve(handler, workers=1, idle_timeout_s=0.1)
+    try:
+        idle = socket.create_connection(server.server_address)
+        assert _wait_for(lambda: server.stats()["idle_timeouts"] == 1)
+        assert idle.recv(1) == b""
+        idle.close()
+        assert _wait_for(lambda: server.stats()["active"] == 0)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_thread_per_connection_mode_keeps_counters(slow_handler):
+    server = _serve(slow_handler, workers=0)
+    try:
+        assert _get(server) == (200, b"ok")
+        assert server.stats()["accepted"] == 1
+        assert server.stats()["workers"] == 0
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_combined_stats_sums_counts_and_keeps_maxima():
+    class _Stub:
+        def __init__(self, **stats):
+            self._stats = stats
+
+        def stats(self):
+            return self._stats
+
+    combined = combined_stats([
+        _Stub(accepted=2, max_queued=5, queue_wait_max_ms=7),
+        _Stub(accepted=3, max_queued=1, queue_wait_max_ms=9),
+    ])
+    assert combined == {"accepted": 5, "max_queued": 5, "queue_wait_max_ms": 9}
@@ -714,3 +714,77 @@ def test_openai_assembler_ignores_malformed_chunks_and_choices():
     assert result["id"] == "chatcmpl-malformed"
     assert result["choices"][0]["message"]["content"] == "ok"
     assert result["choices"][0]["finish_reason"] == "stop"
+
+
+# ─── Incremental folding ─────────────────────────────────────────────────────
+
+
+def _text_delta(index, text):
+    return {"type": "content_block_delta", "index": index, "delta": {"type": "text_delta", "text": text}}
+
+
+def _json_delta(index, partial):
+    return {"type": "content_block_delta", "index": index, "delta": {"type": "input_json_delta", "partial_json": partial}}
+
+
+def test_assembler_matches_batch_reconstruction_for_mixed_blocks():
+    """Streaming assembly and batch reconstruction agree across text/tool/text."""
+    events = [
+        {"type": "message_start", "message": {"id": "m", "model": "x", "role": "assistant", "usage": {}}},
+        {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}},
+        *[_text_delta(0, f"t{i} ") for i in range(50)],
+        {"type": "content_block_stop", "index": 0},
+        {"type": "content_block_start", "index": 1, "content_block": {"type": "tool_use", "id": "tu", "name": "Read"}},
+        _json_delta(1, '{"path": '),
+        _json_delta(1, '"a.txt"}'),
+        {"type": "content_block_stop", "index": 1},
+        {"type": "content_block_start", "index": 2, "content_block": {"type": "text", "text": ""}},
+        _text_delta(2, "done"),
+        {"type": "content_block_stop", "index": 2},
+    ]
+    assembler = ResponseAssembler()
+    for event in events:
+        assembler.on_event(event["type"], event)
+    assembler.on_done()
+
+    assert assembler.result == reconstruct_message_from_events(events)
+    content = assembler.result["content"]
+    assert content[0]["text"] == "".join(f"t{i} " for i in range(50))
+    assert content[1]["input"] == {"path": "a.txt"}
+    assert content[2]["text"] == "done"
+
+
+def test_truncated_stream_keeps_partial_text_and_raw_tool_json():
+    """Blocks without content_block_stop are flushed at on_done."""
+    events = [
+        {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}},
+        _text_delta(0, "partial "),
+        _text_delta(0, "text"),
+        {"type": "content_block_stop", "index": 0},
+        {"type": "content_block_start", "index": 1, "content_block": {"type": "tool_use", "id": "tu", "name": "Bash"}},
+        _json_delta(1, '{"command": "l'),
+    ]
+    result = reconstruct_message_from_events(events)
+    assert result["content"][0]["text"] == "partial text"
+    assert result["content"][1]["input"] == {}
+    assert result["content"][1]["_input_json_str"] == '{"command": "l'
+
+    unterminated = reconstruct_message_from_events(events[:3])
+    assert unterminated["content"][0]["text"] == "partial text"
+
+
+def test_openai_assembler_folds_chunks_without_retaining_them():
+    """Tool-call argument fragments are joined once when the result is built."""
+    assembler = OpenAiChatResponseAssembler()
+    fragments = ['{"pa', 'th":', '"a.txt"}']
+    for i, fragment in enumerate(fragments):
+        tool_call = {"index": 0, "function": {"arguments": fragment}}
+        if i == 0:
+            tool_call.update(id="call_1", function={"name": "read", "arguments": fragment})
+        assembler.on_event("data", {"id": "c", "model": "g", "choices": [{"index": 0, "delta": {"tool_calls": [tool_call]}}]})
+    assembler.on_done()
+
+    call = assembler.result["choices"][0]["message"]["tool_calls"][0]
+    assert call["id"] == "call_1"
+    assert call["function"] == {"name": "read", "arguments": '{"path":"a.txt"}'}
+    assert not hasattr(assembler, "_chunks")
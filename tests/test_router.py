@@ -7,10 +7,18 @@ import time
 
 import pytest
 
-from cc_dump.pipeline.router import DirectSubscriber, EventRouter, QueueSubscriber
+from cc_dump.pipeline.router import (
+    OVERFLOW_COALESCE,
+    OVERFLOW_DROP_PROGRESS,
+    DirectSubscriber,
+    EventChannel,
+    EventRouter,
+    QueueSubscriber,
+)
 from cc_dump.pipeline.event_types import (
     PipelineEvent,
     RequestBodyEvent,
+    ResponseProgressEvent,
     ResponseDoneEvent,
     ErrorEvent,
     LogEvent,
@@ -366,3 +374,224 @@ def test_router_graceful_shutdown_with_pending_events(source_queue):
 
     # Should complete without hanging (timeout in stop() prevents hanging)
     assert True
+
+
+# ─── EventChannel Tests ───────────────────────────────────────────────────────
+
+
+def _progress(text, request_id="r1", seq=0):
+    return ResponseProgressEvent(delta_text=text, request_id=request_id, seq=seq)
+
+
+def test_channel_unknown_overflow_policy_rejected():
+    with pytest.raises(ValueError):
+        EventChannel(overflow="spill")
+
+
+def test_channel_get_times_out_with_queue_empty():
+    channel = EventChannel()
+    with pytest.raises(queue.Empty):
+        channel.get(timeout=0.01)
+    with pytest.raises(queue.Empty):
+        channel.get_nowait()
+
+
+def test_channel_drop_progress_when_full():
+    channel = EventChannel(maxsize=2, overflow=OVERFLOW_DROP_PROGRESS)
+    channel.put_many([_progress("a"), _progress("b"), _progress("c"), _progress("d")])
+
+    assert channel.qsize() == 2
+    stats = channel.stats()
+    assert stats["dropped"] == 2
+    assert stats["max_queued"] == 2
+    assert [channel.get_nowait().delta_text for _ in range(2)] == ["a", "b"]
+
+
+def test_channel_coalesces_progress_per_request():
+    channel = EventChannel(maxsize=2, overflow=OVERFLOW_COALESCE)
+    channel.put_many([
+        _progress("He", seq=1),
+        _progress("x", request_id="r2", seq=1),
+        _progress("llo", seq=2),
+    ])
+
+    assert channel.qsize() == 2
+    assert channel.stats()["coalesced"] == 1
+    first = channel.get_nowait()
+    assert (first.request_id, first.delta_text, first.seq) == ("r1", "Hello", 2)
+    assert channel.get_nowait().delta_text == "x"
+
+
+def test_channel_coalesce_never_jumps_other_events_of_the_request():
+    channel = EventChannel(maxsize=3, overflow=OVERFLOW_COALESCE)
+    done = ResponseDoneEvent(request_id="r1")
+    channel.put_many([_progress("a", seq=1), done, _progress("b", seq=2), _progress("c", seq=3)])
+
+    events = [channel.get_nowait() for _ in range(3)]
+    assert events[1] is done
+    assert (events[0].delta_text, events[2].delta_text) == ("a", "bc")
+    assert channel.stats()["coalesced"] == 1
+
+
+def test_channel_coalesce_only_merges_when_full():
+    channel = EventChannel(maxsize=8, overflow=OVERFLOW_COALESCE)
+    channel.put_many([_progress("a", seq=1), _progress("b", seq=2)])
+
+    assert channel.qsize() == 2
+    assert channel.stats()["coalesced"] == 0
+
+
+def test_channel_does_not_coalesce_into_a_delivered_event():
+    channel = EventChannel(overflow=OVERFLOW_COALESCE)
+    channel.put(_progress("a"))
+    assert channel.get_nowait().delta_text == "a"
+    channel.put(_progress("b"))
+    assert channel.get_nowait().delta_text == "b"
+
+
+def test_channel_block_policy_waits_for_consumer():
+    channel = EventChannel(maxsize=1)
+    channel.put(LogEvent(method="GET", path="/", status="1"))
+    producer = threading.Thread(
+        target=channel.put, args=(LogEvent(method="GET", path="/", status="2"),)
+    )
+    producer.start()
+    time.sleep(0.05)
+    assert producer.is_alive()
+    assert channel.qsize() == 1
+
+    assert channel.get(timeout=1).status == "1"
+    producer.join(timeout=1)
+    assert not producer.is_alive()
+    assert channel.get(timeout=1).status == "2"
+    assert channel.stats()["blocked"] == 1
+
+
+def test_channel_block_wait_is_bounded():
+    channel = EventChannel(maxsize=1, max_block_s=0.01)
+    channel.put_many([_progress("a"), _progress("b"), LogEvent(method="GET", path="/", status="1")])
+
+    # The progress event is dropped; the log event goes over maxsize.
+    assert channel.qsize() == 2
+    stats = channel.stats()
+    assert (stats["blocked"], stats["dropped"]) == (2, 1)
+    assert channel.get_nowait().delta_text == "a"
+    assert channel.get_nowait().status == "1"
+
+
+def test_channel_close_drains_then_raises_empty():
+    channel = EventChannel()
+    channel.put(LogEvent(method="GET", path="/", status="1"))
+    channel.close()
+    assert channel.get().status == "1"
+    with pytest.raises(queue.Empty):
+        channel.get()
+
+
+# ─── Batched EventRouter Tests ────────────────────────────────────────────────
+
+
+@pytest.fixture
+def batched_router(source_queue):
+    r = EventRouter(source_queue, batched=True)
+    yield r
+    r.stop()
+
+
+def test_batched_router_slow_subscriber_does_not_delay_others(batched_router, source_queue):
+    release = threading.Event()
+    fast_received = []
+
+    batched_router.add_subscriber(DirectSubscriber(lambda event: release.wait(5)), name="slow")
+    batched_router.add_subscriber(DirectSubscriber(fast_received.append), name="fast")
+    batched_router.start()
+
+    events = [LogEvent(method="GET", path="/", status=str(i)) for i in range(20)]
+    for event in events:
+        source_queue.put(event)
+
+    assert _wait_for(lambda: len(fast_received) == len(events))
+    assert fast_received == events
+    stats = batched_router.stats()
+    assert stats["slow"]["queued"] >= 1
+    release.set()
+    assert _wait_for(lambda: batched_router.stats()["slow"]["delivered"] == len(events))
+
+
+def test_batched_router_inline_subscriber_sees_events_before_queues(batched_router, source_queue):
+    inline_seen = []
+    order_ok = []
+
+    def inline(event):
+        inline_seen.append(event)
+
+    def queued(event):
+        order_ok.append(event in inline_seen)
+
+    batched_router.add_subscriber(DirectSubscriber(inline), inline=True)
+    batched_router.add_subscriber(DirectSubscriber(queued))
+    batched_router.start()
+
+    for i in range(10):
+        source_queue.put(LogEvent(method="GET", path="/", status=str(i)))
+
+    assert _wait_for(lambda: len(order_ok) == 10)
+    assert all(order_ok)
+    assert len(batched_router.stats()) == 1  # inline subscribers have no channel
+
+
+def test_batched_router_feeds_queue_subscriber_without_worker(batched_router, source_queue):
+    sub = QueueSubscriber(maxsize=4, overflow=OVERFLOW_COALESCE)
+    batched_router.add_subscriber(sub, name="display")
+    batched_router.start()
+
+    for i, text in enumerate("streaming"):
+        source_queue.put(_progress(text, seq=i))
+
+    assert _wait_for(lambda: batched_router.stats()["display"]["coalesced"] + sub.queue.qsize() == 9)
+    text = ""
+    while not sub.queue.empty():
+        text += sub.queue.get_nowait().delta_text
+    assert text == "streaming"
+
+
+def test_batched_router_subscriber_error_isolated(batched_router, source_queue, caplog):
+    received = []
+
+    def failing(event):
+        raise ValueError("boom")
+
+    batched_router.add_subscriber(DirectSubscriber(failing), name="failing")
+    batched_router.add_subscriber(DirectSubscriber(received.append))
+    batched_router.start()
+
+    with caplog.at_level(logging.ERROR, logger="cc_dump.pipeline.router"):
+        source_queue.put(RequestBodyEvent(body={}))
+        assert _wait_for(lambda: len(received) == 1)
+        assert _wait_for(lambda: "subscriber error (failing)" in caplog.text)
+
+
+def test_batched_router_stop_drains_worker_channels(source_queue):
+    router = EventRouter(source_queue, batched=True)
+    received = []
+
+    def slow(event):
+        time.sleep(0.01)
+        received.append(event)
+
+    router.add_subscriber(DirectSubscriber(slow))
+    router.start()
+    for i in range(10):
+        source_queue.put(LogEvent(method="GET", path="/", status=str(i)))
+    assert _wait_for(lambda: source_queue.empty())
+    time.sleep(0.05)  # let the router hand the batch to the channel
+
+    router.stop()
+
+    assert len(received) == 10
+
+
+def test_batched_router_duplicate_names_are_suffixed(batched_router):
+    batched_router.add_subscriber(DirectSubscriber(lambda event: None), name="har")
+    batched_router.add_subscriber(DirectSubscriber(lambda event: None), name="har")
+    assert list(batched_router.stats()) == ["har", "har#2"]
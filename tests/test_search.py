@@ -11,7 +11,9 @@ from cc_dump.tui.search import (
     SearchContext,
     SearchState,
     SearchTextCache,
+    SearchTrigramIndex,
     SearchBar,
+    build_searchable_blocks,
     get_searchable_text,
     compile_search_pattern,
     find_all_matches,
@@ -609,6 +611,118 @@ class TestFindAllMatchesHierarchy:
         assert matches2[0].block is thinking
 
 
+# ─── Trigram index ────────────────────────────────────────────────────────────
+
+
+def _indexed_turn(turn_index, blocks):
+    return _FakeTurnData(turn_index, blocks, searchable_blocks=build_searchable_blocks(blocks))
+
+
+def _match_keys(matches):
+    return [(m.turn_index, m.block_index, id(m.block), m.text_offset, m.text_length) for m in matches]
+
+
+class TestSearchTrigramIndex:
+    """The index narrows blocks without changing find_all_matches results."""
+
+    def _turns(self):
+        shared = "Please fix the Parser bug in module_one.py"
+        return [
+            _indexed_turn(0, [
+                MessageBlock(role="user", msg_index=0, children=[TextContentBlock(content=shared)]),
+            ]),
+            _indexed_turn(1, [
+                MessageBlock(role="user", msg_index=0, children=[TextContentBlock(content=shared)]),
+                MessageBlock(role="assistant", msg_index=1, children=[
+                    TextContentBlock(content="The parser now handles ſtrings and DIRECTIVES."),
+                    ToolUseBlock(name="Read", input_size=10, msg_color_idx=0, detail="module_one.py"),
+                ]),
+            ]),
+            _FakeTurnData(2, [TextContentBlock(content="parser still streaming")], is_streaming=True),
+        ]
+
+    @pytest.mark.parametrize("query,modes", [
+        ("parser", SearchMode.CASE_INSENSITIVE),
+        ("Parser", SearchMode(0)),
+        ("module_one", SearchMode.CASE_INSENSITIVE | SearchMode.REGEX),
+        ("strings", SearchMode.CASE_INSENSITIVE),
+        ("handles", SearchMode.WORD_BOUNDARY),
+        ("absent text", SearchMode.CASE_INSENSITIVE),
+    ])
+    def test_candidates_match_full_scan(self, query, modes):
+        turns = self._turns()
+        index = SearchTrigramIndex()
+        index.sync(turns)
+        candidates = index.candidates(query, modes)
+        assert candidates is not None
+
+        pattern = compile_search_pattern(query, modes)
+        assert _match_keys(find_all_matches(turns, pattern, candidates=candidates)) == _match_keys(
+            find_all_matches(turns, pattern)
+        )
+
+    @pytest.mark.parametrize("query,modes", [
+        ("pa", SearchMode.CASE_INSENSITIVE),
+        ("pars.r", SearchMode.CASE_INSENSITIVE | SearchMode.REGEX),
+        ("ſtrings", SearchMode.CASE_INSENSITIVE),
+        ("ſtrings", SearchMode(0)),
+    ])
+    def test_unnarrowable_queries_fall_back(self, query, modes):
+        index = SearchTrigramIndex()
+        index.sync(self._turns())
+        assert index.candidates(query, modes) is None
+
+    def test_context_folded_sigma_matches_full_scan(self):
+        # str.lower() folds a word-final Σ to ς, so "ΔΟΣ" and "ΟΔΟΣΑ" fold apart.
+        turns = [_indexed_turn(0, [TextContentBlock(content="ΟΔΟΣΑ test")])]
+        index = SearchTrigramIndex()
+        index.sync(turns)
+        modes = SearchMode(0)
+        pattern = compile_search_pattern("ΔΟΣ", modes)
+        matches = find_all_matches(turns, pattern, candidates=index.candidates("ΔΟΣ", modes))
+        assert len(matches) == len(find_all_matches(turns, pattern)) == 1
+
+    def test_shared_text_is_indexed_once(self):
+        turns = self._turns()
+        index = SearchTrigramIndex()
+        index.sync(turns)
+        assert index.turn_count == 2  # streaming turn skipped
+        distinct = len(index)
+        index.sync(turns[:1] + [_indexed_turn(1, list(turns[1].blocks))])
+        assert len(index) == distinct
+
+    def test_sync_releases_pruned_and_replaced_turns(self):
+        turns = self._turns()[:2]
+        index = SearchTrigramIndex()
+        index.sync(turns)
+
+        index.sync(turns[1:])
+        assert index.turn_count == 1
+        assert index.candidates("module_one", SearchMode(0)).text_ids
+
+        turns[1].blocks = [TextContentBlock(content="replacement content")]
+        turns[1].searchable_blocks = build_searchable_blocks(turns[1].blocks)
+        index.sync(turns[1:])
+        assert index.candidates("module_one", SearchMode(0)).text_ids == frozenset()
+        matches = find_all_matches(
+            turns[1:], re.compile("replacement"),
+            candidates=index.candidates("replacement", SearchMode(0)),
+        )
+        assert [m.block for m in matches] == turns[1].blocks
+
+        index.sync([])
+        assert len(index) == 0
+        assert index._postings == {}
+
+    def test_unindexed_turn_is_scanned_in_full(self):
+        index = SearchTrigramIndex()
+        candidates = index.candidates("parser", SearchMode.CASE_INSENSITIVE)
+        turns = self._turns()
+        matches = find_all_matches(turns, compile_search_pattern("parser", SearchMode.CASE_INSENSITIVE),
+                                   candidates=candidates)
+        assert len(matches) == 3
+
+
 # ─── Identity matching in SearchContext ──────────────────────────────────────
 
 
@@ -6,7 +6,11 @@ from unittest.mock import MagicMock
 import pytest
 
 from cc_dump.pipeline.proxy import RequestPipeline, _build_synthetic_sse_bytes
-from cc_dump.pipeline.sentinel import extract_sentinel_command, make_interceptor
+from cc_dump.pipeline.sentinel import (
+    extract_sentinel_command,
+    make_interceptor,
+    may_contain_sentinel,
+)
 
 
 # ─── extract_sentinel_command ────────────────────────────────────────────────
@@ -269,6 +273,35 @@ class TestRequestPipeline:
         assert response == "was flagged"
         assert body["flagged"] is True
 
+    def test_may_rewrite_uses_interceptor_prefilters(self):
+        pipeline = RequestPipeline(interceptors=[make_interceptor(None)])
+        assert not pipeline.may_rewrite(b'{"messages": [{"role": "user", "content": "hi"}]}')
+        assert pipeline.may_rewrite(b'{"messages": [{"role": "user", "content": "$$"}]}')
+
+    def test_may_rewrite_without_prefilter_or_with_transforms(self):
+        assert not RequestPipeline().may_rewrite(b"{}")
+        assert RequestPipeline(interceptors=[lambda body: None]).may_rewrite(b"{}")
+        assert RequestPipeline(transforms=[lambda body, url: (body, url)]).may_rewrite(b"{}")
+
+
+
+# ─── may_contain_sentinel ────────────────────────────────────────────────────
+
+
+class TestMayContainSentinel:
+    @pytest.mark.parametrize("content", ["$$", "  $$focus", [{"type": "text", "text": "$$x"}]])
+    def test_matching_bodies_pass_prefilter(self, content):
+        body = {"messages": [{"role": "user", "content": content}]}
+        assert extract_sentinel_command(body) is not None
+        assert may_contain_sentinel(json.dumps(body).encode())
+
+    def test_escaped_dollar_passes_prefilter(self):
+        raw = b'{"messages": [{"role": "user", "content": "\\u0024\\u0024"}]}'
+        assert extract_sentinel_command(json.loads(raw)) == ""
+        assert may_contain_sentinel(raw)
+
+    def test_plain_body_fails_prefilter(self):
+        assert not may_contain_sentinel(b'{"messages": [{"role": "user", "content": "$5"}]}')
 
 
 # ─── make_interceptor ────────────────────────────────────────────────────────
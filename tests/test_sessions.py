@@ -392,3 +392,121 @@ def test_list_recordings_provider_metadata_overrides_url_fallback(recordings_dir
     recordings = list_recordings(str(recordings_dir))
     assert len(recordings) == 1
     assert recordings[0]["provider"] == "copilot"
+
+
+# ─── Recording catalog ───────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def scan_counter(monkeypatch):
+    """Count full reads of HAR files by the catalog."""
+    import cc_dump.io.recording_catalog
+
+    scanned: list[str] = []
+    real_scan = cc_dump.io.recording_catalog.scan_recording
+
+    def _scan(path):
+        scanned.append(Path(path).name)
+        return real_scan(path)
+
+    monkeypatch.setattr(cc_dump.io.recording_catalog, "scan_recording", _scan)
+    return scanned
+
+
+def test_list_recordings_reads_only_changed_files(recordings_dir, scan_counter):
+    create_har_file(recordings_dir / "a.har", entry_count=1)
+    create_har_file(recordings_dir / "b.har", entry_count=2)
+    list_recordings(str(recordings_dir))
+    assert sorted(scan_counter) == ["a.har", "b.har"]
+
+    scan_counter.clear()
+    assert [r["entry_count"] for r in list_recordings(str(recordings_dir))] == [1, 2]
+    assert scan_counter == []
+
+    create_har_file(recordings_dir / "b.har", entry_count=4)
+    os.utime(recordings_dir / "b.har", ns=(1, 1))
+    assert [r["entry_count"] for r in list_recordings(str(recordings_dir))] == [1, 4]
+    assert scan_counter == ["b.har"]
+
+
+def test_list_recordings_caches_malformed_files(recordings_dir, scan_counter):
+    (recordings_dir / "bad.har").write_text("not valid json {")
+    assert list_recordings(str(recordings_dir)) == []
+    assert list_recordings(str(recordings_dir)) == []
+    assert scan_counter == ["bad.har"]
+
+
+def test_catalog_drops_removed_recordings(recordings_dir):
+    import cc_dump.io.recording_catalog
+
+    create_har_file(recordings_dir / "old.har")
+    create_har_file(recordings_dir / "new.har")
+    list_recordings(str(recordings_dir))
+    (recordings_dir / "old.har").unlink()
+
+    assert [r["filename"] for r in list_recordings(str(recordings_dir))] == ["new.har"]
+    assert set(cc_dump.io.recording_catalog.load_catalog(recordings_dir)) == {"new.har"}
+
+
+def test_recorded_rows_are_journaled_then_folded_into_catalog(recordings_dir, scan_counter):
+    import cc_dump.io.recording_catalog as catalog
+
+    create_har_file(recordings_dir / "a.har", entry_count=1)
+    list_recordings(str(recordings_dir))
+    snapshot = catalog.catalog_path(recordings_dir).read_text()
+
+    create_har_file(recordings_dir / "a.har", entry_count=2)
+    summary = catalog.scan_recording(recordings_dir / "a.har")
+    catalog.record_recording(recordings_dir / "a.har", summary)
+    catalog.record_recording(recordings_dir / "a.har", summary)
+    assert catalog.catalog_path(recordings_dir).read_text() == snapshot
+    assert len(catalog.journal_path(recordings_dir).read_text().splitlines()) == 2
+
+    scan_counter.clear()
+    assert [r["entry_count"] for r in list_recordings(str(recordings_dir))] == [2]
+    assert scan_counter == []
+    assert not catalog.journal_path(recordings_dir).exists()
+    assert catalog.load_catalog(recordings_dir)["a.har"]["summary"]["entry_count"] == 2
+
+
+def test_large_journal_is_compacted_on_append(recordings_dir, monkeypatch):
+    import cc_dump.io.recording_catalog as catalog
+
+    create_har_file(recordings_dir / "a.har", entry_count=2)
+    summary = catalog.scan_recording(recordings_dir / "a.har")
+    catalog.record_recording(recordings_dir / "a.har", summary)
+    assert not catalog.catalog_path(recordings_dir).exists()
+
+    monkeypatch.setattr(catalog, "_JOURNAL_COMPACT_BYTES", 1)
+    catalog.record_recording(recordings_dir / "a.har", summary)
+    assert not catalog.journal_path(recordings_dir).exists()
+    assert catalog._load_snapshot(recordings_dir)["a.har"]["summary"]["entry_count"] == 2
+
+
+def test_catalog_write_replays_appends_it_did_not_read(recordings_dir):
+    import cc_dump.io.recording_catalog as catalog
+
+    create_har_file(recordings_dir / "a.har", entry_count=1)
+    create_har_file(recordings_dir / "b.har", entry_count=3)
+    catalog.record_recording(recordings_dir / "a.har", catalog.scan_recording(recordings_dir / "a.har"))
+    journal, seen = catalog._read_journal(recordings_dir)
+    # Lands after the read, before the journal is claimed.
+    catalog.record_recording(recordings_dir / "b.har", catalog.scan_recording(recordings_dir / "b.har"))
+
+    catalog._write_catalog(recordings_dir, journal, seen)
+
+    assert set(catalog._load_snapshot(recordings_dir)) == {"a.har"}
+    assert set(catalog._read_journal(recordings_dir)[0]) == {"b.har"}
+    assert catalog.load_catalog(recordings_dir)["b.har"]["summary"]["entry_count"] == 3
+    assert not [p for p in recordings_dir.iterdir() if p.name.endswith(".claimed")]
+
+
+def test_list_recordings_ignores_corrupt_catalog(recordings_dir):
+    import cc_dump.io.recording_catalog
+
+    create_har_file(recordings_dir / "a.har", entry_count=3)
+    cc_dump.io.recording_catalog.catalog_path(recordings_dir).write_text("{truncated")
+
+    (rec,) = list_recordings(str(recordings_dir))
+    assert rec["entry_count"] == 3
+    assert "a.har" in cc_dump.io.recording_catalog.load_catalog(recordings_dir)
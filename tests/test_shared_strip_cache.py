@@ -0,0 +1,119 @@
+"""Tests for the process-wide content-addressed block strip cache."""
+
+from rich.console import Console
+from textual.cache import LRUCache
+from textual.theme import BUILTIN_THEMES
+
+from cc_dump.core.formatting import Category, SystemSection, TextContentBlock
+from cc_dump.tui.rendering import (
+    SharedStripCache,
+    block_content_key,
+    clear_shared_strip_cache,
+    create_render_runtime,
+    render_turn_to_strips,
+    set_theme,
+    shared_strip_cache_stats,
+)
+from cc_dump.tui.strip_codec import estimate_strip_bytes
+
+
+def _block(content: str = "shared **markdown** payload") -> TextContentBlock:
+    return TextContentBlock(content=content, category=Category.USER)
+
+
+def _render(block, *, width: int = 80, block_cache=None, runtime=None):
+    strips, _, _ = render_turn_to_strips(
+        [block], {}, Console(), width=width, block_cache=block_cache, runtime=runtime
+    )
+    return strips
+
+
+def _stats_delta(before: dict[str, int]) -> dict[str, int]:
+    after = shared_strip_cache_stats()
+    return {"hits": after["hits"] - before["hits"], "misses": after["misses"] - before["misses"]}
+
+
+def test_content_key_ignores_block_id_but_not_payload():
+    first, second = _block(), _block()
+    assert first.block_id != second.block_id
+    assert block_content_key(first) == block_content_key(second)
+    assert block_content_key(first) != block_content_key(_block("other payload"))
+    assert block_content_key(first) != block_content_key(
+        TextContentBlock(content=first.content, category=Category.ASSISTANT)
+    )
+
+
+def test_content_key_covers_children():
+    parent_a = SystemSection(children=[_block("a")])
+    parent_b = SystemSection(children=[_block("b")])
+    assert block_content_key(parent_a) != block_content_key(parent_b)
+
+
+def test_content_key_is_memoized_per_block_until_cache_clear():
+    block = _block()
+    key = block_content_key(block)
+    # Rendered blocks are not mutated; the memo answers without re-hashing.
+    block.content = "changed in place"
+    assert block_content_key(block) == key
+    clear_shared_strip_cache()
+    assert block_content_key(block) == block_content_key(_block("changed in place"))
+
+
+def test_content_key_memo_survives_block_id_reuse():
+    import cc_dump.core.formatting_impl
+
+    previous = cc_dump.core.formatting_impl.reset_format_runtime_for_tests(next_block_id=1000)
+    try:
+        first = _block("first payload")
+        key = block_content_key(first)
+        cc_dump.core.formatting_impl.reset_format_runtime_for_tests(next_block_id=1000)
+        second = _block("second payload")
+        assert second.block_id == first.block_id
+        assert block_content_key(second) != key
+    finally:
+        cc_dump.core.formatting_impl.set_default_format_runtime(previous)
+
+
+def test_equal_blocks_share_strips_across_turns_and_views():
+    before = shared_strip_cache_stats()
+    first = _render(_block(), block_cache=LRUCache(100))
+    # A different view (own per-view cache) showing a different block instance.
+    second = _render(_block(), block_cache=LRUCache(100))
+
+    assert _stats_delta(before) == {"hits": 1, "misses": 1}
+    assert [s.text for s in second] == [s.text for s in first]
+
+
+def test_width_and_theme_are_part_of_the_key():
+    _render(_block())
+    before = shared_strip_cache_stats()
+    _render(_block(), width=60)
+    light = create_render_runtime()
+    set_theme(BUILTIN_THEMES["textual-light"], runtime=light)
+    _render(_block(), runtime=light)
+
+    assert _stats_delta(before) == {"hits": 0, "misses": 2}
+
+
+def test_cache_evicts_least_recently_used_over_byte_budget():
+    strips = _render(_block())
+    size = estimate_strip_bytes(strips)
+    cache = SharedStripCache(max_bytes=size * 2)
+    cache.put(("a",), strips)
+    cache.put(("b",), strips)
+    assert cache.get(("a",)) is strips
+    cache.put(("c",), strips)
+
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) is strips
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] == size * 2
+    assert stats["evictions"] == 1
+    assert stats["hit_rate_pct"] == 66
+
+
+def test_disabled_cache_stores_nothing():
+    cache = SharedStripCache(max_bytes=0)
+    cache.put(("a",), _render(_block()))
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,117 @@
+"""Tests for the incremental streaming Markdown preview in rendering.py."""
+
+from unittest.mock import patch
+
+import pytest
+from rich.console import Console
+
+import cc_dump.tui.rendering_impl
+from cc_dump.tui.rendering import StreamingPreviewState, render_streaming_preview
+
+_DOC = """# Plan
+
+I'll start by reading the file.
+
+## Steps
+
+1. Read the module
+2. Fix the bug
+
+- bullet a
+
+- bullet b (loose)
+
+Then a paragraph after the list that is long enough to wrap at narrow widths.
+
+```python
+def f(x):
+
+    return x + 1
+```
+
+> quoted text
+> more
+
+| a | b |
+|---|---|
+| 1 | 2 |
+
+---
+
+    indented code
+
+Final paragraph with **bold** and `code`.
+"""
+
+
+def _signature(strips):
+    return [[(seg.text, seg.style) for seg in strip] for strip in strips]
+
+
+@pytest.fixture
+def console():
+    return Console(width=100, force_terminal=True, color_system="truecolor")
+
+
+@pytest.mark.parametrize("width", [40, 100])
+def test_incremental_preview_matches_full_render(console, width):
+    """Every streamed prefix renders exactly like a whole-text render."""
+    state = StreamingPreviewState()
+    for end in range(1, len(_DOC) + 1, 5):
+        text = _DOC[:end]
+        incremental = render_streaming_preview(text, console, width, state=state)
+        full = render_streaming_preview(text, console, width)
+        assert _signature(incremental) == _signature(full), f"mismatch at {end}: {text[-30:]!r}"
+
+
+def test_boundaries_skip_fences_and_list_continuations():
+    state = StreamingPreviewState()
+    text = "para\n\n- a\n\n- b\n\n```\nx\n\ny\n```\n\nafter\n"
+    state.advance(text)
+    starts = [text[b:].split("\n", 1)[0] for b in state.boundaries]
+    # List items (which may continue a loose list) and blank lines inside the
+    # fence never start a new chunk.
+    assert starts == ["```", "after"]
+
+
+def test_appended_text_renders_like_the_whole_text(console):
+    """Feeding only new text gives the same strips; finished chunks keep their own text."""
+    state = StreamingPreviewState()
+    for start in range(0, len(_DOC), 7):
+        state.append(_DOC[start : start + 7])
+        incremental = render_streaming_preview(None, console, 60, state=state)
+        text = _DOC[: start + 7]
+        assert _signature(incremental) == _signature(render_streaming_preview(text, console, 60))
+    assert "".join(state.chunk_texts) + state.tail == _DOC
+    assert state.length == len(_DOC)
+
+
+def test_stable_chunks_render_once_per_width(console):
+    """Finished blocks are not re-rendered when only the tail grows."""
+    state = StreamingPreviewState()
+    text = "".join(f"Paragraph {i} text.\n\n" for i in range(20)) + "tail"
+    render_streaming_preview(text, console, 80, state=state)
+
+    with patch.object(
+        cc_dump.tui.rendering_impl,
+        "_render_markdown_chunk",
+        wraps=cc_dump.tui.rendering_impl._render_markdown_chunk,
+    ) as render_chunk:
+        render_streaming_preview(text + " more tail", console, 80, state=state)
+        assert render_chunk.call_count == 1  # the tail only
+        # The boundary before "tail" is confirmed once that line is complete.
+        assert render_chunk.call_args.args[0] == "Paragraph 19 text.\n\ntail more tail"
+
+        render_streaming_preview(text + " more tail", console, 60, state=state)
+        assert render_chunk.call_count == 1 + len(state.boundaries) + 1
+
+
+def test_state_resets_when_text_is_not_an_extension(console):
+    state = StreamingPreviewState()
+    render_streaming_preview("first\n\nsecond\n", console, 80, state=state)
+    assert state.boundaries
+
+    strips = render_streaming_preview("other", console, 80, state=state)
+
+    assert state.boundaries == []
+    assert _signature(strips) == _signature(render_streaming_preview("other", console, 80))
@@ -0,0 +1,61 @@
+"""Tests for the compact EncodedStrips storage."""
+
+from __future__ import annotations
+
+import pytest
+from rich.console import Console
+from rich.segment import ControlType, Segment
+from rich.style import Style
+from textual.strip import Strip
+
+from cc_dump.core.formatting import TextContentBlock
+from cc_dump.tui.rendering import render_turn_to_strips
+from cc_dump.tui.strip_codec import EncodedStrips, StyleTable, estimate_strip_bytes
+
+
+def _rendered_strips() -> list[Strip]:
+    text = "\n".join(f"line **{i}** with `code` and ünïcödé 你好" for i in range(50))
+    strips, _, _ = render_turn_to_strips(
+        [TextContentBlock(content=text, indent="")], {}, Console(), width=80
+    )
+    return strips
+
+
+def test_round_trip_preserves_every_line():
+    strips = _rendered_strips()
+    encoded = EncodedStrips.encode(strips, StyleTable())
+
+    assert len(encoded) == len(strips)
+    assert list(encoded) == strips
+    assert encoded[-1] == strips[-1]
+    assert encoded[2:5] == strips[2:5]
+    assert [s.cell_length for s in encoded] == [s.cell_length for s in strips]
+
+
+def test_styles_are_interned_across_encodings():
+    table = StyleTable()
+    bold = Style(bold=True)
+    EncodedStrips.encode([Strip([Segment("a", bold), Segment("b", None)])], table)
+    EncodedStrips.encode([Strip([Segment("c", Style(bold=True))])], table)
+    assert len(table) == 2
+
+
+def test_empty_lines_and_empty_input():
+    table = StyleTable()
+    assert len(EncodedStrips.encode([], table)) == 0
+    encoded = EncodedStrips.encode([Strip([]), Strip([Segment("x")])], table)
+    assert encoded[0].text == ""
+    assert encoded[1].text == "x"
+    with pytest.raises(IndexError):
+        encoded[2]
+
+
+def test_control_segments_are_not_encoded():
+    strip = Strip([Segment("", None, [(ControlType.BELL,)])])
+    assert EncodedStrips.encode([strip], StyleTable()) is None
+
+
+def test_encoding_is_several_times_smaller():
+    strips = _rendered_strips()
+    encoded = EncodedStrips.encode(strips, StyleTable())
+    assert encoded.nbytes * 3 < estimate_strip_bytes(strips)
@@ -0,0 +1,175 @@
+"""Tests for the pooled keep-alive upstream client."""
+
+import asyncio
+import http.client
+import http.server
+import threading
+import time
+from typing import ClassVar
+
+import pytest
+
+from cc_dump.pipeline.upstream_pool import UpstreamConnectionPool, wait_with_timeout
+
+
+class _KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: ClassVar[set[tuple[str, int]]] = set()
+    hangups: ClassVar[list[str]] = []
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _reply(self, status: int, body: bytes) -> None:
+        type(self).connections.add(self.client_address)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Drop the socket without announcing it, like an upstream idle timeout.
+        self.close_connection = self.path == "/drop-after"
+
+    def do_GET(self):
+        status = 404 if self.path == "/missing" else 200
+        self._reply(status, b'{"path":"' + self.path.encode() + b'"}')
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        if self.path == "/hangup":
+            # Read the whole request, then close without a response.
+            type(self).hangups.append(self.path)
+            self.close_connection = True
+            return
+        self._reply(200, body)
+
+
+@pytest.fixture
+def upstream():
+    handler = type("Handler", (_KeepAliveHandler,), {"connections": set(), "hangups": []})
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", handler
+    server.shutdown()
+    server.server_close()
+
+
+def _roundtrip(pool, method, url, body=None):
+    lease = pool.request(method, url, body=body, headers={"Content-Length": str(len(body or b""))})
+    try:
+        return lease.response.status, lease.response.read(), lease.reused
+    finally:
+        pool.release(lease)
+
+
+def test_sequential_requests_reuse_one_connection(upstream):
+    base, handler = upstream
+    pool = UpstreamConnectionPool()
+
+    results = [_roundtrip(pool, "GET", f"{base}/v1/messages?n={i}") for i in range(5)]
+
+    assert [status for status, _body, _reused in results] == [200] * 5
+    assert [reused for _status, _body, reused in results] == [False, True, True, True, True]
+    assert len(handler.connections) == 1
+    assert pool.stats()["connections_opened"] == 1
+    pool.close()
+
+
+def test_post_body_is_forwarded(upstream):
+    base, _handler = upstream
+    pool = UpstreamConnectionPool()
+    status, body, _reused = _roundtrip(pool, "POST", f"{base}/v1/messages", b'{"a":1}')
+    assert status == 200
+    assert body == b'{"a":1}'
+    pool.close()
+
+
+def test_error_status_is_returned_not_raised(upstream):
+    base, _handler = upstream
+    pool = UpstreamConnectionPool()
+    status, _body, _reused = _roundtrip(pool, "GET", f"{base}/missing")
+    assert status == 404
+    assert pool.stats()["idle_connections"] == 1
+    pool.close()
+
+
+def test_unread_response_is_not_pooled(upstream):
+    base, _handler = upstream
+    pool = UpstreamConnectionPool()
+    lease = pool.request("GET", f"{base}/x", body=None, headers={})
+    pool.release(lease)
+    assert pool.stats()["idle_connections"] == 0
+    pool.close()
+
+
+def test_idle_connections_are_bounded_per_target(upstream):
+    base, _handler = upstream
+    pool = UpstreamConnectionPool(max_idle_per_target=2)
+    leases = [pool.request("GET", f"{base}/{i}", body=None, headers={}) for i in range(4)]
+    for lease in leases:
+        lease.response.read()
+        pool.release(lease)
+    assert pool.stats()["idle_connections"] == 2
+    pool.close()
+
+
+def test_idle_connections_are_evicted_after_timeout(upstream):
+    base, _handler = upstream
+    pool = UpstreamConnectionPool(idle_timeout_s=0.05)
+    _roundtrip(pool, "GET", f"{base}/a")
+    assert pool.stats()["idle_connections"] == 1
+    time.sleep(0.1)
+    assert pool.evict_idle() == 1
+    assert pool.stats()["idle_connections"] == 0
+    _status, _body, reused = _roundtrip(pool, "GET", f"{base}/b")
+    assert reused is False
+    pool.close()
+
+
+def test_stale_pooled_connection_is_retried_on_fresh_socket(upstream):
+    base, _handler = upstream
+    pool = UpstreamConnectionPool()
+    _roundtrip(pool, "GET", f"{base}/drop-after")
+    time.sleep(0.05)
+
+    status, _body, reused = _roundtrip(pool, "GET", f"{base}/b")
+    assert status == 200
+    assert reused is False
+    pool.close()
+
+
+def test_request_is_not_resent_once_written(upstream):
+    base, handler = upstream
+    pool = UpstreamConnectionPool()
+    _roundtrip(pool, "GET", f"{base}/a")
+
+    with pytest.raises(http.client.RemoteDisconnected):
+        _roundtrip(pool, "POST", f"{base}/hangup", body=b"{}")
+    assert handler.hangups == ["/hangup"]
+    pool.close()
+
+
+def test_close_stops_pooling(upstream):
+    base, _handler = upstream
+    pool = UpstreamConnectionPool()
+    pool.close()
+    _roundtrip(pool, "GET", f"{base}/a")
+    assert pool.stats()["idle_connections"] == 0
+
+
+def test_rejects_unsupported_scheme():
+    pool = UpstreamConnectionPool()
+    with pytest.raises(ValueError):
+        pool.request("GET", "ftp://example.com/x", body=None, headers={})
+
+
+def test_wait_with_timeout_raises_builtin_timeout_error():
+    async def _wait():
+        await wait_with_timeout(asyncio.Event().wait(), 0.01)
+
+    # The builtin (an OSError) on every supported Python, as asyncio.timeout raises on 3.11+.
+    with pytest.raises(TimeoutError):
+        asyncio.run(_wait())
+    assert asyncio.run(wait_with_timeout(asyncio.sleep(0, "done"), None)) == "done"
@@ -1268,6 +1268,200 @@ class TestLazyRerenderInRenderLine:
         assert conv.refresh.call_count == 2
 
 
+class TestDeferredTurnRendering:
+    """Completed turns are appended with estimated heights and rendered on demand."""
+
+    @contextlib.contextmanager
+    def _patch_view(self, conv, scroll_y=0, height=20):
+        region_mock = MagicMock()
+        region_mock.width = 81
+        region_mock.height = height
+        app_mock = MagicMock(console=Console())
+        cls = type(conv)
+
+        conv.scroll_to = MagicMock()
+        conv.scroll_end = MagicMock()
+        conv.call_later = MagicMock()
+        with patch.object(cls, 'scroll_offset', new_callable=PropertyMock, return_value=Offset(0, scroll_y)), \
+             patch.object(cls, 'scrollable_content_region', new_callable=PropertyMock, return_value=region_mock), \
+             patch.object(cls, 'app', new_callable=PropertyMock, return_value=app_mock), \
+             patch.object(cls, 'rich_style', new_callable=PropertyMock, return_value=Style()), \
+             patch.object(cls, 'size', new_callable=PropertyMock, return_value=MagicMock(width=81)):
+            yield
+
+    def _append_turns(self, conv, count: int, lines_per_turn: int = 3) -> None:
+        text = "\n".join(f"line {i}" for i in range(lines_per_turn))
+        for _ in range(count):
+            conv._render_and_append_turn([TextContentBlock(content=text, indent="")], {})
+
+    def test_appended_turns_are_estimated_not_rendered(self):
+        conv = ConversationView()
+        with self._patch_view(conv), \
+             patch.object(cc_dump.tui.rendering, "render_turn_to_strips") as render:
+            self._append_turns(conv, 50)
+
+        render.assert_not_called()
+        assert all(td._pending_render and td.strips == [] for td in conv._turns)
+        assert conv._offset_tree.prefix_sum(50) == 150
+        assert conv._total_lines == 150
+
+    def test_estimate_tracks_wrapping_and_filters(self):
+        wrapped = [TextContentBlock(content="x" * 200, indent="")]
+        assert cc_dump.tui.rendering.estimate_turn_lines(wrapped, {}, 80) == 3
+        tool = [ToolUseBlock(name="t", input_size=1, msg_color_idx=0)]
+        assert cc_dump.tui.rendering.estimate_turn_lines(tool, {"tools": ALWAYS_VISIBLE}, 80) == 1
+        assert cc_dump.tui.rendering.estimate_turn_lines(tool, {"tools": HIDDEN}, 80) == 0
+
+    def test_render_line_renders_turn_on_first_paint(self):
+        conv = ConversationView()
+        with self._patch_view(conv):
+            self._append_turns(conv, 3)
+            td = conv._turns[0]
+            td._estimated_lines = 10  # deliberately wrong estimate
+            conv._recalculate_offsets()
+            conv.render_line(0)
+
+        assert not td._pending_render
+        assert td.line_count == len(td.strips) > 0
+        assert conv._offset_tree.prefix_sum(1) == td.line_count
+        conv.call_later.assert_called_once_with(conv._flush_deferred_anchor_resolve)
+
+    def test_flush_renders_only_viewport_turns_and_keeps_anchor(self):
+        conv = ConversationView()
+        conv._follow_state = FollowState.OFF
+        with self._patch_view(conv, scroll_y=3000, height=20):
+            self._append_turns(conv, 2000)
+            for td in conv._turns:
+                td._estimated_lines = 5  # real height is 3
+            conv._recalculate_offsets()
+            conv._scroll_anchor = conv._compute_anchor_from_scroll()
+            anchor = conv._scroll_anchor
+            conv._flush_pending_renders()
+
+        rendered = [td.turn_index for td in conv._turns if not td._pending_render]
+        assert rendered
+        assert len(rendered) < 200
+        assert anchor.turn_index in rendered
+        # The anchor turn keeps its place even though turns above it were re-measured.
+        expected_y = conv._offset_tree.prefix_sum(anchor.turn_index) + anchor.line_in_turn
+        conv.scroll_to.assert_called_with(y=expected_y, animate=False)
+
+    def test_follow_flush_renders_tail_until_viewport_is_filled(self):
+        conv = ConversationView()
+        conv._follow_state = FollowState.ACTIVE
+        with self._patch_view(conv, height=20):
+            self._append_turns(conv, 1000)
+            conv._flush_pending_renders()
+
+        rendered = [td.turn_index for td in conv._turns if not td._pending_render]
+        budget = 20 + conv._PENDING_RENDER_BUFFER_LINES
+        assert rendered == list(range(1000 - len(rendered), 1000))
+        assert sum(conv._turns[i].line_count for i in rendered) >= budget
+        assert len(rendered) < 200
+        conv.scroll_end.assert_called_once()
+
+    def test_scroll_to_block_renders_target_and_anchors_it(self):
+        conv = ConversationView()
+        conv._follow_state = FollowState.OFF
+        with self._patch_view(conv, height=20):
+            self._append_turns(conv, 100)
+            conv.scroll_to_block(60, 0)
+
+        target = conv._turns[60]
+        assert not target._pending_render
+        assert conv._scroll_anchor is not None
+        anchor_y = (
+            conv._offset_tree.prefix_sum(conv._scroll_anchor.turn_index)
+            + conv._scroll_anchor.line_in_turn
+        )
+        conv.scroll_to.assert_called_with(y=anchor_y, animate=False)
+
+
+class TestStripBudget:
+    """Strips of off-screen turns are evicted LRU-first once over the byte budget."""
+
+    _patch_view = TestDeferredTurnRendering._patch_view
+
+    def _render_turns(self, conv, count: int) -> None:
+        for _ in range(count):
+            conv._render_and_append_turn([TextContentBlock(content="a\nb\nc", indent="")], {})
+        for td in conv._turns:
+            conv._render_turn_now(td)
+
+    def test_eviction_keeps_geometry_and_viewport_turns(self):
+        conv = ConversationView(strip_budget_bytes=0)
+        with self._patch_view(conv, scroll_y=300, height=20):
+            self._render_turns(conv, 200)
+            per_turn = conv._turns[0]._strip_bytes
+            assert per_turn > 0
+            heights = [td.line_count for td in conv._turns]
+            total_lines = conv._total_lines
+            vp_start, vp_end = conv._viewport_turn_range(conv._PENDING_RENDER_BUFFER_LINES)
+
+            conv._strip_budget_bytes = per_turn * ((vp_end - vp_start) + 10)
+            conv._enforce_strip_budget()
+
+        stats = conv.strip_budget_stats()
+        assert stats["strip_resident_bytes"] <= conv._strip_budget_bytes
+        assert stats["strip_evictions"] == 200 - (vp_end - vp_start) - 10
+        assert [td.line_count for td in conv._turns] == heights
+        assert conv._total_lines == total_lines
+        assert all(not td._evicted for td in conv._turns[vp_start:vp_end])
+        assert all(td.strips == [] for td in conv._turns if td._evicted)
+
+    def test_least_recently_used_turns_go_first(self):
+        conv = ConversationView(strip_budget_bytes=0)
+        with self._patch_view(conv, scroll_y=0, height=5):
+            self._render_turns(conv, 400)
+        with self._patch_view(conv, scroll_y=conv._offset_tree.prefix_sum(300), height=5):
+            conv.render_line(0)  # paint turn 300: most recently used
+        with self._patch_view(conv, scroll_y=0, height=5):
+            conv._strip_budget_bytes = conv._turns[0]._strip_bytes * 150
+            conv._enforce_strip_budget()
+
+        assert not conv._turns[300]._evicted
+        assert not conv._turns[399]._evicted
+        assert conv._turns[150]._evicted
+
+    def test_evicted_turn_rerenders_on_paint_and_is_counted(self):
+        conv = ConversationView(strip_budget_bytes=0)
+        with self._patch_view(conv, scroll_y=0, height=5):
+            self._render_turns(conv, 1)
+            td = conv._turns[0]
+            original = [strip.text for strip in td.strips]
+            td.evict_strips()
+            conv.render_line(0)
+
+        assert [strip.text for strip in td.strips] == original
+        assert conv.strip_budget_stats()["strip_rerenders"] == 1
+
+    def test_offscreen_turns_are_compacted_and_paint_identically(self):
+        from cc_dump.tui.strip_codec import EncodedStrips
+
+        conv = ConversationView(strip_budget_bytes=0)
+        conv._follow_state = FollowState.OFF
+        with self._patch_view(conv, scroll_y=0, height=5):
+            self._render_turns(conv, 200)
+            far = conv._turns[150]
+            raw_strips = list(far.strips)
+            raw_bytes = far._strip_bytes
+            conv._flush_pending_renders()
+
+        assert not isinstance(conv._turns[0].strips, EncodedStrips)
+        assert isinstance(far.strips, EncodedStrips)
+        assert far._strip_bytes < raw_bytes
+        assert list(far.strips) == raw_strips
+        with self._patch_view(conv, scroll_y=conv._offset_tree.prefix_sum(150), height=5):
+            painted = conv.render_line(0)
+        assert painted.text.rstrip() == raw_strips[0].text.rstrip()
+
+    def test_budget_reads_environment(self, monkeypatch):
+        monkeypatch.setenv("CC_DUMP_STRIP_BUDGET_MB", "2")
+        assert ConversationView()._strip_budget_bytes == 2 * 1024 * 1024
+        monkeypatch.setenv("CC_DUMP_STRIP_BUDGET_MB", "0")
+        assert ConversationView()._strip_budget_bytes == 0
+
+
 class TestRequestScopedStreaming:
     """Request-scoped streaming turns should not interleave."""
 